@@ -0,0 +1,470 @@
+#usr/bin/python3
+"""
+Module introspection_lib.Tests.PT001_capture_cost
+
+Implements performance testing (benchmarking) of the capture cost of the call
+stack and exception tracebacks by the modules introspection_lib.my_traceback
+and introspection_lib.base_exceptions. Each measurement is compared with the
+equivalent functionality of the Standard Library module traceback.
+
+The measured per call times are printed or saved as a JSON file, so the
+results of different releases can be compared, see the --compare option.
+
+Usage:
+    python3 PT001_capture_cost.py [-o results.json] [--compare old.json]
+        [--depths 10,50,200] [--contexts 1,3,7] [--modules 0,2000]
+        [--number 50] [--repeat 5]
+
+Test ID: TEST-T-009. Covers requirement REQ-FUN-007.
+"""
+
+__version__ = "1.0.0.0"
+__date__ = "17-10-2026"
+__status__ = "Testing"
+
+#imports
+
+#+ standard libraries
+
+import sys
+import os
+import json
+import time
+import types
+import timeit
+import inspect
+import argparse
+import platform
+import traceback
+import contextlib
+
+from typing import Any, Dict, List, Optional, Callable, Iterator, Sequence
+
+#+ my libraries
+
+ROOT_FOLDER = os.path.dirname(os.path.dirname(
+                                os.path.dirname(os.path.realpath(__file__))))
+
+if not (ROOT_FOLDER) in sys.path:
+    sys.path.append(ROOT_FOLDER)
+
+import introspection_lib
+import introspection_lib.my_traceback as my_traceback
+import introspection_lib.base_exceptions as base_exceptions
+
+#types
+
+type TResult = Dict[str, Any]
+
+type TResults = List[TResult]
+
+#globals
+
+DEPTHS = (10, 50, 200)
+
+CONTEXTS = (1, 3, 7)
+
+MODULES = (0, 2000)
+
+NUMBER = 50
+
+REPEAT = 5
+
+#+ UT_* exception class, arguments and the equivalent built-in exception
+
+EXCEPTIONS = (
+    (base_exceptions.UT_Exception, ('Test message', ), Exception),
+    (base_exceptions.UT_TypeError, (1, str), TypeError),
+    (base_exceptions.UT_ValueError, (1, '> 2'), ValueError),
+    (base_exceptions.UT_AttributeError, (1, 'test'), AttributeError),
+    (base_exceptions.UT_IndexError, ('test', 5), IndexError),
+    (base_exceptions.UT_KeyError, ('test', 'key'), KeyError)
+)
+
+#helper functions
+
+def Measure(Function: Callable[[], Any], Number: int, Repeat: int) -> float:
+    """
+    Measures the best (minimal) time per call of the passed function.
+
+    Signature:
+        func()/, int > 0, int > 0/ -> float >= 0
+
+    Args:
+        Function: func(); callable without arguments to measure
+        Number: int > 0; number of the calls per repetition
+        Repeat: int > 0; number of the repetitions
+
+    Returns:
+        float >= 0: best time per call in seconds
+
+    Version 1.0.0.0
+    """
+    Timer = timeit.Timer(Function, timer = time.perf_counter)
+    return min(Timer.repeat(repeat = Repeat, number = Number)) / Number
+
+def Recurse(Depth: int, Function: Callable[[], Any]) -> Any:
+    """
+    Calls the passed function at the specified depth of the call stack, i.e.
+    from within the specified number of the nested calls of itself.
+
+    Signature:
+        int > 0, func() -> type A
+
+    Returns:
+        type A: the value returned by the passed function
+
+    Version 1.0.0.0
+    """
+    if Depth <= 1:
+        Result = Function()
+    else:
+        Result = Recurse(Depth - 1, Function)
+    return Result
+
+def GetTraceback(Depth: int) -> types.TracebackType:
+    """
+    Raises an exception at the specified depth and returns its traceback.
+
+    Signature:
+        int > 0 -> types.TracebackType
+
+    Version 1.0.0.0
+    """
+    def Raise():
+        raise ValueError('test')
+
+    try:
+        Recurse(Depth, Raise)
+    except ValueError as err:
+        Result = err.__traceback__
+    return Result
+
+@contextlib.contextmanager
+def ExtraModules(Number: int) -> Iterator[None]:
+    """
+    Context manager temporary registering the specified number of the dummy
+    modules (with the fake source files) in sys.modules, thus simulating an
+    application with many loaded modules.
+
+    Signature:
+        int >= 0 -> iterator(None)
+
+    Version 1.0.0.0
+    """
+    Names = []
+    for Index in range(Number):
+        Name = f'_pt001_dummy_{Index}'
+        Module = types.ModuleType(Name)
+        Module.__file__ = os.path.join(ROOT_FOLDER, '_pt001', f'{Name}.py')
+        sys.modules[Name] = Module
+        Names.append(Name)
+    try:
+        yield None
+    finally:
+        for Name in Names:
+            del sys.modules[Name]
+
+def MakeResult(Name: str, Parameters: Dict[str, int], Seconds: float,
+                        Baseline: str, BaselineSeconds: float) -> TResult:
+    """
+    Constructs a single result record.
+
+    Signature:
+        str, dict(str -> int), float, str, float -> dict(str -> type A)
+
+    Version 1.0.0.0
+    """
+    return {'name' : Name, 'params' : dict(Parameters), 'seconds' : Seconds,
+            'baseline' : Baseline, 'baseline_seconds' : BaselineSeconds,
+            'ratio' : Seconds / BaselineSeconds if BaselineSeconds else None}
+
+#benchmarks
+
+def BenchStackTraceback(Depth: int, Context: int, Modules: int, Number: int,
+                                                Repeat: int) -> TResults:
+    """
+    Measures the capture and the rendering of the call stack traceback by the
+    class StackTraceback at the specified depth and context length, compared
+    with the functions traceback.extract_stack() and traceback.format_stack().
+
+    Signature:
+        int > 0, int > 0, int >= 0, int > 0, int > 0
+            -> list(dict(str -> type A))
+
+    Version 1.0.0.0
+    """
+    Parameters = {'depth' : Depth, 'context' : Context, 'modules' : Modules}
+
+    def Capture():
+        return my_traceback.StackTraceback(ContextLength = Context)
+
+    def Render():
+        return my_traceback.StackTraceback(ContextLength = Context).Info
+
+    def Run():
+        return (Measure(Capture, Number, Repeat),
+                Measure(traceback.extract_stack, Number, Repeat),
+                Measure(Render, Number, Repeat),
+                Measure(traceback.format_stack, Number, Repeat))
+
+    Times = Recurse(Depth, Run)
+    return [MakeResult('StackTraceback', Parameters, Times[0],
+                                    'traceback.extract_stack', Times[1]),
+            MakeResult('StackTraceback.Info', Parameters, Times[2],
+                                    'traceback.format_stack', Times[3])]
+
+def BenchExceptionTraceback(Depth: int, Context: int, Modules: int,
+                                    Number: int, Repeat: int) -> TResults:
+    """
+    Measures the capture and the rendering of the exception traceback by the
+    class ExceptionTraceback at the specified depth and context length,
+    compared with the functions traceback.extract_tb() and
+    traceback.format_tb().
+
+    Signature:
+        int > 0, int > 0, int >= 0, int > 0, int > 0
+            -> list(dict(str -> type A))
+
+    Version 1.0.0.0
+    """
+    Parameters = {'depth' : Depth, 'context' : Context, 'modules' : Modules}
+    Traceback = GetTraceback(Depth)
+
+    def Capture():
+        return my_traceback.ExceptionTraceback(FromTraceback = Traceback,
+                                                    ContextLength = Context)
+
+    def Render():
+        return my_traceback.ExceptionTraceback(FromTraceback = Traceback,
+                                                ContextLength = Context).Info
+
+    Result = [
+        MakeResult('ExceptionTraceback', Parameters,
+                    Measure(Capture, Number, Repeat), 'traceback.extract_tb',
+                    Measure(lambda : traceback.extract_tb(Traceback),
+                                                            Number, Repeat)),
+        MakeResult('ExceptionTraceback.Info', Parameters,
+                    Measure(Render, Number, Repeat), 'traceback.format_tb',
+                    Measure(lambda : traceback.format_tb(Traceback),
+                                                            Number, Repeat))]
+    del Traceback
+    return Result
+
+def BenchParseFramesList(Depth: int, Context: int, Modules: int, Number: int,
+                                                Repeat: int) -> TResults:
+    """
+    Measures the parsing of the list of the inspect.FrameInfo objects by the
+    function ParseFramesList() at the specified depth and context length,
+    compared with the method traceback.StackSummary.extract() applied to the
+    same frames.
+
+    Signature:
+        int > 0, int > 0, int >= 0, int > 0, int > 0
+            -> list(dict(str -> type A))
+
+    Version 1.0.0.0
+    """
+    Parameters = {'depth' : Depth, 'context' : Context, 'modules' : Modules}
+
+    def Run():
+        Frames = inspect.stack(Context)
+        Pairs = [(Frame.frame, Frame.lineno) for Frame in Frames]
+        Result = (
+            Measure(lambda : my_traceback.ParseFramesList(Frames),
+                                                            Number, Repeat),
+            Measure(lambda : traceback.StackSummary.extract(iter(Pairs)),
+                                                            Number, Repeat))
+        del Frames
+        del Pairs
+        return Result
+
+    Times = Recurse(Depth, Run)
+    return [MakeResult('ParseFramesList', Parameters, Times[0],
+                                'traceback.StackSummary.extract', Times[1])]
+
+def BenchExceptions(Depth: int, Modules: int, Number: int,
+                                                Repeat: int) -> TResults:
+    """
+    Measures raising at the specified depth and catching of each UT_* exception
+    compared with the equivalent built-in exception, as well as with the
+    rendering of the traceback (property Traceback of the exception) compared
+    with the function traceback.format_exc().
+
+    Signature:
+        int > 0, int >= 0, int > 0, int > 0 -> list(dict(str -> type A))
+
+    Version 1.0.0.0
+    """
+    Parameters = {'depth' : Depth, 'modules' : Modules}
+    Result = []
+    for Class, Arguments, BuiltIn in EXCEPTIONS:
+
+        def RaiseCustom():
+            raise Class(*Arguments)
+
+        def RaiseBuiltIn():
+            raise BuiltIn(*Arguments)
+
+        def Custom():
+            try:
+                Recurse(Depth, RaiseCustom)
+            except BuiltIn:
+                pass
+
+        def Standard():
+            try:
+                Recurse(Depth, RaiseBuiltIn)
+            except BuiltIn:
+                pass
+
+        def CustomInfo():
+            try:
+                Recurse(Depth, RaiseCustom)
+            except BuiltIn as err:
+                return err.Traceback.Info
+
+        def StandardInfo():
+            try:
+                Recurse(Depth, RaiseBuiltIn)
+            except BuiltIn:
+                return traceback.format_exc()
+
+        Result.append(MakeResult(f'raise {Class.__name__}', Parameters,
+                                    Measure(Custom, Number, Repeat),
+                                    f'raise {BuiltIn.__name__}',
+                                    Measure(Standard, Number, Repeat)))
+        Result.append(MakeResult(f'raise {Class.__name__} + Traceback.Info',
+                            Parameters, Measure(CustomInfo, Number, Repeat),
+                            f'raise {BuiltIn.__name__} + traceback.format_exc',
+                            Measure(StandardInfo, Number, Repeat)))
+    return Result
+
+#main functions
+
+def RunAll(Depths: Sequence[int], Contexts: Sequence[int],
+            Modules: Sequence[int], Number: int, Repeat: int) -> TResults:
+    """
+    Runs all benchmarks for all combinations of the stack depth, context
+    length and number of the additionally loaded modules.
+
+    Signature:
+        seq(int > 0), seq(int > 0), seq(int >= 0), int > 0, int > 0
+            -> list(dict(str -> type A))
+
+    Version 1.0.0.0
+    """
+    Result = []
+    for ModulesNumber in Modules:
+        with ExtraModules(ModulesNumber):
+            for Depth in Depths:
+                for Context in Contexts:
+                    for Bench in (BenchStackTraceback, BenchExceptionTraceback,
+                                                        BenchParseFramesList):
+                        Result.extend(Bench(Depth, Context, ModulesNumber,
+                                                            Number, Repeat))
+                Result.extend(BenchExceptions(Depth, ModulesNumber, Number,
+                                                                    Repeat))
+    return Result
+
+def GetKey(Item: TResult) -> str:
+    """
+    Constructs a unique key of a result record from its name and parameters.
+
+    Signature:
+        dict(str -> type A) -> str
+
+    Version 1.0.0.0
+    """
+    Parameters = ','.join(f'{Key}={Value}'
+                            for Key, Value in sorted(Item['params'].items()))
+    return f"{Item['name']} [{Parameters}]"
+
+def Compare(Old: Dict[str, Any], New: Dict[str, Any]) -> List[str]:
+    """
+    Compares two sets of results (as loaded from the JSON files) and
+    constructs the report lines with the relative change of the time per call
+    for each benchmark present in both sets. The ratios to the Standard Library
+    baseline are compared, thus the results obtained on different machines
+    are comparable to some degree.
+
+    Signature:
+        dict(str -> type A), dict(str -> type A) -> list(str)
+
+    Version 1.0.0.0
+    """
+    OldResults = {GetKey(Item) : Item for Item in Old['results']}
+    Lines = [f"{Old['library']} -> {New['library']}"]
+    for Item in New['results']:
+        Key = GetKey(Item)
+        OldItem = OldResults.get(Key, None)
+        if OldItem is None or not OldItem['ratio'] or not Item['ratio']:
+            continue
+        Change = 100 * (Item['ratio'] / OldItem['ratio'] - 1)
+        Lines.append(f'{Key}: {1E6 * OldItem["seconds"]:.1f} us -> '
+                        + f'{1E6 * Item["seconds"]:.1f} us, ratio '
+                        + f'{OldItem["ratio"]:.2f} -> {Item["ratio"]:.2f} '
+                        + f'({Change:+.1f}%)')
+    return Lines
+
+def ParseIntegers(Value: str) -> List[int]:
+    """
+    Parses a comma-separated list of the integers (command line option).
+
+    Signature:
+        str -> list(int)
+
+    Version 1.0.0.0
+    """
+    return [int(Item) for Item in Value.split(',') if Item.strip()]
+
+def main(Arguments: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """
+    Parses the command line options, runs the benchmarks, saves or prints the
+    results and, optionally, the comparison with the previous results.
+
+    Signature:
+        /seq(str) OR None/ -> dict(str -> type A)
+
+    Version 1.0.0.0
+    """
+    Parser = argparse.ArgumentParser(description = __doc__.split('\n\n')[1])
+    Parser.add_argument('-o', '--output', default = None,
+                            help = 'path to the JSON file to save the results')
+    Parser.add_argument('--compare', default = None,
+                            help = 'path to the JSON file with old results')
+    Parser.add_argument('--depths', type = ParseIntegers, default = DEPTHS)
+    Parser.add_argument('--contexts', type = ParseIntegers, default = CONTEXTS)
+    Parser.add_argument('--modules', type = ParseIntegers, default = MODULES)
+    Parser.add_argument('--number', type = int, default = NUMBER)
+    Parser.add_argument('--repeat', type = int, default = REPEAT)
+    Options = Parser.parse_args(Arguments)
+    Result = {
+        'library' : introspection_lib.__version__,
+        'modules_versions' : {'my_traceback' : my_traceback.__version__,
+                            'base_exceptions' : base_exceptions.__version__},
+        'python' : sys.version,
+        'implementation' : platform.python_implementation(),
+        'platform' : platform.platform(),
+        'date' : time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'loaded_modules' : len(sys.modules),
+        'number' : Options.number,
+        'repeat' : Options.repeat,
+        'results' : RunAll(Options.depths, Options.contexts, Options.modules,
+                                            Options.number, Options.repeat)
+    }
+    if Options.output is None:
+        print(json.dumps(Result, indent = 1))
+    else:
+        with open(Options.output, 'wt', encoding = 'utf-8') as File:
+            json.dump(Result, File, indent = 1)
+    if Options.compare is not None:
+        with open(Options.compare, 'rt', encoding = 'utf-8') as File:
+            Old = json.load(File)
+        print('\n'.join(Compare(Old, Result)))
+    return Result
+
+#testing
+
+if __name__ == '__main__':
+    main()
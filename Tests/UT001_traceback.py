@@ -5,8 +5,8 @@ Module introspection_lib.Tests.UT001_traceback
 Implements unit testing of the module introspection_lib.my_traceback.
 """
 
-__version__ = "1.0.1.0"
-__date__ = "06-11-2020"
+__version__ = "1.19.0.0"
+__date__ = "17-10-2026"
 __status__ = "Testing"
 
 #imports
@@ -15,7 +15,20 @@ __status__ = "Testing"
 
 import sys
 import os
+import io
+import json
+import types
+import pickle
+import time
+import inspect
+import asyncio
+import shutil
+import tempfile
+import linecache
 import unittest
+import threading
+import zipfile
+import weakref
 
 #+ my libraries
 
@@ -26,6 +39,7 @@ if not (ROOT_FOLDER) in sys.path:
     sys.path.append(ROOT_FOLDER)
 
 import introspection_lib.my_traceback as testmodule
+import introspection_lib.package_structure as package_structure
 
 #helper functions
 
@@ -50,6 +64,41 @@ def outer():
     """
     return middle()
 
+def blocked(Event):
+    """
+    The inner function in the chain waiting() -> blocked(), which blocks the
+    calling thread until the passed event is set.
+    """
+    Event.wait(10)
+
+def waiting(Event):
+    """
+    The outer function in the chain waiting() -> blocked(), which blocks the
+    calling thread until the passed event is set.
+    """
+    blocked(Event)
+
+async def async_inner(Event):
+    """
+    The inner coroutine in the chain async_outer() -> async_middle() ->
+    async_inner(), which is suspended until the passed event is set.
+    """
+    await Event.wait()
+
+async def async_middle(Event):
+    """
+    The middle coroutine in the chain async_outer() -> async_middle() ->
+    async_inner(), which is suspended until the passed event is set.
+    """
+    await async_inner(Event)
+
+async def async_outer(Event):
+    """
+    The outer coroutine in the chain async_outer() -> async_middle() ->
+    async_inner(), which is suspended until the passed event is set.
+    """
+    await async_middle(Event)
+
 #classes
 
 #+ test cases
@@ -58,8 +107,12 @@ class Test_StackTraceback(unittest.TestCase):
     """
     Test cases for the class introspection_lib.my_traceback.StackTraceback
     
-    Implements tests: TEST-T-100 and TEST-T-101. Covers the requirements
-    REQ-FUN-100, REQ-FUN-101 and REQ-FUN-102.
+    Implements tests: TEST-T-100, TEST-T-101, TEST-T-102, TEST-T-103,
+    TEST-T-104, TEST-T-105, TEST-T-106, TEST-T-107, TEST-T-108, TEST-T-109 and
+    TEST-T-10A. Covers the requirements REQ-FUN-100, REQ-FUN-101,
+    REQ-FUN-102, REQ-FUN-104, REQ-FUN-105, REQ-FUN-106, REQ-FUN-107,
+    REQ-FUN-108, REQ-FUN-109, REQ-FUN-10A, REQ-FUN-10B, REQ-FUN-10C and
+    REQ-AWM-100.
     """
     
     @classmethod
@@ -68,10 +121,20 @@ class Test_StackTraceback(unittest.TestCase):
         Preparation for the test cases, done only once.
         """
         cls.TestClass = testmodule.StackTraceback
-        cls.RequiredClassFields = ['ConsoleWidth', 'ContextLenght']
-        cls.RequiredClassFieldsTypes = [int, int]
-        cls.RequiredProperties = ['CallChain', 'Info']
-        cls.RequiredPropertiesTypes = [list, str]
+        cls.RequiredClassFields = ['ConsoleWidth', 'ContextLenght',
+                                'LazyContext', 'CaptureLocals',
+                                'MaxLocalLength', 'MaxFrameLocalsLength']
+        cls.RequiredClassFieldsTypes = [int, int, bool, bool, int, int]
+        cls.RequiredProperties = ['CallChain', 'Info', 'Fingerprint',
+                                                    'Locals', 'IsPlaceholder']
+        cls.RequiredPropertiesTypes = [list, str, str, list, bool]
+    
+    def _getTraceback(self, **kwargs):
+        """
+        Helper method - creates an instance of the tested class with the
+        passed keyword arguments.
+        """
+        return self.TestClass(**kwargs)
     
     def test_ClassHasAttributes(self):
         """
@@ -186,14 +249,401 @@ class Test_StackTraceback(unittest.TestCase):
                 self.assertLessEqual(iLength, iMaxWidth,
                                     'code line {} is too long'.format(strLine))
         del objTest
+    
+    def test_LazyContext(self):
+        """
+        Checks that the lazy mode of instantiation produces the same call chain
+        and frames information as the normal mode, and that the source code
+        sniplets are retrieved only upon access of the Info property.
+        
+        Test: TEST-T-102. Covers requirements: REQ-FUN-104.
+        """
+        objTest, objLazy = self.TestClass(), self.TestClass(LazyContext= True)
+        self.assertIsNotNone(objLazy._PendingContext)
+        self.assertListEqual(objLazy.CallChain, objTest.CallChain)
+        self.assertIsNotNone(objLazy._PendingContext)
+        for Frame in objLazy._Traceback:
+            self.assertIsNone(Frame.CodeLines)
+        self.assertEqual(objLazy.Info, objTest.Info)
+        self.assertIsNone(objLazy._PendingContext)
+        del objTest
+        del objLazy
+    
+    def test_StreamingInfo(self):
+        """
+        Checks that the method iterInfo() yields exactly the lines of the Info
+        property, that the method writeInfo() writes exactly the same text into
+        a stream, and that the too long source code lines are truncated to
+        their beginning followed by the ellipsis.
+        
+        Test: TEST-T-103. Covers requirements: REQ-FUN-105.
+        """
+        iMaxWidth = 20
+        objTest = self.TestClass(ContextLength = 1, ConsoleWidth = iMaxWidth)
+        strInfo = objTest.Info
+        lstLines = list(objTest.iterInfo())
+        self.assertListEqual(lstLines, strInfo.split('\n'))
+        objStream = io.StringIO()
+        objTest.writeInfo(objStream)
+        self.assertEqual(objStream.getvalue(), strInfo)
+        objStream.close()
+        #frames without the source code (e.g. frozen modules) are rendered
+        #+ by the 2 lines only
+        iLine = 0
+        for Frame in objTest._Traceback:
+            CodeLines = Frame.CodeLines
+            self.assertTrue(lstLines[iLine + 1].startswith('Line '))
+            iLine += 2
+            if CodeLines is None:
+                continue
+            if not CodeLines:
+                iLine += 1
+                continue
+            strSource = CodeLines[0].rstrip()
+            strLine = lstLines[iLine]
+            iLine += len(CodeLines)
+            self.assertLessEqual(len(strLine), iMaxWidth)
+            if strLine.endswith('...'):
+                strStart = strLine[:-3].split(' ', 1)[-1].lstrip()
+                self.assertTrue(strSource.lstrip().startswith(strStart))
+        self.assertEqual(iLine, len(lstLines))
+        del objTest
+    
+    def test_Fingerprint(self):
+        """
+        Checks that the fingerprint depends only on the frames locations, but
+        not on the rendering options or the capture mode.
+        
+        Test: TEST-T-104. Covers requirements: REQ-FUN-106.
+        """
+        Class = self.TestClass
+        lstTests = [(Class(), Class(ConsoleWidth= 20), Class(LazyContext= True))
+                                                        for _ in range(2)]
+        setFingerprints = {objTest.Fingerprint for Group in lstTests
+                                                    for objTest in Group}
+        self.assertEqual(len(setFingerprints), 1)
+        objTest = self.TestClass()
+        self.assertNotEqual(objTest.Fingerprint, lstTests[0][0].Fingerprint)
+        objTest = self.TestClass(SkipFrames = 1)
+        self.assertNotEqual(objTest.Fingerprint, lstTests[0][0].Fingerprint)
+        del objTest
+        del lstTests
+    
+    def test_Filters(self):
+        """
+        Checks the max number of frames limit and the include / exclude filters
+        by the module's name and by the source file path.
+        
+        Test: TEST-T-105. Covers requirements: REQ-FUN-107.
+        """
+        strPath = 'Tests/UT001_traceback.py'
+        lstFull = self.TestClass().CallChain
+        for Lazy in (False, True):
+            objTest = self.TestClass(MaxFrames = 2, LazyContext = Lazy)
+            self.assertEqual(objTest.CallChain, lstFull[-2:])
+            objTest = self.TestClass(SkipFrames = 1, MaxFrames = 2,
+                                                        LazyContext = Lazy)
+            self.assertEqual(objTest.CallChain, lstFull[-3:-1])
+            objTest = self.TestClass(Include = 'unittest.*',
+                                                        LazyContext = Lazy)
+            lstChain = objTest.CallChain
+            self.assertGreater(len(lstChain), 0)
+            self.assertEqual(lstChain, [Name for Name in lstFull
+                                                if Name.startswith('unittest')])
+            objTest = self.TestClass(Exclude = ['unittest.*', 'runpy'],
+                                                        LazyContext = Lazy)
+            lstChain = objTest.CallChain
+            self.assertEqual(lstChain, [Name for Name in lstFull
+                            if not Name.startswith(('unittest', 'runpy'))])
+            self.assertTrue(lstChain[-1].endswith('.test_Filters'))
+            objTest = self.TestClass(Include = strPath, LazyContext = Lazy)
+            self.assertEqual(objTest.CallChain[-1], lstChain[-1])
+            self.assertFalse(any(Name.startswith('unittest')
+                                                for Name in objTest.CallChain))
+            objTest = self.TestClass(Include = ['unittest.*', strPath],
+                            Exclude = strPath, MaxFrames = 1, ContextLength = 1,
+                                                        LazyContext = Lazy)
+            self.assertEqual(len(objTest.CallChain), 1)
+            self.assertTrue(objTest.CallChain[0].startswith('unittest'))
+            self.assertEqual(len(objTest.Info.split('\n')), 3)
+        del objTest
+    
+    def test_Serialization(self):
+        """
+        Checks the compact binary serialization and the pickling round-trip,
+        as well as the errors on the improper data.
+        
+        Test: TEST-T-106. Covers requirements: REQ-FUN-108, REQ-AWM-100.
+        """
+        for objTest in (self.TestClass(), self.TestClass(LazyContext = True)):
+            bData = objTest.toBytes()
+            self.assertIsInstance(bData, bytes)
+            self.assertLess(len(bData), len(objTest.Info.encode('utf-8')))
+            for objCopy in (self.TestClass.fromBytes(bData),
+                            self.TestClass.fromBytes(bytearray(bData)),
+                            pickle.loads(pickle.dumps(objTest))):
+                self.assertIs(type(objCopy), self.TestClass)
+                self.assertEqual(objCopy.CallChain, objTest.CallChain)
+                self.assertEqual(objCopy.Info, objTest.Info)
+                self.assertEqual(objCopy.Fingerprint, objTest.Fingerprint)
+                self.assertEqual(objCopy.toBytes(), bData)
+        for gData in ('test', 1, None):
+            with self.assertRaises(TypeError):
+                self.TestClass.fromBytes(gData)
+        for gData in (b'', b'TB\x7f', bData[:-1], bData + b'\x00'):
+            with self.assertRaises(ValueError):
+                self.TestClass.fromBytes(gData)
+        #only the additional attributes emitted by toBytes() are restored
+        for strName in ('_Placeholder', '__class__', '_Traceback', 'Info',
+                                                                '_TaskName'):
+            bName = strName.encode('utf-8')
+            bData = (b'TB\x02\x50\x02' + bytes([len(bName)]) + bName +
+                                            b'\x01x\x00\x01\x00\x02\x00')
+            if strName == '_Placeholder':
+                objCopy = self.TestClass.fromBytes(bData)
+                self.assertIs(type(objCopy), self.TestClass)
+                self.assertEqual(objCopy._Placeholder, 'x')
+                self.assertEqual(objCopy.CallChain, [])
+            else:
+                with self.assertRaises(ValueError):
+                    self.TestClass.fromBytes(bData)
+        del objTest
+        del objCopy
+    
+    def test_CaptureLocals(self):
+        """
+        Checks the bounded representations of the local variables of the
+        frames, and that they are recorded only upon request.
+        
+        Test: TEST-T-107. Covers requirements: REQ-FUN-109.
+        """
+        lstBig = list(range(1000000))
+        strLong = 'x' * 10000
+        for objTest in (self.TestClass(CaptureLocals = True),
+                        self.TestClass(CaptureLocals = True,
+                                                        LazyContext = True)):
+            lstLocals = objTest.Locals
+            self.assertEqual(len(lstLocals), len(objTest.CallChain))
+            dictLocals = lstLocals[-1]
+            self.assertEqual(dictLocals['lstBig'], '[0, 1, 2, 3, 4, 5, ...]')
+            self.assertLessEqual(len(dictLocals['strLong']),
+                                                self.TestClass.MaxLocalLength)
+            self.assertIn('self', dictLocals)
+            strInfo = objTest.Info
+            self.assertIn('\nLocal lstBig = [0, 1, 2, 3, 4, 5, ...]\n',
+                                                                    strInfo)
+            objCopy = self.TestClass.fromBytes(objTest.toBytes())
+            self.assertEqual(objCopy.Locals, lstLocals)
+            self.assertEqual(objCopy.Info, strInfo)
+        objTest = self.TestClass(CaptureLocals = True, MaxLocalLength = 10,
+                                                    MaxFrameLocalsLength = 30)
+        for dictLocals in objTest.Locals:
+            self.assertLessEqual(sum(len(Key) + len(Value)
+                                    for Key, Value in dictLocals.items()), 30)
+            for strValue in dictLocals.values():
+                self.assertLessEqual(len(strValue), 10)
+        self.assertIn('\nLocals: ', objTest.Info)
+        objTest = self.TestClass()
+        self.assertEqual(objTest.Locals, [])
+        self.assertNotIn('\nLocal ', objTest.Info)
+        del objTest
+        del objCopy
+        del lstBig
+    
+    def test_DeferredLocals(self):
+        """
+        Checks that the representations of the local variables are created
+        only upon the first access, regardless of the LazyContext mode, and
+        that the large containers are not kept alive by the snapshots.
+        
+        Test: TEST-T-107. Covers requirements: REQ-FUN-109.
+        """
+        class Counted:
+            Calls = 0
+            
+            def __repr__(self):
+                Counted.Calls += 1
+                return 'counted'
+        
+        objCounted = Counted()
+        for bLazy in (False, True):
+            Counted.Calls = 0
+            lstHolder = [0] * 10 + [Counted()]
+            objRef = weakref.ref(lstHolder[-1])
+            try:
+                raise ValueError('test')
+            except ValueError:
+                objTest = self.TestClass(CaptureLocals = True,
+                                                        LazyContext = bLazy)
+            self.assertEqual(Counted.Calls, 0)
+            del lstHolder
+            #before Python 3.13 the frame caches its own locals dictionary
+            sys._getframe().f_locals
+            self.assertIsNone(objRef())
+            dictLocals = objTest.Locals[-1]
+            self.assertEqual(Counted.Calls, 1)
+            self.assertEqual(dictLocals['objCounted'], 'counted')
+            self.assertEqual(dictLocals['lstHolder'], '[0, 0, 0, 0, 0, 0, ...]')
+            self.assertIsNone(objTest._PendingLocals)
+            self.assertIn('\nLocal objCounted = counted\n', objTest.Info)
+            self.assertEqual(Counted.Calls, 1)
+        del objCounted
+        del objTest
+    
+    def test_Records(self):
+        """
+        Checks the structured representation of the frames as the records and
+        the JSON string, with and without the source code sniplets.
+        
+        Test: TEST-T-108. Covers requirements: REQ-FUN-10A.
+        """
+        objTest = self.TestClass()
+        lstRecords = objTest.asRecords()
+        self.assertIsInstance(lstRecords, list)
+        self.assertEqual([dictItem['FullName'] for dictItem in lstRecords],
+                                                            objTest.CallChain)
+        for dictItem, objRecord in zip(lstRecords, objTest._Traceback):
+            self.assertEqual(list(dictItem.keys()), ['FilePath', 'Caller',
+                        'FullName', 'LineNumber', 'LineIndex', 'CodeLines'])
+            self.assertEqual(dictItem['FilePath'], objRecord.FilePath)
+            self.assertEqual(dictItem['Caller'], objRecord.Caller)
+            self.assertEqual(dictItem['LineNumber'], objRecord.LineNumber)
+            self.assertEqual(dictItem['LineIndex'], objRecord.LineIndex)
+            if objRecord.CodeLines is None:
+                self.assertIsNone(dictItem['CodeLines'])
+            else:
+                self.assertEqual(dictItem['CodeLines'], [strLine.rstrip('\n')
+                                        for strLine in objRecord.CodeLines])
+        dictData = json.loads(objTest.toJSON())
+        self.assertEqual(dictData['Class'], self.TestClass.__name__)
+        self.assertEqual(dictData['Fingerprint'], objTest.Fingerprint)
+        self.assertEqual(dictData['Frames'], lstRecords)
+        self.assertEqual(json.loads(objTest.toJSON(Indent = 2)), dictData)
+        self.assertNotIn('\n', objTest.toJSON())
+        objTest = self.TestClass(LazyContext = True)
+        lstRecords = objTest.asRecords(WithContext = False)
+        for dictItem in lstRecords:
+            self.assertIsNone(dictItem['LineIndex'])
+            self.assertIsNone(dictItem['CodeLines'])
+        self.assertIsNotNone(objTest._PendingContext)
+        dictData = json.loads(objTest.toJSON(WithContext = False))
+        self.assertEqual(dictData['Frames'], lstRecords)
+        self.assertIsNotNone(objTest._PendingContext)
+        self.assertIsNotNone(objTest.asRecords()[-1]['CodeLines'])
+        objTest = self.TestClass(CaptureLocals = True)
+        lstRecords = objTest.asRecords()
+        self.assertEqual([dictItem['Locals'] for dictItem in lstRecords],
+                                                                objTest.Locals)
+        for dictItem in lstRecords:
+            self.assertIsInstance(dictItem['OmittedLocals'], int)
+        objCopy = self.TestClass.fromBytes(objTest.toBytes())
+        self.assertEqual(objCopy.toJSON(), objTest.toJSON())
+        del objTest
+        del objCopy
+    
+    def test_RenderMemo(self):
+        """
+        Checks that the rendered text is memoized per width, and that it is
+        the same as rendered by the streaming methods.
+        
+        Test: TEST-T-109. Covers requirements: REQ-FUN-10B.
+        """
+        for objTest in (self.TestClass(), self.TestClass(LazyContext = True),
+                            self.TestClass(CaptureLocals = True,
+                                                        ConsoleWidth = 60)):
+            strInfo = objTest.Info
+            self.assertIs(objTest.Info, strInfo)
+            self.assertIs(objTest.getInfo(), strInfo)
+            self.assertEqual('\n'.join(objTest.iterInfo()), strInfo)
+            objStream = io.StringIO()
+            objTest.writeInfo(objStream)
+            self.assertEqual(objStream.getvalue(), strInfo)
+            strNarrow = objTest.getInfo(40)
+            self.assertIs(objTest.getInfo(40), strNarrow)
+            self.assertEqual(len(strNarrow.split('\n')),
+                                                    len(strInfo.split('\n')))
+            for strLine in strNarrow.split('\n'):
+                if strLine[:1] in (' ', '>'): #source code lines only
+                    self.assertLessEqual(len(strLine), 40)
+            self.assertIs(objTest.Info, strInfo)
+            for Value in (None, 0, -1, 1.0, True):
+                self.assertIs(objTest.getInfo(Value), strInfo)
+            objCopy = self.TestClass.fromBytes(objTest.toBytes())
+            self.assertEqual(objCopy.Info, strInfo)
+        del objTest
+        del objCopy
+    
+    def test_Concurrent(self):
+        """
+        Checks that the tracebacks captured and rendered in parallel threads,
+        in the eager and lazy modes, whilst the module level caches of the
+        modules names and the source files are being cleared, are the same.
+        
+        Test: TEST-T-10A. Covers requirements: REQ-FUN-10C.
+        """
+        Threads = 8
+        Repeats = 25
+        objBarrier = threading.Barrier(Threads + 1)
+        objStop = threading.Event()
+        dictResults = {}
+        lstErrors = []
+        
+        def worker(Index):
+            try:
+                objBarrier.wait()
+                lstResults = []
+                for _ in range(Repeats):
+                    for bLazy in (False, True):
+                        objTest = self._getTraceback(LazyContext = bLazy)
+                        lstResults.append((objTest.Fingerprint, objTest.Info))
+                dictResults[Index] = lstResults
+            except Exception as err:
+                lstErrors.append(err)
+        
+        def cleaner():
+            objBarrier.wait()
+            while not objStop.is_set():
+                testmodule.GetSourceCache().clear()
+                testmodule._ModuleResolver.clear()
+                time.sleep(0.0001)
+        
+        lstWorkers = [threading.Thread(target = worker, args = (Index, ))
+                                                    for Index in range(Threads)]
+        objCleaner = threading.Thread(target = cleaner)
+        fInterval = sys.getswitchinterval()
+        sys.setswitchinterval(0.00001)
+        try:
+            objCleaner.start()
+            for objThread in lstWorkers:
+                objThread.start()
+            for objThread in lstWorkers:
+                objThread.join(60)
+        finally:
+            objStop.set()
+            objCleaner.join(10)
+            sys.setswitchinterval(fInterval)
+        self.assertListEqual(lstErrors, [])
+        self.assertEqual(len(dictResults), Threads)
+        setResults = set()
+        for lstResults in dictResults.values():
+            self.assertEqual(len(lstResults), 2 * Repeats)
+            setResults.update(lstResults)
+        self.assertEqual(len(setResults), 1)
+        strInfo = setResults.pop()[1]
+        self.assertIn('_getTraceback', strInfo)
+        self.assertIn('\n>', strInfo) #source code is found
 
 class Test_ExceptionTraceback(Test_StackTraceback):
     """
     Test cases for the class introspection_lib.my_traceback.ExceptionTraceback.
     Extends the unit test class Test_StackTraceback.
     
-    Implements tests: TEST-T-110 and TEST-T-111. Covers the requirements
-    REQ-FUN-110, REQ-FUN-111 and REQ-FUN-112.
+    Implements tests: TEST-T-110, TEST-T-111, TEST-T-112, TEST-T-113,
+    TEST-T-114, TEST-T-115, TEST-T-116, TEST-T-117, TEST-T-118, TEST-T-119,
+    TEST-T-11A and TEST-T-11B. Covers the requirements REQ-FUN-110,
+    REQ-FUN-111, REQ-FUN-112, REQ-FUN-114, REQ-FUN-115, REQ-FUN-116,
+    REQ-FUN-117, REQ-FUN-118, REQ-FUN-119, REQ-FUN-108, REQ-FUN-10A,
+    REQ-FUN-10B, REQ-FUN-10C and REQ-AWM-100.
     """
     
     @classmethod
@@ -204,6 +654,17 @@ class Test_ExceptionTraceback(Test_StackTraceback):
         super(Test_ExceptionTraceback, cls).setUpClass()
         cls.TestClass = testmodule.ExceptionTraceback
     
+    def _getTraceback(self, **kwargs):
+        """
+        Helper method - creates an instance of the tested class with the
+        passed keyword arguments within the exception handler.
+        """
+        try:
+            outer()
+        except ValueError:
+            objTest = self.TestClass(**kwargs)
+        return objTest
+    
     def test_CallChain(self):
         """
         Checks the correctness of the callers chain returned by the property
@@ -294,14 +755,1955 @@ class Test_ExceptionTraceback(Test_StackTraceback):
         del objTest
         self.assertEqual(strInfo, strInfo1)
         self.assertEqual(lstCallChain, lstCallChain1)
+    
+    def test_LazyContext(self):
+        """
+        Checks that the lazy mode of instantiation produces the same call chain
+        and frames information as the normal mode, both for the current
+        exception and a substituted traceback, including the skipped frames.
+        
+        Test: TEST-T-113. Covers requirements: REQ-FUN-115.
+        """
+        try:
+            outer()
+        except ValueError as err:
+            objTest = self.TestClass(SkipFrames = 1)
+            objLazy = self.TestClass(SkipFrames = 1, LazyContext = True)
+            tbTest = err.__traceback__
+        self.assertEqual(len(objLazy.CallChain), 3)
+        self.assertListEqual(objLazy.CallChain, objTest.CallChain)
+        self.assertEqual(objLazy.Info, objTest.Info)
+        del objTest
+        del objLazy
+        objTest = self.TestClass(FromTraceback = tbTest)
+        objLazy = self.TestClass(FromTraceback = tbTest, LazyContext = True)
+        del tbTest
+        self.assertEqual(len(objLazy.CallChain), 4)
+        self.assertListEqual(objLazy.CallChain, objTest.CallChain)
+        self.assertEqual(objLazy.Info, objTest.Info)
+        del objTest
+        del objLazy
+    
+    def test_StreamingInfo(self):
+        """
+        Checks that the method iterInfo() yields exactly the lines of the Info
+        property, that the method writeInfo() writes exactly the same text into
+        a stream, and that the too long source code lines are truncated to
+        their beginning followed by the ellipsis.
+        
+        Test: TEST-T-114. Covers requirements: REQ-FUN-116.
+        """
+        try:
+            outer()
+        except ValueError:
+            super(Test_ExceptionTraceback, self).test_StreamingInfo()
+    
+    def test_Fingerprint(self):
+        """
+        Checks that the repeated identical failures have the same fingerprint,
+        regardless of the capture mode, and that the different failures have
+        different fingerprints.
+        
+        Test: TEST-T-115. Covers requirements: REQ-FUN-117.
+        """
+        lstTests = []
+        for Index in range(3):
+            try:
+                outer()
+            except ValueError as err:
+                lstTests.append(self.TestClass(
+                                            FromTraceback = err.__traceback__,
+                                            LazyContext = bool(Index % 2)))
+        setFingerprints = {objTest.Fingerprint for objTest in lstTests}
+        self.assertEqual(len(setFingerprints), 1)
+        try:
+            middle()
+        except ValueError as err:
+            objTest = self.TestClass(FromTraceback = err.__traceback__)
+        self.assertNotIn(objTest.Fingerprint, setFingerprints)
+        del objTest
+        del lstTests
+    
+    def test_Filters(self):
+        """
+        Checks the max number of frames limit and the include / exclude filters
+        applied to the exception traceback.
+        
+        Test: TEST-T-116. Covers requirements: REQ-FUN-118.
+        """
+        strPath = 'Tests/UT001_traceback.py'
+        try:
+            outer()
+        except ValueError as err:
+            for Lazy in (False, True):
+                lstFull = self.TestClass(LazyContext = Lazy).CallChain
+                self.assertEqual(len(lstFull), 4)
+                objTest = self.TestClass(MaxFrames = 2, LazyContext = Lazy)
+                self.assertEqual(objTest.CallChain, lstFull[-2:])
+                objTest = self.TestClass(MaxFrames = 2, SkipFrames = 1,
+                                                        LazyContext = Lazy)
+                self.assertEqual(objTest.CallChain, lstFull[1:3])
+                objTest = self.TestClass(MaxFrames = 3, LazyContext = Lazy,
+                                            FromTraceback = err.__traceback__)
+                self.assertEqual(objTest.CallChain, lstFull[-3:])
+                objTest = self.TestClass(Include = strPath, LazyContext = Lazy)
+                self.assertEqual(objTest.CallChain, lstFull)
+                objTest = self.TestClass(Exclude = strPath, LazyContext = Lazy)
+                self.assertEqual(objTest.CallChain, [])
+                self.assertEqual(objTest.Info, '')
+        del objTest
+    
+    def test_Serialization(self):
+        """
+        Checks the compact binary serialization and the pickling round-trip,
+        as well as the errors on the improper data.
+        
+        Test: TEST-T-117. Covers requirements: REQ-FUN-108, REQ-AWM-100.
+        """
+        try:
+            outer()
+        except ValueError:
+            super(Test_ExceptionTraceback, self).test_Serialization()
+    
+    def test_CaptureLocals(self):
+        """
+        Checks the bounded representations of the local variables of the
+        frames, and that they are recorded only upon request.
+        
+        Test: TEST-T-118. Covers requirements: REQ-FUN-119.
+        """
+        lstBig = list(range(1000000))
+        strLong = 'x' * 10000
+        try:
+            raise ValueError(len(lstBig), len(strLong))
+        except ValueError:
+            super(Test_ExceptionTraceback, self).test_CaptureLocals()
+        del lstBig
+    
+    def test_Records(self):
+        """
+        Checks the structured representation of the frames as the records and
+        the JSON string, with and without the source code sniplets.
+        
+        Test: TEST-T-119. Covers requirements: REQ-FUN-10A.
+        """
+        try:
+            outer()
+        except ValueError:
+            super(Test_ExceptionTraceback, self).test_Records()
+    
+    def test_RenderMemo(self):
+        """
+        Checks that the rendered text is memoized per width, and that it is
+        the same as rendered by the streaming methods.
+        
+        Test: TEST-T-11A. Covers requirements: REQ-FUN-10B.
+        """
+        try:
+            outer()
+        except ValueError:
+            super(Test_ExceptionTraceback, self).test_RenderMemo()
+    
+    def test_Concurrent(self):
+        """
+        Checks that the tracebacks captured and rendered in parallel threads,
+        in the eager and lazy modes, whilst the module level caches of the
+        modules names and the source files are being cleared, are the same.
+        
+        Test: TEST-T-11B. Covers requirements: REQ-FUN-10C.
+        """
+        super(Test_ExceptionTraceback, self).test_Concurrent()
+
+class Test_ModuleNameResolver(unittest.TestCase):
+    """
+    Test cases for the class introspection_lib.my_traceback.ModuleNameResolver
+    
+    Implements tests: TEST-T-120, TEST-T-121 and TEST-T-122. Covers the
+    requirements REQ-FUN-120, REQ-FUN-121 and REQ-FUN-122.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.ModuleNameResolver
+        cls.FakePath = os.path.join(ROOT_FOLDER, 'ut001_fake_module.py')
+    
+    def _getExecFrame(self, FilePath):
+        """
+        Helper method - returns a frame of a code compiled with the specified
+        path to the source file and executed in a namespace without __name__.
+        """
+        Code = compile('import sys\nFrame = sys._getframe()', FilePath, 'exec')
+        Globals = {}
+        exec(Code, Globals)
+        return Globals['Frame']
+    
+    def test_SameAsInspect(self):
+        """
+        Checks that the names of the modules of all frames in the current call
+        stack are resolved in the same manner as by inspect.getmodule().
+        
+        Test: TEST-T-120. Covers requirements: REQ-FUN-120.
+        """
+        objTest = self.TestClass()
+        Frame = sys._getframe()
+        while not (Frame is None):
+            Module = inspect.getmodule(Frame)
+            Expected = None if Module is None else Module.__name__
+            self.assertEqual(objTest.getModuleName(Frame), Expected)
+            Frame = Frame.f_back
+        del Frame
+        del Module
+        del objTest
+    
+    def test_Fallback(self):
+        """
+        Checks the fall back resolution by the source file path, its exact
+        invalidation upon the removal, addition and replacement of the modules
+        in sys.modules, and the per entry bound of the cache.
+        
+        Test: TEST-T-121. Covers requirements: REQ-FUN-121.
+        """
+        objTest = self.TestClass(MaxSize = 2)
+        Frame = self._getExecFrame(self.FakePath)
+        self.assertIsNone(objTest.getModuleName(Frame))
+        Module = types.ModuleType('ut001_fake_module')
+        Module.__file__ = self.FakePath
+        sys.modules['ut001_fake_module'] = Module
+        try:
+            self.assertEqual(objTest.getModuleName(Frame),
+                                                        'ut001_fake_module')
+        finally:
+            del sys.modules['ut001_fake_module']
+        self.assertIsNone(objTest.getModuleName(Frame))
+        for Index in range(5):
+            objTest.getModuleName(self._getExecFrame(f'fake_{Index}.py'))
+            self.assertLessEqual(len(objTest._getResolved()), 2)
+        #removal and addition with the same number of modules
+        OtherPath = os.path.join(ROOT_FOLDER, 'ut001_other_module.py')
+        OtherFrame = self._getExecFrame(OtherPath)
+        Module = types.ModuleType('ut001_fake_module')
+        Module.__file__ = self.FakePath
+        Other = types.ModuleType('ut001_other_module')
+        Other.__file__ = self.FakePath
+        sys.modules['ut001_fake_module'] = Module
+        try:
+            self.assertEqual(objTest.getModuleName(Frame),
+                                                        'ut001_fake_module')
+            del sys.modules['ut001_fake_module']
+            sys.modules['ut001_other_module'] = Other
+            self.assertEqual(objTest.getModuleName(Frame),
+                                                        'ut001_other_module')
+            #replacement under the same name with another file
+            Other = types.ModuleType('ut001_other_module')
+            Other.__file__ = OtherPath
+            sys.modules['ut001_other_module'] = Other
+            self.assertIsNone(objTest.getModuleName(Frame))
+            self.assertEqual(objTest.getModuleName(OtherFrame),
+                                                        'ut001_other_module')
+            #no re-build while sys.modules is not changed
+            Snapshot = objTest._getIndex()
+            self.assertIs(objTest._updateIndex(Snapshot), Snapshot)
+            self.assertIsNone(objTest.getModuleName(Frame))
+            self.assertIs(objTest._getIndex(), Snapshot)
+            #aliases of the same file take the place of a removed module
+            sys.modules['ut001_fake_module'] = Module
+            sys.modules['ut001_alias_module'] = Module
+            self.assertEqual(objTest.getModuleName(Frame),
+                                                        'ut001_fake_module')
+            del sys.modules['ut001_fake_module']
+            self.assertEqual(objTest.getModuleName(Frame),
+                                                        'ut001_alias_module')
+        finally:
+            for Name in ('ut001_fake_module', 'ut001_other_module',
+                                                        'ut001_alias_module'):
+                sys.modules.pop(Name, None)
+        self.assertIsNone(objTest.getModuleName(Frame))
+        self.assertIsNone(objTest.getModuleName(OtherFrame))
+        #the least recently used result is dropped
+        lstFrames = [self._getExecFrame(f'fake_{Index}.py')
+                                                        for Index in range(3)]
+        objTest.clear()
+        objTest.getModuleName(lstFrames[0])
+        objTest.getModuleName(lstFrames[1])
+        objTest.getModuleName(lstFrames[0])
+        objTest.getModuleName(lstFrames[2])
+        self.assertListEqual(list(objTest._getResolved()),
+                                                ['fake_0.py', 'fake_2.py'])
+        del lstFrames
+        del OtherFrame
+        del Frame
+        del objTest
+    
+    def test_Threads(self):
+        """
+        Checks that the memoized fall back resolution results are kept per
+        thread, and that they are invalidated in all threads by the clearing
+        of the cache.
+        
+        Test: TEST-T-122. Covers requirements: REQ-FUN-122.
+        """
+        objTest = self.TestClass()
+        Frame = self._getExecFrame(self.FakePath)
+        objTest.getModuleName(Frame)
+        self.assertEqual(len(objTest._getResolved()), 1)
+        objResolved = threading.Event()
+        objCleared = threading.Event()
+        lstResults = []
+        
+        def worker():
+            lstResults.append(len(objTest._getResolved()))
+            lstResults.append(objTest.getModuleName(Frame))
+            lstResults.append(objTest.getModuleName(sys._getframe()))
+            lstResults.append(len(objTest._getResolved()))
+            objResolved.set()
+            objCleared.wait(10)
+            lstResults.append(len(objTest._getResolved()))
+        
+        objThread = threading.Thread(target = worker)
+        objThread.start()
+        objResolved.wait(10)
+        objTest.clear()
+        objCleared.set()
+        objThread.join(10)
+        self.assertListEqual(lstResults, [0, None, __name__, 1, 0])
+        self.assertEqual(len(objTest._getResolved()), 0)
+        Threads = 8
+        lstErrors = []
+        
+        def resolver():
+            try:
+                for Index in range(200):
+                    Result = objTest.getModuleName(
+                            self._getExecFrame(f'fake_{Index % 10}.py'))
+                    if not (Result is None):
+                        lstErrors.append(Result)
+                    if objTest.getModuleName(sys._getframe()) != __name__:
+                        lstErrors.append(Index)
+                    if not (Index % 50):
+                        objTest.clear()
+            except Exception as err:
+                lstErrors.append(err)
+        
+        lstThreads = [threading.Thread(target = resolver)
+                                                    for _ in range(Threads)]
+        for objThread in lstThreads:
+            objThread.start()
+        for objThread in lstThreads:
+            objThread.join(60)
+        self.assertListEqual(lstErrors, [])
+        del Frame
+        del objTest
+
+class Test_FrameRecord(unittest.TestCase):
+    """
+    Test cases for the class introspection_lib.my_traceback.FrameRecord
+    
+    Implements tests: TEST-T-130 and TEST-T-131. Covers the requirements
+    REQ-FUN-130 and REQ-FUN-131.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.FrameRecord
+    
+    def test_TupleLike(self):
+        """
+        Checks that the record behaves as the 6-elements frame tuple - the
+        unpacking, indexing, length and comparison.
+        
+        Test: TEST-T-130. Covers requirements: REQ-FUN-130.
+        """
+        Data = ('a.py', 'f', 'a.f', 12, 1, ('x\n', 'y\n', 'z\n'))
+        objTest = self.TestClass('a.py', 'f', 'a.f', 12, 1,
+                                                    ['x\n', 'y\n', 'z\n'])
+        self.assertEqual(len(objTest), 6)
+        self.assertTupleEqual(tuple(objTest), Data)
+        FilePath, _, FullName, LineNumber, _, CodeLines = objTest
+        self.assertEqual(FilePath, 'a.py')
+        self.assertEqual(FullName, 'a.f')
+        self.assertEqual(LineNumber, 12)
+        self.assertIsInstance(CodeLines, tuple)
+        self.assertEqual(objTest[2], 'a.f')
+        self.assertTupleEqual(objTest[-2:], Data[-2:])
+        self.assertEqual(objTest, Data)
+        self.assertEqual(objTest, self.TestClass(*Data))
+        self.assertNotEqual(objTest, self.TestClass('a.py', 'f', 'a.f', 13))
+        objTest = self.TestClass('a.py', 'f', 'a.f', 12)
+        self.assertIsNone(objTest.LineIndex)
+        self.assertIsNone(objTest.CodeLines)
+        del objTest
+    
+    def test_Compact(self):
+        """
+        Checks that the records do not have the instance dictionary, that the
+        strings are shared by the records of different tracebacks, and that
+        the traceback analysis objects do not define the finalizer.
+        
+        Test: TEST-T-131. Covers requirements: REQ-FUN-131.
+        """
+        objTest = self.TestClass('a.py', 'f', 'a.f', 12)
+        self.assertFalse(hasattr(objTest, '__dict__'))
+        with self.assertRaises(AttributeError):
+            objTest.Extra = 1
+        objFirst = testmodule.StackTraceback()
+        objSecond = testmodule.StackTraceback()
+        for Frame1, Frame2 in zip(objFirst._Traceback, objSecond._Traceback):
+            self.assertIsInstance(Frame1, self.TestClass)
+            self.assertIs(Frame1.FilePath, Frame2.FilePath)
+            self.assertIs(Frame1.FullName, Frame2.FullName)
+        self.assertFalse(hasattr(testmodule.StackTraceback, '__del__'))
+        self.assertFalse(hasattr(testmodule.ExceptionTraceback, '__del__'))
+        del objTest
+        del objFirst
+        del objSecond
+
+class Test_AsyncTaskTraceback(unittest.TestCase):
+    """
+    Test cases for the class introspection_lib.my_traceback.AsyncTaskTraceback
+    
+    Implements tests: TEST-T-170, TEST-T-171, TEST-T-172 and TEST-T-173.
+    Covers the requirements REQ-FUN-170, REQ-FUN-171, REQ-FUN-172 and
+    REQ-FUN-108.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.AsyncTaskTraceback
+        cls.Chain = ['async_outer', 'async_middle', 'async_inner',
+                                                    'asyncio.locks.Event.wait']
+    
+    def checkChain(self, CallChain):
+        """
+        Helper method - checks that the call chain is async_outer() ->
+        async_middle() -> async_inner() -> asyncio.Event.wait().
+        """
+        self.assertEqual(len(CallChain), 4)
+        for Name, Expected in zip(CallChain[:3], self.Chain):
+            self.assertTrue(Name.endswith(f'.{Expected}'))
+        self.assertEqual(CallChain[-1], self.Chain[-1])
+    
+    def test_SuspendedTask(self):
+        """
+        Checks the reconstruction of the call chain of a suspended task and of
+        a coroutine, as well as the finished task and no running loop cases.
+        
+        Test: TEST-T-170. Covers requirements: REQ-FUN-170.
+        """
+        async def Main():
+            Event = asyncio.Event()
+            Task = asyncio.create_task(async_outer(Event), name = 'Worker')
+            await asyncio.sleep(0)
+            objTest = self.TestClass(Task = Task)
+            self.assertEqual(objTest.TaskName, 'Worker')
+            self.checkChain(objTest.CallChain)
+            objTest = self.TestClass(Task = Task.get_coro())
+            self.assertIsNone(objTest.TaskName)
+            self.checkChain(objTest.CallChain)
+            Event.set()
+            await Task
+            objTest = self.TestClass(Task = Task)
+            self.assertEqual(objTest.CallChain, [])
+            self.assertEqual(objTest.Info, '')
+        
+        asyncio.run(Main())
+        objTest = self.TestClass()
+        self.assertIsNone(objTest.TaskName)
+        self.assertEqual(objTest.CallChain, [])
+        objCoroutine = async_outer(None)
+        objTest = self.TestClass(Task = objCoroutine)
+        self.assertEqual(len(objTest.CallChain), 1)
+        self.assertTrue(objTest.CallChain[0].endswith('.async_outer'))
+        objCoroutine.close()
+        del objTest
+    
+    def test_CurrentTask(self):
+        """
+        Checks the call chain of the current (running) task, the rendering in
+        the normal and lazy modes, and the limit and filters.
+        
+        Test: TEST-T-171. Covers requirements: REQ-FUN-171.
+        """
+        class SubClass(self.TestClass):
+            def __init__(self, **kwargs):
+                super().__init__(**kwargs)
+        
+        def helper(clsTest, **kwargs):
+            return clsTest(**kwargs)
+        
+        async def Probe(clsTest = self.TestClass, **kwargs):
+            return clsTest(**kwargs)
+        
+        async def Main():
+            objTest = await Probe()
+            strName = asyncio.current_task().get_name()
+            self.assertEqual(objTest.TaskName, strName)
+            self.assertEqual(len(objTest.CallChain), 2)
+            self.assertTrue(objTest.CallChain[0].endswith('.Main'))
+            self.assertTrue(objTest.CallChain[1].endswith('.Probe'))
+            objTest = await Probe(SubClass)
+            self.assertEqual(len(objTest.CallChain), 2)
+            self.assertTrue(objTest.CallChain[0].endswith('.Main'))
+            self.assertTrue(objTest.CallChain[1].endswith('.Probe'))
+            for objTest in (await Probe(SkipFrames = 1),
+                            await Probe(SubClass, SkipFrames = 1),
+                            helper(self.TestClass, SkipFrames = 1),
+                            helper(SubClass, SkipFrames = 1),
+                            helper(SubClass, SkipFrames = 5)):
+                self.assertEqual(len(objTest.CallChain), 1)
+                self.assertTrue(objTest.CallChain[0].endswith('.Main'))
+            objTest = helper(SubClass)
+            self.assertEqual(len(objTest.CallChain), 2)
+            self.assertTrue(objTest.CallChain[1].endswith('.helper'))
+            Event = asyncio.Event()
+            Task = asyncio.create_task(async_outer(Event))
+            await asyncio.sleep(0)
+            objTest = self.TestClass(Task = Task)
+            objLazy = self.TestClass(Task = Task, LazyContext = True)
+            self.assertEqual(objTest.Info, objLazy.Info)
+            lstLines = objTest.Info.split('\n')
+            self.assertEqual(len(lstLines), 4 * 5)
+            self.assertTrue(lstLines[0].startswith('Caller '))
+            self.assertTrue(lstLines[0].endswith('.async_outer()'))
+            objLimited = self.TestClass(Task = Task, MaxFrames = 2)
+            self.assertEqual(objLimited.CallChain, objTest.CallChain[-2:])
+            self.assertEqual(self.TestClass(Task = Task,
+                                    Exclude = 'asyncio.*').CallChain,
+                                                        objTest.CallChain[:3])
+            Event.set()
+            await Task
+        
+        asyncio.run(Main())
+    
+    def test_AllTasks(self):
+        """
+        Checks the snapshot of all not finished tasks of the event loop.
+        
+        Test: TEST-T-172. Covers requirements: REQ-FUN-172.
+        """
+        async def Main():
+            Event = asyncio.Event()
+            lstTasks = [asyncio.create_task(async_outer(Event),
+                                name = f'Worker-{Index}') for Index in range(3)]
+            await asyncio.sleep(0)
+            lstTest = self.TestClass.fromAllTasks()
+            self.assertEqual(len(lstTest), 4)
+            self.assertEqual(len(lstTest[0].CallChain), 1)
+            self.assertTrue(lstTest[0].CallChain[0].endswith('.Main'))
+            self.assertEqual([objTest.TaskName for objTest in lstTest[-3:]],
+                                        ['Worker-0', 'Worker-1', 'Worker-2'])
+            for objTest in lstTest[-3:]:
+                self.checkChain(objTest.CallChain)
+            self.assertIs(lstTest[-1]._Traceback[-1].CodeLines,
+                                        lstTest[-2]._Traceback[-1].CodeLines)
+            self.assertEqual(lstTest[-1].Info, lstTest[-2].Info)
+            lstTest = self.TestClass.fromAllTasks(asyncio.get_running_loop(),
+                                            LazyContext = True, MaxFrames = 1)
+            self.assertEqual(len(lstTest[-1].CallChain), 1)
+            Event.set()
+            for Task in lstTasks:
+                await Task
+            lstTest = self.TestClass.fromAllTasks()
+            self.assertEqual(len(lstTest), 1)
+        
+        asyncio.run(Main())
+        with self.assertRaises(RuntimeError):
+            self.TestClass.fromAllTasks()
+    
+    def test_Serialization(self):
+        """
+        Checks that the task name is preserved by the binary serialization and
+        the pickling.
+        
+        Test: TEST-T-173. Covers requirements: REQ-FUN-108.
+        """
+        async def Main():
+            Event = asyncio.Event()
+            Task = asyncio.create_task(async_outer(Event), name = 'Worker')
+            await asyncio.sleep(0)
+            objTest = self.TestClass(Task = Task)
+            Event.set()
+            await Task
+            return objTest
+        
+        objTest = asyncio.run(Main())
+        for objCopy in (self.TestClass.fromBytes(objTest.toBytes()),
+                                        pickle.loads(pickle.dumps(objTest))):
+            self.assertIsInstance(objCopy, self.TestClass)
+            self.assertEqual(objCopy.TaskName, 'Worker')
+            self.checkChain(objCopy.CallChain)
+            self.assertEqual(objCopy.Info, objTest.Info)
+        objTest = self.TestClass()
+        objCopy = self.TestClass.fromBytes(objTest.toBytes())
+        self.assertIsNone(objCopy.TaskName)
+        self.assertEqual(objCopy.CallChain, [])
+        with self.assertRaises(ValueError):
+            testmodule.StackTraceback.fromBytes(objTest.toBytes())
+
+class Test_ThreadStacksSnapshot(unittest.TestCase):
+    """
+    Test cases for the class introspection_lib.my_traceback.ThreadStacksSnapshot
+    
+    Implements tests: TEST-T-160 and TEST-T-161. Covers the requirements
+    REQ-FUN-160 and REQ-FUN-161.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.ThreadStacksSnapshot
+    
+    def setUp(self):
+        """
+        Starts several threads blocked in the same call chain.
+        """
+        self.Event = threading.Event()
+        self.Threads = [threading.Thread(target = waiting,
+                                        args = (self.Event, ), daemon = Flag,
+                                        name = f'Blocked-{Index}')
+                            for Index, Flag in enumerate((False, True, False))]
+        for Thread in self.Threads:
+            Thread.start()
+    
+    def tearDown(self):
+        """
+        Releases the blocked threads.
+        """
+        self.Event.set()
+        for Thread in self.Threads:
+            Thread.join()
+    
+    def test_AllThreads(self):
+        """
+        Checks that the stacks of all threads are captured, including the
+        current thread without the instantiation method's frame, and that the
+        threads are properly identified.
+        
+        Test: TEST-T-160. Covers requirements: REQ-FUN-160.
+        """
+        objTest = self.TestClass()
+        lstIds = objTest.ThreadIds
+        self.assertEqual(len(objTest), len(lstIds))
+        self.assertEqual(lstIds[0], threading.main_thread().ident)
+        for Thread in self.Threads:
+            self.assertIn(Thread.ident, lstIds)
+            self.assertEqual(objTest.getThreadName(Thread.ident), Thread.name)
+            objTraceback = objTest.getTraceback(Thread.ident)
+            self.assertIsInstance(objTraceback, testmodule.StackTraceback)
+            lstChain = objTraceback.CallChain
+            self.assertEqual(lstChain[-2:], ['threading.Event.wait',
+                                                'threading.Condition.wait'])
+            self.assertTrue(lstChain[-4].endswith('.waiting'))
+            self.assertTrue(lstChain[-3].endswith('.blocked'))
+        lstChain = testmodule.StackTraceback().CallChain
+        self.assertEqual(objTest.getTraceback(threading.get_ident()).CallChain,
+                                                                    lstChain)
+        self.assertIsNone(objTest.getTraceback(-1))
+        self.assertIsNone(objTest.getThreadName(-1))
+        del objTest
+    
+    def test_Info(self):
+        """
+        Checks the human-readable representation of the stacks, its identity
+        in the normal and lazy modes, and the sharing of the retrieved source
+        code sniplets.
+        
+        Test: TEST-T-161. Covers requirements: REQ-FUN-161.
+        """
+        objTest, objLazy = self.TestClass(), self.TestClass(LazyContext= True)
+        strInfo = objTest.Info
+        self.assertEqual(objLazy.Info, strInfo)
+        lstLines = list(objTest.iterInfo())
+        self.assertEqual('\n'.join(lstLines), strInfo)
+        objStream = io.StringIO()
+        objTest.writeInfo(objStream)
+        self.assertEqual(objStream.getvalue(), strInfo)
+        lstSections = strInfo.split('\n\n')
+        self.assertEqual(len(lstSections), len(objTest))
+        for ThreadId, Section in zip(objTest.ThreadIds, lstSections):
+            strHeader, _, strBody = Section.partition('\n')
+            self.assertIn(f'(id {ThreadId}', strHeader)
+            self.assertEqual(strBody, objTest.getTraceback(ThreadId).Info)
+        self.assertTrue(lstSections[1].startswith(
+                        f'Thread Blocked-0 (id {self.Threads[0].ident})\n'))
+        self.assertTrue(lstSections[2].startswith(
+                f'Thread Blocked-1 (id {self.Threads[1].ident}, daemon)\n'))
+        objWidth = self.TestClass(ConsoleWidth = 30, ContextLength = 1)
+        for Line in objWidth.iterInfo():
+            if Line.startswith(('>', ' ')):
+                self.assertLessEqual(len(Line), 30)
+        lstFirst = objTest.getTraceback(self.Threads[0].ident)._Traceback
+        lstLast = objTest.getTraceback(self.Threads[2].ident)._Traceback
+        self.assertIs(lstFirst[-1].CodeLines, lstLast[-1].CodeLines)
+        del objTest
+        del objLazy
+        del objWidth
+
+class Test_TracebackStore(unittest.TestCase):
+    """
+    Test cases for the class introspection_lib.my_traceback.TracebackStore
+    
+    Implements tests: TEST-T-140, TEST-T-141 and TEST-T-142. Covers the
+    requirements REQ-FUN-140, REQ-FUN-141 and REQ-AWM-140.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.TracebackStore
+    
+    def test_Interning(self):
+        """
+        Checks that the identical tracebacks are stored only once with the
+        proper counters and timestamps, and that the Info is rendered once.
+        
+        Test: TEST-T-140. Covers requirements: REQ-FUN-140, REQ-AWM-140.
+        """
+        objTest = self.TestClass()
+        lstErrors = []
+        for _ in range(5):
+            try:
+                outer()
+            except ValueError as err:
+                lstErrors.append(err)
+        lstFingerprints = [objTest.addException(Error) for Error in lstErrors]
+        self.assertEqual(len(set(lstFingerprints)), 1)
+        strFingerprint = lstFingerprints[0]
+        try:
+            middle()
+        except ValueError as err:
+            strOther = objTest.add(testmodule.ExceptionTraceback(
+                                            FromTraceback = err.__traceback__))
+        self.assertEqual(len(objTest), 2)
+        self.assertEqual(objTest.Size, 2)
+        self.assertIn(strFingerprint, objTest)
+        self.assertEqual(objTest.getCount(strFingerprint), 5)
+        self.assertEqual(objTest.getCount(strOther), 1)
+        self.assertEqual(objTest.getCount('unknown'), 0)
+        lstStatistics = objTest.getStatistics()
+        self.assertEqual(lstStatistics[0][:2], (strFingerprint, 5))
+        self.assertLessEqual(lstStatistics[0][2], lstStatistics[0][3])
+        self.assertEqual(lstStatistics[1][:2], (strOther, 1))
+        strInfo = objTest.getInfo(strFingerprint)
+        self.assertEqual(strInfo,
+                            objTest.get(strFingerprint).Info)
+        self.assertIs(objTest.getInfo(strFingerprint), strInfo)
+        self.assertIsNone(objTest.getInfo('unknown'))
+        self.assertIsNone(objTest.get('unknown'))
+        with self.assertRaises(TypeError):
+            objTest.add(lstErrors[0])
+        objTest.clear()
+        self.assertEqual(len(objTest), 0)
+        del objTest
+        del lstErrors
+    
+    def test_Bounded(self):
+        """
+        Checks that the number of the stored tracebacks is bounded, and the
+        least recently seen ones are discarded.
+        
+        Test: TEST-T-141. Covers requirements: REQ-FUN-141.
+        """
+        def Capture(Kind):
+            if Kind == 0:
+                Result = testmodule.StackTraceback()
+            elif Kind == 1:
+                Result = testmodule.StackTraceback()
+            else:
+                Result = testmodule.StackTraceback()
+            return Result
+        
+        objTest = self.TestClass(MaxSize = 2)
+        lstFingerprints = [objTest.add(Capture(Kind)) for Kind in (0, 1, 1)]
+        self.assertEqual(len(set(lstFingerprints)), 2)
+        self.assertEqual(len(objTest), 2)
+        strThird = objTest.add(Capture(2))
+        self.assertEqual(len(objTest), 2)
+        self.assertNotIn(lstFingerprints[0], objTest)
+        self.assertIn(lstFingerprints[1], objTest)
+        self.assertIn(strThird, objTest)
+        self.assertEqual(objTest.getCount(lstFingerprints[1]), 2)
+        del objTest
+    
+    def test_Concurrent(self):
+        """
+        Checks that the concurrent requests of the same traceback render it
+        only once, whilst the store is being modified, and that a failed
+        rendering is repeated upon the next request.
+        
+        Test: TEST-T-142. Covers requirements: REQ-FUN-140, REQ-FUN-141.
+        """
+        class SlowTraceback(testmodule.StackTraceback):
+            Calls = 0
+            Fails = False
+            
+            @property
+            def Info(self):
+                SlowTraceback.Calls += 1
+                time.sleep(0.05)
+                if SlowTraceback.Fails:
+                    SlowTraceback.Fails = False
+                    raise RuntimeError('rendering failed')
+                return 'rendered'
+        
+        objTest = self.TestClass(MaxSize = 4)
+        strFingerprint = objTest.add(SlowTraceback())
+        objBarrier = threading.Barrier(8)
+        lstResults = []
+        
+        def worker(Index):
+            objBarrier.wait()
+            if Index % 2:
+                lstResults.append(objTest.getInfo(strFingerprint))
+            else:
+                for _ in range(100):
+                    objTest.add(testmodule.StackTraceback(LazyContext = True))
+                    objTest.getCount(strFingerprint)
+        
+        lstThreads = [threading.Thread(target = worker, args = (Index, ))
+                                                    for Index in range(8)]
+        for objThread in lstThreads:
+            objThread.start()
+        for objThread in lstThreads:
+            objThread.join()
+        self.assertEqual(lstResults, ['rendered'] * 4)
+        self.assertEqual(SlowTraceback.Calls, 1)
+        SlowTraceback.Calls = 0
+        SlowTraceback.Fails = True
+        objTest.clear()
+        strFingerprint = objTest.add(SlowTraceback())
+        with self.assertRaises(RuntimeError):
+            objTest.getInfo(strFingerprint)
+        self.assertEqual(objTest.getInfo(strFingerprint), 'rendered')
+        self.assertEqual(SlowTraceback.Calls, 2)
+        del objTest
+
+class Test_StackSampler(unittest.TestCase):
+    """
+    Test cases for the class introspection_lib.my_traceback.StackSampler
+    
+    Implements tests: TEST-T-150, TEST-T-151 and TEST-T-152. Covers the
+    requirements REQ-FUN-150, REQ-FUN-151 and REQ-FUN-152.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.StackSampler
+    
+    def setUp(self):
+        """
+        Starts two threads blocked in the different call chains.
+        """
+        self.Event = threading.Event()
+        self.First = threading.Thread(target = waiting, args = (self.Event, ))
+        self.Second = threading.Thread(target = blocked, args = (self.Event, ))
+        self.First.start()
+        self.Second.start()
+    
+    def tearDown(self):
+        """
+        Releases the blocked threads.
+        """
+        self.Event.set()
+        self.First.join()
+        self.Second.join()
+    
+    def test_CollapsedStacks(self):
+        """
+        Checks the aggregation of the sampled call paths, the collapsed stacks
+        format, the threads selection and the max depth.
+        
+        Test: TEST-T-150. Covers requirements: REQ-FUN-150, REQ-FUN-151.
+        """
+        objTest = self.TestClass(Threads = [self.First, self.Second.ident])
+        for _ in range(3):
+            objTest.sample()
+        self.assertEqual(objTest.Samples, 3)
+        dictCounts = objTest.getCounts()
+        self.assertEqual(sum(dictCounts.values()), 6)
+        lstFirst = [Path for Path in dictCounts
+                            if any(Name.endswith('.waiting') for Name in Path)]
+        self.assertEqual(len(lstFirst), 1)
+        tupPath = lstFirst[0]
+        self.assertEqual(dictCounts[tupPath], 3)
+        self.assertTrue(tupPath[0].startswith('threading.Thread.'))
+        intIndex = [Name.endswith('.waiting') for Name in tupPath].index(True)
+        self.assertTrue(tupPath[intIndex + 1].endswith('.blocked'))
+        self.assertEqual(tupPath[-1], 'threading.Condition.wait')
+        for Path in dictCounts:
+            self.assertNotIn('test_CollapsedStacks',
+                                        ' '.join(Path)) #own thread excluded
+        lstLines = objTest.getCollapsed()
+        self.assertEqual(len(lstLines), len(dictCounts))
+        self.assertIn('{} 3'.format(';'.join(tupPath)), lstLines)
+        objStream = io.StringIO()
+        objTest.writeCollapsed(objStream)
+        self.assertEqual(objStream.getvalue(), '\n'.join(lstLines) + '\n')
+        objTest = self.TestClass(Threads = [self.First], MaxDepth = 2)
+        objTest.sample()
+        tupPath = ('threading.Event.wait', 'threading.Condition.wait')
+        self.assertEqual(objTest.getCounts(), {tupPath : 1})
+        objTest.clear()
+        self.assertEqual(objTest.Samples, 0)
+        self.assertEqual(objTest.getCounts(), {})
+        self.assertEqual(objTest.getCollapsed(), [])
+        del objTest
+    
+    def test_Background(self):
+        """
+        Checks the periodic sampling in the background thread.
+        
+        Test: TEST-T-151. Covers requirements: REQ-FUN-150, REQ-FUN-152.
+        """
+        objTest = self.TestClass(Interval = 0.001, Threads = [self.First])
+        self.assertFalse(objTest.IsRunning)
+        self.assertEqual(objTest.Overhead, 0.0)
+        with objTest:
+            self.assertTrue(objTest.IsRunning)
+            objTest.start() #no effect
+            while objTest.Samples < 5:
+                self.Event.wait(0.01)
+        self.assertFalse(objTest.IsRunning)
+        objTest.stop() #no effect
+        intSamples = objTest.Samples
+        self.assertGreaterEqual(intSamples, 5)
+        self.assertEqual(sum(objTest.getCounts().values()), intSamples)
+        self.assertGreater(objTest.Overhead, 0.0)
+        self.assertLess(objTest.Overhead, 1.0)
+        self.Event.wait(0.01)
+        self.assertEqual(objTest.Samples, intSamples)
+        del objTest
+    
+    def test_NamesCache(self):
+        """
+        Checks that the bounded cache of the callers' names drops the least
+        recently used entries instead of being cleared.
+        
+        Test: TEST-T-152. Covers requirements: REQ-FUN-150.
+        """
+        objTest = self.TestClass(Threads = [self.First])
+        objTest.sample()
+        intSize = len(objTest._Names)
+        self.assertGreater(intSize, 2)
+        objTest = self.TestClass(Threads = [self.First])
+        intOldSize = testmodule.ModuleNameResolver.MaxSize
+        testmodule.ModuleNameResolver.MaxSize = intSize
+        try:
+            objTest.sample()
+            lstCodes = list(objTest._Names)
+            self.assertEqual(len(lstCodes), intSize)
+            objOwn = sys._getframe()
+            objTest._getName(objOwn)
+            self.assertEqual(list(objTest._Names),
+                                            lstCodes[1:] + [objOwn.f_code])
+            #the sampled names are used, the own one is the least recent
+            objTest.sample()
+            self.assertEqual(len(objTest._Names), intSize)
+            self.assertNotIn(objOwn.f_code, objTest._Names)
+            self.assertEqual(list(objTest._Names), lstCodes)
+        finally:
+            testmodule.ModuleNameResolver.MaxSize = intOldSize
+        del objOwn
+        del objTest
+
+class Test_ChainedExceptionTraceback(unittest.TestCase):
+    """
+    Test cases for the class
+    introspection_lib.my_traceback.ChainedExceptionTraceback
+    
+    Implements tests: TEST-T-180, TEST-T-181 and TEST-T-182. Covers the
+    requirements REQ-FUN-180, REQ-FUN-181 and REQ-FUN-182.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.ChainedExceptionTraceback
+    
+    def test_Chain(self):
+        """
+        Checks the order of the chained exceptions (causes, contexts and the
+        members of the exception groups), the suppression of the context and
+        the breaking of the loops.
+        
+        Test: TEST-T-180. Covers requirements: REQ-FUN-180.
+        """
+        try:
+            try:
+                try:
+                    outer()
+                except ValueError as err:
+                    raise TypeError('wrapper') from err
+            except TypeError:
+                raise KeyError('handler')
+        except KeyError:
+            objTest = self.TestClass()
+        self.assertEqual(len(objTest), 3)
+        self.assertEqual(objTest.Exceptions, ['ValueError',
+                                'TypeError: wrapper', "KeyError: 'handler'"])
+        lstTracebacks = objTest.Tracebacks
+        for objTraceback in lstTracebacks:
+            self.assertIsInstance(objTraceback, testmodule.ExceptionTraceback)
+        self.assertEqual(lstTracebacks[0].CallChain[-3:],
+                            [f'{__name__}.outer', f'{__name__}.middle',
+                                                        f'{__name__}.inner'])
+        strInfo = objTest.Info
+        self.assertIn('\n\nThe above exception was the direct cause of the',
+                                                                    strInfo)
+        self.assertIn('\n\nDuring handling of the above exception, another',
+                                                                    strInfo)
+        self.assertTrue(strInfo.endswith("\nKeyError: 'handler'"))
+        try:
+            try:
+                outer()
+            except ValueError:
+                raise TypeError('wrapper') from None
+        except TypeError as err:
+            objTest = self.TestClass(FromException = err)
+        self.assertEqual(objTest.Exceptions, ['TypeError: wrapper'])
+        objFirst, objSecond = ValueError('first'), ValueError('second')
+        objFirst.__context__ = objSecond
+        objSecond.__context__ = objFirst
+        objTest = self.TestClass(FromException = objFirst)
+        self.assertEqual(objTest.Exceptions, ['ValueError: second',
+                                                        'ValueError: first'])
+        self.assertEqual(objTest.Tracebacks[0].CallChain, [])
+        lstErrors = []
+        for Index in range(2):
+            try:
+                outer()
+            except ValueError as err:
+                lstErrors.append(err)
+        lstErrors[1].__cause__ = KeyError('cause')
+        objGroup = ExceptionGroup('group', lstErrors)
+        objTest = self.TestClass(FromException = objGroup)
+        self.assertEqual(objTest.Exceptions, [
+                            'ExceptionGroup: group (2 sub-exceptions)',
+                            'ValueError', "KeyError: 'cause'", 'ValueError'])
+        strInfo = objTest.Info
+        self.assertIn('Sub-exception 1 of 2 of the exception group', strInfo)
+        self.assertIn('Sub-exception 2 of 2 of the exception group', strInfo)
+        self.assertEqual(len(self.TestClass()), 0)
+        self.assertEqual(self.TestClass().Info, '')
+        self.assertEqual(len(self.TestClass(FromException = 1)), 0)
+        del objTest
+        del objGroup
+        del lstErrors
+    
+    def test_SharedFrames(self):
+        """
+        Checks that the frames shared between the chained tracebacks are
+        stored only once, and that they are rendered only once in the combined
+        report.
+        
+        Test: TEST-T-181. Covers requirements: REQ-FUN-181.
+        """
+        try:
+            outer()
+        except ValueError as err:
+            objError = err
+        objWrapper = TypeError('wrapper').with_traceback(
+                                                        objError.__traceback__)
+        objWrapper.__cause__ = objError
+        objTest = self.TestClass(FromException = objWrapper)
+        lstFirst, lstSecond = [Item._Traceback for Item in objTest.Tracebacks]
+        self.assertEqual(len(lstFirst), 4)
+        self.assertEqual(len(lstSecond), 4)
+        for Index in range(4):
+            self.assertIs(lstFirst[Index], lstSecond[Index])
+        strInfo = objTest.Info
+        self.assertTrue(strInfo.endswith('\n'.join([
+                'The above exception was the direct cause of the following '
+                + 'exception:', '', '... 4 frames shared with the traceback '
+                + 'above', 'TypeError: wrapper'])))
+        self.assertEqual(strInfo.count(f'Caller {__name__}.inner()'), 1)
+        self.assertEqual(objTest.Tracebacks[1].Info,
+                                            objTest.Tracebacks[0].Info)
+        lstErrors = []
+        for Index in range(3):
+            try:
+                outer()
+            except ValueError as err:
+                lstErrors.append(err)
+        objTest = self.TestClass(FromException = ExceptionGroup('group',
+                                                                lstErrors))
+        lstTracebacks = objTest.Tracebacks
+        for objTraceback in lstTracebacks[2:]:
+            for Index, Record in enumerate(objTraceback._Traceback):
+                self.assertIs(Record, lstTracebacks[1]._Traceback[Index])
+        self.assertEqual(objTest.Info.count(f'Caller {__name__}.inner()'), 1)
+        self.assertEqual(objTest.Info.count(
+                                '... 4 frames shared with the traceback'), 2)
+        del objTest
+        del objError
+        del objWrapper
+        del lstErrors
+    
+    def test_Options(self):
+        """
+        Checks the lazy mode, the limitation and filtering of the frames, and
+        the streaming output of the combined report.
+        
+        Test: TEST-T-182. Covers requirements: REQ-FUN-182.
+        """
+        try:
+            try:
+                outer()
+            except ValueError as err:
+                raise TypeError('wrapper') from err
+        except TypeError as err:
+            objTest = self.TestClass(FromException = err)
+            objLazy = self.TestClass(FromException = err, LazyContext = True)
+            objLimited = self.TestClass(FromException = err, MaxFrames = 1)
+            objIncluded = self.TestClass(FromException = err,
+                                                        Include = __name__)
+            objExcluded = self.TestClass(FromException = err,
+                                                        Exclude = __name__)
+            objShort = self.TestClass(FromException = err, ContextLength = 1,
+                                                            ConsoleWidth = 30)
+        self.assertIsNone(objLazy.Tracebacks[0]._Traceback[-1].CodeLines)
+        strInfo = objTest.Info
+        self.assertEqual(objLazy.Info, strInfo)
+        self.assertEqual('\n'.join(objTest.iterInfo()), strInfo)
+        objStream = io.StringIO()
+        objTest.writeInfo(objStream)
+        self.assertEqual(objStream.getvalue(), strInfo)
+        self.assertEqual([len(Item.CallChain)
+                                for Item in objLimited.Tracebacks], [1, 1])
+        self.assertEqual(objLimited.Tracebacks[0].CallChain,
+                                                        [f'{__name__}.inner'])
+        for objTraceback in objIncluded.Tracebacks:
+            for strName in objTraceback.CallChain:
+                self.assertTrue(strName.startswith(f'{__name__}.'))
+        self.assertEqual(objIncluded.Tracebacks[0].CallChain[-3:],
+                            [f'{__name__}.outer', f'{__name__}.middle',
+                                                        f'{__name__}.inner'])
+        for objTraceback in objExcluded.Tracebacks:
+            self.assertEqual(objTraceback.CallChain, [])
+        for Line in objShort.iterInfo():
+            if Line.startswith(('>', ' ')):
+                self.assertLessEqual(len(Line), 30)
+                self.assertTrue(Line.startswith('>'))
+        del objTest
+        del objLazy
+        del objLimited
+        del objIncluded
+        del objExcluded
+        del objShort
+
+class Test_CapturePolicy(unittest.TestCase):
+    """
+    Test cases for the class introspection_lib.my_traceback.CapturePolicy
+    and its use by the traceback classes.
+    
+    Implements tests: TEST-T-190 and TEST-T-191. Covers the requirements
+    REQ-FUN-190 and REQ-FUN-191.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.CapturePolicy
+    
+    def tearDown(self):
+        """
+        Removes the process-wide policy after each test.
+        """
+        testmodule.StackTraceback.Policy = None
+    
+    def test_Modes(self):
+        """
+        Checks the decisions of the policy in all modes, the statistics and
+        the improper arguments.
+        
+        Test: TEST-T-190. Covers requirements: REQ-FUN-190.
+        """
+        objTest = self.TestClass()
+        self.assertEqual(objTest.Mode, 'always')
+        self.assertEqual([objTest.allow('a') for _ in range(5)], [True] * 5)
+        objTest = self.TestClass('never')
+        self.assertEqual([objTest.allow('a') for _ in range(5)], [False] * 5)
+        self.assertEqual((objTest.Allowed, objTest.Declined), (0, 5))
+        objTest.reset()
+        self.assertEqual((objTest.Allowed, objTest.Declined), (0, 0))
+        objTest = self.TestClass('sample', SampleEvery = 3)
+        self.assertEqual(objTest.Description, 'sample 1 in 3')
+        self.assertEqual([objTest.allow(Index) for Index in range(7)],
+                                [True, False, False, True, False, False, True])
+        self.assertEqual((objTest.Allowed, objTest.Declined), (3, 4))
+        objTest = self.TestClass('bucket', Rate = 0.001, Burst = 2)
+        self.assertEqual(objTest.Description, 'bucket 0.001/s burst 2')
+        self.assertEqual([objTest.allow('a') for _ in range(3)],
+                                                        [True, True, False])
+        self.assertEqual([objTest.allow('b') for _ in range(3)],
+                                                        [True, True, False])
+        objTest = self.TestClass('bucket', Rate = 1000, Burst = 1)
+        self.assertTrue(objTest.allow('a'))
+        self.assertFalse(objTest.allow('a'))
+        time.sleep(0.01)
+        self.assertTrue(objTest.allow('a'))
+        objTest = self.TestClass('bucket', Burst = 1, MaxSites = 2)
+        self.assertTrue(objTest.allow('a'))
+        self.assertTrue(objTest.allow('b'))
+        self.assertTrue(objTest.allow('c')) #shared overflow bucket
+        self.assertFalse(objTest.allow('a'))
+        self.assertFalse(objTest.allow('d'))
+        objTest = self.TestClass('bucket', Rate = 0.001, Burst = 1,
+                                                                MaxSites = 2)
+        for _ in range(10):
+            for Site in ('a', 'b', 'c'):
+                objTest.allow(Site)
+        self.assertEqual((objTest.Allowed, objTest.Declined), (3, 27))
+        for dictOptions, Stripes in (({}, 16), ({'MaxSites' : 40}, 2),
+                            ({'Stripes' : 4}, 4), ({'Stripes' : 0}, 16),
+                            ({'MaxSites' : 40, 'Stripes' : 1}, 1)):
+            objTest = self.TestClass('bucket', **dictOptions)
+            self.assertEqual(len(objTest._Stripes), Stripes)
+            self.assertEqual(sum(Limit for _, _, Limit in objTest._Stripes),
+                                                            objTest._MaxSites)
+        for Mode, dictOptions, Expected in (('always', {}, 4000),
+                        ('never', {}, 0), ('sample', {'SampleEvery' : 4}, 1000),
+                        ('bucket', {'Rate' : 0.001, 'Burst' : 5}, 500)):
+            objTest = self.TestClass(Mode, **dictOptions)
+            objBarrier = threading.Barrier(4)
+            
+            def worker():
+                objBarrier.wait()
+                for Index in range(1000):
+                    objTest.allow(Index % 100)
+            
+            lstThreads = [threading.Thread(target = worker) for _ in range(4)]
+            for objThread in lstThreads:
+                objThread.start()
+            for objThread in lstThreads:
+                objThread.join()
+            self.assertEqual((objTest.Allowed, objTest.Declined),
+                                                    (Expected, 4000 - Expected))
+            objTest.reset()
+            self.assertEqual((objTest.Allowed, objTest.Declined), (0, 0))
+        #sampling is counted per thread - the same pattern in each thread
+        objTest = self.TestClass('sample', SampleEvery = 7)
+        lstPatterns = []
+        for _ in range(2):
+            objBarrier = threading.Barrier(32)
+
+            def worker():
+                objBarrier.wait()
+                lstPatterns.append([objTest.allow(None)
+                                                    for _ in range(1000)])
+
+            lstThreads = [threading.Thread(target = worker)
+                                                            for _ in range(32)]
+            for objThread in lstThreads:
+                objThread.start()
+            for objThread in lstThreads:
+                objThread.join()
+        self.assertEqual(len(lstPatterns), 64)
+        for lstPattern in lstPatterns:
+            self.assertEqual([Index for Index, bAllowed in enumerate(lstPattern)
+                                        if bAllowed], list(range(0, 1000, 7)))
+        self.assertEqual((objTest.Allowed, objTest.Declined),
+                                                        (64 * 143, 64 * 857))
+        objTest.reset()
+        self.assertEqual((objTest.Allowed, objTest.Declined), (0, 0))
+        self.assertEqual([objTest.allow(None) for _ in range(8)],
+                                            [True] + [False] * 6 + [True])
+        objTest = self.TestClass('sample', SampleEvery = 0, Rate = -1)
+        self.assertEqual(objTest.Description,
+                                f'sample 1 in {self.TestClass.SampleEvery}')
+        for Mode in ('sometimes', 'Always', ''):
+            with self.assertRaises(ValueError):
+                self.TestClass(Mode)
+        for Mode in (None, 1, ['always']):
+            with self.assertRaises(TypeError):
+                self.TestClass(Mode)
+        del objTest
+    
+    def test_Placeholder(self):
+        """
+        Checks that the stack and exception tracebacks store the placeholder
+        with the raise site frame if the capture is declined by the policy.
+        
+        Test: TEST-T-191. Covers requirements: REQ-FUN-191.
+        """
+        strThis = f'{__name__}.{self.__class__.__name__}.test_Placeholder'
+        objPolicy = self.TestClass('never')
+        testmodule.StackTraceback.Policy = objPolicy
+        objStack = testmodule.StackTraceback(CaptureLocals = True)
+        try:
+            outer()
+        except ValueError:
+            objError = testmodule.ExceptionTraceback(CaptureLocals = True)
+            objSkipped = testmodule.ExceptionTraceback(SkipFrames = 2)
+        self.assertEqual(objPolicy.Declined, 3)
+        self.assertEqual(objStack.CallChain, [strThis])
+        self.assertEqual(objError.CallChain, [f'{__name__}.inner'])
+        self.assertEqual(objSkipped.CallChain, [f'{__name__}.outer'])
+        for objTest in (objStack, objError, objSkipped):
+            self.assertTrue(objTest.IsPlaceholder)
+            self.assertEqual(objTest.Locals, [])
+            strInfo = objTest.Info
+            self.assertTrue(strInfo.startswith(
+                        'Traceback is not captured (policy: never)\nCaller '))
+            objCopy = pickle.loads(pickle.dumps(objTest))
+            self.assertTrue(objCopy.IsPlaceholder)
+            self.assertEqual(objCopy.Info, strInfo)
+        testmodule.StackTraceback.Policy = self.TestClass('sample',
+                                                            SampleEvery = 2)
+        objFirst = testmodule.StackTraceback()
+        objSecond = testmodule.StackTraceback()
+        self.assertFalse(objFirst.IsPlaceholder)
+        self.assertGreater(len(objFirst.CallChain), 1)
+        self.assertTrue(objSecond.IsPlaceholder)
+        testmodule.StackTraceback.Policy = None
+        objTest = testmodule.StackTraceback()
+        self.assertFalse(objTest.IsPlaceholder)
+        self.assertFalse(objTest.Info.startswith('Traceback is not captured'))
+        del objStack
+        del objError
+        del objSkipped
+        del objCopy
+        del objFirst
+        del objSecond
+        del objTest
+
+class Test_CallPathTrie(unittest.TestCase):
+    """
+    Test cases for the class introspection_lib.my_traceback.CallPathTrie
+    
+    Implements tests: TEST-T-195 and TEST-T-196. Covers the requirements
+    REQ-FUN-195, REQ-FUN-196 and REQ-AWM-195.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.CallPathTrie
+    
+    def getFilled(self):
+        """
+        Helper method, returns a trie with the known paths and counts.
+        """
+        objTest = self.TestClass()
+        objTest.add(['a', 'b', 'c'])
+        objTest.add(('a', 'b', 'c'), 3)
+        objTest.add(['a', 'b'])
+        objTest.add(['a', 'x'], 2)
+        objTest.add(['y'])
+        return objTest
+    
+    def test_Counts(self):
+        """
+        Checks the registration of the paths, the counts per prefix and the
+        hottest paths.
+        
+        Test: TEST-T-195. Covers requirements: REQ-FUN-195.
+        """
+        objTest = self.TestClass()
+        self.assertEqual((len(objTest), objTest.Total, objTest.Size), (0, 0, 0))
+        self.assertEqual(objTest.getTop(5), [])
+        objTest = self.getFilled()
+        self.assertEqual((len(objTest), objTest.Total, objTest.Size), (4, 8, 5))
+        self.assertEqual(objTest.getCount(['a']), 7)
+        self.assertEqual(objTest.getCount(['a', 'b']), 5)
+        self.assertEqual(objTest.getCount(['a', 'b', 'c']), 4)
+        self.assertEqual(objTest.getCount([]), 8)
+        self.assertEqual(objTest.getCount(['b']), 0)
+        self.assertEqual(objTest.getCount(['a', 'b', 'c', 'd']), 0)
+        self.assertEqual(objTest.getTop(2),
+                                    [(('a', 'b', 'c'), 4), (('a', 'x'), 2)])
+        self.assertEqual(objTest.getTop(5, Prefix = ['a', 'b']),
+                                    [(('a', 'b', 'c'), 4), (('a', 'b'), 1)])
+        self.assertEqual(objTest.getTop(5, Prefix = ['z']), [])
+        try:
+            outer()
+        except ValueError as err:
+            objTest.addException(err)
+            objTest.addException(err)
+            objTraceback = testmodule.ExceptionTraceback()
+        objTest.add(objTraceback, 3)
+        lstPath, intCount = objTest.getTop(1)[0]
+        self.assertEqual(intCount, 5)
+        self.assertEqual(list(lstPath), objTraceback.CallChain)
+        self.assertEqual(objTest.getCount(objTraceback), 5)
+        self.assertEqual(lstPath[-3:], (f'{__name__}.outer',
+                                f'{__name__}.middle', f'{__name__}.inner'))
+        objTest.clear()
+        self.assertEqual((len(objTest), objTest.Total, objTest.Size), (0, 0, 0))
+        for Value in (1, 'abc', ['a', 1], None, {'a' : 1}):
+            with self.assertRaises(TypeError):
+                objTest.add(Value)
+            with self.assertRaises(TypeError):
+                objTest.getCount(Value)
+        for Value in (1.0, '1', True, None):
+            with self.assertRaises(TypeError):
+                objTest.add(['a'], Value)
+            with self.assertRaises(TypeError):
+                objTest.getTop(Value)
+        for Value in (0, -1):
+            with self.assertRaises(ValueError):
+                objTest.add(['a'], Value)
+            with self.assertRaises(ValueError):
+                objTest.getTop(Value)
+        self.assertEqual(objTest.Total, 0)
+        del objTest
+        del objTraceback
+    
+    def test_MergeSerialization(self):
+        """
+        Checks the merging of the tries and their serialization.
+        
+        Test: TEST-T-196. Covers requirements: REQ-FUN-196, REQ-AWM-195.
+        """
+        objTest = self.getFilled()
+        bData = objTest.toBytes()
+        self.assertIsInstance(bData, bytes)
+        for objCopy in (self.TestClass.fromBytes(bData),
+                        self.TestClass.fromBytes(bytearray(bData)),
+                        pickle.loads(pickle.dumps(objTest))):
+            self.assertIsInstance(objCopy, self.TestClass)
+            self.assertEqual((len(objCopy), objCopy.Total, objCopy.Size),
+                                                                    (4, 8, 5))
+            self.assertEqual(objCopy.getTop(10), objTest.getTop(10))
+            self.assertEqual(objCopy.getCount(['a', 'b']), 5)
+            self.assertEqual(objCopy.toBytes(), bData)
+        objCopy = self.TestClass.fromBytes(self.TestClass().toBytes())
+        self.assertEqual((len(objCopy), objCopy.Total, objCopy.Size), (0, 0, 0))
+        objOther = self.TestClass()
+        objOther.add(['a', 'b', 'c'], 2)
+        objOther.add(['a', 'z'])
+        objTest.merge(objOther)
+        self.assertEqual((len(objTest), objTest.Total, objTest.Size),
+                                                                    (5, 11, 6))
+        self.assertEqual(objTest.getTop(2),
+                                    [(('a', 'b', 'c'), 6), (('a', 'x'), 2)])
+        self.assertEqual(objTest.getCount(['a']), 10)
+        objTest.merge(objTest)
+        self.assertEqual(objTest.Total, 22)
+        self.assertEqual(objOther.Total, 3)
+        for Value in (None, 1, ['a'], testmodule.TracebackStore()):
+            with self.assertRaises(TypeError):
+                objTest.merge(Value)
+        for Value in (None, 1, 'CT\x01', [1, 2]):
+            with self.assertRaises(TypeError):
+                self.TestClass.fromBytes(Value)
+        for Value in (b'', b'CT\x7f\x00\x00\x00', bData[:-1], bData + b'\x00',
+                                                        bData[:3] + b'\x05'):
+            with self.assertRaises(ValueError):
+                self.TestClass.fromBytes(Value)
+        del objTest
+        del objCopy
+        del objOther
+
+class Test_SourceCache(unittest.TestCase):
+    """
+    Test cases for the class introspection_lib.my_traceback.SourceCache
+    
+    Implements tests: TEST-T-1A0, TEST-T-1A1 and TEST-T-1A2. Covers the
+    requirements REQ-FUN-1A0, REQ-FUN-1A1, REQ-FUN-1A2 and REQ-AWM-1A0.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.SourceCache
+        cls.TempFolder = tempfile.mkdtemp()
+        cls.TempFile = os.path.join(cls.TempFolder, 'ut001_source.py')
+    
+    @classmethod
+    def tearDownClass(cls):
+        """
+        Cleaning up after all tests are done.
+        """
+        shutil.rmtree(cls.TempFolder, ignore_errors = True)
+    
+    def _getExpected(self, FilePath, LineNumber, ContextLength):
+        """
+        Helper method - the source code sniplet obtained via the module
+        linecache.
+        """
+        linecache.checkcache(FilePath)
+        Lines = linecache.getlines(FilePath)
+        Start = LineNumber - 1 - ContextLength // 2
+        Start = max(0, min(Start, len(Lines) - ContextLength))
+        return LineNumber - 1 - Start, tuple(Lines[Start:Start+ContextLength])
+    
+    def test_SameAsLinecache(self):
+        """
+        Checks that the source code sniplets are the same as those obtained via
+        the module linecache, including the encoding declaration and the
+        Windows line endings, and that the files not available are not handled.
+        
+        Test: TEST-T-1A0. Covers requirements: REQ-FUN-1A0.
+        """
+        objTest = self.TestClass()
+        FilePath = testmodule.__file__
+        LinesCount = len(linecache.getlines(FilePath))
+        self.assertEqual(objTest.getLineCount(FilePath), LinesCount)
+        for LineNumber in (1, 2, 10, LinesCount // 2, LinesCount - 1,
+                                                    LinesCount, LinesCount + 2):
+            for ContextLength in (1, 2, 5, 11):
+                self.assertEqual(
+                    objTest.getContext(FilePath, LineNumber, ContextLength),
+                    self._getExpected(FilePath, LineNumber, ContextLength))
+        with open(self.TempFile, 'wb') as fFile:
+            fFile.write(
+                '# -*- coding: latin-1 -*-\r\nx = "\xe9"\r\ny = 1'.encode(
+                                                                    'latin-1'))
+        for LineNumber in (1, 2, 3):
+            self.assertEqual(objTest.getContext(self.TempFile, LineNumber, 3),
+                                self._getExpected(self.TempFile, LineNumber, 3))
+        self.assertEqual(objTest.getContext(self.TempFile, 2, 1),
+                                                        (0, ('x = "é"\n', )))
+        self.assertEqual(objTest.Size, 2)
+        for FilePath in ('<string>', self.TempFolder,
+                                os.path.join(self.TempFolder, 'missing.py')):
+            self.assertIsNone(objTest.getContext(FilePath, 1, 3))
+            self.assertIsNone(objTest.getLineCount(FilePath))
+        self.assertIs(testmodule.GetSourceCache(),
+                                                testmodule.GetSourceCache())
+        self.assertIsInstance(testmodule.GetSourceCache(), self.TestClass)
+        #the frames of a zip-imported module - linecache only as fall back
+        strZip = os.path.join(self.TempFolder, 'ut001_zipped.zip')
+        with zipfile.ZipFile(strZip, 'w') as fFile:
+            fFile.writestr('ut001_zipped.py', '\n'.join([
+                'import introspection_lib.my_traceback as my_traceback',
+                'def capture():',
+                '    return my_traceback.StackTraceback(LazyContext = True)',
+                '']))
+        sys.path.insert(0, strZip)
+        try:
+            import ut001_zipped
+            linecache.cache.pop(__file__, None)
+            objTraceback = ut001_zipped.capture()
+            self.assertNotIn(__file__, linecache.cache)
+        finally:
+            sys.path.remove(strZip)
+            sys.modules.pop('ut001_zipped', None)
+        del ut001_zipped
+        objRecord = objTraceback._Traceback[-1]
+        self.assertEqual(objRecord.FullName, 'ut001_zipped.capture')
+        self.assertIsNotNone(objRecord._ModuleGlobals)
+        self.assertIsNone(objTraceback._Traceback[-2]._ModuleGlobals)
+        self.assertIn('return my_traceback.StackTraceback(', objTraceback.Info)
+        self.assertIsNone(objRecord._ModuleGlobals)
+        del objTest
+        del objTraceback
+        del objRecord
+    
+    def test_Invalidation(self):
+        """
+        Checks the re-validation of the changed and removed files, the bound
+        on the number of the cached files and the pre-warming.
+        
+        Test: TEST-T-1A1. Covers requirements: REQ-FUN-1A1 and REQ-AWM-1A0.
+        """
+        objTest = self.TestClass(MaxFiles = 2)
+        with open(self.TempFile, 'wt') as fFile:
+            fFile.write('a = 1\nb = 2\n')
+        self.assertEqual(objTest.getContext(self.TempFile, 2, 1),
+                                                            (0, ('b = 2\n', )))
+        with open(self.TempFile, 'wt') as fFile:
+            fFile.write('a = 1\nb = 22\nc = 3\n')
+        self.assertEqual(objTest.getContext(self.TempFile, 2, 1),
+                                                            (0, ('b = 22\n', )))
+        self.assertEqual(objTest.getLineCount(self.TempFile), 3)
+        os.remove(self.TempFile)
+        self.assertIsNone(objTest.getContext(self.TempFile, 2, 1))
+        self.assertEqual(objTest.Size, 0)
+        with open(self.TempFile, 'wt') as fFile:
+            pass
+        self.assertIsNone(objTest.getContext(self.TempFile, 1, 1))
+        self.assertEqual(objTest.getLineCount(self.TempFile), 0)
+        #truncation in place after the look-up of the entry - no bus error
+        with open(self.TempFile, 'wt') as fFile:
+            fFile.write(''.join(f'x{Index} = {Index}\n'
+                                                    for Index in range(1000)))
+        Entry = objTest._getEntry(self.TempFile)
+        with open(self.TempFile, 'r+b') as fFile:
+            fFile.truncate(10)
+        self.assertIsNone(objTest._getLines(self.TempFile, Entry, 990, 1000))
+        self.assertEqual(objTest.getContext(self.TempFile, 2, 1),
+                                                            (0, ('x1 \n', )))
+        if os.path.isdir('/proc/self/fd'): #no descriptors are kept open
+            Descriptors = len(os.listdir('/proc/self/fd'))
+            objOther = self.TestClass()
+            for FilePath in (testmodule.__file__, os.__file__,
+                                                            inspect.__file__):
+                objOther.getContext(FilePath, 10, 5)
+            self.assertEqual(objOther.Size, 3)
+            self.assertEqual(len(os.listdir('/proc/self/fd')), Descriptors)
+            del objOther
+        self.assertEqual(objTest.prewarm([testmodule.__file__, os.__file__,
+                            inspect.__file__, self.TempFolder, 1, '<string>']),
+                                                                            3)
+        self.assertEqual(objTest.Size, 2)
+        objTest.invalidate(inspect.__file__)
+        self.assertEqual(objTest.Size, 1)
+        objTest.clear()
+        self.assertEqual(objTest.Size, 0)
+        FolderPath = os.path.dirname(os.path.realpath(testmodule.__file__))
+        objTest = self.TestClass()
+        Count = objTest.prewarmPackage(FolderPath)
+        self.assertGreater(Count, 10)
+        self.assertEqual(objTest.Size, Count)
+        objTest.clear()
+        objPackage = package_structure.PackageStructure(FolderPath)
+        objPackage.setFoldersFilters(['Tests'])
+        self.assertEqual(objTest.prewarmPackage(objPackage),
+                                                len(objPackage.getModules()))
+        for Value in (None, 1, 1.0):
+            with self.assertRaises(TypeError):
+                objTest.prewarm(Value)
+        for Value in (None, 1, ['a'], objTest):
+            with self.assertRaises(TypeError):
+                objTest.prewarmPackage(Value)
+        with self.assertRaises(ValueError):
+            objTest.prewarmPackage(self.TempFolder)
+        del objTest
+        del objPackage
+    
+    def test_Concurrent(self):
+        """
+        Checks the splitting of the cache into the stripes, and that the
+        source code sniplets retrieved in parallel threads are correct, whilst
+        the files are being dropped from the cache.
+        
+        Test: TEST-T-1A2. Covers requirements: REQ-FUN-1A2.
+        """
+        for dictOptions, Stripes in (({}, 16), ({'MaxFiles' : 2}, 1),
+                        ({'Stripes' : 4}, 4), ({'MaxFiles' : 40}, 2),
+                        ({'MaxFiles' : 40, 'Stripes' : 1}, 1),
+                        ({'Stripes' : 0}, 16), ({'Stripes' : True}, 16)):
+            objTest = self.TestClass(**dictOptions)
+            self.assertEqual(len(objTest._Stripes), Stripes)
+            self.assertEqual(sum(Limit for _, _, Limit in objTest._Stripes),
+                                                            objTest._MaxFiles)
+        lstFiles = [testmodule.__file__, os.__file__, inspect.__file__,
+                                                        threading.__file__]
+        dictExpected = {FilePath : [self._getExpected(FilePath, LineNumber, 5)
+                                            for LineNumber in range(1, 300, 7)]
+                                                    for FilePath in lstFiles}
+        Threads = 8
+        lstErrors = []
+        for dictOptions in ({'MaxFiles' : 2}, {'MaxFiles' : 32,
+                                                            'Stripes' : 2}):
+            objTest = self.TestClass(**dictOptions)
+            objBarrier = threading.Barrier(Threads)
+            
+            def worker(Index):
+                try:
+                    objBarrier.wait()
+                    for Repeat in range(10):
+                        for FilePath in lstFiles:
+                            for LineIndex, LineNumber in enumerate(
+                                                        range(1, 300, 7)):
+                                if (objTest.getContext(FilePath, LineNumber, 5)
+                                    != dictExpected[FilePath][LineIndex]):
+                                    lstErrors.append((FilePath, LineNumber))
+                            if not ((Repeat + Index) % 3):
+                                objTest.invalidate(FilePath)
+                        if Index == Repeat:
+                            objTest.clear()
+                except Exception as err:
+                    lstErrors.append(err)
+            
+            lstThreads = [threading.Thread(target = worker, args = (Index, ))
+                                                    for Index in range(Threads)]
+            for objThread in lstThreads:
+                objThread.start()
+            for objThread in lstThreads:
+                objThread.join(60)
+            self.assertListEqual(lstErrors, [])
+            self.assertLessEqual(objTest.Size, objTest._MaxFiles)
+        del objTest
+
+class Test_RenderCache(unittest.TestCase):
+    """
+    Test cases for the class introspection_lib.my_traceback.RenderCache
+    
+    Implements tests: TEST-T-1B0 and TEST-T-1B1. Covers the requirements
+    REQ-FUN-1B0 and REQ-FUN-1B1.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.TestClass = testmodule.RenderCache
+    
+    def tearDown(self):
+        """
+        Cleaning up after each test - the process-wide cache is removed.
+        """
+        testmodule.StackTraceback.InfoCache = None
+    
+    def test_Bounded(self):
+        """
+        Checks the look-up statistics and the least recently used eviction.
+        
+        Test: TEST-T-1B0. Covers requirements: REQ-FUN-1B0.
+        """
+        objTest = self.TestClass(MaxSize = 2)
+        self.assertEqual((objTest.Size, objTest.Hits, objTest.Misses),
+                                                                    (0, 0, 0))
+        self.assertIsNone(objTest.get(('a', )))
+        objTest.put(('a', ), 'A')
+        objTest.put(('b', ), 'B')
+        self.assertEqual(objTest.get(('a', )), 'A')
+        objTest.put(('c', ), 'C')
+        self.assertEqual(objTest.Size, 2)
+        self.assertIsNone(objTest.get(('b', )))
+        self.assertEqual(objTest.get(('a', )), 'A')
+        self.assertEqual(objTest.get(('c', )), 'C')
+        self.assertEqual((objTest.Hits, objTest.Misses), (3, 2))
+        objTest.clear()
+        self.assertEqual((objTest.Size, objTest.Hits, objTest.Misses),
+                                                                    (0, 0, 0))
+        for Value in (None, 0, -1, 1.5, True):
+            self.assertEqual(self.TestClass(MaxSize = Value)._MaxSize,
+                                                        self.TestClass.MaxSize)
+        del objTest
+    
+    def test_Shared(self):
+        """
+        Checks that the identical tracebacks are rendered only once in the
+        process, with the width, the context length and the locals capture
+        respected.
+        
+        Test: TEST-T-1B1. Covers requirements: REQ-FUN-1B1.
+        """
+        objCache = self.TestClass()
+        testmodule.StackTraceback.InfoCache = objCache
+        lstTracebacks = []
+        for dictOptions in ({}, {'LazyContext' : True}, {},
+                            {'ContextLength' : 5}, {'ConsoleWidth' : 20}):
+            try:
+                outer()
+            except ValueError:
+                lstTracebacks.append(
+                            testmodule.ExceptionTraceback(**dictOptions))
+        lstInfo = [objTraceback.Info for objTraceback in lstTracebacks]
+        self.assertEqual(objCache.Size, 3)
+        self.assertEqual(objCache.Hits, 2)
+        self.assertIs(lstInfo[1], lstInfo[0])
+        self.assertIs(lstInfo[2], lstInfo[0])
+        self.assertIsNotNone(lstTracebacks[1]._PendingContext)
+        self.assertNotEqual(lstInfo[3], lstInfo[0])
+        self.assertNotEqual(lstInfo[4], lstInfo[0])
+        testmodule.StackTraceback.InfoCache = None
+        for objTraceback, strInfo in zip(lstTracebacks, lstInfo):
+            objCopy = testmodule.ExceptionTraceback.fromBytes(
+                                                        objTraceback.toBytes())
+            self.assertEqual(objCopy.Info, strInfo)
+        testmodule.StackTraceback.InfoCache = objCache
+        try:
+            outer()
+        except ValueError:
+            objTraceback = testmodule.ExceptionTraceback(CaptureLocals = True)
+        self.assertIsNotNone(objTraceback.Info)
+        self.assertEqual(objCache.Size, 3)
+        del objCache
+        del objTraceback
+        del objCopy
+        del lstTracebacks
+
+class Test_TracebackComparison(unittest.TestCase):
+    """
+    Test cases for the functions GetCommonPrefix(), GetCommonSuffix(),
+    DiffTracebacks() and GroupByPrefix() of the module
+    introspection_lib.my_traceback
+    
+    Implements tests: TEST-T-1C0, TEST-T-1C1 and TEST-T-1C2. Covers the
+    requirements REQ-FUN-1C0, REQ-FUN-1C1 and REQ-AWM-1C0.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Stack = testmodule.StackTraceback()
+        cls.Inner = cls.getStack()
+        try:
+            outer()
+        except ValueError:
+            cls.Error = testmodule.ExceptionTraceback()
+        try:
+            middle()
+        except ValueError:
+            cls.Middle = testmodule.ExceptionTraceback()
+    
+    @classmethod
+    def getStack(cls):
+        """
+        Helper method - the traceback of the call stack one frame deeper than
+        in the setUpClass() method.
+        """
+        return testmodule.StackTraceback()
+    
+    def test_PrefixSuffix(self):
+        """
+        Checks the longest common prefix and suffix of the tracebacks, and
+        the grouping of the tracebacks by the common roots.
+        
+        Test: TEST-T-1C0. Covers requirements: REQ-FUN-1C0.
+        """
+        Length = len(self.Stack.CallChain)
+        self.assertEqual(testmodule.GetCommonPrefix(self.Stack), Length)
+        self.assertEqual(testmodule.GetCommonSuffix(self.Stack), Length)
+        #the calls in the setUpClass() are made from the different lines
+        self.assertEqual(testmodule.GetCommonPrefix(self.Stack, self.Inner),
+                                                                    Length - 1)
+        self.assertEqual(
+                    testmodule.GetCommonSuffix(self.Stack, self.Inner), 0)
+        self.assertEqual(
+                    testmodule.GetCommonPrefix(self.Error, self.Middle), 0)
+        self.assertEqual(
+                    testmodule.GetCommonSuffix(self.Error, self.Middle), 2)
+        self.assertEqual(testmodule.GetCommonPrefix(self.Error, self.Stack), 0)
+        lstTracebacks = [self.Stack, self.Inner, self.Stack] * 100
+        self.assertEqual(testmodule.GetCommonPrefix(*lstTracebacks),
+                                                                    Length - 1)
+        self.assertEqual(testmodule.GetCommonSuffix(*lstTracebacks), 0)
+        lstTracebacks.extend([self.Error, self.Middle])
+        self.assertEqual(testmodule.GetCommonPrefix(*lstTracebacks), 0)
+        dictGroups = testmodule.GroupByPrefix(lstTracebacks, Length + 1)
+        self.assertEqual(len(dictGroups), 4)
+        self.assertListEqual([len(Item) for Item in dictGroups.values()],
+                                                            [200, 100, 1, 1])
+        dictGroups = testmodule.GroupByPrefix(iter(lstTracebacks),
+                                                                    Length - 1)
+        self.assertListEqual([len(Item) for Item in dictGroups.values()],
+                                                                [300, 1, 1])
+        tupRoot = list(dictGroups.keys())[0]
+        self.assertEqual(len(tupRoot), Length - 1)
+        for tupKey, strName in zip(tupRoot, self.Stack.CallChain):
+            self.assertEqual(tupKey[1], strName)
+        self.assertDictEqual(testmodule.GroupByPrefix([], 1), {})
+    
+    def test_Diff(self):
+        """
+        Checks the minimal diff between two tracebacks.
+        
+        Test: TEST-T-1C1. Covers requirements: REQ-FUN-1C1.
+        """
+        Length = len(self.Stack.CallChain)
+        self.assertListEqual(
+                        testmodule.DiffTracebacks(self.Stack, self.Stack),
+                                        [('equal', 0, Length, 0, Length)])
+        self.assertListEqual(
+                        testmodule.DiffTracebacks(self.Stack, self.Inner),
+                                [('equal', 0, Length - 1, 0, Length - 1),
+                                ('replace', Length - 1, Length, Length - 1,
+                                                                Length + 1)])
+        self.assertListEqual(
+                        testmodule.DiffTracebacks(self.Error, self.Middle),
+                                [('replace', 0, 2, 0, 1),
+                                ('equal', 2, 4, 1, 3)])
+        self.assertListEqual(
+                        testmodule.DiffTracebacks(self.Middle, self.Error),
+                                [('replace', 0, 1, 0, 2),
+                                ('equal', 1, 3, 2, 4)])
+        #minimality - the number of the equal elements is the length of the
+        #+ longest common sub-sequence
+        for First, Second, Common in (('abcabba', 'cbabac', 4),
+                                    ('', 'abc', 0), ('abc', '', 0),
+                                    ('abcd', 'xaxbxcxdx', 4),
+                                    ('aaaa', 'bbbb', 0), ('', '', 0)):
+            lstOpcodes = testmodule._GetEditScript(list(First), list(Second))
+            strResult = ''
+            Equal = 0
+            for Tag, I1, I2, J1, J2 in lstOpcodes:
+                if Tag == 'equal':
+                    self.assertEqual(First[I1:I2], Second[J1:J2])
+                    Equal += I2 - I1
+                strResult += Second[J1:J2]
+            self.assertEqual(strResult, Second)
+            self.assertEqual(Equal, Common)
+    
+    def test_Errors(self):
+        """
+        Checks the improper arguments treatment.
+        
+        Test: TEST-T-1C2. Covers requirements: REQ-AWM-1C0.
+        """
+        for Function in (testmodule.GetCommonPrefix,
+                                                testmodule.GetCommonSuffix):
+            with self.assertRaises(ValueError):
+                Function()
+            for Value in (1, 'a', [self.Stack], self.Stack.CallChain,
+                                                    testmodule.FrameRecord):
+                with self.assertRaises(TypeError):
+                    Function(Value)
+                with self.assertRaises(TypeError):
+                    Function(self.Stack, Value)
+        for Value in (1, 'a', [self.Stack], None):
+            with self.assertRaises(TypeError):
+                testmodule.DiffTracebacks(self.Stack, Value)
+            with self.assertRaises(TypeError):
+                testmodule.DiffTracebacks(Value, self.Stack)
+        for Value in (1, None, [1], ['a']):
+            with self.assertRaises(TypeError):
+                testmodule.GroupByPrefix(Value, 1)
+        for Value in (None, 1.0, '1', True):
+            with self.assertRaises(TypeError):
+                testmodule.GroupByPrefix([self.Stack], Value)
+        for Value in (0, -1):
+            with self.assertRaises(ValueError):
+                testmodule.GroupByPrefix([self.Stack], Value)
 
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_StackTraceback)
 TestSuite2 = unittest.TestLoader().loadTestsFromTestCase(
                                                     Test_ExceptionTraceback)
+TestSuite3 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_ModuleNameResolver)
+TestSuite4 = unittest.TestLoader().loadTestsFromTestCase(Test_FrameRecord)
+TestSuite5 = unittest.TestLoader().loadTestsFromTestCase(Test_TracebackStore)
+TestSuite6 = unittest.TestLoader().loadTestsFromTestCase(Test_StackSampler)
+TestSuite7 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_ThreadStacksSnapshot)
+TestSuite8 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_AsyncTaskTraceback)
+TestSuite9 = unittest.TestLoader().loadTestsFromTestCase(
+                                            Test_ChainedExceptionTraceback)
+TestSuite10 = unittest.TestLoader().loadTestsFromTestCase(Test_CapturePolicy)
+TestSuite11 = unittest.TestLoader().loadTestsFromTestCase(Test_CallPathTrie)
+TestSuite12 = unittest.TestLoader().loadTestsFromTestCase(Test_SourceCache)
+TestSuite13 = unittest.TestLoader().loadTestsFromTestCase(Test_RenderCache)
+TestSuite14 = unittest.TestLoader().loadTestsFromTestCase(
+                                                    Test_TracebackComparison)
 TestSuite = unittest.TestSuite()
-TestSuite.addTests([TestSuite1, TestSuite2])
+TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4,
+                TestSuite5, TestSuite6, TestSuite7, TestSuite8, TestSuite9,
+                            TestSuite10, TestSuite11, TestSuite12, TestSuite13,
+                                                                TestSuite14])
 
 if __name__ == "__main__":
     sys.stdout.write(
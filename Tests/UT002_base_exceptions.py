@@ -5,8 +5,8 @@ Module introspection_lib.Tests.UT002_base_exceptions
 Implements unit testing of the module introspection_lib.base_exceptions.
 """
 
-__version__ = "1.0.2.0"
-__date__ = "13-04-2020"
+__version__ = "1.7.0.0"
+__date__ = "18-10-2026"
 __status__ = "Testing"
 
 #imports
@@ -17,6 +17,12 @@ import sys
 import os
 import unittest
 import types
+import collections
+import threading
+import json
+import pickle
+import copy
+import weakref
 
 #+ my libraries
 
@@ -28,7 +34,8 @@ if not (ROOT_FOLDER) in sys.path:
 
 import introspection_lib.base_exceptions as testmodule
 
-from introspection_lib.my_traceback import ExceptionTraceback
+from introspection_lib.my_traceback import ExceptionTraceback, StackTraceback
+from introspection_lib.my_traceback import CapturePolicy, RenderCache
 
 #helper functions
 
@@ -99,8 +106,11 @@ class Test_UT_Exception(unittest.TestCase):
     """
     Test cases for the class introspection_lib.base_exceptions.UT_Exception.
     
-    Implements tests: TEST-T-200, TEST-T-201, TEST-T-202 and TEST-T-210. Covers
-    the requirements REQ-FUN-200, REQ-FUN-201, REQ-FUN-202 and REQ-FUN-210.
+    Implements tests: TEST-T-200, TEST-T-201, TEST-T-202, TEST-T-205,
+    TEST-T-206, TEST-T-207, TEST-T-208, TEST-T-209, TEST-T-20A and TEST-T-210.
+    Covers the requirements REQ-FUN-200, REQ-FUN-201, REQ-FUN-202, REQ-FUN-206,
+    REQ-FUN-207, REQ-FUN-208, REQ-FUN-209, REQ-FUN-20A, REQ-FUN-20B and
+    REQ-FUN-210.
     """
     
     @classmethod
@@ -696,6 +706,211 @@ class Test_UT_Exception(unittest.TestCase):
                     del LastError
                 del NewError
             del TestError
+    
+    def test_CapturePolicy(self):
+        """
+        Checks that the process-wide traceback capture policy is applied to the
+        traceback analysis object of the exception.
+
+        Test ID: TEST-T-205. Covers the requirement: REQ-FUN-206.
+        """
+        StackTraceback.Policy = CapturePolicy('never')
+        try:
+            try:
+                outer(self.TestClass, *self.DefArguments)
+            except self.TestClass as err:
+                objDeclined = err.Traceback
+            StackTraceback.Policy = CapturePolicy('always')
+            try:
+                outer(self.TestClass, *self.DefArguments)
+            except self.TestClass as err:
+                objAllowed = err.Traceback
+        finally:
+            StackTraceback.Policy = None
+        self.assertTrue(objDeclined.IsPlaceholder)
+        self.assertEqual(objDeclined.CallChain, [f'{__name__}.inner'])
+        self.assertTrue(objDeclined.Info.startswith(
+                                'Traceback is not captured (policy: never)'))
+        self.assertFalse(objAllowed.IsPlaceholder)
+        self.assertEqual(objAllowed.CallChain[-3:], [f'{__name__}.outer',
+                                    f'{__name__}.middle', f'{__name__}.inner'])
+        del objDeclined
+        del objAllowed
+    
+    def test_RenderInvalidation(self):
+        """
+        Checks that the memoized rendered text of the traceback is discarded
+        by the method with_traceback(), also with the process-wide cache of the
+        rendered texts.
+
+        Test ID: TEST-T-206. Covers the requirement: REQ-FUN-207.
+        """
+        try:
+            outer(self.TestClass, *self.DefArguments)
+        except self.TestClass as err:
+            objError = err
+            tbOriginal = err.__traceback__
+        try:
+            raise ValueError
+        except ValueError as err:
+            tbTemp = err.__traceback__
+        for objCache in (None, RenderCache()):
+            StackTraceback.InfoCache = objCache
+            try:
+                objError = objError.with_traceback(tbOriginal)
+                strInfo = objError.Traceback.Info
+                self.assertIs(objError.Traceback.Info, strInfo)
+                objOther = objError.with_traceback(tbTemp)
+                self.assertIs(objOther, objError)
+                strNewInfo = objError.Traceback.Info
+                self.assertNotEqual(strNewInfo, strInfo)
+                self.assertIn('raise ValueError', strNewInfo)
+                self.assertNotIn(f'{__name__}.outer', strNewInfo)
+            finally:
+                StackTraceback.InfoCache = None
+        del objError
+        del objOther
+        del tbTemp
+        del tbOriginal
+    
+    def test_DeferredMessage(self):
+        """
+        Checks that the error message is constructed only upon the first read,
+        and that the deferred parts are converted into strings only once,
+        whereas the containers are represented in their state at the moment of
+        the message setting.
+
+        Test ID: TEST-T-207. Covers the requirement: REQ-FUN-208.
+        """
+        class Counted:
+            Calls = 0
+            
+            def __str__(self):
+                Counted.Calls += 1
+                return 'counted'
+        
+        class Broken:
+            def __str__(self):
+                raise RuntimeError
+        
+        objTest = self.TestClass(*self.DefArguments)
+        objTest.appendMessage('in {}', Counted())
+        objTest.appendMessage(Broken())
+        self.assertEqual(Counted.Calls, 0)
+        strMessage = objTest.getMessage()
+        self.assertEqual(Counted.Calls, 1)
+        self.assertTrue(strMessage.endswith('in counted <str() failed>'))
+        self.assertEqual(objTest.args, (strMessage, ))
+        self.assertIn('counted', str(objTest))
+        self.assertIn('counted', repr(objTest))
+        self.assertEqual(Counted.Calls, 1)
+        objTest.setMessage('{} - {}', Counted(), 1)
+        self.assertEqual(Counted.Calls, 1)
+        self.assertEqual(objTest.args, ('counted - 1', ))
+        objTest.args = ('test', )
+        self.assertEqual(objTest.getMessage(), 'test')
+        self.assertEqual(Counted.Calls, 2)
+        objTest.appendMessage(testmodule.LazyFormat(lambda : 'lazy'))
+        self.assertEqual(objTest.getMessage(), 'test lazy')
+        lstTest = [1, 2]
+        objTest.setMessage('in {}', lstTest)
+        lstTest.append(3)
+        self.assertEqual(objTest.getMessage(), 'in [1, 2]')
+        objTest.setMessage('{} - {}', 'outer',
+                        testmodule.LazyFormat('in {}', 'x' * 300))
+        self.assertEqual(objTest.getMessage(), 'outer - in {}...'.format(
+                                                                'x' * 237))
+        del objTest
+    
+    def test_BoundedMessage(self):
+        """
+        Checks that the objects involved into the error message are represented
+        in the bounded form.
+
+        Test ID: TEST-T-208. Covers the requirement: REQ-FUN-209.
+        """
+        objTest = self.TestClass(*self.DefArguments)
+        objTest.appendMessage('for {}', list(range(100000)))
+        objTest.appendMessage({str(Index): Index for Index in range(100000)})
+        strMessage = objTest.getMessage()
+        self.assertIn(' for [0, 1, 2, 3, 4, 5, ...]', strMessage)
+        self.assertTrue(strMessage.endswith(
+                            " {'0': 0, '1': 1, '2': 2, '3': 3, '4': 4, '5': 5, "
+                            + "...}"))
+        self.assertLess(len(strMessage), 1000)
+        del objTest
+    
+    def test_Metrics(self):
+        """
+        Checks that the occurrences of the exception are registered by the
+        process-wide metrics registry with the proper raise site.
+
+        Test ID: TEST-T-209. Covers the requirement: REQ-FUN-20A.
+        """
+        objMetrics = testmodule.ExceptionMetrics()
+        testmodule.TracebackPlugin.Metrics = objMetrics
+        try:
+            for SkipFrames in (None, None, 1):
+                try:
+                    outer(self.TestClass, *self.DefArguments,
+                                                    SkipFrames = SkipFrames)
+                except self.TestClass:
+                    pass
+        finally:
+            testmodule.TracebackPlugin.Metrics = None
+        self.TestClass(*self.DefArguments) #not registered
+        dictData = objMetrics.snapshot()
+        strName = f'{self.TestClass.__module__}.{self.TestClass.__qualname__}'
+        self.assertEqual(dictData['Classes'], {strName : 3})
+        self.assertEqual([(Site['Function'], Site['Count'])
+                                            for Site in dictData['Sites']],
+                                                [('inner', 2), ('middle', 1)])
+        for Site in dictData['Sites']:
+            self.assertEqual(Site['Class'], strName)
+            self.assertEqual(Site['FilePath'], __file__)
+            self.assertNotIn('Intervals', Site)
+    
+    def test_Pickle(self):
+        """
+        Checks that the exceptions survive the pickling and copying with the
+        error message and the traceback analysis, without the re-capturing.
+
+        Test ID: TEST-T-20A. Covers the requirement: REQ-FUN-20B.
+        """
+        for SkipFrames in (None, 1):
+            try:
+                outer(self.TestClass, *self.DefArguments,
+                                                    SkipFrames = SkipFrames)
+            except self.TestClass as err:
+                objError = err
+            objError.appendMessage('for {}', list(range(100000)))
+            objError.Extra = 42
+            bData = pickle.dumps(objError)
+            self.assertLess(len(bData), 5000)
+            objTest = pickle.loads(bData)
+            self.assertIs(objTest.__class__, self.TestClass)
+            self.assertEqual(objTest.args, objError.args)
+            self.assertEqual(objTest.getMessage(), objError.getMessage())
+            self.assertEqual(objTest.Extra, 42)
+            self.assertIsNone(objTest.__traceback__)
+            self.assertIsInstance(objTest.Traceback, ExceptionTraceback)
+            self.assertEqual(objTest.Traceback.CallChain,
+                                                objError.Traceback.CallChain)
+            self.assertEqual(objTest.Traceback.Info, objError.Traceback.Info)
+            strLast = 'inner' if SkipFrames is None else 'middle'
+            self.assertTrue(objTest.Traceback.CallChain[-1].endswith(strLast))
+            objCopy = copy.deepcopy(objError)
+            self.assertIs(objCopy.__class__, self.TestClass)
+            self.assertEqual(objCopy.args, objError.args)
+            self.assertEqual(objCopy.Traceback.Info, objError.Traceback.Info)
+            del objTest, objCopy, objError
+        #never raised instance - only the message and the attributes
+        objError = self.TestClass(*self.DefArguments)
+        objTest = pickle.loads(pickle.dumps(objError))
+        self.assertIs(objTest.__class__, self.TestClass)
+        self.assertEqual(objTest.args, objError.args)
+        self.assertIsNone(objTest._Traceback)
+        del objTest, objError
 
 class Test_Sub_Exception(Test_UT_Exception):
     """
@@ -804,6 +1019,15 @@ class Test_UT_TypeError(Test_UT_Exception):
                             msg = 'substitution instantiation -> chained')
         del objError
         del tbTemp
+        #the object involved is not kept alive by the pending message
+        objValue = S_Exception('test')
+        objRef = weakref.ref(objValue)
+        objError = self.TestClass(objValue, int)
+        del objValue
+        self.assertIsNone(objRef())
+        self.assertEqual(objError.args,
+                            ('S_Exception is not a sub-class of (int, )', ))
+        del objError
 
 class Test_UT_ValueError(Test_UT_Exception):
     """
@@ -1257,6 +1481,265 @@ class Test_Sub_KeyError(Test_UT_KeyError):
                             S_ValueError]
         cls.DefArguments = ['test', 'whatever']
 
+class Test_BoundedRepr(unittest.TestCase):
+    """
+    Test cases for the class introspection_lib.base_exceptions.BoundedRepr.
+    
+    Implements tests: TEST-T-208. Covers the requirement REQ-FUN-209.
+    """
+    
+    def test_Limits(self):
+        """
+        Checks that the representation is bounded by the default and passed
+        limits, and that the improper limits are ignored.
+
+        Test ID: TEST-T-208. Covers the requirement: REQ-FUN-209.
+        """
+        objTest = testmodule.BoundedRepr()
+        self.assertIs(type(testmodule.LazyFormat.Formatter),
+                                                    testmodule.BoundedRepr)
+        self.assertEqual(objTest.repr(list(range(10))),
+                                                '[0, 1, 2, 3, 4, 5, ...]')
+        self.assertEqual(objTest.repr([[[[1]]]]), '[[[[...]]]]')
+        self.assertEqual(objTest.toString('a' * 1000), 'a' * 237 + '...')
+        self.assertEqual(len(objTest.repr([['a' * 100] * 6] * 6)), 240)
+        objTest = testmodule.BoundedRepr(MaxLevel = 1, MaxItems = 2,
+                                            MaxString = 9, MaxLength = 20)
+        self.assertEqual(objTest.repr([[1], 2, 3]), '[[...], 2, ...]')
+        self.assertEqual(objTest.repr(['abcdefghijkl']), "['ab...kl']")
+        self.assertEqual(objTest.repr(b'abcdefghijk'), "b'abcdefghi'...")
+        self.assertEqual(objTest.toString('a' * 30), 'a' * 17 + '...')
+        for Value in [0, -1, 1.0, True, '1', None]:
+            objTest = testmodule.BoundedRepr(MaxLevel = Value,
+                                MaxItems = Value, MaxString = Value,
+                                MaxLength = Value)
+            self.assertEqual(objTest.repr(list(range(10))),
+                                                '[0, 1, 2, 3, 4, 5, ...]')
+    
+    def test_Containers(self):
+        """
+        Checks that the generic mappings, sequences and sets, and the
+        sub-classes of the built-in containers are bounded, and that only the
+        first elements are processed.
+
+        Test ID: TEST-T-208. Covers the requirement: REQ-FUN-209.
+        """
+        class Poisoned:
+            def __repr__(self):
+                raise RuntimeError
+        
+        objTest = testmodule.BoundedRepr(MaxItems = 2)
+        self.assertEqual(objTest.repr(collections.OrderedDict(a = 1, b = 2,
+                                    c = Poisoned())), "OrderedDict({'a': 1, "
+                                                            + "'b': 2, ...})")
+        self.assertEqual(objTest.repr({'b': 1, 'a': 2, 0: Poisoned()}),
+                                                        "{'b': 1, 'a': 2, ...}")
+        self.assertEqual(objTest.repr(collections.UserList([1, 2, 3])),
+                                                        'UserList([1, 2, ...])')
+        self.assertEqual(objTest.repr(frozenset()), 'frozenset()')
+        self.assertEqual(objTest.repr(range(10)), 'range(0, 10)')
+        self.assertTrue(objTest.repr([Poisoned()]).startswith(
+                                                    '[<Poisoned instance at'))
+        self.assertEqual(objTest.toString(Poisoned()), '<str() failed>')
+        self.assertEqual(objTest.toString(1), '1')
+        self.assertEqual(objTest.toString('test'), 'test')
+
+class Test_Lightweight(unittest.TestCase):
+    """
+    Test cases for the lightweight exceptions classes of the module
+    introspection_lib.base_exceptions.
+    
+    Implements tests: TEST-T-270. Covers the requirement REQ-FUN-270.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        """
+        Preparation for the test cases, done only once.
+        """
+        cls.Classes = {testmodule.LW_Exception: Exception,
+                        testmodule.LW_TypeError: TypeError,
+                        testmodule.LW_ValueError: ValueError,
+                        testmodule.LW_AttributeError: AttributeError,
+                        testmodule.LW_IndexError: IndexError,
+                        testmodule.LW_KeyError: KeyError}
+    
+    def test_Classes(self):
+        """
+        Checks that the lightweight exceptions are the sub-classes of the
+        respective standard exceptions, but not of the custom exceptions, and
+        that they have no traceback analysis and add no instance attributes.
+
+        Test ID: TEST-T-270. Covers the requirement: REQ-FUN-270.
+        """
+        self.assertEqual(set(testmodule.LW_Exception_Check),
+                                                        set(self.Classes))
+        for TestClass, Parent in self.Classes.items():
+            self.assertTrue(issubclass(TestClass, Parent))
+            self.assertTrue(issubclass(TestClass,
+                                                testmodule.LightweightPlugin))
+            self.assertFalse(issubclass(TestClass, testmodule.UT_Exception))
+            self.assertFalse(issubclass(TestClass, testmodule.TracebackPlugin))
+            self.assertEqual(TestClass.__slots__, ())
+            try:
+                raise TestClass('test', 1)
+            except Parent as err:
+                self.assertEqual(err.args, ('test', 1))
+                self.assertEqual(err.getMessage(), 'test')
+                self.assertFalse(hasattr(err, 'Traceback'))
+                self.assertEqual(vars(err), {})
+            self.assertEqual(TestClass().getMessage(), '')
+    
+    def test_NoSharedInstance(self):
+        """
+        Checks that no shared pre-allocated instances are provided, and that
+        each raise of a new instance keeps its own traceback and context.
+
+        Test ID: TEST-T-270. Covers the requirement: REQ-FUN-270.
+        """
+        for TestClass, Parent in self.Classes.items():
+            self.assertFalse(hasattr(TestClass, 'getInstance'))
+            try:
+                try:
+                    raise ValueError
+                except ValueError:
+                    raise TestClass()
+            except Parent as err:
+                objFirst = err
+            try:
+                raise TestClass()
+            except Parent as err:
+                objSecond = err
+            self.assertIsNot(objFirst, objSecond)
+            self.assertIsInstance(objFirst.__context__, ValueError)
+            self.assertIsNone(objSecond.__context__)
+            self.assertIsNotNone(objFirst.__traceback__)
+            self.assertIsNotNone(objSecond.__traceback__)
+            self.assertIsNot(objFirst.__traceback__, objSecond.__traceback__)
+
+class Test_ExceptionMetrics(unittest.TestCase):
+    """
+    Test cases for the class introspection_lib.base_exceptions.ExceptionMetrics
+    
+    Implements tests: TEST-T-209. Covers the requirement REQ-FUN-20A.
+    """
+    
+    def tearDown(self):
+        """
+        Ensures that the process-wide registry is removed after each test.
+        """
+        testmodule.TracebackPlugin.Metrics = None
+    
+    def test_Threads(self):
+        """
+        Checks that the occurrences in the concurrent threads are counted
+        without losses, including the finished threads.
+
+        Test ID: TEST-T-209. Covers the requirement: REQ-FUN-20A.
+        """
+        objMetrics = testmodule.ExceptionMetrics()
+        testmodule.TracebackPlugin.Metrics = objMetrics
+        objBarrier = threading.Barrier(4)
+        
+        def worker():
+            objBarrier.wait()
+            for _ in range(500):
+                try:
+                    raise testmodule.UT_KeyError('test', 'key')
+                except KeyError:
+                    pass
+        
+        lstThreads = [threading.Thread(target = worker) for _ in range(4)]
+        for objThread in lstThreads:
+            objThread.start()
+        objSnapshot = objMetrics.snapshot() #while running
+        for objThread in lstThreads:
+            objThread.join()
+        self.assertLessEqual(
+                    sum(objSnapshot['Classes'].values(), 0), 2000)
+        for _ in range(2): #counters of the finished threads are retained
+            dictData = objMetrics.snapshot()
+            self.assertEqual(dictData['Classes'],
+                        {'introspection_lib.base_exceptions.UT_KeyError': 2000})
+            self.assertEqual(len(dictData['Sites']), 1)
+            self.assertEqual(dictData['Sites'][0]['Function'],
+                        'Test_ExceptionMetrics.test_Threads.<locals>.worker')
+        objMetrics.reset()
+        self.assertEqual(objMetrics.snapshot(), {'Classes' : {}, 'Sites' : []})
+    
+    def test_Export(self):
+        """
+        Checks the JSON and Prometheus text format export with the intervals
+        histograms.
+
+        Test ID: TEST-T-209. Covers the requirement: REQ-FUN-20A.
+        """
+        objMetrics = testmodule.ExceptionMetrics(Timing = True,
+                                    Buckets = [0.5, 1000], Prefix = 'test')
+        self.assertTrue(objMetrics.Timing)
+        testmodule.TracebackPlugin.Metrics = objMetrics
+        for _ in range(3):
+            testmodule.UT_ValueError(1, 'x')
+        testmodule.TracebackPlugin.Metrics = None
+        objMetrics.record(KeyError, None, 0)
+        dictData = json.loads(objMetrics.toJSON(Indent = 2))
+        self.assertEqual(dictData, objMetrics.snapshot())
+        self.assertEqual(dictData['Classes'], {
+                    'introspection_lib.base_exceptions.UT_ValueError' : 3,
+                    'builtins.KeyError' : 1})
+        dictSite = dictData['Sites'][0]
+        self.assertEqual(dictSite['Intervals']['Bounds'], [0.5, 1000.0])
+        self.assertEqual(dictSite['Intervals']['Count'], 2)
+        self.assertEqual(sum(dictSite['Intervals']['Counts']), 2)
+        self.assertEqual(dictData['Sites'][1]['FilePath'], '<other>')
+        self.assertEqual(dictData['Sites'][1]['Intervals']['Count'], 0)
+        strLabel = 'class="{}",file="{}",function="{}",line="{}"'.format(
+                    'introspection_lib.base_exceptions.UT_ValueError',
+                    __file__.replace('\\', '\\\\'),
+                    'Test_ExceptionMetrics.test_Export',
+                    dictSite['LineNumber'])
+        lstLines = objMetrics.toPrometheus().splitlines()
+        self.assertIn('# TYPE test_exceptions_total counter', lstLines)
+        self.assertIn('test_exceptions_total{class="builtins.KeyError"} 1',
+                                                                    lstLines)
+        self.assertIn(f'test_exception_sites_total{{{strLabel}}} 3', lstLines)
+        self.assertIn('# TYPE test_exception_interval_seconds histogram',
+                                                                    lstLines)
+        self.assertIn(
+            f'test_exception_interval_seconds_bucket{{{strLabel},le="+Inf"}} 2',
+                                                                    lstLines)
+        self.assertIn(f'test_exception_interval_seconds_count{{{strLabel}}} 2',
+                                                                    lstLines)
+    
+    def test_Limits(self):
+        """
+        Checks that the sites beyond the limit are counted per class only, and
+        that the improper arguments are replaced by the defaults.
+
+        Test ID: TEST-T-209. Covers the requirement: REQ-FUN-20A.
+        """
+        objMetrics = testmodule.ExceptionMetrics(MaxSites = 1)
+        for Index in range(5):
+            objMetrics.record(KeyError, self.test_Limits.__code__, Index)
+        lstSites = objMetrics.snapshot()['Sites']
+        self.assertEqual([(Site['LineNumber'], Site['Count'])
+                                        for Site in lstSites], [(0, 4), (0, 1)])
+        self.assertEqual(lstSites[0]['Function'], '<other>')
+        self.assertEqual(lstSites[1]['Function'],
+                                        'Test_ExceptionMetrics.test_Limits')
+        for Value in [0, -1, 1.0, True, '1', [], [1, 0.5], [-1]]:
+            objMetrics = testmodule.ExceptionMetrics(Timing = Value,
+                        MaxSites = Value, Buckets = Value, Prefix = Value)
+            self.assertIs(objMetrics.Timing, Value is True)
+            self.assertEqual(objMetrics._MaxSites,
+                                        testmodule.ExceptionMetrics.MaxSites)
+            self.assertEqual(objMetrics._Buckets,
+                                        testmodule.ExceptionMetrics.Buckets)
+            self.assertEqual(objMetrics._Prefix,
+                                        testmodule.ExceptionMetrics.Prefix)
+        objMetrics = testmodule.ExceptionMetrics(Prefix = 'a b')
+        self.assertEqual(objMetrics._Prefix, 'introspection_lib')
+
 #+ test suites
 
 TestSuite1 = unittest.TestLoader().loadTestsFromTestCase(Test_UT_Exception)
@@ -1271,10 +1754,15 @@ TestSuite9 = unittest.TestLoader().loadTestsFromTestCase(Test_Sub_ValueError)
 TestSuite10=unittest.TestLoader().loadTestsFromTestCase(Test_Sub_AttributeError)
 TestSuite11 = unittest.TestLoader().loadTestsFromTestCase(Test_Sub_IndexError)
 TestSuite12 = unittest.TestLoader().loadTestsFromTestCase(Test_Sub_KeyError)
+TestSuite13 = unittest.TestLoader().loadTestsFromTestCase(Test_BoundedRepr)
+TestSuite14 = unittest.TestLoader().loadTestsFromTestCase(Test_Lightweight)
+TestSuite15 = unittest.TestLoader().loadTestsFromTestCase(
+                                                        Test_ExceptionMetrics)
 TestSuite = unittest.TestSuite()
 TestSuite.addTests([TestSuite1, TestSuite2, TestSuite3, TestSuite4, TestSuite5,
                     TestSuite6, TestSuite7, TestSuite8, TestSuite9, TestSuite10,
-                    TestSuite11, TestSuite12])
+                    TestSuite11, TestSuite12, TestSuite13, TestSuite14,
+                    TestSuite15])
 
 if __name__ == "__main__":
     sys.stdout.write(
@@ -16,8 +16,10 @@ __status__ = "Testing"
 import sys
 import os
 import unittest
+import unittest.mock
 import collections
 import random
+import weakref
 
 #+ tested module
 
@@ -667,6 +669,42 @@ class Test_SetDataStrict(Test_SetData):
         for strKey in ['e', 'f', 'g']:
             with self.assertRaises(AttributeError, msg = 'struct'):
                 self.TestFunction(self.Struct, strKey, 9)
+    
+    def test_MessageSnapshot(self):
+        """
+        Checks that the error message shows the state of the container at the
+        moment of the error, even if it is read after the container is
+        modified, and that the container is not kept alive by the exception.
+        
+        Implements tests ID TEST-T-540. Covers requirements REQ-FUN-540 and
+        REQ-AMW-503.
+        """
+        class Tracked(dict):
+            pass
+        
+        dictTest = Tracked()
+        try:
+            self.TestFunction(dictTest, 'a', 1)
+        except KeyError as err:
+            objError = err
+        dictTest['a'] = 1
+        lstTest = [1, 2]
+        try:
+            self.TestFunction(lstTest, 2, 1)
+        except IndexError as err:
+            objIndexError = err
+        lstTest.append(3)
+        self.assertEqual(objError.getMessage(),
+                            'Key not found passed mapping Tracked({})[a]')
+        self.assertEqual(objIndexError.getMessage(),
+                                'Out of range index passed sequence [1, 2][2]')
+        #the frames of the traceback refer to the container as well
+        objError.__traceback__ = None
+        objRef = weakref.ref(dictTest)
+        del dictTest
+        self.assertIsNone(objRef())
+        del objError
+        del objIndexError
 
 class Test_GetElement(unittest.TestCase):
     """
@@ -748,6 +786,27 @@ class Test_GetElement(unittest.TestCase):
             with self.assertRaises(TypeError, msg = str(gPath)):
                 self.TestFunction(self.Data, gPath)
     
+    def test_DeferredMessage(self):
+        """
+        Checks that the message of the caught nested exception is not
+        constructed upon a path mismatch, but only upon the read of the
+        message of the raised exception.
+        
+        Test ID: TEST-T-550. Covers requirements REQ-FUN-550 and REQ-AWM-500.
+        """
+        Original = TestModule.UT_TypeError.getMessage
+        with unittest.mock.patch.object(TestModule.UT_TypeError, 'getMessage',
+                        autospec = True, side_effect = Original) as objMock:
+            for gPath in self.PathMissMatch:
+                with self.assertRaises(TypeError, msg = str(gPath)) as objCM:
+                    self.TestFunction(self.Data, gPath)
+                self.assertEqual(objMock.call_count, 0)
+                strMessage = objCM.exception.getMessage()
+                self.assertGreater(objMock.call_count, 0)
+                self.assertIn(' - ', strMessage)
+                self.assertIn('is not a sub-class of', strMessage)
+                objMock.reset_mock()
+    
     def test_PathMismatch(self):
         """
         Checks that TypeError sub-class exception is raised if a generic path
@@ -944,6 +1003,27 @@ class Test_SetElement(unittest.TestCase):
             with self.assertRaises(TypeError, msg = str(gPath)):
                 self.TestFunction(self.Data, gPath, 9)
     
+    def test_DeferredMessage(self):
+        """
+        Checks that the message of the caught nested exception is not
+        constructed upon a path mismatch, but only upon the read of the
+        message of the raised exception.
+        
+        Test ID: TEST-T-560. Covers requirements REQ-FUN-560 and REQ-AWM-500.
+        """
+        Original = TestModule.UT_TypeError.getMessage
+        with unittest.mock.patch.object(TestModule.UT_TypeError, 'getMessage',
+                        autospec = True, side_effect = Original) as objMock:
+            for gPath in self.PathMissMatch:
+                with self.assertRaises(TypeError, msg = str(gPath)) as objCM:
+                    self.TestFunction(self.Data, gPath, 9)
+                self.assertEqual(objMock.call_count, 0)
+                strMessage = objCM.exception.getMessage()
+                self.assertGreater(objMock.call_count, 0)
+                self.assertIn(' - ', strMessage)
+                self.assertIn('is not a sub-class of', strMessage)
+                objMock.reset_mock()
+    
     def test_PathMismatch(self):
         """
         Checks that TypeError sub-class exception is raised if a generic path
@@ -19,10 +19,10 @@ Modules:
 """
 
 __project__ = 'Python introspection framework'
-__version_info__= (0, 6, 0)
+__version_info__= (0, 7, 0)
 __version_suffix__= '-dev1'
 __version__= ''.join(['.'.join(map(str, __version_info__)), __version_suffix__])
-__date__ = '01-07-2026'
+__date__ = '17-10-2026'
 __status__ = 'Development'
 __author__ = 'Anton Azarov'
 __maintainer__ = 'a.azarov@diagnoptics.com'
@@ -6,11 +6,18 @@ of the traceback functionality. Use the module's global variable
 UT_Exception_Check as an 'umbrella' term in the except clause to catch any of
 the defined custom exceptions.
 
+Also implements the lightweight exception classes (LW_* prefix) without the
+traceback analysis for the control flow signalling, with the umbrella tuple
+LW_Exception_Check.
+
 Functions:
     GetObjectClass(Value):
         type A -> str
 
 Classes:
+    BoundedRepr: bounded representation of the objects for the error messages
+    LazyFormat: deferred string formatting of a template with the arguments
+    ExceptionMetrics: opt-in registry of the exceptions occurrences
     TracebackPlugin: left plugin class implementing the built-in traceback
         analysis functionality and the exception message modification
     UT_Exception: the base custom exception, parent to all custom exceptions
@@ -19,21 +26,36 @@ Classes:
     UT_AttributeError: custom version of AttributeError
     UT_IndexError: custom version of IndexError
     UT_KeyError: custom version of KeyError
+    LightweightPlugin: left plugin class of the lightweight exceptions
+    LW_Exception: lightweight version of Exception
+    LW_TypeError: lightweight version of TypeError
+    LW_ValueError: lightweight version of ValueError
+    LW_AttributeError: lightweight version of AttributeError
+    LW_IndexError: lightweight version of IndexError
+    LW_KeyError: lightweight version of KeyError
 """
 
-__version__ = "1.2.0.0"
-__date__ = "01-07-2026"
+__version__ = "1.7.0.0"
+__date__ = "18-10-2026"
 __status__ = "Production"
 
 #imports
 
 #+ standard libraries
 
+import sys
 import collections
 import types
 import abc
+import reprlib
+import itertools
+import threading
+import time
+import bisect
+import json
+import re
 
-from typing import Any, Optional, Union
+from typing import Any, Optional, Union, Callable, ClassVar
 
 #+ custom modules
 
@@ -44,9 +66,74 @@ from .my_traceback import ExceptionTraceback
 type TIntNone = Optional[int]
 type TTracebackNone = Optional[types.TracebackType]
 type TScalarSequence = Union[Any, list[Any]]
+type TTemplate = Union[str, Callable[..., str]]
+
+#global variables
+
+METRIC_NAME = re.compile(r'[a-zA-Z_:][a-zA-Z0-9_:]*') #Prometheus metrics names
 
 #functions
 
+def _EscapeLabel(Value: Any) -> str:
+    """
+    Helper function. Escapes the backslashes, double quotes and new lines in
+    the string representation of a value of a label in the Prometheus text
+    format.
+
+    Signature:
+        type A -> str
+    
+    Version 1.0.0.0
+    """
+    return str(Value).replace('\\', '\\\\').replace('"', '\\"').replace(
+                                                                '\n', '\\n')
+
+def _TruncateTraceback(Traceback: types.TracebackType,
+                            SkipFrames: int) -> types.TracebackType:
+    """
+    Helper function. Creates a copy of the chain of the traceback objects
+    without the specified number of the innermost frames, unless there are not
+    enough frames, in which case the original traceback is returned. The
+    original chain is not modified.
+
+    Signature:
+        types.TracebackType, int > 0 -> types.TracebackType
+    
+    Version 1.0.0.0
+    """
+    Links = []
+    Link = Traceback
+    while not (Link is None):
+        Links.append(Link)
+        Link = Link.tb_next
+    if 0 < SkipFrames < len(Links):
+        Result = None
+        for Link in reversed(Links[:len(Links) - SkipFrames]):
+            Result = types.TracebackType(Result, Link.tb_frame, Link.tb_lasti,
+                                                                Link.tb_lineno)
+    else:
+        Result = Traceback
+    Links.clear()
+    del Link
+    return Result
+
+def _RestoreException(ExceptionClass: type, Arguments: tuple) -> Exception:
+    """
+    Helper function. Re-creates an instance of a custom exception upon
+    unpickling without calling its initialization method (the signatures of
+    which differ), with the error message as the arguments. The rest of the
+    state, including the traceback analysis object, is restored by the pickle
+    protocol afterwards.
+
+    Signature:
+        type, tuple(type A) -> Exception
+    
+    Version 1.0.0.0
+    """
+    Result = ExceptionClass.__new__(ExceptionClass)
+    BaseException.args.__set__(Result, Arguments)
+    return Result
+
 def GetObjectClass(Value: Any) -> str:
     """
     Helper function. Attempts to extract the class's name of the passed class
@@ -74,6 +161,754 @@ def GetObjectClass(Value: Any) -> str:
 
 #classes
 
+#+ helper classes
+
+class BoundedRepr(reprlib.Repr):
+    """
+    Bounded representation of the objects for the error messages, based on
+    the reprlib module: only the first few elements of the containers are
+    processed (also of the sub-classes of the built-in containers and of the
+    mappings, sequences and sets in general), the nested containers are
+    processed only down to the specified depth, and the resulting string is
+    truncated to the specified length. Thus, the cost of the representation
+    does not depend on the size of the object. The exceptions raised during
+    the representation are not propagated.
+
+    The process-wide instance is the class attribute LazyFormat.Formatter,
+    which is used for the arguments of all custom exceptions' error messages,
+    and which can be replaced by an instance with other limits.
+
+    Methods:
+        repr(Value):
+            type A -> str
+        toString(Value):
+            type A -> str
+    
+    Version 1.0.0.0
+    """
+
+    #class data attributes - default values
+
+    MaxLevel: ClassVar[int] = 3 #max depth of the nested containers
+    MaxItems: ClassVar[int] = 6 #max number of the shown elements per container
+    MaxString: ClassVar[int] = 60 #max length of a nested element
+    MaxLength: ClassVar[int] = 240 #max length of the whole representation
+
+    #special methods
+
+    def __init__(self, *, MaxLevel: TIntNone = None, MaxItems: TIntNone = None,
+                            MaxString: TIntNone = None,
+                            MaxLength: TIntNone = None) -> None:
+        """
+        Initialization method. The not passed or improper values of the limits
+        are replaced by the respective class fields.
+
+        Signature:
+            /int > 0 OR None, int > 0 OR None, int > 0 OR None,
+                int > 0 OR None/ -> None
+        
+        Args:
+            MaxLevel: (keyword) int > 0 OR None; max depth of the nested
+                containers
+            MaxItems: (keyword) int > 0 OR None; max number of the shown
+                elements of each container
+            MaxString: (keyword) int > 0 OR None; max length of the nested
+                strings, numbers and other objects
+            MaxLength: (keyword) int > 0 OR None; max length of the whole
+                representation
+        
+        Version 1.0.0.0
+        """
+        super().__init__()
+        Limits = dict()
+        for Name, Value in (('MaxLevel', MaxLevel), ('MaxItems', MaxItems),
+                                ('MaxString', MaxString),
+                                ('MaxLength', MaxLength)):
+            if (isinstance(Value, int) and not isinstance(Value, bool)
+                                                                and Value > 0):
+                Limits[Name] = Value
+            else:
+                Limits[Name] = getattr(self, Name)
+        self.maxlevel = Limits['MaxLevel']
+        self.maxtuple = self.maxlist = self.maxarray = Limits['MaxItems']
+        self.maxdict = self.maxset = self.maxfrozenset = Limits['MaxItems']
+        self.maxdeque = Limits['MaxItems']
+        self.maxstring = self.maxlong = self.maxother = Limits['MaxString']
+        self._MaxLength = Limits['MaxLength']
+    
+    #private methods
+
+    def _truncate(self, Text: str) -> str:
+        """
+        Truncates the string to the max length of the representation, marking
+        the truncation by the trailing ellipsis.
+
+        Signature:
+            str -> str
+        
+        Version 1.0.0.0
+        """
+        if len(Text) > self._MaxLength:
+            Text = '{}...'.format(Text[:max(self._MaxLength - 3, 0)])
+        return Text
+    
+    def _reprItems(self, Items: collections.abc.Iterable, Size: int,
+                    Level: int, Left: str, Right: str, *,
+                    IsMapping: bool = False) -> str:
+        """
+        Creates the representation of only the first few elements of a
+        generic container, or only the brackets with the ellipsis if the max
+        depth is reached.
+
+        Signature:
+            iterable(type A), int >= 0, int, str, str/, *, bool/ -> str
+        
+        Version 1.0.0.0
+        """
+        if not Size:
+            Result = f'{Left}{Right}'
+        elif Level <= 0:
+            Result = f'{Left}...{Right}'
+        else:
+            Parts = []
+            for Item in itertools.islice(Items, self.maxlist):
+                if IsMapping:
+                    Parts.append('{}: {}'.format(self.repr1(Item[0], Level - 1),
+                                                self.repr1(Item[1], Level - 1)))
+                else:
+                    Parts.append(self.repr1(Item, Level - 1))
+            if Size > self.maxlist:
+                Parts.append('...')
+            Result = '{}{}{}'.format(Left, ', '.join(Parts), Right)
+        return Result
+    
+    #public methods
+
+    def repr1(self, x: Any, level: int) -> str:
+        """
+        Overrides the dispatching method of the reprlib.Repr class to process
+        the generic mappings, sequences and sets, as well as the sub-classes
+        of the built-in containers, which are not bounded by reprlib itself.
+
+        Signature:
+            type A, int -> str
+        
+        Version 1.0.0.0
+        """
+        Name = '_'.join(type(x).__name__.split())
+        if hasattr(self, f'repr_{Name}'):
+            Result = super().repr1(x, level)
+        elif isinstance(x, collections.abc.Mapping):
+            Result = self._reprItems(x.items(), len(x), level, f'{Name}({{',
+                                                    '})', IsMapping = True)
+        elif isinstance(x, str):
+            Result = self.repr_str(x, level)
+        elif isinstance(x, (bytes, bytearray)):
+            Result = self.repr_bytes(bytes(x[:self.maxstring + 1]), level)
+        elif isinstance(x, range):
+            Result = repr(x)
+        elif isinstance(x, tuple) and hasattr(x, '_fields'): #named tuple
+            Result = self._reprItems(x, len(x), level, f'{Name}(', ')')
+        elif isinstance(x, collections.abc.Sequence):
+            Result = self._reprItems(x, len(x), level, f'{Name}([', '])')
+        elif isinstance(x, collections.abc.Set):
+            Result = self._reprItems(x, len(x), level, f'{Name}({{', '})')
+        else:
+            Result = super().repr1(x, level)
+        return Result
+    
+    def repr_dict(self, x: dict, level: int) -> str:
+        """
+        Creates the representation of only the first few items of the
+        dictionary in their insertion order, instead of the sorting of all
+        keys done by reprlib.
+
+        Signature:
+            dict, int -> str
+        
+        Version 1.0.0.0
+        """
+        return self._reprItems(x.items(), len(x), level, '{', '}',
+                                                            IsMapping = True)
+    
+    def repr_set(self, x: set, level: int) -> str:
+        """
+        Creates the representation of only the first few elements of the set
+        in their iteration order, instead of the sorting of all elements done
+        by reprlib.
+
+        Signature:
+            set, int -> str
+        
+        Version 1.0.0.0
+        """
+        if len(x):
+            Result = self._reprItems(x, len(x), level, '{', '}')
+        else:
+            Result = 'set()'
+        return Result
+    
+    def repr_frozenset(self, x: frozenset, level: int) -> str:
+        """
+        Creates the representation of only the first few elements of the set
+        in their iteration order, instead of the sorting of all elements done
+        by reprlib.
+
+        Signature:
+            frozenset, int -> str
+        
+        Version 1.0.0.0
+        """
+        if len(x):
+            Result = self._reprItems(x, len(x), level, 'frozenset({', '})')
+        else:
+            Result = 'frozenset()'
+        return Result
+    
+    def repr_bytes(self, x: bytes, level: int) -> str:
+        """
+        Creates the representation of only the first few bytes, instead of the
+        truncation of the full representation.
+
+        Signature:
+            bytes, int -> str
+        
+        Version 1.0.0.0
+        """
+        Result = repr(x[:self.maxstring])
+        if len(x) > self.maxstring:
+            Result = f'{Result}...'
+        return Result
+    
+    def repr_bytearray(self, x: bytearray, level: int) -> str:
+        """
+        Creates the representation of only the first few bytes, instead of the
+        truncation of the full representation.
+
+        Signature:
+            bytearray, int -> str
+        
+        Version 1.0.0.0
+        """
+        Result = repr(x[:self.maxstring])
+        if len(x) > self.maxstring:
+            Result = f'{Result[:-1]}...)'
+        return Result
+    
+    def repr(self, x: Any) -> str:
+        """
+        Creates the bounded representation of an object; '<repr() failed>' is
+        returned if an exception is raised.
+
+        Signature:
+            type A -> str
+        
+        Version 1.0.0.0
+        """
+        try:
+            Result = self._truncate(super().repr(x))
+        except Exception:
+            Result = '<repr() failed>'
+        return Result
+    
+    def toString(self, Value: Any) -> str:
+        """
+        Creates the bounded string conversion of an object: the strings are
+        only truncated (not quoted), the containers are represented with only
+        the first few elements, and the other objects are converted by str()
+        and truncated; '<str() failed>' is returned if an exception is raised.
+
+        Signature:
+            type A -> str
+        
+        Version 1.0.0.0
+        """
+        if isinstance(Value, str):
+            Result = self._truncate(Value)
+        elif isinstance(Value, collections.abc.Collection):
+            Result = self.repr(Value)
+        else:
+            try:
+                Result = self._truncate(str(Value))
+            except Exception:
+                Result = '<str() failed>'
+        return Result
+
+class LazyFormat():
+    """
+    Deferred string formatting: stores a template and its arguments, and
+    produces the string only when it is converted, e.g. by str() or within an
+    f-string. The template is either a string, which is filled in by its
+    method format(), or a callable, which is called with the arguments. Used
+    to defer the construction of the error messages of the custom exceptions,
+    since most of the caught exceptions are discarded without being read.
+
+    The arguments of a string template are converted into the strings by the
+    bounded representation (the class attribute Formatter), so a large
+    container involved into an error is not converted in the whole. The
+    container arguments (except for the strings) are represented immediately
+    upon the instantiation, since the cost of the bounded representation does
+    not depend on their size; thus the message shows their state at the moment
+    of the error, and the containers are not kept alive by the message. The
+    other arguments are converted only upon the conversion of the instance,
+    except for the nested instances of this class, which are converted as they
+    are (not truncated). The arguments of a callable template are passed as
+    they are, therefore only the immutable or O(1) facts (e.g. the class name)
+    should be passed to it.
+
+    Note that the mutable arguments, which are not containers, are represented
+    in their state at the moment of the conversion, not of the instantiation.
+
+    Version 1.2.0.0
+    """
+
+    #class data attributes - default values
+
+    Formatter: ClassVar[BoundedRepr] = BoundedRepr() #process-wide
+
+    #special methods
+
+    def __init__(self, Template: TTemplate, *args) -> None:
+        """
+        Initialization method.
+
+        Signature:
+            str OR callable(type A, ... -> str)/, type A, .../ -> None
+        
+        Args:
+            Template: str OR callable(type A, ... -> str); format string or a
+                function producing the string
+            *args: type A; any number of the arguments for the template
+        
+        Version 1.1.0.0
+        """
+        self._Template = Template
+        if callable(Template):
+            self._Arguments = args
+        else:
+            self._Arguments = tuple(map(self._snapshot, args))
+    
+    def __str__(self) -> str:
+        """
+        Produces the string by filling in the template with the bounded
+        string conversions of the stored arguments or calling it with them.
+
+        Signature:
+            None -> str
+        
+        Version 1.2.0.0
+        """
+        if callable(self._Template):
+            Result = str(self._Template(*self._Arguments))
+        else:
+            Result = str(self._Template).format(
+                                        *map(self._convert, self._Arguments))
+        return Result
+    
+    def __format__(self, Specification: str) -> str:
+        """
+        Applies the format specification to the produced string, thus the
+        formatting is also deferred when the instance is used as an argument
+        of an f-string or another template.
+
+        Signature:
+            str -> str
+        
+        Version 1.0.0.0
+        """
+        return format(str(self), Specification)
+    
+    #private methods
+
+    @classmethod
+    def _snapshot(cls, Value: Any) -> Any:
+        """
+        Replaces a container (except for a string) by its bounded
+        representation, other values are returned as they are.
+
+        Signature:
+            type A -> type A OR str
+        
+        Version 1.0.0.0
+        """
+        if (isinstance(Value, collections.abc.Collection) and
+                                                not isinstance(Value, str)):
+            Value = cls.Formatter.toString(Value)
+        return Value
+    
+    @classmethod
+    def _convert(cls, Value: Any) -> str:
+        """
+        Bounded string conversion of an argument of a string template; the
+        nested instances of this class are converted without truncation.
+
+        Signature:
+            type A -> str
+        
+        Version 1.0.0.0
+        """
+        if isinstance(Value, LazyFormat):
+            try:
+                Result = str(Value)
+            except Exception:
+                Result = '<str() failed>'
+        else:
+            Result = cls.Formatter.toString(Value)
+        return Result
+
+class ExceptionMetrics():
+    """
+    Thread-safe opt-in registry of the occurrences of the custom exceptions,
+    which counts the instantiated exceptions per class and per raise site
+    (code object and line number), and, optionally, keeps the histograms of
+    the time intervals between the consecutive occurrences at each site. The
+    counters are kept per thread without locking, and they are merged only
+    upon the snapshot; the counters of the finished threads are retained.
+    The intervals are measured per thread.
+
+    The registry is applied process-wide by the assignment of an instance to
+    the class attribute TracebackPlugin.Metrics (also used by all custom
+    exceptions, unless overridden). The raise site is the frame instantiating
+    the exception, unless the innermost frames are skipped (see SkipFrames
+    argument of the exceptions). The number of the tracked sites per thread
+    is bounded; the occurrences at the sites beyond the limit are counted per
+    class only.
+
+    Properties:
+        Timing: (read-only) bool; flag if the intervals histograms are kept
+    
+    Methods:
+        record(ExceptionClass, CodeObject, LineNumber):
+            type, types.CodeType OR None, int -> None
+        snapshot():
+            None -> dict(str -> type A)
+        toJSON(*, Indent = None):
+            /int >= 0 OR None/ -> str
+        toPrometheus():
+            None -> str
+        reset():
+            None -> None
+    
+    Version 1.0.0.0
+    """
+
+    #class data attributes - default values
+
+    MaxSites: ClassVar[int] = 1024 #max number of the tracked sites per thread
+    Buckets: ClassVar[tuple[float, ...]] = (0.001, 0.01, 0.1, 1.0, 10.0, 60.0)
+    Prefix: ClassVar[str] = 'introspection_lib' #prefix of the metrics names
+
+    #special methods
+
+    def __init__(self, *, Timing: bool = False, MaxSites: TIntNone = None,
+                    Buckets: Optional[collections.abc.Sequence[float]] = None,
+                    Prefix: Optional[str] = None) -> None:
+        """
+        Initialization method. The not passed or improper values of the
+        keyword arguments are replaced by the respective class fields.
+
+        Signature:
+            /bool, int > 0 OR None, seq(int > 0 OR float > 0) OR None,
+                str OR None/ -> None
+        
+        Args:
+            Timing: (keyword) bool; flag if the intervals histograms are to be
+                kept, defaults to False
+            MaxSites: (keyword) int > 0 OR None; max number of the tracked
+                sites per thread
+            Buckets: (keyword) seq(int > 0 OR float > 0) OR None; upper bounds
+                of the histograms buckets in seconds, in the ascending order
+            Prefix: (keyword) str OR None; prefix of the names of the metrics
+                in the Prometheus format
+        
+        Version 1.0.0.0
+        """
+        self._Timing = Timing is True
+        if (isinstance(MaxSites, int) and not isinstance(MaxSites, bool)
+                                                            and MaxSites > 0):
+            self._MaxSites = MaxSites
+        else:
+            self._MaxSites = self.MaxSites
+        if (isinstance(Buckets, collections.abc.Sequence) and len(Buckets)
+                and all(isinstance(Bound, (int, float))
+                        and not isinstance(Bound, bool) and Bound > 0
+                                                        for Bound in Buckets)
+                and list(Buckets) == sorted(set(Buckets))):
+            self._Buckets = tuple(float(Bound) for Bound in Buckets)
+        else:
+            self._Buckets = tuple(self.Buckets)
+        if isinstance(Prefix, str) and METRIC_NAME.fullmatch(Prefix):
+            self._Prefix = Prefix
+        else:
+            self._Prefix = self.Prefix
+        self._Lock = threading.Lock()
+        self.reset()
+    
+    #private methods
+
+    def _getState(self) -> list[dict]:
+        """
+        Returns the counters and histograms of the current thread, which are
+        created and registered upon the first call from a thread.
+
+        Signature:
+            None -> list(dict(tuple(type A) -> type B) x3)
+        
+        Version 1.0.0.0
+        """
+        Local = self._Local
+        State = getattr(Local, 'State', None)
+        if State is None:
+            State = [dict(), dict(), dict()] #counters, last seen, histograms
+            Local.State = State
+            with self._Lock:
+                self._Threads.append((threading.current_thread(), State))
+        return State
+    
+    @staticmethod
+    def _mergeState(Target: list[dict], State: list[dict]) -> None:
+        """
+        Adds the counters and histograms of a thread to the target ones.
+
+        Signature:
+            list(dict x3), list(dict x3) -> None
+        
+        Version 1.0.0.0
+        """
+        for Key, (Count, CodeObject, LineNumber) in list(State[0].items()):
+            Entry = Target[0].get(Key, None)
+            if Entry is None:
+                Target[0][Key] = [Count, CodeObject, LineNumber]
+            else:
+                Entry[0] += Count
+        for Key, Histogram in list(State[2].items()):
+            Histogram = list(Histogram)
+            Total = Target[2].get(Key, None)
+            if Total is None:
+                Target[2][Key] = Histogram
+            else:
+                Target[2][Key] = [First + Second
+                                for First, Second in zip(Total, Histogram)]
+    
+    @staticmethod
+    def _getClassName(ExceptionClass: type) -> str:
+        """
+        Returns the class name qualified by the module's name.
+
+        Signature:
+            type -> str
+        
+        Version 1.0.0.0
+        """
+        return f'{ExceptionClass.__module__}.{ExceptionClass.__qualname__}'
+    
+    #public methods
+
+    #+ properties
+
+    @property
+    def Timing(self) -> bool:
+        """
+        Read-only property returning the flag if the histograms of the time
+        intervals between the consecutive occurrences are kept.
+
+        Signature:
+            None -> bool
+        
+        Version 1.0.0.0
+        """
+        return self._Timing
+    
+    #+ methods
+
+    def record(self, ExceptionClass: type, CodeObject: Optional[types.CodeType],
+                                                    LineNumber: int) -> None:
+        """
+        Registers an occurrence of an exception at the raise site, defined by
+        the code object and the line number. Called by the custom exceptions
+        upon instantiation, can also be called directly.
+
+        Signature:
+            type, types.CodeType OR None, int -> None
+        
+        Args:
+            ExceptionClass: type; class of the exception
+            CodeObject: types.CodeType OR None; code object of the raise site,
+                None means unknown site
+            LineNumber: int; line number of the raise site
+        
+        Version 1.0.0.0
+        """
+        State = getattr(self._Local, 'State', None)
+        if State is None:
+            State = self._getState()
+        Counters = State[0]
+        #code objects are identified by id(), since their hashing is costly;
+        #+ the counters keep the references, so the ids are not re-used
+        Key = (ExceptionClass, id(CodeObject), LineNumber)
+        Entry = Counters.get(Key, None)
+        if Entry is None:
+            if len(Counters) >= self._MaxSites:
+                CodeObject = None
+                LineNumber = 0
+                Key = (ExceptionClass, id(None), 0)
+                Entry = Counters.get(Key, None)
+            if Entry is None:
+                Entry = [0, CodeObject, LineNumber]
+                Counters[Key] = Entry
+        Entry[0] += 1
+        if self._Timing:
+            Now = time.monotonic()
+            LastSeen = State[1]
+            Last = LastSeen.get(Key, None)
+            LastSeen[Key] = Now
+            if not (Last is None):
+                Histograms = State[2]
+                Histogram = Histograms.get(Key, None)
+                if Histogram is None:
+                    Histogram = [0] * (len(self._Buckets) + 1) + [0.0]
+                    Histograms[Key] = Histogram
+                Interval = Now - Last
+                Histogram[bisect.bisect_left(self._Buckets, Interval)] += 1
+                Histogram[-1] += Interval
+    
+    def snapshot(self) -> dict[str, Any]:
+        """
+        Returns the merged counters of all threads as a dictionary with the
+        keys 'Classes' (class names qualified by the modules' names mapped to
+        the numbers of the occurrences) and 'Sites' (list of the dictionaries
+        with the keys 'Class', 'FilePath', 'Function', 'LineNumber' and
+        'Count', sorted by the descending count). With the timing the sites
+        have the key 'Intervals' - dictionary with the keys 'Bounds' (upper
+        bounds of the buckets in seconds), 'Counts' (non-cumulative, with the
+        last bucket for the longer intervals), 'Sum' (seconds) and 'Count'.
+        The sites beyond the limit have 'FilePath' and 'Function' as '<other>'
+        and 'LineNumber' as 0.
+
+        Signature:
+            None -> dict(str -> type A)
+        
+        Version 1.0.0.0
+        """
+        Total = [dict(), None, dict()]
+        with self._Lock:
+            Threads = []
+            for ThreadObject, State in self._Threads:
+                if ThreadObject.is_alive():
+                    Threads.append((ThreadObject, State))
+                    self._mergeState(Total, State)
+                else: #finished thread - retain its counters only
+                    self._mergeState(self._Retired, State)
+            self._Threads = Threads
+            self._mergeState(Total, self._Retired)
+        Classes = dict()
+        Sites = []
+        for Key, (Count, CodeObject, LineNumber) in Total[0].items():
+            ExceptionClass = Key[0]
+            Name = self._getClassName(ExceptionClass)
+            Classes[Name] = Classes.get(Name, 0) + Count
+            if CodeObject is None:
+                FilePath = Function = '<other>'
+            else:
+                FilePath = CodeObject.co_filename
+                Function = CodeObject.co_qualname
+            Site = {'Class' : Name, 'FilePath' : FilePath,
+                    'Function' : Function, 'LineNumber' : LineNumber,
+                    'Count' : Count}
+            if self._Timing:
+                Histogram = Total[2].get(Key, None)
+                if Histogram is None:
+                    Histogram = [0] * (len(self._Buckets) + 1) + [0.0]
+                Site['Intervals'] = {'Bounds' : list(self._Buckets),
+                                        'Counts' : Histogram[:-1],
+                                        'Sum' : Histogram[-1],
+                                        'Count' : sum(Histogram[:-1])}
+            Sites.append(Site)
+        Sites.sort(key = lambda Item: - Item['Count'])
+        return {'Classes' : Classes, 'Sites' : Sites}
+    
+    def toJSON(self, *, Indent: TIntNone = None) -> str:
+        """
+        Serializes the snapshot of the counters (see the method snapshot())
+        into a JSON object string.
+
+        Signature:
+            /int >= 0 OR None/ -> str
+        
+        Args:
+            Indent: (keyword) int >= 0 OR None; indentation of the nested
+                elements, defaults to None - compact single line output
+        
+        Version 1.0.0.0
+        """
+        if not (isinstance(Indent, int) and not isinstance(Indent, bool)
+                                                            and Indent >= 0):
+            Indent = None
+        return json.dumps(self.snapshot(), indent = Indent)
+    
+    def toPrometheus(self) -> str:
+        """
+        Serializes the snapshot of the counters (see the method snapshot())
+        in the Prometheus text exposition format: the counters per class
+        {Prefix}_exceptions_total, the counters per site
+        {Prefix}_exception_sites_total, and with the timing - the histograms
+        of the intervals {Prefix}_exception_interval_seconds.
+
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        Data = self.snapshot()
+        Prefix = self._Prefix
+        Lines = [f'# HELP {Prefix}_exceptions_total Number of the '
+                                    + 'instantiated exceptions per class',
+                    f'# TYPE {Prefix}_exceptions_total counter']
+        for Name, Count in sorted(Data['Classes'].items()):
+            Lines.append('{}_exceptions_total{{class="{}"}} {}'.format(Prefix,
+                                                    _EscapeLabel(Name), Count))
+        Lines.append(f'# HELP {Prefix}_exception_sites_total Number of the '
+                                    + 'instantiated exceptions per raise site')
+        Lines.append(f'# TYPE {Prefix}_exception_sites_total counter')
+        Labels = []
+        for Site in Data['Sites']:
+            Label = 'class="{}",file="{}",function="{}",line="{}"'.format(
+                        *map(_EscapeLabel, (Site['Class'], Site['FilePath'],
+                                    Site['Function'], Site['LineNumber'])))
+            Labels.append(Label)
+            Lines.append('{}_exception_sites_total{{{}}} {}'.format(Prefix,
+                                                        Label, Site['Count']))
+        if self._Timing:
+            Name = f'{Prefix}_exception_interval_seconds'
+            Lines.append(f'# HELP {Name} Time intervals between the '
+                            + 'consecutive exceptions at the same raise site')
+            Lines.append(f'# TYPE {Name} histogram')
+            for Label, Site in zip(Labels, Data['Sites']):
+                Intervals = Site['Intervals']
+                Cumulative = 0
+                for Bound, Count in zip(Intervals['Bounds'] + ['+Inf'],
+                                                        Intervals['Counts']):
+                    Cumulative += Count
+                    Lines.append(f'{Name}_bucket{{{Label},le="{Bound}"}} '
+                                                            + f'{Cumulative}')
+                Lines.append(f'{Name}_sum{{{Label}}} {Intervals["Sum"]}')
+                Lines.append(f'{Name}_count{{{Label}}} {Intervals["Count"]}')
+        return '\n'.join(Lines) + '\n'
+    
+    def reset(self) -> None:
+        """
+        Discards all counters and histograms.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        with self._Lock:
+            self._Local = threading.local()
+            self._Threads = []
+            self._Retired = [dict(), None, dict()]
+
 #+ plugin class
 
 class TracebackPlugin():
@@ -84,22 +919,40 @@ class TracebackPlugin():
     Cannot be instantiated by itself, since TypeError will be raised. Must be
     used only as left plugin for sub-classing exceptions.
 
+    The error message can be stored as the parts pending the conversion into
+    the strings (see the class LazyFormat), in which case it is constructed
+    only upon the first read - access to the args attribute, str(), repr(),
+    the method getMessage(), etc. The parts, which fail to be converted, are
+    replaced by '<str() failed>'.
+
+    The occurrences of the exceptions are counted per class and raise site by
+    the process-wide metrics registry, if it is assigned to the class
+    attribute Metrics (see the class ExceptionMetrics).
+
     Properties:
         Traceback: (read-only) introspection_lib.my_traceback.ExceptionTraceback
+        args: tuple(str x1); the error message as the only element, constructed
+            from the pending parts upon the first access
     
     Methods:
         with_traceback(Traceback):
             types.TracebackType -> Exception
         getMessage():
             None -> str
-        appendMessage(Message):
-            type A -> None
-        setMessage(Message):
-            type A -> None
+        appendMessage(Message, *args):
+            type A/, type B, .../ -> None
+        setMessage(Message, *args):
+            type A/, type B, .../ -> None
     
-    Version 2.0.0.0
+    Version 2.2.0.0
     """
 
+    #class data attributes - default values
+
+    Metrics: ClassVar[Optional[ExceptionMetrics]] = None #process-wide registry
+
+    _InitCodes: ClassVar[dict[type, frozenset]] = dict() #ids of __init__ code
+
     #special methods
 
     def __init__(self, *args, SkipFrames: TIntNone = None,
@@ -129,35 +982,189 @@ class TracebackPlugin():
                 holds a proper traceback object the SkipFrames argument is
                 ignored
         
-        Version 1.0.0.0
+        If the metrics registry is assigned to the class attribute Metrics,
+        the occurrence of the exception is registered with the raise site.
+
+        Version 1.1.0.0
         """
         super().__init__(*args)
         self._Traceback = None
         self._SkipFrames = SkipFrames
+        self._PendingMessage = None
         if not (FromTraceback is None):
             self._Traceback = ExceptionTraceback(FromTraceback = FromTraceback)
+        Metrics = self.Metrics
+        if isinstance(Metrics, ExceptionMetrics):
+            self._recordMetrics(Metrics, SkipFrames)
+    
+    def __str__(self) -> str:
+        """
+        Constructs the pending error message (if any) before the standard
+        conversion into a string.
+
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        self._renderMessage()
+        return super().__str__()
+    
+    def __repr__(self) -> str:
+        """
+        Constructs the pending error message (if any) before the standard
+        representation.
+
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        self._renderMessage()
+        return super().__repr__()
+    
+    def __reduce__(self) -> tuple:
+        """
+        Support of the pickle protocol and copying. The exception is restored
+        without calling its initialization method, from the constructed error
+        message and the instance attributes. The traceback analysis object of
+        the raised exception is created (if not yet), so it is transferred in
+        its compact binary form (see the class ExceptionTraceback) and can be
+        rendered by the receiving process without any frame objects.
+
+        Signature:
+            None -> tuple(function, tuple(type, tuple(str x1)), dict)
+        
+        Version 1.1.0.0
+        """
+        self._renderMessage()
+        if self._Traceback is None and not (self.__traceback__ is None):
+            self.Traceback
+        return (_RestoreException, (self.__class__, self.args),
+                                                            dict(self.__dict__))
+    
+    #private methods
+
+    def _recordMetrics(self, Metrics: ExceptionMetrics,
+                                                SkipFrames: TIntNone) -> None:
+        """
+        Registers the occurrence of the exception in the metrics registry. The
+        raise site is the frame instantiating the exception, i.e. the first
+        frame outside the initialization methods of the exception's class and
+        its parents, further shifted outwards by SkipFrames if it is a positive
+        integer.
+
+        Signature:
+            ExceptionMetrics, int > 0 OR None -> None
+        
+        Version 1.0.0.0
+        """
+        ExceptionClass = type(self)
+        InitCodes = self._InitCodes.get(ExceptionClass, None)
+        if InitCodes is None:
+            InitCodes = frozenset(id(Class.__dict__['__init__'].__code__)
+                                for Class in ExceptionClass.__mro__
+                                if hasattr(Class.__dict__.get('__init__', None),
+                                                                '__code__'))
+            self._InitCodes[ExceptionClass] = InitCodes
+        Frame = sys._getframe(2)
+        while not (Frame is None) and id(Frame.f_code) in InitCodes:
+            Frame = Frame.f_back
+        if (isinstance(SkipFrames, int) and not isinstance(SkipFrames, bool)
+                                                            and SkipFrames > 0):
+            for _ in range(SkipFrames):
+                if Frame is None:
+                    break
+                Frame = Frame.f_back
+        if Frame is None:
+            Metrics.record(ExceptionClass, None, 0)
+        else:
+            Metrics.record(ExceptionClass, Frame.f_code, Frame.f_lineno)
+        del Frame
+    
+    def _renderMessage(self) -> None:
+        """
+        Constructs the error message from the pending parts (if any) joined
+        by single whitespaces, and stores it as the only element of the args
+        tuple. Does nothing otherwise. The parts, which are neither strings
+        nor deferred templates, are converted by the bounded representation.
+
+        Signature:
+            None -> None
+        
+        Version 1.1.0.0
+        """
+        Pending = getattr(self, '_PendingMessage', None)
+        if not (Pending is None):
+            Parts = []
+            for Part in Pending:
+                if isinstance(Part, (str, LazyFormat)):
+                    try:
+                        Parts.append(str(Part))
+                    except Exception:
+                        Parts.append('<str() failed>')
+                else:
+                    Parts.append(LazyFormat.Formatter.toString(Part))
+            BaseException.args.__set__(self, (' '.join(Parts), ))
+            self._PendingMessage = None
 
     #added public API
 
+    @property
+    def args(self) -> tuple:
+        """
+        Property returning the arguments of the exception, i.e. the error
+        message as the only element. The pending message is constructed upon
+        the first access. The assigned value replaces the pending message.
+
+        Signature:
+            None -> tuple(str x1)
+        
+        Version 1.0.0.0
+        """
+        self._renderMessage()
+        return BaseException.args.__get__(self)
+    
+    @args.setter
+    def args(self, Value: Any) -> None:
+        """
+        Setter of the arguments of the exception, which discards the pending
+        message.
+
+        Signature:
+            type A -> None
+        
+        Version 1.0.0.0
+        """
+        self._PendingMessage = None
+        BaseException.args.__set__(self, Value)
+
     @property
     def Traceback(self) -> ExceptionTraceback:
         """
         Read-only property returning exception traceback analysis object. If
         such object does not yet exist, it is created 'on the fly' and is stored
-        for the future references.
+        for the future references. The process-wide capture policy (class
+        attribute Policy of introspection_lib.my_traceback.StackTraceback) is
+        respected, i.e. a cheap placeholder holding only the raise site frame
+        can be returned under overload.
 
         Signature:
             None -> introspection_lib.traceback.ExceptionTraceback
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
         if (self._Traceback is None):
+            Traceback = self.__traceback__
             if self._SkipFrames is None:
-                self._Traceback = ExceptionTraceback(FromTraceback
-                                                        = self.__traceback__)
-            else:
+                self._Traceback = ExceptionTraceback(FromTraceback = Traceback)
+            elif Traceback is None:
                 self._Traceback = ExceptionTraceback(
                                                 SkipFrames = self._SkipFrames)
+            else: #also outside the except clause, e.g. upon pickling
+                self._Traceback = ExceptionTraceback(FromTraceback =
+                                _TruncateTraceback(Traceback, self._SkipFrames))
+            del Traceback
         return self._Traceback
     
     def with_traceback(self, Traceback: types.TracebackType) -> Exception:
@@ -165,8 +1172,11 @@ class TracebackPlugin():
         Overrides the standard exceptions' method; ensures the de-referencig of
         the stored exception traceback instance and sets the corresponding
         'private' attributes to None, thus when requested the traceback analysis
-        object will be created from the actual traceback of the exception. Then
-        it reverts to the original version of the same method.
+        object will be created from the actual traceback of the exception, and
+        the memoized rendered text of the old traceback is discarded with it
+        (the process-wide rendered texts cache is keyed by the fingerprint of
+        the traceback, thus it is not affected). Then it reverts to the
+        original version of the same method.
 
         Signature:
             types.TracebackType -> Exception
@@ -180,7 +1190,7 @@ class TracebackPlugin():
                 fact, the reference to the instance of the same custom exception
                 class, into which this plugin is added
         
-        Version 1.0.0.0
+        Version 1.0.1.0
         """
         del self._Traceback
         self._Traceback = None
@@ -198,31 +1208,41 @@ class TracebackPlugin():
         """
         return str(self.args[0])
     
-    def setMessage(self, Message: Any) -> None:
+    def setMessage(self, Message: Any, *args) -> None:
         """
         Changes the exception error message to the string representation of the
-        passed argument value.
+        passed argument value. If the extra arguments are passed, the first one
+        is treated as the format string. The conversion is deferred until the
+        message is read.
         
         Signature:
-            type A -> None
+            type A/, type B, .../ -> None
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        self.args = (str(Message), )
+        if len(args):
+            Message = LazyFormat(Message, *args)
+        self._PendingMessage = [Message]
     
-    def appendMessage(self, Message: Any) -> None:
+    def appendMessage(self, Message: Any, *args) -> None:
         """
         Changes the exception error message by appending to the end the string
         representation of the passed argument value separated by a single
-        whitespace.
+        whitespace. If the extra arguments are passed, the first one is treated
+        as the format string. The conversion is deferred until the message is
+        read.
         
         Signature:
-            type A -> None
+            type A/, type B, .../ -> None
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        NewMessage = ' '.join([str(self.args[0]), str(Message)])
-        self.args = (NewMessage, )
+        if len(args):
+            Message = LazyFormat(Message, *args)
+        Pending = getattr(self, '_PendingMessage', None)
+        if Pending is None:
+            Pending = [BaseException.args.__get__(self)[0]]
+        self._PendingMessage = Pending + [Message]
 
 #+ main classes
 
@@ -238,7 +1258,8 @@ class UT_Exception(TracebackPlugin, Exception, abc.ABC):
     Sub-classes the standard Exception and the left plugin TracebackPlugin.
 
     Attributes:
-        args: tuple(str x1); one string element tuple storing the passed message
+        args: tuple(str x1); one string element tuple storing the error message
+            (constructed upon the first read)
         __traceback__: types.TracebackType; stores the actual traceback of the
             exception
     
@@ -252,12 +1273,12 @@ class UT_Exception(TracebackPlugin, Exception, abc.ABC):
             types.TracebackType -> UT_Exception
         getMessage():
             None -> str
-        appendMessage(Message):
-            type A -> None
-        setMessage(Message):
-            type A -> None
+        appendMessage(Message, *args):
+            type A/, type B, .../ -> None
+        setMessage(Message, *args):
+            type A/, type B, .../ -> None
 
-    Version 2.0.0.0
+    Version 2.1.0.0
     """
 
     #special methods
@@ -330,10 +1351,15 @@ class UT_Exception(TracebackPlugin, Exception, abc.ABC):
                 holds a proper traceback object the SkipFrames argument is
                 ignored
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        super().__init__(Message, SkipFrames = SkipFrames,
-                                    FromTraceback = FromTraceback)
+        if isinstance(Message, LazyFormat):
+            super().__init__(SkipFrames = SkipFrames,
+                                            FromTraceback = FromTraceback)
+            self._PendingMessage = [Message]
+        else:
+            super().__init__(Message, SkipFrames = SkipFrames,
+                                            FromTraceback = FromTraceback)
 
 class UT_TypeError(TracebackPlugin, TypeError):
     """
@@ -349,7 +1375,8 @@ class UT_TypeError(TracebackPlugin, TypeError):
     is a virtual sub-class of UT_Exception.
 
     Attributes:
-        args: tuple(str x1); one string element tuple storing the passed message
+        args: tuple(str x1); one string element tuple storing the error message
+            (constructed upon the first read)
         __traceback__: types.TracebackType; stores the actual traceback of the
             exception
     
@@ -363,12 +1390,12 @@ class UT_TypeError(TracebackPlugin, TypeError):
             types.TracebackType -> UT_TypeError
         getMessage():
             None -> str
-        appendMessage(Message):
-            type A -> None
-        setMessage(Message):
-            type A -> None
+        appendMessage(Message, *args):
+            type A/, type B, .../ -> None
+        setMessage(Message, *args):
+            type A/, type B, .../ -> None
 
-    Version 2.0.0.0
+    Version 2.1.0.0
     """
 
     #special methods
@@ -377,9 +1404,10 @@ class UT_TypeError(TracebackPlugin, TypeError):
                     SkipFrames: TIntNone = None,
                     FromTraceback: TTracebackNone = None) -> None:
         """
-        Converts the two passed mandatory (positional) arguments into a single
-        string error message, which is stored as the only element of the args
-        tuple attribute. If the FromTraceback keyword argument holds the proper
+        Stores the two passed mandatory (positional) arguments, which are
+        converted into a single string error message only upon the first read,
+        and the message is stored as the only element of the args tuple
+        attribute. If the FromTraceback keyword argument holds the proper
         value, the traceback analysis object is created immediately from the
         substituion object; otherwise its creation is delayed until the first
         access of the property Traceback, in wich case the actual traceback can
@@ -403,9 +1431,27 @@ class UT_TypeError(TracebackPlugin, TypeError):
                 holds a proper traceback object the SkipFrames argument is
                 ignored
         
-        Version 1.0.0.0
+        Version 1.2.0.0
+        """
+        super().__init__(SkipFrames = SkipFrames,
+                                            FromTraceback = FromTraceback)
+        self._PendingMessage = [LazyFormat(self._buildMessage,
+                                            GetObjectClass(Value), Types)]
+    
+    #private methods
+
+    @staticmethod
+    def _buildMessage(ObjectType: str, Types: TScalarSequence) -> str:
+        """
+        Constructs the error message from the class name of the object
+        involved, which is taken upon the instantiation (thus the object is not
+        kept alive by the message), and the expected types.
+
+        Signature:
+            str, type B -> str
+        
+        Version 1.1.0.0
         """
-        ObjectType = GetObjectClass(Value)
         if isinstance(Types, str):
             Message = f'{ObjectType} is not a sub-class of {Types}'
         else:
@@ -415,8 +1461,7 @@ class UT_TypeError(TracebackPlugin, TypeError):
                 _seqTypes = [Types]
             Message = '{} is not a sub-class of ({}, )'.format(ObjectType,
                                     ', '.join(map(GetObjectClass, _seqTypes)))
-        super().__init__(Message, SkipFrames = SkipFrames,
-                                    FromTraceback = FromTraceback)
+        return Message
 
 class UT_ValueError(TracebackPlugin, ValueError):
     """
@@ -431,7 +1476,8 @@ class UT_ValueError(TracebackPlugin, ValueError):
     also is a virtual sub-class of UT_Exception.
 
     Attributes:
-        args: tuple(str x1); one string element tuple storing the passed message
+        args: tuple(str x1); one string element tuple storing the error message
+            (constructed upon the first read)
         __traceback__: types.TracebackType; stores the actual traceback of the
             exception
     
@@ -445,12 +1491,12 @@ class UT_ValueError(TracebackPlugin, ValueError):
             types.TracebackType -> UT_ValueError
         getMessage():
             None -> str
-        appendMessage(Message):
-            type A -> None
-        setMessage(Message):
-            type A -> None
+        appendMessage(Message, *args):
+            type A/, type B, .../ -> None
+        setMessage(Message, *args):
+            type A/, type B, .../ -> None
 
-    Version 2.0.0.0
+    Version 2.1.0.0
     """
 
     #special methods
@@ -459,9 +1505,10 @@ class UT_ValueError(TracebackPlugin, ValueError):
                     SkipFrames: TIntNone = None,
                     FromTraceback: TTracebackNone = None) -> None:
         """
-        Converts the two passed mandatory (positional) arguments into a single
-        string error message, which is stored as the only element of the args
-        tuple attribute. If the FromTraceback keyword argument holds the proper
+        Stores the two passed mandatory (positional) arguments, which are
+        converted into a single string error message only upon the first read,
+        and the message is stored as the only element of the args tuple
+        attribute. If the FromTraceback keyword argument holds the proper
         value, the traceback analysis object is created immediately from the
         substituion object; otherwise its creation is delayed until the first
         access of the property Traceback, in wich case the actual traceback can
@@ -483,11 +1530,12 @@ class UT_ValueError(TracebackPlugin, ValueError):
                 holds a proper traceback object the SkipFrames argument is
                 ignored
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        Message = f'{str(Value)} does not meet restriction {Ranges}'
-        super().__init__(Message, SkipFrames = SkipFrames,
-                                    FromTraceback = FromTraceback)
+        super().__init__(SkipFrames = SkipFrames,
+                                            FromTraceback = FromTraceback)
+        self._PendingMessage = [LazyFormat('{!s} does not meet restriction {}',
+                                                                Value, Ranges)]
 
 class UT_AttributeError(TracebackPlugin, AttributeError):
     """
@@ -502,7 +1550,8 @@ class UT_AttributeError(TracebackPlugin, AttributeError):
     also is a virtual sub-class of UT_Exception.
 
     Attributes:
-        args: tuple(str x1); one string element tuple storing the passed message
+        args: tuple(str x1); one string element tuple storing the error message
+            (constructed upon the first read)
         __traceback__: types.TracebackType; stores the actual traceback of the
             exception
     
@@ -516,12 +1565,12 @@ class UT_AttributeError(TracebackPlugin, AttributeError):
             types.TracebackType -> UT_AttributeError
         getMessage():
             None -> str
-        appendMessage(Message):
-            type A -> None
-        setMessage(Message):
-            type A -> None
+        appendMessage(Message, *args):
+            type A/, type B, .../ -> None
+        setMessage(Message, *args):
+            type A/, type B, .../ -> None
 
-    Version 2.0.0.0
+    Version 2.1.0.0
     """
 
     #special methods
@@ -530,9 +1579,10 @@ class UT_AttributeError(TracebackPlugin, AttributeError):
                     SkipFrames: TIntNone = None,
                     FromTraceback: TTracebackNone = None) -> None:
         """
-        Converts the two passed mandatory (positional) arguments into a single
-        string error message, which is stored as the only element of the args
-        tuple attribute. If the FromTraceback keyword argument holds the proper
+        Stores the two passed mandatory (positional) arguments, which are
+        converted into a single string error message only upon the first read,
+        and the message is stored as the only element of the args tuple
+        attribute. If the FromTraceback keyword argument holds the proper
         value, the traceback analysis object is created immediately from the
         substituion object; otherwise its creation is delayed until the first
         access of the property Traceback, in wich case the actual traceback can
@@ -554,12 +1604,12 @@ class UT_AttributeError(TracebackPlugin, AttributeError):
                 holds a proper traceback object the SkipFrames argument is
                 ignored
         
-        Version 1.0.0.0
+        Version 1.2.0.0
         """
-        ObjectType = GetObjectClass(gObject)
-        Message = f'{ObjectType}.{AttributeName}'
-        super().__init__(Message, SkipFrames = SkipFrames,
-                                    FromTraceback = FromTraceback)
+        super().__init__(SkipFrames = SkipFrames,
+                                            FromTraceback = FromTraceback)
+        self._PendingMessage = [LazyFormat('{}.{}', GetObjectClass(gObject),
+                                                                AttributeName)]
 
 class UT_IndexError(TracebackPlugin, IndexError):
     """
@@ -574,7 +1624,8 @@ class UT_IndexError(TracebackPlugin, IndexError):
     also is a virtual sub-class of UT_Exception.
 
     Attributes:
-        args: tuple(str x1); one string element tuple storing the passed message
+        args: tuple(str x1); one string element tuple storing the error message
+            (constructed upon the first read)
         __traceback__: types.TracebackType; stores the actual traceback of the
             exception
     
@@ -588,12 +1639,12 @@ class UT_IndexError(TracebackPlugin, IndexError):
             types.TracebackType -> UT_IndexError
         getMessage():
             None -> str
-        appendMessage(Message):
-            type A -> None
-        setMessage(Message):
-            type A -> None
+        appendMessage(Message, *args):
+            type A/, type B, .../ -> None
+        setMessage(Message, *args):
+            type A/, type B, .../ -> None
 
-    Version 2.0.0.0
+    Version 2.1.0.0
     """
 
     #special methods
@@ -602,9 +1653,10 @@ class UT_IndexError(TracebackPlugin, IndexError):
                     SkipFrames: TIntNone = None,
                     FromTraceback: TTracebackNone = None) -> None:
         """
-        Converts the two passed mandatory (positional) arguments into a single
-        string error message, which is stored as the only element of the args
-        tuple attribute. If the FromTraceback keyword argument holds the proper
+        Stores the two passed mandatory (positional) arguments, which are
+        converted into a single string error message only upon the first read,
+        and the message is stored as the only element of the args tuple
+        attribute. If the FromTraceback keyword argument holds the proper
         value, the traceback analysis object is created immediately from the
         substituion object; otherwise its creation is delayed until the first
         access of the property Traceback, in wich case the actual traceback can
@@ -626,11 +1678,12 @@ class UT_IndexError(TracebackPlugin, IndexError):
                 holds a proper traceback object the SkipFrames argument is
                 ignored
         
-        Version 1.0.0.0
+        Version 1.1.0.0
         """
-        Message = f'Out of range index {Name}[{Index}]'
-        super().__init__(Message, SkipFrames = SkipFrames,
-                                    FromTraceback = FromTraceback)
+        super().__init__(SkipFrames = SkipFrames,
+                                            FromTraceback = FromTraceback)
+        self._PendingMessage = [LazyFormat('Out of range index {}[{}]', Name,
+                                                                        Index)]
 
 class UT_KeyError(TracebackPlugin, KeyError):
     """
@@ -645,7 +1698,8 @@ class UT_KeyError(TracebackPlugin, KeyError):
     is a virtual sub-class of UT_Exception.
 
     Attributes:
-        args: tuple(str x1); one string element tuple storing the passed message
+        args: tuple(str x1); one string element tuple storing the error message
+            (constructed upon the first read)
         __traceback__: types.TracebackType; stores the actual traceback of the
             exception
     
@@ -659,12 +1713,12 @@ class UT_KeyError(TracebackPlugin, KeyError):
             types.TracebackType -> UT_KeyError
         getMessage():
             None -> str
-        appendMessage(Message):
-            type A -> None
-        setMessage(Message):
-            type A -> None
+        appendMessage(Message, *args):
+            type A/, type B, .../ -> None
+        setMessage(Message, *args):
+            type A/, type B, .../ -> None
 
-    Version 2.0.0.0
+    Version 2.1.0.0
     """
 
     #special methods
@@ -673,9 +1727,10 @@ class UT_KeyError(TracebackPlugin, KeyError):
                     SkipFrames: TIntNone = None,
                     FromTraceback: TTracebackNone = None) -> None:
         """
-        Converts the two passed mandatory (positional) arguments into a single
-        string error message, which is stored as the only element of the args
-        tuple attribute. If the FromTraceback keyword argument holds the proper
+        Stores the two passed mandatory (positional) arguments, which are
+        converted into a single string error message only upon the first read,
+        and the message is stored as the only element of the args tuple
+        attribute. If the FromTraceback keyword argument holds the proper
         value, the traceback analysis object is created immediately from the
         substituion object; otherwise its creation is delayed until the first
         access of the property Traceback, in wich case the actual traceback can
@@ -697,13 +1752,124 @@ class UT_KeyError(TracebackPlugin, KeyError):
                 holds a proper traceback object the SkipFrames argument is
                 ignored
         
+        Version 1.1.0.0
+        """
+        super().__init__(SkipFrames = SkipFrames,
+                                            FromTraceback = FromTraceback)
+        self._PendingMessage = [LazyFormat('Key not found {}[{}]', Name, Key)]
+
+#+ lightweight classes
+
+class LightweightPlugin():
+    """
+    Left plugin class for the lightweight exceptions intended for the control
+    flow signalling, which is caught and handled without being reported. Such
+    exceptions have neither the traceback analysis, nor the frames skipping or
+    substitution, nor the deferred message; and they do not add any instance
+    attributes (empty __slots__). The error message is stored in the args
+    attribute as by the standard exceptions.
+
+    A fresh instance should be created for each raise: a shared instance
+    would have its traceback and context overwritten by concurrent raises and
+    would keep the frames of its last raise alive.
+
+    Methods:
+        getMessage():
+            None -> str
+    
+    Version 1.0.1.0
+    """
+
+    __slots__ = ()
+
+    #public API
+
+    def getMessage(self) -> str:
+        """
+        Returns the exception error message, i.e. the string representation of
+        the first argument, or an empty string if there are no arguments.
+        
+        Signature:
+            None -> str
+        
         Version 1.0.0.0
         """
-        Message = f'Key not found {Name}[{Key}]'
-        super().__init__(Message, SkipFrames = SkipFrames,
-                                    FromTraceback = FromTraceback)
+        if len(self.args):
+            Result = str(self.args[0])
+        else:
+            Result = ''
+        return Result
+
+class LW_Exception(LightweightPlugin, Exception):
+    """
+    Lightweight version of Exception without the traceback analysis, intended
+    for the library internal control flow signalling. Accepts any positional
+    arguments, as the standard Exception.
+
+    Version 1.0.0.0
+    """
+
+    __slots__ = ()
+
+class LW_TypeError(LightweightPlugin, TypeError):
+    """
+    Lightweight version of TypeError without the traceback analysis, intended
+    for the library internal control flow signalling. Accepts any positional
+    arguments, as the standard TypeError.
+
+    Version 1.0.0.0
+    """
+
+    __slots__ = ()
+
+class LW_ValueError(LightweightPlugin, ValueError):
+    """
+    Lightweight version of ValueError without the traceback analysis, intended
+    for the library internal control flow signalling. Accepts any positional
+    arguments, as the standard ValueError.
+
+    Version 1.0.0.0
+    """
+
+    __slots__ = ()
+
+class LW_AttributeError(LightweightPlugin, AttributeError):
+    """
+    Lightweight version of AttributeError without the traceback analysis,
+    intended for the library internal control flow signalling. Accepts any
+    positional arguments, as the standard AttributeError.
+
+    Version 1.0.0.0
+    """
+
+    __slots__ = ()
+
+class LW_IndexError(LightweightPlugin, IndexError):
+    """
+    Lightweight version of IndexError without the traceback analysis, intended
+    for the library internal control flow signalling. Accepts any positional
+    arguments, as the standard IndexError.
+
+    Version 1.0.0.0
+    """
+
+    __slots__ = ()
+
+class LW_KeyError(LightweightPlugin, KeyError):
+    """
+    Lightweight version of KeyError without the traceback analysis, intended
+    for the library internal control flow signalling. Accepts any positional
+    arguments, as the standard KeyError.
+
+    Version 1.0.0.0
+    """
+
+    __slots__ = ()
 
 # hack / walkaround on try...except limitations to actual MRO check
 
 UT_Exception_Check = (UT_Exception, UT_ValueError, UT_TypeError,
-                        UT_AttributeError, UT_IndexError, UT_KeyError)
\ No newline at end of file
+                        UT_AttributeError, UT_IndexError, UT_KeyError)
+
+LW_Exception_Check = (LW_Exception, LW_ValueError, LW_TypeError,
+                        LW_AttributeError, LW_IndexError, LW_KeyError)
\ No newline at end of file
@@ -6,47 +6,669 @@ traceback.
 
 Functions:
     ParseFramesList(Frames, *, SkipFrames = None):
-        list(inspect.FrameInfo)/, int > 0 OR None/
-            -> list(tuple(str, str, str, int >= 0, int >= 0, list(str) OR None))
+        list(inspect.FrameInfo)/, int > 0 OR None/ -> list(FrameRecord)
+    ParseRawFrames(Frames, *, SkipFrames = None):
+        list(tuple(types.FrameType, int >= 0))/, int > 0 OR None/
+            -> list(FrameRecord)
+    GetSourceCache():
+        None -> SourceCache
+    GetCommonPrefix(*Tracebacks):
+        StackTraceback/, StackTraceback, .../ -> int >= 0
+    GetCommonSuffix(*Tracebacks):
+        StackTraceback/, StackTraceback, .../ -> int >= 0
+    DiffTracebacks(First, Second):
+        StackTraceback, StackTraceback
+            -> list(tuple(str, int >= 0, int >= 0, int >= 0, int >= 0))
+    GroupByPrefix(Tracebacks, Depth):
+        Iterable(StackTraceback), int > 0
+            -> dict(tuple(tuple(str, str, int)) -> list(int >= 0))
 
 Classes:
+    FrameRecord: compact record of a single parsed frame
+    ModuleNameResolver: cached resolution of the module's name of a frame
+    SourceCache: source files cache with the lines index
+    CapturePolicy: rate limiting / sampling policy of the traceback capture
+    RenderCache: process-wide cache of the rendered tracebacks texts
     StackTraceback: function / method call stack traceback
     ExceptionTraceback: exception traceback
+    AsyncTaskTraceback: logical call chain of an asyncio task or a coroutine
+    ChainedExceptionTraceback: aggregated traceback of the chained exceptions
+    ThreadStacksSnapshot: call stacks of all running threads
+    TracebackStore: de-duplicating storage of tracebacks with statistics
+    StackSampler: sampling profiler of the call stacks of the running threads
+    CallPathTrie: prefix tree aggregator of the call paths with the counts
 """
 
-__version__ = "1.1.0.0"
-__date__ = "01-07-2026"
+__version__ = "1.20.0.0"
+__date__ = "18-10-2026"
 __status__ = "Production"
 
 #imports
 
 #+ standard libraries
 
+import os
+import re
+import sys
+import stat
+import time
+import fnmatch
 import inspect
+import reprlib
+import json
+import heapq
+import hashlib
+import tokenize
+import linecache
+import itertools
+import threading
+import collections
+import collections.abc as c_abc
 
-from types import TracebackType
-from typing import Optional, ClassVar
+from array import array
+
+from importlib.machinery import SourceFileLoader
+
+from types import TracebackType, FrameType, CoroutineType, GeneratorType
+from types import AsyncGeneratorType
+from typing import Optional, ClassVar, Iterator, TextIO, Iterable, Any, Union
 
 #types
 
 type TIntNone = Optional[int]
+type TBoolNone = Optional[bool]
 type TStringList = list[str]
 type TFramesList = list[inspect.FrameInfo]
-type TParsedFrame = list[tuple[str, str, str, int, int, TStringList]]
+type TRawFramesList = list[tuple[FrameType, int]]
+type TCodeLines = Optional[tuple[str, ...]]
+type TParsedFrame = list[FrameRecord]
 type TTracebackNone = Optional[TracebackType]
+type TSourceContext = tuple[TIntNone, TCodeLines]
+type TStoreStatistics = list[tuple[str, int, float, float]]
+type TFloatNone = Optional[float]
+type TCallPath = tuple[str, ...]
+type TThreadsNone = Optional[Iterable[Union[int, threading.Thread]]]
+type TContextCache = dict[tuple[str, int, int], TSourceContext]
+type TPatterns = Optional[Union[str, Iterable[str]]]
+type TRegexNone = Optional[re.Pattern]
+type TAsyncTracebacks = list[AsyncTaskTraceback]
+type TBytesLike = Union[bytes, bytearray, memoryview]
+type TLocals = tuple[dict[str, str], int]
+type TLocalsList = Optional[list[TLocals]]
+type TTrieNode = list[Any]
+type TTrieItem = tuple[TCallPath, TTrieNode]
+type TCallPathCounts = list[tuple[TCallPath, int]]
+type TSourceEntry = list[Any]
+type TFrameKeys = tuple[tuple[str, str, int], ...]
+type TDiffOpcodes = list[tuple[str, int, int, int, int]]
+type TModulesIndex = tuple[list[str], list[int], dict[str, int],
+                                dict[str, tuple[str, str]], dict[str, str]]
+type TResolvedCache = collections.OrderedDict[str, tuple[Optional[str], Any]]
 
 #helper functions
 
+def _GetFullName(FrameObject: FrameType, Caller: str) -> str:
+    """
+    Resolves the fully qualified name of the caller of a frame, i.e. module,
+    module.function or module.class.method. The module's name is resolved by
+    the module level instance of the class ModuleNameResolver.
+
+    Signature:
+        types.FrameType, str -> str
+    
+    Version 1.1.0.0
+    """
+    ModuleName = _ModuleResolver.getModuleName(FrameObject)
+    if ModuleName is None:
+        ModuleName = '<console input>'
+    if Caller == '<module>':
+        FullName = ModuleName
+    else:
+        LocalsDictionary = FrameObject.f_locals
+        if 'self' in LocalsDictionary:
+            ClassName = LocalsDictionary['self'].__class__.__name__
+            FullName = '.'.join([ModuleName, ClassName, Caller])
+        elif 'cls' in LocalsDictionary:
+            ClassName = LocalsDictionary['cls'].__name__
+            FullName = '.'.join([ModuleName, ClassName, Caller])
+        else:
+            FullName = '.'.join([ModuleName, Caller])
+        del LocalsDictionary
+    return FullName
+
+def _GetSourceContext(FilePath: str, LineNumber: int, ContextLength: int,
+                                ModuleGlobals: Optional[dict[str, Any]] = None
+                                                        ) -> TSourceContext:
+    """
+    Retrieves the source code sniplet of the required length centered around
+    the specified line of a source file in the same manner as the function
+    inspect.getframeinfo() does, but using only the path to the file. The
+    indexed source files cache is used, and the module linecache is
+    the fall back for the files not handled by the cache, e.g. from the zip
+    archives; only in this case the lazy loading of the source via the module's
+    loader is registered with linecache, if the loader data is provided.
+
+    Signature:
+        str, int > 0, int > 0/, dict(str -> type A) OR None/
+            -> tuple(int >= 0 OR None, tuple(str) OR None)
+    
+    Returns:
+        tuple(int >= 0, tuple(str)): position index of the line in the sniplet
+            and the sniplet itself as a tuple of the source code lines
+        tuple(None, None): the source code is not available
+    
+    Version 1.3.0.0
+    """
+    if LineNumber is None:
+        return None, None
+    Context = _SourceFilesCache.getContext(FilePath, LineNumber, ContextLength)
+    if not (Context is None):
+        return Context
+    if ModuleGlobals:
+        linecache.lazycache(FilePath, ModuleGlobals)
+    linecache.checkcache(FilePath)
+    Lines = linecache.getlines(FilePath)
+    if not Lines:
+        LineIndex = None
+        CodeLines = None
+    else:
+        Start = LineNumber - 1 - ContextLength // 2
+        Start = max(0, min(Start, len(Lines) - ContextLength))
+        CodeLines = tuple(Lines[Start : Start + ContextLength])
+        LineIndex = LineNumber - 1 - Start
+    return LineIndex, CodeLines
+
+def _CompilePatterns(Patterns: TPatterns) -> TRegexNone:
+    """
+    Compiles the glob-style (module fnmatch) patterns into a single regular
+    expression to be matched against the module's name and the normalized (with
+    the forward slashes) path to the source file of a frame. A pattern without
+    a slash is intended for the module's name, and if it ends with '.*' it also
+    matches the package itself, e.g. 'asyncio.*' matches 'asyncio' and
+    'asyncio.events'. A pattern with a slash is intended for the path, and if
+    it is not absolute and does not start with '*', it matches any part of the
+    path, e.g. 'site-packages/*' is treated as '*/site-packages/*'.
+
+    Signature:
+        str OR seq(str) OR None -> re.Pattern OR None
+    
+    Returns:
+        re.Pattern: the compiled expression
+        None: no patterns are provided
+    
+    Version 1.0.0.0
+    """
+    if Patterns is None:
+        Patterns = []
+    elif isinstance(Patterns, str):
+        Patterns = [Patterns]
+    Expressions = []
+    for Pattern in Patterns:
+        Pattern = Pattern.replace('\\', '/')
+        if '/' in Pattern:
+            if not Pattern.startswith(('*', '/')):
+                Pattern = f'*/{Pattern}'
+        elif Pattern.endswith('.*'):
+            Expressions.append(fnmatch.translate(Pattern[:-2]))
+        Expressions.append(fnmatch.translate(Pattern))
+    if Expressions:
+        Result = re.compile('|'.join(Expressions))
+    else:
+        Result = None
+    return Result
+
+def _IsFrameSelected(FrameObject: FrameType, Include: TRegexNone,
+                                                Exclude: TRegexNone) -> bool:
+    """
+    Checks if a frame passes the compiled include and exclude filters, which
+    are matched against the module's name and the path to the source file. If
+    the include filter is defined, the frame must match it, and it must not
+    match the exclude filter, if that one is defined.
+
+    Signature:
+        types.FrameType, re.Pattern OR None, re.Pattern OR None -> bool
+    
+    Version 1.0.0.0
+    """
+    ModuleName = _ModuleResolver.getModuleName(FrameObject) or ''
+    FilePath = FrameObject.f_code.co_filename.replace(os.sep, '/')
+    if Include is None:
+        Result = True
+    else:
+        Result = bool(Include.match(ModuleName) or Include.match(FilePath))
+    if Result and not (Exclude is None):
+        Result = not (Exclude.match(ModuleName) or Exclude.match(FilePath))
+    return Result
+
+def _WalkStack(FrameObject: Optional[FrameType], *,
+                SkipFrames: TIntNone = None, MaxFrames: TIntNone = None,
+                Include: TRegexNone = None,
+                Exclude: TRegexNone = None) -> TRawFramesList:
+    """
+    Walks the call stack outwards starting from the passed frame and returns
+    the list of (frame, line number) pairs ordered from the outmost frame
+    (interpreter's loop) to the passed one. Optionally, the specified number of
+    the innermost frames is skipped (unless the stack is not deeper than that),
+    the frames not passing the include / exclude filters are skipped, and the
+    walk is stopped as soon as the max number of the frames is collected. Thus,
+    the skipped frames and the frames beyond the limit are never processed.
+
+    Signature:
+        types.FrameType OR None/, *, int > 0 OR None, int > 0 OR None,
+            re.Pattern OR None, re.Pattern OR None/
+                -> list(tuple(types.FrameType, int >= 0))
+    
+    Version 1.1.0.0
+    """
+    if isinstance(SkipFrames, int) and SkipFrames > 0:
+        Current = FrameObject
+        for _ in range(SkipFrames):
+            Current = Current.f_back
+            if Current is None:
+                break
+        if not (Current is None):
+            FrameObject = Current
+        del Current
+    if not (isinstance(MaxFrames, int) and MaxFrames > 0):
+        MaxFrames = None
+    IsFiltered = not (Include is None and Exclude is None)
+    Result = []
+    while not (FrameObject is None):
+        if ((not IsFiltered) or
+                            _IsFrameSelected(FrameObject, Include, Exclude)):
+            Result.append((FrameObject, FrameObject.f_lineno))
+            if len(Result) == MaxFrames:
+                break
+        FrameObject = FrameObject.f_back
+    Result.reverse()
+    return Result
+
+def _SelectFrames(Frames: TRawFramesList, *, MaxFrames: TIntNone = None,
+                    Include: TRegexNone = None,
+                    Exclude: TRegexNone = None) -> TRawFramesList:
+    """
+    Applies the include / exclude filters and the max number of the frames
+    limit to the already obtained list of (frame, line number) pairs ordered
+    from the outmost frame, in the same manner as the function _WalkStack()
+    does, i.e. the innermost selected frames are kept. The list is processed
+    from its end, and the processing is stopped as soon as the limit is
+    reached. The passed list is not modified.
+
+    Signature:
+        list(tuple(types.FrameType, int >= 0))/, *, int > 0 OR None,
+            re.Pattern OR None, re.Pattern OR None/
+                -> list(tuple(types.FrameType, int >= 0))
+    
+    Version 1.0.0.0
+    """
+    if not (isinstance(MaxFrames, int) and MaxFrames > 0):
+        MaxFrames = None
+    if Include is None and Exclude is None:
+        if MaxFrames is None:
+            Result = list(Frames)
+        else:
+            Result = Frames[-MaxFrames:]
+    else:
+        Result = []
+        for Index in range(len(Frames) - 1, -1, -1):
+            Item = Frames[Index]
+            if _IsFrameSelected(Item[0], Include, Exclude):
+                Result.append(Item)
+                if len(Result) == MaxFrames:
+                    break
+        Result.reverse()
+        Item = None
+    return Result
+
+def _WalkTraceback(Traceback: TTracebackNone) -> TRawFramesList:
+    """
+    Walks the chain of the traceback objects starting from the passed one and
+    returns the list of (frame, line number) pairs in the same order, i.e. from
+    the frame where an exception is caught towards the one where it is raised.
+
+    Signature:
+        types.TracebackType OR None -> list(tuple(types.FrameType, int >= 0))
+    
+    Version 1.0.0.0
+    """
+    Result = []
+    while not (Traceback is None):
+        LineNumber = Traceback.tb_lineno
+        if LineNumber is None:
+            LineNumber = Traceback.tb_frame.f_lineno
+        Result.append((Traceback.tb_frame, LineNumber))
+        Traceback = Traceback.tb_next
+    return Result
+
+def _IterFramesLines(Frames: TParsedFrame, ConsoleWidth: int,
+                            Locals: TLocalsList = None) -> Iterator[str]:
+    """
+    Generator yielding the lines of the human-readable representation of the
+    passed frame records one by one, see the property StackTraceback.Info.
+    The source code sniplets must be already retrieved. The representations
+    of the local variables, if passed, are added after each frame's sniplet.
+
+    Signature:
+        list(FrameRecord), int > 0/, list(tuple(dict(str -> str), int >= 0))
+            OR None/ -> iterator(str)
+    
+    Version 1.1.0.0
+    """
+    for FrameIndex, Frame in enumerate(Frames):
+        FullName = Frame.FullName
+        LineNumber = Frame.LineNumber
+        LineIndex = Frame.LineIndex
+        CodeLines = Frame.CodeLines
+        if not (CodeLines is None):
+            MaxDigits = len(str(LineNumber + LineIndex))
+            MaxLineWidth = ConsoleWidth - 2 - MaxDigits
+            if Frame.Caller == '<module>':
+                yield f'In module {FullName}'
+            else:
+                yield f'Caller {FullName}()'
+            yield f'Line {LineNumber} in {Frame.FilePath}'
+            if not CodeLines:
+                yield ''
+            for LineOffset, SourceLine in enumerate(CodeLines):
+                SourceLine = SourceLine.rstrip()
+                CurrentLineNumber = LineNumber - LineIndex + LineOffset
+                if CurrentLineNumber == LineNumber:
+                    Prefix = '>'
+                else:
+                    Prefix = ' '
+                PrintNumber = str(CurrentLineNumber)
+                if len(PrintNumber) < MaxDigits:
+                    Prefix = f'{Prefix} '
+                PrintNumber = f'{Prefix}{PrintNumber} '
+                if len(SourceLine) > MaxLineWidth:
+                    yield '{}{}...'.format(PrintNumber,
+                                            SourceLine[:MaxLineWidth - 3])
+                else:
+                    yield f'{PrintNumber}{SourceLine}'
+        else:
+            yield '<console input>'
+            yield f'Line {LineNumber} in console input'
+        if not (Locals is None):
+            Variables, Omitted = Locals[FrameIndex]
+            for Name, Text in Variables.items():
+                yield f'Local {Name} = {Text}'
+            if Omitted:
+                yield f'Locals: {Omitted} more not shown'
+
+def _FormatLocals(Snapshot: dict[str, Any], MaxLength: int,
+                                            MaxFrameLength: int) -> TLocals:
+    """
+    Creates the bounded string representations of the local variables of a
+    frame using the reprlib module (see the class _LocalsRepr), i.e. only the
+    first few elements of the containers are processed, regardless of their
+    actual size. The snapshots of the values made by the method snapshotLocals()
+    of that class are represented in the same manner as the values. Each value's
+    representation is truncated to the specified length, and the variables
+    are added in their definition order only until the total length of their
+    names and values exceeds the per frame limit. The special (dunder) names
+    are ignored.
+
+    Signature:
+        dict(str -> type A), int > 0, int > 0
+            -> tuple(dict(str -> str), int >= 0)
+    
+    Returns:
+        tuple(dict(str -> str), int >= 0): the names of the variables mapped to
+            their representations, and the number of the omitted variables
+    
+    Version 1.1.0.0
+    """
+    Formatter = _LocalsRepr(MaxLength)
+    Result = dict()
+    Names = [Name for Name in Snapshot
+                        if not (Name.startswith('__') and Name.endswith('__'))]
+    TotalLength = 0
+    for Name in Names:
+        try:
+            Text = Formatter.repr(Snapshot[Name])
+        except Exception:
+            Text = '<repr() failed>'
+        if len(Text) > MaxLength:
+            Text = '{}...'.format(Text[:max(MaxLength - 3, 0)])
+        TotalLength += len(Name) + len(Text)
+        if TotalLength > MaxFrameLength:
+            break
+        Result[Name] = Text
+    return (Result, len(Names) - len(Result))
+
+def _FormatException(Error: BaseException) -> str:
+    """
+    Returns the type of the exception, qualified by the module's name unless
+    it is built-in or defined in the main module, and its message separated by
+    a colon, in the same manner as the Standard Library traceback module.
+
+    Signature:
+        BaseException -> str
+    
+    Version 1.0.0.0
+    """
+    Class = Error.__class__
+    if Class.__module__ in ('builtins', '__main__'):
+        Name = Class.__qualname__
+    else:
+        Name = '.'.join([Class.__module__, Class.__qualname__])
+    try:
+        Message = str(Error)
+    except Exception:
+        Message = '<exception str() failed>'
+    return f'{Name}: {Message}' if Message else Name
+
+def _EncodeVarint(Value: int, Buffer: bytearray) -> None:
+    """
+    Appends the non-negative integer to the buffer encoded as an unsigned
+    variable length integer (LEB128): 7 bits per byte, the least significant
+    group first, the high bit indicating that more bytes follow.
+
+    Signature:
+        int >= 0, bytearray -> None
+    
+    Version 1.0.0.0
+    """
+    while Value > 0x7F:
+        Buffer.append((Value & 0x7F) | 0x80)
+        Value >>= 7
+    Buffer.append(Value)
+
+def _DecodeVarint(Data: bytes, Position: int) -> tuple[int, int]:
+    """
+    Decodes an unsigned variable length integer (LEB128) from the data starting
+    at the specified position.
+
+    Signature:
+        bytes, int >= 0 -> tuple(int >= 0, int >= 0)
+    
+    Returns:
+        tuple(int >= 0, int >= 0): the decoded value and the position of the
+            next byte after it
+    
+    Raises:
+        IndexError: the data is truncated
+    
+    Version 1.0.0.0
+    """
+    Result = 0
+    Shift = 0
+    while True:
+        Byte = Data[Position]
+        Position += 1
+        Result |= (Byte & 0x7F) << Shift
+        if Byte < 0x80:
+            break
+        Shift += 7
+    return Result, Position
+
+def _WalkAwaitChain(Awaitable: Any) -> TRawFramesList:
+    """
+    Follows the chain of the awaited objects starting from the passed coroutine,
+    asynchronous generator or (generator based coroutine) generator via their
+    cr_await, ag_await and gi_yieldfrom attributes, and returns the list of
+    (frame, line number) pairs of the suspended frames ordered from the passed
+    object to the innermost awaited one. The walk stops at a finished coroutine
+    or at an awaited object of any other type (e.g. a Future).
+
+    Signature:
+        type A -> list(tuple(types.FrameType, int >= 0))
+    
+    Version 1.0.0.0
+    """
+    Result = []
+    Visited = set()
+    while not (id(Awaitable) in Visited):
+        Visited.add(id(Awaitable))
+        if isinstance(Awaitable, CoroutineType):
+            FrameObject = Awaitable.cr_frame
+            Next = Awaitable.cr_await
+        elif isinstance(Awaitable, AsyncGeneratorType):
+            FrameObject = Awaitable.ag_frame
+            Next = Awaitable.ag_await
+        elif isinstance(Awaitable, GeneratorType):
+            FrameObject = Awaitable.gi_frame
+            Next = Awaitable.gi_yieldfrom
+        else:
+            break
+        if FrameObject is None:
+            break
+        Result.append((FrameObject, FrameObject.f_lineno))
+        Awaitable = Next
+    FrameObject = None
+    Next = None
+    return Result
+
+def _GetFrameKeys(Traceback: Any, *, Keys: bool = True) -> list[Any]:
+    """
+    Extracts the keys of the frames of a traceback analysis object - the path
+    to the module, the fully qualified name of the caller and the line number
+    of each frame, from the outmost to the innermost one. The strings are
+    interned by the frame records, thus the equal keys are compared mostly by
+    the identity of their elements. Optionally, returns the frame records
+    themselves instead of the keys.
+
+    Signature:
+        StackTraceback/, *, bool/ -> list(tuple(str, str, int))
+            OR list(FrameRecord)
+    
+    Raises:
+        TypeError: the argument is not a traceback analysis object
+    
+    Version 1.0.0.0
+    """
+    if not isinstance(Traceback, StackTraceback):
+        raise TypeError(
+            f'{type(Traceback).__name__} is not a sub-class of StackTraceback')
+    if Keys:
+        Result = [(Record.FilePath, Record.FullName, Record.LineNumber)
+                                            for Record in Traceback._Traceback]
+    else:
+        Result = Traceback._Traceback
+    return Result
+
+def _GetEditScript(First: list[Any], Second: list[Any]) -> TDiffOpcodes:
+    """
+    Calculates the minimal edit script (Myers O(ND) algorithm) transforming
+    the first sequence into the second one, and represents it as the opcodes
+    in the format of the method get_opcodes() of difflib.SequenceMatcher.
+
+    Signature:
+        list(type A), list(type A)
+            -> list(tuple(str, int >= 0, int >= 0, int >= 0, int >= 0))
+    
+    Version 1.0.0.0
+    """
+    LengthA = len(First)
+    LengthB = len(Second)
+    Offset = LengthA + LengthB + 1
+    Furthest = [0] * (2 * Offset + 1)
+    Trace = []
+    IsDone = not (LengthA or LengthB)
+    Distance = 0
+    while not IsDone:
+        Trace.append(list(Furthest))
+        for Diagonal in range(-Distance, Distance + 1, 2):
+            if (Diagonal == -Distance or (Diagonal != Distance and
+                                Furthest[Offset + Diagonal - 1] <
+                                            Furthest[Offset + Diagonal + 1])):
+                X = Furthest[Offset + Diagonal + 1]
+            else:
+                X = Furthest[Offset + Diagonal - 1] + 1
+            Y = X - Diagonal
+            while X < LengthA and Y < LengthB and First[X] == Second[Y]:
+                X += 1
+                Y += 1
+            Furthest[Offset + Diagonal] = X
+            if X >= LengthA and Y >= LengthB:
+                IsDone = True
+                break
+        else:
+            Distance += 1
+    #backtracking - per element operations from the end
+    Operations = []
+    X = LengthA
+    Y = LengthB
+    for Distance in range(len(Trace) - 1, -1, -1):
+        Furthest = Trace[Distance]
+        Diagonal = X - Y
+        if (Diagonal == -Distance or (Diagonal != Distance and
+                                Furthest[Offset + Diagonal - 1] <
+                                            Furthest[Offset + Diagonal + 1])):
+            PreviousDiagonal = Diagonal + 1
+        else:
+            PreviousDiagonal = Diagonal - 1
+        PreviousX = Furthest[Offset + PreviousDiagonal]
+        PreviousY = PreviousX - PreviousDiagonal
+        while X > PreviousX and Y > PreviousY:
+            X -= 1
+            Y -= 1
+            Operations.append('equal')
+        if Distance:
+            Operations.append('insert' if X == PreviousX else 'delete')
+        X = PreviousX
+        Y = PreviousY
+    Operations.reverse()
+    #grouping into the opcodes
+    Result = []
+    X = 0
+    Y = 0
+    Index = 0
+    Total = len(Operations)
+    while Index < Total:
+        StartX = X
+        StartY = Y
+        if Operations[Index] == 'equal':
+            while Index < Total and Operations[Index] == 'equal':
+                X += 1
+                Y += 1
+                Index += 1
+            Result.append(('equal', StartX, X, StartY, Y))
+        else:
+            while Index < Total and Operations[Index] != 'equal':
+                if Operations[Index] == 'delete':
+                    X += 1
+                else:
+                    Y += 1
+                Index += 1
+            if X == StartX:
+                Tag = 'insert'
+            elif Y == StartY:
+                Tag = 'delete'
+            else:
+                Tag = 'replace'
+            Result.append((Tag, StartX, X, StartY, Y))
+    return Result
+
 def ParseFramesList(Frames: TFramesList, *,
                     SkipFrames: TIntNone = None) -> TParsedFrame:
     """
     Parses the passed list of the inspect.FrameInfo objects into a list of
-    tuples of simple atomic and atomic container objects not containg any frame
-    object, which helps in avoiding the circular referencing.
+    compact frame records of simple atomic and atomic container objects not
+    containg any frame object, which helps in avoiding the circular referencing.
 
     Signature:
-        list(inspect.FrameInfo)/, int > 0 OR None/
-            -> list(tuple(str, str, str, int >= 0, int >= 0, list(str) OR None))
+        list(inspect.FrameInfo)/, int > 0 OR None/ -> list(FrameRecord)
 
     Args:
         Frames: list(inspect.FrameInfo); list of FrameInfo objects as named
@@ -56,16 +678,16 @@ def ParseFramesList(Frames: TFramesList, *,
             to None
     
     Returns:
-        list(tuple(str, str, str, int > 0, int >= 0, list(str))): a list of
-            tuples, possibly empty, with each element (tuple) being the parsed
-            frame data not containg the a frame object itself, and the elements
-            of each tuple being the path to the source code module, name of the
-            caller (module or function / method), the fully qualified name of
-            the caller, position index of the offending code line in the module,
-            position index of the same line in the provided code sniplet, and
-            the code sniplet as a list of the source code lines (strings)
+        list(FrameRecord): a list of the tuple-like records, possibly empty,
+            with each element being the parsed frame data not containg the a
+            frame object itself, and the fields of each record being the path
+            to the source code module, name of the caller (module or function /
+            method), the fully qualified name of the caller, position index of
+            the offending code line in the module, position index of the same
+            line in the provided code sniplet, and the code sniplet as a tuple
+            of the source code lines (strings)
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     NumberFrames = len(Frames)
     Result = []
@@ -77,22 +699,8 @@ def ParseFramesList(Frames: TFramesList, *,
             #resolving module, caller name and qualified name
             FrameData = Frames[FrameIndex]
             FrameObject = FrameData.frame
-            Module = inspect.getmodule(FrameObject)
-            ModuleName= '<console input>' if Module is None else Module.__name__
-            del Module
             Caller = FrameData.function
-            if Caller == '<module>':
-                FullName = ModuleName
-            else:
-                LocalsDictionary = FrameObject.f_locals
-                if 'self' in LocalsDictionary:
-                    ClassName = LocalsDictionary['self'].__class__.__name__
-                    FullName = '.'.join([ModuleName, ClassName, Caller])
-                elif 'cls' in LocalsDictionary:
-                    ClassName = LocalsDictionary['cls'].__name__
-                    FullName = '.'.join([ModuleName, ClassName, Caller])
-                else:
-                    FullName = '.'.join([ModuleName, Caller])
+            FullName = _GetFullName(FrameObject, Caller)
             del FrameObject
             FilePath = FrameData.filename
             #getting content of the source code file
@@ -100,268 +708,4892 @@ def ParseFramesList(Frames: TFramesList, *,
             LineIndex = FrameData.index
             CodeLines = FrameData.code_context
             #adding entry to the list
-            Result.append((FilePath, Caller, FullName, LineNumber, LineIndex,
-                                                                    CodeLines))
+            Result.append(FrameRecord(FilePath, Caller, FullName, LineNumber,
+                                                        LineIndex, CodeLines))
             del FrameData
     return Result
 
-#classes
-
-class StackTraceback():
+def ParseRawFrames(Frames: TRawFramesList, *,
+                    SkipFrames: TIntNone = None) -> TParsedFrame:
     """
-    Utility class to obtain and analyze the traceback of the current state of
-    the call stack up to but excluding the frame, where this object is
-    instantiated, and to extract the call chain from it with an option to 'hide'
-    the specified number of the deepest (inner) frames. Note that stack
-    traceback created is in the reversed order with respect to that of the
-    returned by the function inspect.stack(), i.e. the interpreter's loop
-    (outmost call) is the first element, and the frame, where this class is
-    instantiated, is the last element.
+    Parses the passed list of the (frame, line number) pairs into a list of
+    frame records of the same structure as returned by the function
+    ParseFramesList(), but without the source code sniplet, i.e. the last two
+    fields of each record are None. The source code lines are not read at all.
+    For the modules not loaded from the source files (e.g. from the zip
+    archives) the record keeps the name, spec and loader of the module, so the
+    sniplet can be retrieved later via linecache without the frame object.
+
+    Signature:
+        list(tuple(types.FrameType, int >= 0))/, int > 0 OR None/
+            -> list(FrameRecord)
+
+    Args:
+        Frames: list(tuple(types.FrameType, int >= 0)); list of pairs of a
+            frame object and the number of the currently executed line
+        SkipFrames: (keyword) int > 0 OR None; number of the most inner frames
+            to skip as a non-negative integer, otherwise is ignored, defaults
+            to None
     
-    Properties:
-        CallChain: (read-only) list(str); list of the names of the callers
-        Info: (read-only) str; human-readable frames data
+    Returns:
+        list(FrameRecord): a list of the tuple-like records, possibly empty,
+            with each element being the parsed frame data not containg the a
+            frame object itself, and the fields of each record being the path
+            to the source code module, name of the caller (module or function /
+            method), the fully qualified name of the caller, position index of
+            the offending code line in the module and two None placeholders
+            for the sniplet data
     
-    Version 1.0.1.0
+    Version 1.2.0.0
+    """
+    NumberFrames = len(Frames)
+    if (isinstance(SkipFrames, int) and (0 < SkipFrames < NumberFrames)):
+        EndFrameIndex = NumberFrames - SkipFrames
+    else:
+        EndFrameIndex = NumberFrames
+    Result = []
+    for FrameIndex in range(EndFrameIndex):
+        FrameObject, LineNumber = Frames[FrameIndex]
+        Code = FrameObject.f_code
+        Caller = Code.co_name
+        FilePath = Code.co_filename
+        FullName = _GetFullName(FrameObject, Caller)
+        Record = FrameRecord(FilePath, Caller, FullName, LineNumber)
+        Globals = FrameObject.f_globals
+        Loader = Globals.get('__loader__', None)
+        if not (Loader is None or Loader.__class__ is SourceFileLoader):
+            Record._ModuleGlobals = {'__name__' : Globals.get('__name__'),
+                                        '__spec__' : Globals.get('__spec__'),
+                                        '__loader__' : Loader}
+        Result.append(Record)
+        del FrameObject
+        del Code
+        del Globals
+        del Loader
+    return Result
+
+def GetSourceCache() -> 'SourceCache':
     """
+    Returns the module level (shared) instance of the indexed source
+    files cache, which is used for the retrieval of the source code context of
+    the frames, e.g. in order to pre-warm it for a package.
+
+    Signature:
+        None -> SourceCache
     
-    #class data attributes - default values
+    Version 1.0.0.0
+    """
+    return _SourceFilesCache
+
+def GetCommonPrefix(*Tracebacks: 'StackTraceback') -> int:
+    """
+    Calculates the length of the longest common prefix (the outer frames
+    starting from the root of the call stack) of the passed tracebacks, i.e.
+    the number of the outmost frames, which are the same in all of them. The
+    frames are compared by their keys - the path to the module, the fully
+    qualified name of the caller and the line number (the strings are
+    interned). The time is linear with the total number of the compared frames,
+    i.e. it is the same as for the N-1 pair-wise comparisons with the first
+    traceback, not N*(N-1)/2 comparisons.
+
+    Signature:
+        StackTraceback/, StackTraceback, .../ -> int >= 0
     
-    ConsoleWidth: ClassVar[int] = 80 #max width of the lines in the Info output
+    Args:
+        *Tracebacks: StackTraceback; any number (at least one) of the call stack
+            or exception tracebacks (any sub-class)
     
-    ContextLenght: ClassVar[int] = 3 #number of the lines to display per frame
+    Returns:
+        int >= 0: number of the common outer frames
     
-    #special methods
+    Raises:
+        TypeError: an argument is not a traceback analysis object
+        ValueError: no argument is passed
     
-    def __init__(self, *, SkipFrames: TIntNone = None,
-                            ContextLength: TIntNone = None,
-                            ConsoleWidth: TIntNone = None) -> None:
-        """
-        Initialization method. Attempts to retrieve and store the traceback of
-        the current stack excluding the instantiation method itself. Can accept
-        up to 3 keyword arguments: SkipFrames, ContextLength, ConsoleWidth.
-        
-        Signature:
-            /int > 0 OR None, int > 0 OR None, int > 0 OR None/ -> None
-        
-        Args:
-            SkipFrames: (keyword) int > 0; number of the deepest (inner) frames
-                to 'hide' in the traceback excluding the initialization method
-                itself, which is always removed (default is None -> zero)
-            ContextLength: (keyword) int > 0; total number of lines of the
-                source code to retrieve around and including the one, there a
-                call was made (default is None -> the value of the class field
-                ContextLenght)
-            ConsoleWidth: (keyword) int > 0; width to which the source code
-                lines must be truncated, including the line's number + 2 extra
-                characters (default is None -> the value of the class field
-                ConsoleWidth)
-        
-        Version 1.0.1.0
-        """
-        if (isinstance(ContextLength, int) and ContextLength > 0):
-            _ContextLenght = ContextLength
-        else:
-            _ContextLenght = self.ContextLenght
-        if (isinstance(ConsoleWidth, int) and ConsoleWidth > 0):
-            self._ConsoleWidth = ConsoleWidth
-        else:
-            self._ConsoleWidth = self.ConsoleWidth
-        RawFrames = list(reversed(inspect.stack(_ContextLenght)))
-        if isinstance(SkipFrames, int) and SkipFrames > 0:
-            _SkipFrames = SkipFrames + 1
-        else:
-            _SkipFrames = 1
-        self._Traceback = ParseFramesList(RawFrames, SkipFrames= _SkipFrames)
-        RawFrames.clear()
-        del RawFrames
+    Version 1.0.0.0
+    """
+    if not len(Tracebacks):
+        raise ValueError('At least one traceback is required')
+    Keys = _GetFrameKeys(Tracebacks[0])
+    Length = len(Keys)
+    for Traceback in Tracebacks[1:]:
+        Records = _GetFrameKeys(Traceback, Keys = False)
+        Length = min(Length, len(Records))
+        for Index in range(Length):
+            Record = Records[Index]
+            if ((Record.FilePath, Record.FullName, Record.LineNumber) !=
+                                                                Keys[Index]):
+                Length = Index
+                break
+    return Length
+
+def GetCommonSuffix(*Tracebacks: 'StackTraceback') -> int:
+    """
+    Calculates the length of the longest common suffix (the inner frames
+    ending with the innermost one, e.g. the raise site) of the passed
+    tracebacks, i.e. the number of the innermost frames, which are the same in
+    all of them. The frames are compared in the same manner as by the function
+    GetCommonPrefix(), and the time is also linear with the total number of the
+    compared frames.
+
+    Signature:
+        StackTraceback/, StackTraceback, .../ -> int >= 0
     
-    def __del__(self) -> None:
-        """
-        Special method to ensure proper deletion of the stored data, i.e. the
-        parsed traceback data.
-        
-        Signature:
-            None -> None
-        
-        Version 1.0.1.0
-        """
-        while self._Traceback:
-            Frame = self._Traceback.pop()
-            for Item in Frame:
-                if isinstance(Item, list):
-                    Item.clear()
-                del Item
-            del Frame
-        self._Traceback = []
+    Args:
+        *Tracebacks: StackTraceback; any number (at least one) of the call stack
+            or exception tracebacks (any sub-class)
     
-    #public methods
+    Returns:
+        int >= 0: number of the common inner frames
     
-    #+ properties
+    Raises:
+        TypeError: an argument is not a traceback analysis object
+        ValueError: no argument is passed
     
-    @property
-    def CallChain(self) -> TStringList:
-        """
-        Extracts and returns the call chain from the stored parsed snapshot of
-        the traceback. All callers names are fully qualified.
-        
-        Signature:
-            None -> list(str)
-        
-        Version 1.0.1.0
-        """
-        Callers = [Item[2] for Item in self._Traceback]
-        return Callers
+    Version 1.0.0.0
+    """
+    if not len(Tracebacks):
+        raise ValueError('At least one traceback is required')
+    Keys = _GetFrameKeys(Tracebacks[0])
+    Length = len(Keys)
+    for Traceback in Tracebacks[1:]:
+        Records = _GetFrameKeys(Traceback, Keys = False)
+        Length = min(Length, len(Records))
+        for Index in range(1, Length + 1):
+            Record = Records[-Index]
+            if ((Record.FilePath, Record.FullName, Record.LineNumber) !=
+                                                            Keys[-Index]):
+                Length = Index - 1
+                break
+    return Length
+
+def DiffTracebacks(First: 'StackTraceback',
+                            Second: 'StackTraceback') -> TDiffOpcodes:
+    """
+    Calculates the minimal diff between two tracebacks (the frames are
+    compared in the same manner as by the function GetCommonPrefix()), i.e.
+    the shortest sequence of the frames deletions and insertions transforming
+    the first traceback into the second one. The common prefix and suffix are
+    stripped first, and the rest is compared by the Myers algorithm, which
+    time is proportional to the product of the total length and the number of
+    the differences. The result is represented in the same format as by the
+    method get_opcodes() of the class difflib.SequenceMatcher: the list of
+    tuples (Tag, I1, I2, J1, J2) with the Tag being one of 'equal', 'replace',
+    'delete' and 'insert', which covers all frames of both tracebacks, e.g.
+    the frames First[I1:I2] are to be replaced by Second[J1:J2].
+
+    Signature:
+        StackTraceback, StackTraceback
+            -> list(tuple(str, int >= 0, int >= 0, int >= 0, int >= 0))
     
-    @property
-    def Info(self) -> str:
+    Args:
+        First: StackTraceback; the first traceback (any sub-class)
+        Second: StackTraceback; the second traceback (any sub-class)
+    
+    Returns:
+        list(tuple(str, int >= 0, int >= 0, int >= 0, int >= 0)): the diff
+            opcodes, empty list if both tracebacks are empty
+    
+    Raises:
+        TypeError: an argument is not a traceback analysis object
+    
+    Version 1.0.0.0
+    """
+    KeysA = _GetFrameKeys(First)
+    KeysB = _GetFrameKeys(Second)
+    LengthA = len(KeysA)
+    LengthB = len(KeysB)
+    Prefix = GetCommonPrefix(First, Second)
+    Suffix = min(GetCommonSuffix(First, Second),
+                                    min(LengthA, LengthB) - Prefix)
+    Middle = _GetEditScript(KeysA[Prefix : LengthA - Suffix],
+                                            KeysB[Prefix : LengthB - Suffix])
+    Result = []
+    if Prefix:
+        Result.append(('equal', 0, Prefix, 0, Prefix))
+    for Tag, I1, I2, J1, J2 in Middle:
+        Result.append((Tag, I1 + Prefix, I2 + Prefix, J1 + Prefix,
+                                                                J2 + Prefix))
+    if Suffix:
+        Result.append(('equal', LengthA - Suffix, LengthA, LengthB - Suffix,
+                                                                    LengthB))
+    return Result
+
+def GroupByPrefix(Tracebacks: Iterable['StackTraceback'],
+                                    Depth: int) -> dict[TFrameKeys, list[int]]:
+    """
+    Groups the tracebacks by their common roots, i.e. the keys of the Depth
+    outmost frames (or all frames of a shorter traceback), see the function
+    GetCommonPrefix(). The time is linear with the number of the tracebacks
+    (for a fixed depth), the tracebacks are not compared pair-wise.
+
+    Signature:
+        Iterable(StackTraceback), int > 0
+            -> dict(tuple(tuple(str, str, int)) -> list(int >= 0))
+    
+    Args:
+        Tracebacks: Iterable(StackTraceback); the call stack or exception
+            tracebacks (any sub-class)
+        Depth: int > 0; the number of the outmost frames to compare
+    
+    Returns:
+        dict(tuple(tuple(str, str, int)) -> list(int >= 0)): the tuples of the
+            keys of the root frames (path to the module, fully qualified name
+            of the caller and the line number) mapped to the list of the
+            indexes of the tracebacks with this root, in the order of
+            the first appearance of the roots
+    
+    Raises:
+        TypeError: the first argument is not an iterable of the traceback
+            analysis objects, or the depth is not an integer
+        ValueError: the depth is not positive
+    
+    Version 1.0.0.0
+    """
+    if not isinstance(Tracebacks, c_abc.Iterable):
+        raise TypeError(f'{type(Tracebacks).__name__} is not iterable')
+    if not isinstance(Depth, int) or isinstance(Depth, bool):
+        raise TypeError(f'{type(Depth).__name__} is not a sub-class of int')
+    if Depth <= 0:
+        raise ValueError(f'Depth {Depth} is not positive')
+    Result = dict()
+    for Index, Traceback in enumerate(Tracebacks):
+        Root = tuple((Record.FilePath, Record.FullName, Record.LineNumber)
+                for Record in _GetFrameKeys(Traceback, Keys = False)[:Depth])
+        Group = Result.get(Root, None)
+        if Group is None:
+            Result[Root] = [Index]
+        else:
+            Group.append(Index)
+    return Result
+
+#classes
+
+class _LocalsRepr(reprlib.Repr):
+    """
+    Bounded representation of the local variables of the frames based on the
+    reprlib module, see the function _FormatLocals(). Also creates the bounded
+    snapshots of the values, which hold only what their representations need:
+    the built-in containers are replaced by the copies of only their first few
+    elements (and a filler marking the omitted ones) down to the max depth,
+    and the long strings - by their heads and tails; the other objects are
+    kept as they are. Thus, a large container is not kept alive by a captured
+    traceback until it is rendered, and no __repr__() method is called upon
+    the capture. The representation of a snapshot is the same as of the value
+    itself, except that the dictionaries and sets show their first elements
+    in the iteration order instead of sorting all of them.
+
+    Methods:
+        snapshot(Value, Level):
+            type A, int -> type A OR list
+        snapshotLocals(Variables):
+            dict(str -> type A) -> dict(str -> type A)
+    
+    Version 1.0.0.0
+    """
+
+    #class data attributes - default values
+
+    _Filler: ClassVar[object] = object() #marks the omitted elements
+
+    #helper classes
+
+    class _DictItems(list):
         """
-        Prepares and returns a human-readable representation of the frames
-        within the obtained traceback as a single string composed of multiple
-        lines separated by the new-line character ('\n'). For each frame record
-        the first line indicates the fully qualified name of the caller, and the
-        second line - the path to the corresponding module and the line number
-        in the source code, where the call has occurred. These lines are
-        followed by the extract from the source code containing a specified
-        number of lines centered around the one, where the call has occurred.
-        The lines are prefixed with the line number left padded when required
-        with zero in order to preserve the indentation. The line, where the
-        call has occurred is indicated by '>' character. The lines are truncated
-        when required such that the total length together with the line number
-        prefix (and two extra characters) does not exceed the specified width
-        of the output. The number of the source code lines per frame as well as
-        the output width can be specified during instantiation (ContextLength
-        and ContextWidth arguments) as non-negative integers; otherwise the
-        default values stored in the class attributes ContextLength and
-        ConsoleWidth are used.
+        Snapshot of a dictionary - list of its first few (key, value) pairs.
+        """
+
+        __slots__ = ()
+
+    class _SetItems(list):
+        """
+        Snapshot of a set - list of its first few elements.
+        """
+
+        __slots__ = ()
+
+    class _FrozenSetItems(list):
+        """
+        Snapshot of a frozen set - list of its first few elements.
+        """
+
+        __slots__ = ()
+
+    #special methods
+
+    def __init__(self, MaxLength: int) -> None:
+        """
+        Initialization method.
+
+        Signature:
+            int > 0 -> None
+        
+        Args:
+            MaxLength: int > 0; max length of the representations of the
+                strings, numbers and other objects
         
+        Version 1.0.0.0
+        """
+        super().__init__()
+        self.maxlevel = 2
+        self.maxstring = self.maxlong = self.maxother = MaxLength
+    
+    #public methods
+
+    def snapshot(self, Value: Any, Level: int) -> Any:
+        """
+        Creates the bounded snapshot of a value to be represented at the
+        specified depth level.
+
         Signature:
-            None -> str
+            type A, int -> type A OR list
         
-        Version 1.0.1.0
+        Version 1.0.0.0
         """
-        Info = ''
-        for Frame in self._Traceback:
-            FilePath, Caller, FullName, LineNumber, LineIndex, CodeLines = Frame
-            if not (CodeLines is None):
-                MaxDigits = len(str(LineNumber + LineIndex))
-                MaxLineWidth = self._ConsoleWidth - 2 - MaxDigits
-                if Caller == '<module>':
-                    CallerInfo = f'In module {FullName}'
-                else:
-                    CallerInfo = f'Caller {FullName}()'
-                FileInfo = f'Line {LineNumber} in {FilePath}'
-                SourceCode = []
-                for LineOffset, SourceLine in enumerate(CodeLines):
-                    SourceLine = SourceLine.rstrip()
-                    CurrentLineNumber = LineNumber - LineIndex + LineOffset
-                    if CurrentLineNumber == LineNumber:
-                        Prefix = '>'
-                    else:
-                        Prefix = ' '
-                    PrintNumber = str(CurrentLineNumber)
-                    if len(PrintNumber) < MaxDigits:
-                        Prefix = f'{Prefix} '
-                    PrintNumber = f'{Prefix}{PrintNumber} '
-                    if len(SourceLine) > (MaxLineWidth):
-                        CodeLine = '{}{}...'.format(PrintNumber,
-                                                SourceLine[MaxLineWidth - 3])
-                    else:
-                        CodeLine = f'{PrintNumber}{SourceLine}'
-                    SourceCode.append(CodeLine)
-                CodeInfo = '\n'.join(SourceCode)
-                Info = '\n'.join([Info, CallerInfo, FileInfo, CodeInfo])
+        Class = type(Value)
+        if Class is str:
+            if len(Value) > 2 * self.maxstring:
+                Value = Value[:self.maxstring] + Value[-self.maxstring:]
+        elif Class is array:
+            Value = array(Value.typecode, Value[:self.maxarray + 1])
+        elif Class in (list, tuple, collections.deque, dict, set, frozenset):
+            if Class is dict:
+                Limit = self.maxdict
+                Items = Value.items()
+                Result = self._DictItems()
             else:
-                Info = '\n'.join([Info, '<console input>',
-                                        f'Line {LineNumber} in console input'])
-        if Info:
-            Info = Info.lstrip()
-        return Info
-
-class ExceptionTraceback(StackTraceback):
-    """
-    Utility class to obtain and analyze the traceback of the last raised
-    exception currently being handled as a a list of frame records for the stack
-    between the current frame and the frame in which an exception currently
-    being handled was raised in. Alternatively, can be used for parsing of a
-    traceback of any other exception (including the last one) stored in the
-    exception instance itself.
+                if Class is set:
+                    Limit = self.maxset
+                    Result = self._SetItems()
+                elif Class is frozenset:
+                    Limit = self.maxfrozenset
+                    Result = self._FrozenSetItems()
+                else:
+                    Limit = getattr(self, f'max{Class.__name__}')
+                    Result = []
+                Items = Value
+            if Level > 0:
+                for Item in itertools.islice(Items, Limit):
+                    if Class is dict:
+                        Item = (Item[0], self.snapshot(Item[1], Level - 1))
+                    elif not (Class is set or Class is frozenset):
+                        Item = self.snapshot(Item, Level - 1)
+                    Result.append(Item)
+            if len(Value) > len(Result):
+                Result.append(self._Filler)
+            if Class is list or Class is tuple or Class is collections.deque:
+                Result = Class(Result)
+            Value = Result
+        return Value
     
-    Built upon the functions inspect.trace() and inspect.getinnerframes();
-    preserves the order of the frames.
+    def snapshotLocals(self, Variables: c_abc.Mapping) -> dict[str, Any]:
+        """
+        Creates the bounded snapshots of the local variables of a frame, except
+        for the special (dunder) names.
+
+        Signature:
+            dict(str -> type A) -> dict(str -> type A)
+        
+        Version 1.0.0.0
+        """
+        return {Name: self.snapshot(Value, self.maxlevel)
+                    for Name, Value in Variables.items()
+                        if not (Name.startswith('__') and Name.endswith('__'))}
     
-    Extends the class StackTraceback and inherits the read-only properties.
+    def repr__DictItems(self, x: list, level: int) -> str:
+        """
+        Represents the snapshot of a dictionary.
+
+        Signature:
+            list(tuple(type A, type B)), int -> str
+        
+        Version 1.0.0.0
+        """
+        if not len(x):
+            Result = '{}'
+        elif level <= 0:
+            Result = f'{{{self.fillvalue}}}'
+        else:
+            Pieces = ['{}: {}'.format(self.repr1(Key, level - 1),
+                                                self.repr1(Value, level - 1))
+                        for Key, Value in itertools.islice(x, self.maxdict)]
+            if len(x) > self.maxdict:
+                Pieces.append(self.fillvalue)
+            Result = '{{{}}}'.format(', '.join(Pieces))
+        return Result
     
-    Properties:
-        CallChain: (read-only) list(str); list of the names of the callers
-        Info: (read-only) str; human-readable frames data
+    def repr__SetItems(self, x: list, level: int) -> str:
+        """
+        Represents the snapshot of a set.
+
+        Signature:
+            list(type A), int -> str
+        
+        Version 1.0.0.0
+        """
+        if not len(x):
+            Result = 'set()'
+        else:
+            Result = self._repr_iterable(x, level, '{', '}', self.maxset)
+        return Result
     
-    Version 1.0.1.0
+    def repr__FrozenSetItems(self, x: list, level: int) -> str:
+        """
+        Represents the snapshot of a frozen set.
+
+        Signature:
+            list(type A), int -> str
+        
+        Version 1.0.0.0
+        """
+        if not len(x):
+            Result = 'frozenset()'
+        else:
+            Result = self._repr_iterable(x, level, 'frozenset({', '})',
+                                                            self.maxfrozenset)
+        return Result
+
+class FrameRecord():
     """
+    Compact record of a single parsed frame, which does not contain any frame
+    object. The strings (path to the module, caller's and its fully qualified
+    names) are interned, thus they are shared by all records referring to the
+    same location, and the source code sniplet is stored as a tuple.
+
+    Supports unpacking, indexing and comparison as a 6-elements tuple:
+    (FilePath, Caller, FullName, LineNumber, LineIndex, CodeLines).
+
+    Attributes:
+        FilePath: str; path to the source code module
+        Caller: str; name of the caller (module or function / method)
+        FullName: str; fully qualified name of the caller
+        LineNumber: int > 0; number of the offending code line in the module
+        LineIndex: int >= 0 OR None; position index of the same line in the
+            code sniplet
+        CodeLines: tuple(str) OR None; the code sniplet as a tuple of the source
+            code lines
     
-    #special methods
+    The record of a not yet resolved frame of a module, which is not loaded
+    from a source file, also keeps the module's name, spec and loader for the
+    source retrieval via linecache (not a field of the record).
     
-    def __init__(self, *, SkipFrames: TIntNone = None,
-                            ContextLength: TIntNone = None,
-                            ConsoleWidth: TIntNone = None,
-                            FromTraceback: TTracebackNone = None) -> None:
+    Version 1.1.0.0
+    """
+
+    __slots__ = ('FilePath', 'Caller', 'FullName', 'LineNumber', 'LineIndex',
+                                                'CodeLines', '_ModuleGlobals')
+
+    #special methods
+
+    def __init__(self, FilePath: str, Caller: str, FullName: str,
+                    LineNumber: int, LineIndex: TIntNone = None,
+                    CodeLines: Optional[Iterable[str]] = None) -> None:
         """
-        Initialization method. Attempts to retrieve and store the traceback of
-        the last raised exception as a a list of frame records for the stack
-        between the current frame and the frame in which an exception currently
-        being handled was raised in. Can accept up to 3 optional positional
-        arguments, which can be passed as the keyword arguments: SkipFrames,
-        ConsoleWidth and ConsoleWidth.
+        Initialization method.
 
-        Alternatively, a traceback stored in an exception can be passed as the
-        keyword argument FromTraceback, in which case the SkipFrames argument
-        is ignored, and the traceback is reconstructed from the passed object.
-        
         Signature:
-            /int > 0 OR None, int > 0 OR None, int > 0 OR None,
-                types.TracebackType OR None/ -> None
+            str, str, str, int > 0/, int >= 0 OR None, seq(str) OR None/
+                -> None
         
         Args:
-            SkipFrames: (keyword) int > 0; number of the deepest (inner) frames
-                to 'hide' in the traceback excluding the initialization method
-                itself, which is always removed (default is None -> zero),
-                ignored if FromTraceback argument is a proper traceback object
-            ContextLength: (keyword) int > 0; total number of lines of the
-                source code to retrieve around and including the one, there a
-                call was made (default is None -> the value of the class field
-                ContextLenght)
-            ConsoleWidth: (keyword) int > 0; width to which the source code
-                lines must be truncated, including the line's number + 2 extra
-                characters (default is None -> the value of the class field
-                ConsoleWidth)
-            FromTraceback: (keyword) types.TracebackType OR None; an instance of
-                a traceback object from which the extract the information, if
-                provided and proper - the SkipFrames argument is ignored
-                (defaults to None -> actual traceback stack is analyzed)
+            FilePath: str; path to the source code module
+            Caller: str; name of the caller (module or function / method)
+            FullName: str; fully qualified name of the caller
+            LineNumber: int > 0; number of the offending code line
+            LineIndex: (optional) int >= 0 OR None; position index of the same
+                line in the code sniplet, defaults to None
+            CodeLines: (optional) seq(str) OR None; the code sniplet, defaults
+                to None
+        
+        Version 1.0.0.0
+        """
+        self.FilePath = sys.intern(FilePath)
+        self.Caller = sys.intern(Caller)
+        self.FullName = sys.intern(FullName)
+        self.LineNumber = LineNumber
+        self.LineIndex = LineIndex
+        self.CodeLines = None if CodeLines is None else tuple(CodeLines)
+        self._ModuleGlobals = None
+    
+    def __iter__(self) -> Iterator[Any]:
+        """
+        Iterates over the fields in the same order as the elements of the
+        frame tuple, thus allowing the unpacking.
+
+        Signature:
+            None -> iterator(type A)
+        
+        Version 1.0.0.0
+        """
+        return iter((self.FilePath, self.Caller, self.FullName,
+                        self.LineNumber, self.LineIndex, self.CodeLines))
+    
+    def __len__(self) -> int:
+        """
+        Returns the number of the fields, i.e. 6.
+
+        Signature:
+            None -> int
         
         Version 1.0.1.0
         """
+        return 6
+    
+    def __getitem__(self, Index: Union[int, slice]) -> Any:
+        """
+        Index access to the fields as to the elements of the frame tuple.
 
+        Signature:
+            int OR slice -> type A
+        
+        Version 1.0.0.0
+        """
+        return tuple(self)[Index]
+    
+    def __eq__(self, Other: Any) -> bool:
+        """
+        Compares the record with another record or a 6-elements tuple field by
+        field.
 
-        if (isinstance(ContextLength, int) and ContextLength > 0):
-            _ContextLenght = ContextLength
+        Signature:
+            type A -> bool
+        
+        Version 1.0.0.0
+        """
+        if isinstance(Other, (FrameRecord, tuple)):
+            Result = tuple(self) == tuple(Other)
         else:
-            _ContextLenght = self.ContextLenght
-        if (isinstance(ConsoleWidth, int) and ConsoleWidth > 0):
-            self._ConsoleWidth = ConsoleWidth
+            Result = NotImplemented
+        return Result
+    
+    def __repr__(self) -> str:
+        """
+        Returns the string representation of the record.
+
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        return '{}({})'.format(self.__class__.__name__,
+                                            ', '.join(map(repr, tuple(self))))
+
+class ModuleNameResolver():
+    """
+    Cached resolver of the name of the module, to which a frame belongs. As the
+    replacement of the function inspect.getmodule() it takes the name directly
+    from the frame's globals dictionary, if this dictionary is the namespace of
+    the module registered in sys.modules under the same name. Otherwise, it
+    falls back to the look-up of the path to the source file in the index of
+    the loaded modules by their files. The index remembers the identity of the
+    module object registered under each name; a found entry is checked against
+    sys.modules (the module is still registered under the same name), and only
+    a miss or a stale entry triggers the update of the index, which compares
+    the current content of sys.modules with the remembered one and indexes
+    only the new or replaced modules, and drops the removed ones. The results
+    of the fall back resolution are memoized per file path and checked in the
+    same manner, the size of this cache is bounded, and the least recently used
+    results are dropped first.
+
+    The resolver does not use locks, thus the frames are resolved in parallel
+    threads without serialization, also in the free-threaded (no GIL) builds.
+    The index of the modules is an immutable snapshot, which is replaced as a
+    whole, and the memoized results are kept per thread (the bound is applied
+    to each thread separately).
+
+    Methods:
+        getModuleName(FrameObject):
+            types.FrameType -> str OR None
+        clear():
+            None -> None
+    
+    Version 1.2.0.0
+    """
+
+    #class data attributes - default values
+
+    MaxSize: ClassVar[int] = 4096 #max number of memoized file paths
+
+    #special methods
+
+    def __init__(self, *, MaxSize: TIntNone = None) -> None:
+        """
+        Initialization method.
+
+        Signature:
+            /int > 0 OR None/ -> None
+        
+        Args:
+            MaxSize: (keyword) int > 0 OR None; max number of the memoized
+                file path resolution results per thread (default is None -> the
+                value of the class field MaxSize)
+        
+        Version 1.1.0.0
+        """
+        if (isinstance(MaxSize, int) and MaxSize > 0):
+            self._MaxSize = MaxSize
         else:
-            self._ConsoleWidth = self.ConsoleWidth
-        if isinstance(SkipFrames, int) and SkipFrames > 0:
-            _SkipFrames = SkipFrames
+            self._MaxSize = self.MaxSize
+        self._Local = threading.local()
+        self._Generation = 0
+        self.clear()
+    
+    #private methods
+
+    def _getResolved(self) -> TResolvedCache:
+        """
+        Returns the memoized fall back resolution results of the calling
+        thread, which are discarded when the cache is cleared. Each result is
+        stored together with the identity of the found module, or with the
+        index snapshot, in which nothing was found.
+
+        Signature:
+            None -> collections.OrderedDict(str -> tuple(str OR None, Any))
+        
+        Version 1.1.0.0
+        """
+        Local = self._Local
+        if getattr(Local, 'State', None) != self._Generation:
+            Local.State = self._Generation
+            Local.Resolved = collections.OrderedDict()
+        return Local.Resolved
+    
+    def _getIndex(self) -> TModulesIndex:
+        """
+        Returns the current snapshot of the index of the loaded modules, which
+        is built upon the first call or after the cache is cleared. The
+        snapshot is not modified after its creation, and it is shared by all
+        threads.
+
+        Signature:
+            None -> tuple(list(str), list(int), dict(str -> int),
+                dict(str -> tuple(str, str)), dict(str -> str))
+        
+        Version 1.1.0.0
+        """
+        Snapshot = self._Index
+        if Snapshot is None:
+            Snapshot = self._updateIndex(None)
+            self._Index = Snapshot
+        return Snapshot
+    
+    def _updateIndex(self,
+                    Snapshot: Optional[TModulesIndex]) -> TModulesIndex:
+        """
+        Compares the current content of sys.modules with the one remembered by
+        the index snapshot, and returns the same snapshot if they are equal.
+        Otherwise, returns a new snapshot, in which the entries of the removed
+        or replaced modules are dropped, and only the new or replaced modules
+        are indexed by the normalized absolute paths to their source files.
+
+        The snapshot holds: the names of the modules (in the order of
+        sys.modules) and the identities of the module objects, which are
+        compared in this order, then the identities by the names, the raw and
+        normalized paths by the names, and the names by the paths. The module
+        objects themselves are not referenced.
+
+        Signature:
+            tuple(list(str), list(int), dict(str -> int),
+                dict(str -> tuple(str, str)), dict(str -> str)) OR None
+                    -> tuple(list(str), list(int), dict(str -> int),
+                        dict(str -> tuple(str, str)), dict(str -> str))
+        
+        Version 1.0.0.0
+        """
+        Modules = sys.modules.copy()
+        Names = list(Modules)
+        if not (Snapshot is None) and Names == Snapshot[0]:
+            Identities = list(map(id, Modules.values()))
+            if Identities == Snapshot[1]:
+                return Snapshot
         else:
-            _SkipFrames = None
-        if ((not (FromTraceback is None)) and
-                                    isinstance(FromTraceback, TracebackType)):
-            RawFrames = inspect.getinnerframes(FromTraceback, _ContextLenght)
-            self._Traceback = ParseFramesList(RawFrames)
+            Identities = list(map(id, Modules.values()))
+        Current = dict(zip(Names, Identities))
+        if Snapshot is None:
+            Files = {}
+            Index = {}
+            Changed = Names
         else:
-            RawFrames = inspect.trace(_ContextLenght)
-            self._Traceback = ParseFramesList(RawFrames,
-                                                    SkipFrames = _SkipFrames)
-        RawFrames.clear()
-        del RawFrames
+            Seen = Snapshot[2]
+            Files = dict(Snapshot[3])
+            Index = dict(Snapshot[4])
+            Changed = [Name for Name, Identity in Current.items()
+                                                if Seen.get(Name) != Identity]
+            Dropped = set(Seen.keys() - Current.keys())
+            Dropped.update(Name for Name in Changed if Name in Seen)
+            Stale = set()
+            for Name in Dropped:
+                Paths = Files.pop(Name, None)
+                if not (Paths is None):
+                    for FilePath in Paths:
+                        if Index.get(FilePath, None) == Name:
+                            del Index[FilePath]
+                            Stale.add(FilePath)
+            if len(Stale):
+                #other modules of the same files may take the dropped entries
+                for Name, Paths in Files.items():
+                    for FilePath in Paths:
+                        if FilePath in Stale:
+                            Index.setdefault(FilePath, Name)
+        for Name in Changed:
+            FilePath = getattr(Modules[Name], '__file__', None)
+            if isinstance(FilePath, str):
+                Paths = (FilePath, os.path.normcase(os.path.abspath(FilePath)))
+                Files[Name] = Paths
+                for Path in Paths:
+                    Index.setdefault(Path, Name)
+        del Modules
+        return (Names, Identities, Current, Files, Index)
+    
+    def _lookUp(self, Snapshot: TModulesIndex, FilePath: str) -> Optional[str]:
+        """
+        Looks up the name of the module by the path to its source file in the
+        index snapshot, and checks that this module is still registered in
+        sys.modules under the same name. Returns None if the path is not found
+        or the found entry is stale.
+
+        Signature:
+            tuple(list(str), list(int), dict(str -> int),
+                dict(str -> tuple(str, str)), dict(str -> str)), str
+                    -> str OR None
+        
+        Version 1.0.0.0
+        """
+        Index = Snapshot[4]
+        Result = Index.get(FilePath, None)
+        if Result is None:
+            Result = Index.get(os.path.normcase(os.path.abspath(FilePath)),
+                                                                        None)
+        if ((not (Result is None)) and
+                (id(sys.modules.get(Result, None)) != Snapshot[2][Result])):
+            Result = None
+        return Result
+    
+    def _resolveFile(self, FilePath: str) -> Optional[str]:
+        """
+        Fall back resolution of the module's name by the path to its source
+        file.
+
+        Signature:
+            str -> str OR None
+        
+        Version 1.2.0.0
+        """
+        Resolved = self._getResolved()
+        Entry = Resolved.get(FilePath, None)
+        IsValid = False
+        if not (Entry is None):
+            Result, Token = Entry
+            if Token is None: #pseudo-file
+                IsValid = True
+            elif Result is None:
+                Snapshot = self._Index
+                if not (Snapshot is None) and Token is Snapshot:
+                    Updated = self._updateIndex(Snapshot)
+                    if Updated is Snapshot:
+                        IsValid = True
+                    else:
+                        self._Index = Updated
+            else:
+                IsValid = id(sys.modules.get(Result, None)) == Token
+        if IsValid:
+            Resolved.move_to_end(FilePath)
+        else:
+            if not (Entry is None):
+                del Resolved[FilePath]
+            if FilePath.startswith('<') and FilePath.endswith('>'):
+                Result = None
+                Token = None
+            else:
+                Snapshot = self._getIndex()
+                Result = self._lookUp(Snapshot, FilePath)
+                if Result is None:
+                    Updated = self._updateIndex(Snapshot)
+                    if not (Updated is Snapshot):
+                        Snapshot = Updated
+                        self._Index = Snapshot
+                        Result = self._lookUp(Snapshot, FilePath)
+                if Result is None:
+                    Token = Snapshot
+                else:
+                    Token = Snapshot[2][Result]
+            while len(Resolved) >= self._MaxSize:
+                Resolved.popitem(last = False)
+            Resolved[FilePath] = (Result, Token)
+        return Result
+    
+    #public methods
+
+    def getModuleName(self, FrameObject: FrameType) -> Optional[str]:
+        """
+        Resolves the name of the module, to which the frame belongs.
+
+        Signature:
+            types.FrameType -> str OR None
+        
+        Args:
+            FrameObject: types.FrameType; the frame object to be analyzed
+        
+        Returns:
+            str: the name of the module
+            None: the module cannot be resolved, e.g. the console input or a
+                code executed with a custom namespace
+        
+        Version 1.1.0.0
+        """
+        Globals = FrameObject.f_globals
+        FilePath = FrameObject.f_code.co_filename
+        Name = Globals.get('__name__', None)
+        Module = sys.modules.get(Name, None) if isinstance(Name, str) else None
+        if ((not (Module is None)) and
+                            (getattr(Module, '__dict__', None) is Globals) and
+                            not (FilePath.startswith('<') and
+                                                    FilePath.endswith('>'))):
+            Result = Name
+        else:
+            Result = self._resolveFile(FilePath)
+        del Module
+        del Globals
+        return Result
+    
+    def clear(self) -> None:
+        """
+        Invalidates all cached data, including the memoized results of all
+        threads.
+
+        Signature:
+            None -> None
+        
+        Version 1.1.0.0
+        """
+        self._Index = None
+        self._Generation += 1
+
+class SourceCache():
+    """
+    Thread-safe cache of the source files used for the retrieval of the source
+    code context of the frames as the replacement of the module linecache. A
+    file is read once in chunks to build the index of the offsets of its lines,
+    and only this index is kept, thus the large (e.g. generated) modules are
+    not kept in the memory as lists of strings. Upon each look-up only the
+    byte range of the requested lines is read from a file descriptor opened
+    for this look-up, and only these lines are decoded. A cached file is
+    re-validated on each look-up by its modification time, size and inode
+    number, and a changed file is re-indexed; the opened file is checked in
+    the same manner, so a file changed in between is not used, and a file
+    truncated in place results only in the short read. The number of the
+    cached files is bounded, the least recently used files are dropped first.
+
+    The cache can be pre-warmed for a list of files or for all modules of a
+    package (see PackageStructure.getModules()), since the indexing of a file
+    reads it into the page cache of the OS, the first traceback after a deploy
+    does not stall on the cold disk reads.
+
+    The pseudo-files (e.g. '<string>'), the modules loaded from the zip
+    archives, etc. are not handled, and the look-up returns None for them.
+
+    The cache is split into the independently locked stripes (by the hash of
+    the path), and the locks are held only for the look-ups in the stripes'
+    dictionaries, whereas the file status checks, the indexing and the reading
+    of the files and the decoding of the lines are done without locks; thus the
+    tracebacks captured in parallel threads are not serialized, also in the
+    free-threaded (no GIL) builds. The least recently used file is dropped per
+    stripe. The small caches (less than 16 files per stripe) are not split.
+
+    Properties:
+        Size: (read-only) int >= 0; number of the cached files
+    
+    Methods:
+        getContext(FilePath, LineNumber, ContextLength):
+            str, int > 0, int > 0 -> tuple(int >= 0, tuple(str)) OR None
+        getLineCount(FilePath):
+            str -> int >= 0 OR None
+        prewarm(Paths):
+            str OR Iterable(str) -> int >= 0
+        prewarmPackage(Package):
+            str OR PackageStructure -> int >= 0
+        invalidate(FilePath):
+            str -> None
+        clear():
+            None -> None
+    
+    Version 1.2.0.0
+    """
+
+    #class data attributes - default values
+
+    MaxFiles: ClassVar[int] = 256 #max number of the cached files
+
+    Stripes: ClassVar[int] = 16 #max number of the independently locked parts
+
+    _MinStripeFiles: ClassVar[int] = 16 #min number of the files per stripe
+
+    _ChunkSize: ClassVar[int] = 1 << 20 #bytes read at once upon indexing
+
+    #special methods
+
+    def __init__(self, *, MaxFiles: TIntNone = None,
+                                        Stripes: TIntNone = None) -> None:
+        """
+        Initialization method.
+
+        Signature:
+            /int > 0 OR None, int > 0 OR None/ -> None
+        
+        Args:
+            MaxFiles: (keyword) int > 0 OR None; max number of the cached
+                files (default is None -> the value of the class field
+                MaxFiles)
+            Stripes: (keyword) int > 0 OR None; max number of the independently
+                locked parts of the cache (default is None -> the value of the
+                class field Stripes), which is reduced to keep at least 16
+                files per stripe
+        
+        Version 1.1.0.0
+        """
+        if (isinstance(MaxFiles, int) and not isinstance(MaxFiles, bool)
+                                                            and MaxFiles > 0):
+            self._MaxFiles = MaxFiles
+        else:
+            self._MaxFiles = self.MaxFiles
+        if not (isinstance(Stripes, int) and not isinstance(Stripes, bool)
+                                                            and Stripes > 0):
+            Stripes = self.Stripes
+        Stripes = max(1, min(Stripes, self._MaxFiles // self._MinStripeFiles))
+        Limit, Extra = divmod(self._MaxFiles, Stripes)
+        self._Stripes: tuple[tuple[threading.Lock,
+                    collections.OrderedDict[str, TSourceEntry], int], ...] = (
+                tuple((threading.Lock(), collections.OrderedDict(),
+                            Limit + int(Index < Extra))
+                                                for Index in range(Stripes)))
+    
+    #private methods
+
+    @classmethod
+    def _loadFile(cls, FilePath: str) -> TSourceEntry:
+        """
+        Reads a file in chunks, builds the index of the offsets of its lines
+        and detects its encoding. The content of the file is not kept.
+
+        Signature:
+            str -> list(tuple(int, int, int), array('Q'), str)
+        
+        Raises:
+            OSError: the file cannot be opened or read
+        
+        Version 1.1.0.0
+        """
+        Offsets = array('Q', [0])
+        Size = 0
+        Head = b''
+        with open(FilePath, 'rb', buffering = 0) as fFile:
+            Stat = os.fstat(fFile.fileno())
+            while True:
+                Chunk = fFile.read(cls._ChunkSize)
+                if not Chunk:
+                    break
+                if not Size:
+                    Head = Chunk
+                Position = Chunk.find(b'\n')
+                while Position >= 0:
+                    Offsets.append(Size + Position + 1)
+                    Position = Chunk.find(b'\n', Position + 1)
+                Size += len(Chunk)
+        if Offsets[-1] != Size:
+            Offsets.append(Size)
+        HeadLines = iter(Head.splitlines(keepends = True)[:2])
+        try:
+            Encoding = tokenize.detect_encoding(
+                                            lambda : next(HeadLines, b''))[0]
+        except SyntaxError:
+            Encoding = 'utf-8'
+        Stamp = (Stat.st_mtime_ns, Stat.st_size, Stat.st_ino)
+        return [Stamp, Offsets, Encoding]
+    
+    def _getStripe(self, FilePath: str) -> tuple[threading.Lock,
+                    collections.OrderedDict[str, TSourceEntry], int]:
+        """
+        Selects the stripe of the cache for a file by the hash of its path.
+
+        Signature:
+            str -> tuple(threading.Lock, collections.OrderedDict(str -> list),
+                int > 0)
+        
+        Version 1.0.0.0
+        """
+        return self._Stripes[hash(FilePath) % len(self._Stripes)]
+    
+    def _getEntry(self, FilePath: str) -> Optional[TSourceEntry]:
+        """
+        Looks up the cached data of a file, re-validates it and (re-) loads the
+        file if required. The lock of the stripe is acquired only for the
+        look-up and the update of its dictionary; a file loaded concurrently by
+        several threads is stored by the last one. The returned data is not
+        modified afterwards, and it remains usable after being dropped from
+        the cache.
+
+        Signature:
+            str -> list(tuple(int, int, int), array('Q'), str) OR None
+        
+        Version 1.2.0.0
+        """
+        if FilePath.startswith('<') and FilePath.endswith('>'):
+            return None
+        Lock, Files, Limit = self._getStripe(FilePath)
+        try:
+            Stat = os.stat(FilePath)
+        except (OSError, ValueError):
+            Stat = None
+        if not (Stat is None):
+            with Lock:
+                Entry = Files.get(FilePath, None)
+                if ((not (Entry is None)) and Entry[0] == (Stat.st_mtime_ns,
+                                                Stat.st_size, Stat.st_ino)):
+                    Files.move_to_end(FilePath)
+                    return Entry
+        Entry = None
+        if not (Stat is None) and stat.S_ISREG(Stat.st_mode):
+            try:
+                Entry = self._loadFile(FilePath)
+            except (OSError, ValueError):
+                pass
+        with Lock:
+            if Entry is None:
+                Files.pop(FilePath, None)
+            else:
+                Files[FilePath] = Entry
+                Files.move_to_end(FilePath)
+                while len(Files) > Limit:
+                    Files.popitem(last = False)
+        return Entry
+    
+    @staticmethod
+    def _getLines(FilePath: str, Entry: TSourceEntry, Start: int,
+                                    Stop: int) -> Optional[tuple[str, ...]]:
+        """
+        Reads and decodes the lines of a cached file within the specified range
+        of the indexes. The byte range of the lines is read from a descriptor
+        opened only for this call, after checking that the opened file is the
+        indexed one. As in the module linecache, each line ends with the new
+        line character, and the Windows line endings are converted.
+
+        Signature:
+            str, list(tuple(int, int, int), array('Q'), str), int >= 0,
+                int >= 0 -> tuple(str) OR None
+        
+        Returns:
+            tuple(str): the decoded lines, possibly incomplete if the file is
+                being truncated
+            None: the file cannot be read, or it is changed since indexing
+        
+        Version 1.1.0.0
+        """
+        Stamp, Offsets, Encoding = Entry
+        Begin = Offsets[Start]
+        try:
+            Descriptor = os.open(FilePath, os.O_RDONLY |
+                                                getattr(os, 'O_BINARY', 0))
+        except (OSError, ValueError):
+            return None
+        try:
+            Stat = os.fstat(Descriptor)
+            if Stamp != (Stat.st_mtime_ns, Stat.st_size, Stat.st_ino):
+                return None
+            os.lseek(Descriptor, Begin, os.SEEK_SET)
+            Data = os.read(Descriptor, Offsets[Stop] - Begin)
+        except OSError:
+            return None
+        finally:
+            os.close(Descriptor)
+        Result = []
+        for Index in range(Start, Stop):
+            Line = Data[Offsets[Index] - Begin :
+                            Offsets[Index + 1] - Begin].decode(Encoding,
+                                                                    'replace')
+            if Line.endswith('\r\n'):
+                Line = f'{Line[:-2]}\n'
+            elif Line.endswith('\r'):
+                Line = f'{Line[:-1]}\n'
+            elif not Line.endswith('\n'):
+                Line = f'{Line}\n'
+            Result.append(Line)
+        return tuple(Result)
+    
+    #public methods
+
+    #+ properties
+
+    @property
+    def Size(self) -> int:
+        """
+        Read-only property returning the number of the cached files.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.1.0.0
+        """
+        return sum(len(Files) for _, Files, _ in self._Stripes)
+    
+    #+ methods
+
+    def getContext(self, FilePath: str, LineNumber: int,
+                                ContextLength: int) -> Optional[TSourceContext]:
+        """
+        Retrieves the source code sniplet of the required length centered around
+        the specified line of a source file in the same manner as the function
+        inspect.getframeinfo() does.
+
+        Signature:
+            str, int > 0, int > 0 -> tuple(int >= 0, tuple(str)) OR None
+        
+        Args:
+            FilePath: str; path to the source file
+            LineNumber: int > 0; number of the line, starting from 1
+            ContextLength: int > 0; number of the lines in the sniplet
+        
+        Returns:
+            tuple(int >= 0, tuple(str)): position index of the line in the
+                sniplet and the sniplet itself as a tuple of the source code
+                lines
+            None: the file is not available or it is empty
+        
+        Version 1.2.0.0
+        """
+        Entry = self._getEntry(FilePath)
+        if Entry is None:
+            return None
+        LinesCount = len(Entry[1]) - 1
+        if not LinesCount:
+            return None
+        Start = LineNumber - 1 - ContextLength // 2
+        Start = max(0, min(Start, LinesCount - ContextLength))
+        Stop = min(Start + ContextLength, LinesCount)
+        CodeLines = self._getLines(FilePath, Entry, Start, Stop)
+        if CodeLines is None:
+            return None
+        return LineNumber - 1 - Start, CodeLines
+    
+    def getLineCount(self, FilePath: str) -> TIntNone:
+        """
+        Returns the number of the lines in a source file.
+
+        Signature:
+            str -> int >= 0 OR None
+        
+        Args:
+            FilePath: str; path to the source file
+        
+        Returns:
+            int >= 0: number of the lines
+            None: the file is not available
+        
+        Version 1.1.1.0
+        """
+        Entry = self._getEntry(FilePath)
+        return None if Entry is None else len(Entry[1]) - 1
+    
+    def prewarm(self, Paths: Union[str, Iterable[str]]) -> int:
+        """
+        Loads the source files into the cache in advance. The paths, which are
+        not strings or do not refer to the existing files, are ignored.
+
+        Signature:
+            str OR Iterable(str) -> int >= 0
+        
+        Args:
+            Paths: str OR Iterable(str); a path or paths to the source files
+        
+        Returns:
+            int >= 0: number of the loaded files
+        
+        Raises:
+            TypeError: the argument is neither a string nor an iterable
+        
+        Version 1.1.0.0
+        """
+        if isinstance(Paths, str):
+            Paths = [Paths]
+        elif not isinstance(Paths, c_abc.Iterable):
+            raise TypeError(
+                f'{type(Paths).__name__} is neither str nor iterable')
+        Result = 0
+        for FilePath in Paths:
+            if (isinstance(FilePath, str) and
+                                    not (self._getEntry(FilePath) is None)):
+                Result += 1
+        return Result
+    
+    def prewarmPackage(self, Package: Any) -> int:
+        """
+        Loads all Python source modules of a package into the cache in advance,
+        see PackageStructure.getModules(). The folders and files filtering
+        options of a passed package analyzer instance are respected.
+
+        Signature:
+            str OR PackageStructure -> int >= 0
+        
+        Args:
+            Package: str OR PackageStructure; path to a package folder or an
+                instance of the static package structure analyzer
+        
+        Returns:
+            int >= 0: number of the loaded files
+        
+        Raises:
+            TypeError: the argument is neither a string nor an instance of
+                PackageStructure
+            UT_ValueError: the path is not a Python package folder
+        
+        Version 1.0.0.0
+        """
+        #late import to avoid circular dependency
+        from .package_structure import PackageStructure
+        if isinstance(Package, str):
+            Package = PackageStructure(Package)
+        elif not isinstance(Package, PackageStructure):
+            raise TypeError(
+                f'{type(Package).__name__} is neither str nor PackageStructure')
+        return self.prewarm(os.path.join(Package.Path, Module)
+                                            for Module in Package.getModules())
+    
+    def invalidate(self, FilePath: str) -> None:
+        """
+        Removes a file from the cache.
+
+        Signature:
+            str -> None
+        
+        Args:
+            FilePath: str; path to the source file
+        
+        Version 1.1.0.0
+        """
+        Lock, Files, _ = self._getStripe(FilePath)
+        with Lock:
+            Files.pop(FilePath, None)
+    
+    def clear(self) -> None:
+        """
+        Removes all files from the cache.
+
+        Signature:
+            None -> None
+        
+        Version 1.1.0.0
+        """
+        for Lock, Files, _ in self._Stripes:
+            with Lock:
+                Files.clear()
+
+class CapturePolicy():
+    """
+    Thread-safe decision maker on whether a traceback should be captured, which
+    allows to bound the cost of the traceback analysis under overload, when the
+    exceptions are raised en masse. Supports four modes:
+        * 'always' - every traceback is captured
+        * 'never' - no traceback is captured
+        * 'sample' - only 1 in every SampleEvery tracebacks is captured per
+            thread (the first one in each thread is always captured)
+        * 'bucket' - token bucket per raise site, i.e. each site can capture up
+            to Burst tracebacks at once, and the tokens are replenished at the
+            Rate tokens per second
+    
+    The raise site is any hashable object, e.g. a pair of the code object and
+    the line number, as used by the traceback classes. The number of the
+    tracked sites is bounded; when the limit is reached the new sites share a
+    single overflow bucket with the same rate and capacity, until reset.
+
+    The decisions in the 'always', 'never' and 'sample' modes do not acquire
+    any lock, and the statistics and the sampling are counted per thread, thus
+    the threads do not contend on a shared counter. The buckets are split
+    into independently locked stripes selected by the hash of the site; the
+    limit of the sites and the overflow bucket are per stripe.
+    
+    The policy is applied process-wide by the assignment of an instance to the
+    class attribute StackTraceback.Policy (also used by all sub-classes, unless
+    overridden), when a traceback is declined the cheap placeholder traceback
+    holding only the raise site frame is created instead.
+
+    Properties:
+        Mode: (read-only) str; the mode of the policy
+        Description: (read-only) str; the mode and its parameters
+        Allowed: (read-only) int >= 0; number of the allowed captures
+        Declined: (read-only) int >= 0; number of the declined captures
+    
+    Methods:
+        allow(Site):
+            type A -> bool
+        reset():
+            None -> None
+    
+    Version 1.2.0.0
+    """
+
+    #class data attributes - default values
+
+    Modes: ClassVar[tuple[str, ...]] = ('always', 'never', 'sample', 'bucket')
+
+    SampleEvery: ClassVar[int] = 100 #capture 1 in N tracebacks in sample mode
+
+    Rate: ClassVar[float] = 1.0 #tokens per second per site in bucket mode
+
+    Burst: ClassVar[int] = 10 #bucket capacity per site in bucket mode
+
+    MaxSites: ClassVar[int] = 4096 #max number of the tracked raise sites
+
+    Stripes: ClassVar[int] = 16 #max number of the independently locked parts
+
+    _MinStripeSites: ClassVar[int] = 16 #min number of the sites per stripe
+
+    _OverflowSite: ClassVar[object] = object() #key of the shared bucket
+
+    #special methods
+
+    def __init__(self, Mode: str = 'always', *,
+                    SampleEvery: TIntNone = None,
+                    Rate: TFloatNone = None,
+                    Burst: TIntNone = None,
+                    MaxSites: TIntNone = None,
+                    Stripes: TIntNone = None) -> None:
+        """
+        Initialization method.
+
+        Signature:
+            /str, int > 0 OR None, int > 0 OR float > 0 OR None,
+                int > 0 OR None, int > 0 OR None, int > 0 OR None/ -> None
+        
+        Args:
+            Mode: (optional) str; one of 'always', 'never', 'sample' and
+                'bucket' (default is 'always')
+            SampleEvery: (keyword) int > 0 OR None; N in 1 in N sampling
+                (default is None -> the value of the class field SampleEvery)
+            Rate: (keyword) int > 0 OR float > 0 OR None; number of the tokens
+                added to the bucket of a site per second (default is None ->
+                the value of the class field Rate)
+            Burst: (keyword) int > 0 OR None; capacity of the bucket of a site
+                (default is None -> the value of the class field Burst)
+            MaxSites: (keyword) int > 0 OR None; max number of the tracked
+                raise sites (default is None -> the value of the class field
+                MaxSites)
+            Stripes: (keyword) int > 0 OR None; max number of the independently
+                locked parts of the buckets (default is None -> the value of
+                the class field Stripes), which is reduced to keep at least 16
+                sites per stripe
+        
+        Raises:
+            TypeError: the mode is not a string
+            ValueError: the mode is not supported
+        
+        Version 1.1.0.0
+        """
+        if not isinstance(Mode, str):
+            raise TypeError(f'{type(Mode).__name__} is not a sub-class of str')
+        if not (Mode in self.Modes):
+            raise ValueError(
+                        f'Capture mode {Mode!r} is not one of {self.Modes}')
+        self._Mode = Mode
+        if (isinstance(SampleEvery, int) and
+                        not isinstance(SampleEvery, bool) and SampleEvery > 0):
+            self._SampleEvery = SampleEvery
+        else:
+            self._SampleEvery = self.SampleEvery
+        if (isinstance(Rate, (int, float)) and not isinstance(Rate, bool)
+                                                                and Rate > 0):
+            self._Rate = float(Rate)
+        else:
+            self._Rate = float(self.Rate)
+        if (isinstance(Burst, int) and not isinstance(Burst, bool)
+                                                                and Burst > 0):
+            self._Burst = Burst
+        else:
+            self._Burst = self.Burst
+        if (isinstance(MaxSites, int) and not isinstance(MaxSites, bool)
+                                                            and MaxSites > 0):
+            self._MaxSites = MaxSites
+        else:
+            self._MaxSites = self.MaxSites
+        if not (isinstance(Stripes, int) and not isinstance(Stripes, bool)
+                                                            and Stripes > 0):
+            Stripes = self.Stripes
+        self._NumberStripes = max(1, min(Stripes,
+                                    self._MaxSites // self._MinStripeSites))
+        self._Lock = threading.Lock() #registry of the threads counters only
+        self.reset()
+    
+    #private methods
+
+    def _getCounters(self) -> list[int]:
+        """
+        Returns the counters of the allowed and declined captures and of the
+        sampled calls of the current thread, which are created and registered
+        upon the first call from a thread.
+
+        Signature:
+            None -> list(int >= 0, int >= 0, int >= 0)
+        
+        Version 1.1.0.0
+        """
+        Local = self._Local
+        Counters = getattr(Local, 'Counters', None)
+        if Counters is None:
+            Counters = [0, 0, 0]
+            Local.Counters = Counters
+            with self._Lock:
+                self._Threads.append((threading.current_thread(), Counters))
+        return Counters
+    
+    def _getTotals(self) -> tuple[int, int]:
+        """
+        Sums up the counters of all threads; the counters of the finished
+        threads are retained, but they are no longer tracked separately.
+
+        Signature:
+            None -> tuple(int >= 0, int >= 0)
+        
+        Version 1.0.0.0
+        """
+        with self._Lock:
+            Threads = []
+            for ThreadObject, Counters in self._Threads:
+                if ThreadObject.is_alive():
+                    Threads.append((ThreadObject, Counters))
+                else:
+                    self._Retired[0] += Counters[0]
+                    self._Retired[1] += Counters[1]
+            self._Threads = Threads
+            Allowed, Declined = self._Retired
+            for _, Counters in Threads:
+                Allowed += Counters[0]
+                Declined += Counters[1]
+        return Allowed, Declined
+    
+    def _getStripe(self, Site: Any) -> tuple[threading.Lock,
+                                                    dict[Any, tuple], int]:
+        """
+        Selects the stripe of the buckets for a site by its hash.
+
+        Signature:
+            type A -> tuple(threading.Lock, dict(type A -> tuple), int > 0)
+        
+        Version 1.0.0.0
+        """
+        Stripes = self._Stripes
+        return Stripes[hash(Site) % len(Stripes)]
+    
+    #public methods
+
+    #+ properties
+
+    @property
+    def Mode(self) -> str:
+        """
+        Read-only property returning the mode of the policy.
+
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        return self._Mode
+    
+    @property
+    def Description(self) -> str:
+        """
+        Read-only property returning the short description of the policy, i.e.
+        its mode and the relevant parameters, e.g. 'sample 1 in 100' or
+        'bucket 1.0/s burst 10'.
+
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        if self._Mode == 'sample':
+            Result = f'sample 1 in {self._SampleEvery}'
+        elif self._Mode == 'bucket':
+            Result = f'bucket {self._Rate}/s burst {self._Burst}'
+        else:
+            Result = self._Mode
+        return Result
+    
+    @property
+    def Allowed(self) -> int:
+        """
+        Read-only property returning the number of the allowed captures since
+        the instantiation or the last reset.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.1.0.0
+        """
+        return self._getTotals()[0]
+    
+    @property
+    def Declined(self) -> int:
+        """
+        Read-only property returning the number of the declined captures since
+        the instantiation or the last reset.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.1.0.0
+        """
+        return self._getTotals()[1]
+    
+    #+ methods
+
+    def allow(self, Site: Any) -> bool:
+        """
+        Decides if a traceback raised at the specified site should be captured,
+        and updates the statistics.
+
+        Signature:
+            type A -> bool
+        
+        Args:
+            Site: type A; any hashable identifier of the raise site, used only
+                in the bucket mode
+        
+        Returns:
+            bool: True if the traceback should be captured, False otherwise
+        
+        Version 1.3.0.0
+        """
+        Mode = self._Mode
+        Counters = self._getCounters()
+        if Mode == 'always':
+            Result = True
+        elif Mode == 'never':
+            Result = False
+        elif Mode == 'sample':
+            Result = not (Counters[2] % self._SampleEvery)
+            Counters[2] += 1
+        else:
+            Lock, Buckets, Limit = self._getStripe(Site)
+            Now = time.monotonic()
+            with Lock:
+                Bucket = Buckets.get(Site, None)
+                if Bucket is None and len(Buckets) >= Limit:
+                    Site = self._OverflowSite
+                    Bucket = Buckets.get(Site, None)
+                if Bucket is None:
+                    Tokens = float(self._Burst)
+                else:
+                    Tokens, LastTime = Bucket
+                    Tokens = min(float(self._Burst),
+                                        Tokens + (Now - LastTime) * self._Rate)
+                Result = Tokens >= 1.0
+                if Result:
+                    Tokens -= 1.0
+                Buckets[Site] = (Tokens, Now)
+        if Result:
+            Counters[0] += 1
+        else:
+            Counters[1] += 1
+        return Result
+    
+    def reset(self) -> None:
+        """
+        Resets the statistics, the sampling counters of all threads and the
+        tokens buckets of all sites.
+
+        Signature:
+            None -> None
+        
+        Version 1.2.0.0
+        """
+        Limit, Extra = divmod(self._MaxSites, self._NumberStripes)
+        with self._Lock:
+            self._Local = threading.local()
+            self._Threads = []
+            self._Retired = [0, 0]
+            self._Stripes = tuple((threading.Lock(), dict(),
+                                                Limit + int(Index < Extra))
+                                        for Index in range(self._NumberStripes))
+
+class RenderCache():
+    """
+    Thread-safe bounded cache of the rendered text representations of the
+    tracebacks, which is shared by all traceback analysis objects, thus the
+    repeated identical failures (same fingerprint, console width and context
+    length) are formatted only once. The least recently used texts are dropped
+    first when the limit is reached.
+
+    The cache is applied process-wide by the assignment of an instance to the
+    class attribute StackTraceback.InfoCache (also used by all sub-classes,
+    unless overridden). Note that the fingerprint does not depend on the source
+    code, so a source file changed without shifting the lines is shown in its
+    old state until the cache is cleared.
+
+    Properties:
+        Size: (read-only) int >= 0; number of the cached texts
+        Hits: (read-only) int >= 0; number of the successful look-ups
+        Misses: (read-only) int >= 0; number of the failed look-ups
+    
+    Methods:
+        get(Key):
+            tuple(type A) -> str OR None
+        put(Key, Text):
+            tuple(type A), str -> None
+        clear():
+            None -> None
+    
+    Version 1.0.0.0
+    """
+
+    #class data attributes - default values
+
+    MaxSize: ClassVar[int] = 256 #max number of the cached texts
+
+    #special methods
+
+    def __init__(self, *, MaxSize: TIntNone = None) -> None:
+        """
+        Initialization method.
+
+        Signature:
+            /int > 0 OR None/ -> None
+        
+        Args:
+            MaxSize: (keyword) int > 0 OR None; max number of the cached texts
+                (default is None -> the value of the class field MaxSize)
+        
+        Version 1.0.0.0
+        """
+        if (isinstance(MaxSize, int) and not isinstance(MaxSize, bool)
+                                                            and MaxSize > 0):
+            self._MaxSize = MaxSize
+        else:
+            self._MaxSize = self.MaxSize
+        self._Lock = threading.Lock()
+        self.clear()
+    
+    #public methods
+
+    #+ properties
+
+    @property
+    def Size(self) -> int:
+        """
+        Read-only property returning the number of the cached texts.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return len(self._Texts)
+    
+    @property
+    def Hits(self) -> int:
+        """
+        Read-only property returning the number of the successful look-ups.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Hits
+    
+    @property
+    def Misses(self) -> int:
+        """
+        Read-only property returning the number of the failed look-ups.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Misses
+    
+    #+ methods
+
+    def get(self, Key: tuple[Any, ...]) -> Optional[str]:
+        """
+        Looks up a cached text and marks it as the most recently used.
+
+        Signature:
+            tuple(type A) -> str OR None
+        
+        Args:
+            Key: tuple(type A); hashable key of the text
+        
+        Returns:
+            str: the cached text
+            None: the text is not cached
+        
+        Version 1.0.0.0
+        """
+        with self._Lock:
+            Result = self._Texts.get(Key, None)
+            if Result is None:
+                self._Misses += 1
+            else:
+                self._Texts.move_to_end(Key)
+                self._Hits += 1
+        return Result
+    
+    def put(self, Key: tuple[Any, ...], Text: str) -> None:
+        """
+        Stores a text, dropping the least recently used one(s) if the limit
+        is reached.
+
+        Signature:
+            tuple(type A), str -> None
+        
+        Args:
+            Key: tuple(type A); hashable key of the text
+            Text: str; the text to store
+        
+        Version 1.0.0.0
+        """
+        with self._Lock:
+            self._Texts[Key] = Text
+            self._Texts.move_to_end(Key)
+            while len(self._Texts) > self._MaxSize:
+                self._Texts.popitem(last = False)
+    
+    def clear(self) -> None:
+        """
+        Removes all cached texts and resets the statistics.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        with self._Lock:
+            self._Texts = collections.OrderedDict()
+            self._Hits = 0
+            self._Misses = 0
+
+class StackTraceback():
+    """
+    Utility class to obtain and analyze the traceback of the current state of
+    the call stack up to but excluding the frame, where this object is
+    instantiated, and to extract the call chain from it with an option to 'hide'
+    the specified number of the deepest (inner) frames. Note that stack
+    traceback created is in the reversed order with respect to that of the
+    returned by the function inspect.stack(), i.e. the interpreter's loop
+    (outmost call) is the first element, and the frame, where this class is
+    instantiated, is the last element.
+    
+    Properties:
+        CallChain: (read-only) list(str); list of the names of the callers
+        Info: (read-only) str; human-readable frames data
+        Fingerprint: (read-only) str; stable hash of the frames locations
+        Locals: (read-only) list(dict(str -> str)); bounded representations
+            of the local variables per frame (CaptureLocals mode only)
+        IsPlaceholder: (read-only) bool; the capture was declined by the
+            capture policy, only the raise site frame is stored
+    
+    Methods:
+        iterInfo():
+            None -> iterator(str)
+        writeInfo(Stream):
+            file-like -> None
+        getInfo(ConsoleWidth = None):
+            /int > 0 OR None/ -> str
+        asRecords(*, WithContext = True):
+            /bool/ -> list(dict(str -> type A))
+        toJSON(*, WithContext = True, Indent = None):
+            /bool, int >= 0 OR None/ -> str
+        toBytes():
+            None -> bytes
+    
+    Class methods:
+        fromBytes(Data):
+            bytes OR bytearray OR memoryview -> StackTraceback
+    
+    Version 1.12.0.0
+    """
+    
+    #class data attributes - default values
+    
+    ConsoleWidth: ClassVar[int] = 80 #max width of the lines in the Info output
+    
+    ContextLenght: ClassVar[int] = 3 #number of the lines to display per frame
+    
+    LazyContext: ClassVar[bool] = False #defer the source code lines retrieval
+    
+    CaptureLocals: ClassVar[bool] = False #record the frames' local variables
+    
+    MaxLocalLength: ClassVar[int] = 80 #max length of a local variable's repr
+    
+    MaxFrameLocalsLength: ClassVar[int] = 800 #max total length of the locals
+    
+    Policy: ClassVar[Optional[CapturePolicy]] = None #process-wide, see class
+    
+    InfoCache: ClassVar[Optional[RenderCache]] = None #process-wide, see class
+    
+    #placeholder message, set per instance if the capture is declined
+    _Placeholder: ClassVar[Optional[str]] = None
+    
+    #rendered texts by the console width, set per instance upon rendering
+    _Rendered: ClassVar[Optional[dict[int, str]]] = None
+    
+    #instance attributes restored by fromBytes() in any case
+    _CoreAttributes: ClassVar[frozenset[str]] = frozenset(['_Traceback',
+                        '_ConsoleWidth', '_PendingContext', '_Fingerprint',
+                        '_Locals', '_PendingLocals', '_Rendered'])
+    
+    #optional string instance attributes serialized by toBytes()
+    _ExtraAttributes: ClassVar[frozenset[str]] = frozenset(['_Placeholder'])
+    
+    #special methods
+    
+    def __init__(self, *, SkipFrames: TIntNone = None,
+                            ContextLength: TIntNone = None,
+                            ConsoleWidth: TIntNone = None,
+                            LazyContext: TBoolNone = None,
+                            MaxFrames: TIntNone = None,
+                            Include: TPatterns = None,
+                            Exclude: TPatterns = None,
+                            CaptureLocals: TBoolNone = None,
+                            MaxLocalLength: TIntNone = None,
+                            MaxFrameLocalsLength: TIntNone = None) -> None:
+        """
+        Initialization method. Attempts to retrieve and store the traceback of
+        the current stack excluding the instantiation method itself. Can accept
+        up to 10 keyword arguments: SkipFrames, ContextLength, ConsoleWidth,
+        LazyContext, MaxFrames, Include, Exclude, CaptureLocals, MaxLocalLength
+        and MaxFrameLocalsLength.
+
+        The stack is walked directly from the current frame outwards, and the
+        skipped, filtered out and exceeding the MaxFrames limit frames are never
+        parsed, nor their source code is looked up. In the lazy mode only the
+        paths, names and line numbers are stored, and the source code sniplets
+        are retrieved upon the first access of the Info property.
+
+        The include / exclude filters are glob-style patterns matched against
+        the name of the module and the path to the source file of each frame,
+        e.g. 'asyncio.*' or 'site-packages/*', see the function
+        _CompilePatterns().
+
+        In the CaptureLocals mode the bounded snapshots of the local variables
+        of each frame are also recorded, and their representations are created
+        only upon the first access of the Locals or Info property, see the
+        method _captureLocals().
+
+        If the class attribute Policy holds an instance of CapturePolicy, and
+        it declines the capture for the raise site (the innermost frame after
+        the skipped ones), only a placeholder with that frame is stored, see
+        the method _checkPolicy().
+        
+        Signature:
+            /int > 0 OR None, int > 0 OR None, int > 0 OR None, bool OR None,
+                int > 0 OR None, str OR seq(str) OR None,
+                    str OR seq(str) OR None, bool OR None, int > 0 OR None,
+                        int > 0 OR None/ -> None
+        
+        Args:
+            SkipFrames: (keyword) int > 0; number of the deepest (inner) frames
+                to 'hide' in the traceback excluding the initialization method
+                itself, which is always removed (default is None -> zero)
+            ContextLength: (keyword) int > 0; total number of lines of the
+                source code to retrieve around and including the one, there a
+                call was made (default is None -> the value of the class field
+                ContextLenght)
+            ConsoleWidth: (keyword) int > 0; width to which the source code
+                lines must be truncated, including the line's number + 2 extra
+                characters (default is None -> the value of the class field
+                ConsoleWidth)
+            LazyContext: (keyword) bool; if True, the retrieval of the source
+                code sniplets is deferred until the first access of the Info
+                property (default is None -> the value of the class field
+                LazyContext)
+            MaxFrames: (keyword) int > 0; max number of the innermost frames
+                (after the skipping and filtering) to keep (default is None ->
+                not limited)
+            Include: (keyword) str OR seq(str); glob-style pattern(s), only the
+                frames matching any of them are kept (default is None -> all
+                frames are kept)
+            Exclude: (keyword) str OR seq(str); glob-style pattern(s), the
+                frames matching any of them are removed (default is None ->
+                no frames are removed)
+            CaptureLocals: (keyword) bool; if True, the bounded representations
+                of the local variables of each frame are recorded (default is
+                None -> the value of the class field CaptureLocals)
+            MaxLocalLength: (keyword) int > 0; max length of the
+                representation of a single local variable (default is None ->
+                the value of the class field MaxLocalLength)
+            MaxFrameLocalsLength: (keyword) int > 0; max total length of the
+                names and representations of the local variables per frame
+                (default is None -> the value of the class field
+                MaxFrameLocalsLength)
+        
+        Version 1.5.0.0
+        """
+        if (isinstance(ContextLength, int) and ContextLength > 0):
+            _ContextLenght = ContextLength
+        else:
+            _ContextLenght = self.ContextLenght
+        if (isinstance(ConsoleWidth, int) and ConsoleWidth > 0):
+            self._ConsoleWidth = ConsoleWidth
+        else:
+            self._ConsoleWidth = self.ConsoleWidth
+        if isinstance(SkipFrames, int) and SkipFrames > 0:
+            _SkipFrames = SkipFrames + 1
+        else:
+            _SkipFrames = 1
+        if LazyContext is None:
+            LazyContext = self.LazyContext
+        if isinstance(self.Policy, CapturePolicy):
+            try:
+                SiteFrame = sys._getframe(_SkipFrames)
+                IsAllowed = self._checkPolicy((SiteFrame, SiteFrame.f_lineno),
+                                                                _ContextLenght)
+                del SiteFrame
+            except ValueError: #not enough frames to skip
+                IsAllowed = True
+        else:
+            IsAllowed = True
+        if IsAllowed:
+            RawFrames = _WalkStack(sys._getframe(), SkipFrames = _SkipFrames,
+                                    MaxFrames = MaxFrames,
+                                    Include = _CompilePatterns(Include),
+                                    Exclude = _CompilePatterns(Exclude))
+            self._Traceback = ParseRawFrames(RawFrames)
+            self._PendingContext = _ContextLenght
+            self._Fingerprint = None
+            self._captureLocals(RawFrames, CaptureLocals = CaptureLocals,
+                                MaxLocalLength = MaxLocalLength,
+                                MaxFrameLocalsLength = MaxFrameLocalsLength)
+            if not LazyContext:
+                self._resolveContext()
+            RawFrames.clear()
+            del RawFrames
+    
+    def __reduce__(self) -> tuple[Any, tuple[bytes]]:
+        """
+        Support of the pickle protocol - an instance is pickled as its compact
+        binary representation, see the method toBytes(), and it is restored by
+        the class method fromBytes().
+
+        Signature:
+            None -> tuple(classmethod, tuple(bytes))
+        
+        Version 1.0.0.0
+        """
+        return (self.__class__.fromBytes, (self.toBytes(), ))
+    
+    #private methods
+    
+    def _resolveContext(self, Cache: Optional[TContextCache] = None) -> None:
+        """
+        Retrieves the source code sniplets for all stored frames if the
+        traceback was captured in the lazy mode and they are not yet retrieved.
+        Does nothing otherwise. The retrieved sniplets can be shared between
+        several tracebacks via the optional cache dictionary.
+        
+        Signature:
+            /dict(tuple(str, int, int) -> tuple(int OR None,
+                tuple(str) OR None)) OR None/ -> None
+        
+        Args:
+            Cache: (optional) dict OR None; sniplets already retrieved, keyed
+                by the path, the line number and the context length (default is
+                None -> no sharing)
+        
+        Version 1.2.0.0
+        """
+        ContextLength = self._PendingContext
+        if not (ContextLength is None):
+            for Record in self._Traceback:
+                FilePath = Record.FilePath
+                LineNumber = Record.LineNumber
+                ModuleGlobals = Record._ModuleGlobals
+                if Cache is None:
+                    Context = _GetSourceContext(FilePath, LineNumber,
+                                                ContextLength, ModuleGlobals)
+                else:
+                    Key = (FilePath, LineNumber, ContextLength)
+                    Context = Cache.get(Key, None)
+                    if Context is None:
+                        Context = _GetSourceContext(FilePath, LineNumber,
+                                                ContextLength, ModuleGlobals)
+                        Cache[Key] = Context
+                Record.LineIndex, Record.CodeLines = Context
+                Record._ModuleGlobals = None
+            self._PendingContext = None
+    
+    def _checkPolicy(self, Site: tuple[FrameType, int],
+                                                ContextLength: int) -> bool:
+        """
+        Consults the process-wide capture policy (class attribute Policy), if
+        it is set, whether the traceback with the specified raise site should
+        be captured. If the capture is declined, the cheap placeholder is stored
+        instead - the single (raise site) frame record with the lazily retrieved
+        source code sniplet and the message mentioning the policy, see the
+        property IsPlaceholder.
+
+        Signature:
+            tuple(types.FrameType, int >= 0), int > 0 -> bool
+        
+        Args:
+            Site: tuple(types.FrameType, int >= 0); the innermost frame to be
+                captured and its current line number
+            ContextLength: int > 0; the number of the source code lines to
+                retrieve for the placeholder's frame upon rendering
+        
+        Returns:
+            bool: True if the traceback should be captured, False if the
+                placeholder is stored
+        
+        Version 1.0.0.0
+        """
+        Policy = self.Policy
+        if isinstance(Policy, CapturePolicy):
+            FrameObject, LineNumber = Site
+            Result = Policy.allow((FrameObject.f_code, LineNumber))
+            del FrameObject
+            if not Result:
+                self._Traceback = ParseRawFrames([Site])
+                self._PendingContext = ContextLength
+                self._Fingerprint = None
+                self._Locals = None
+                self._PendingLocals = None
+                self._Placeholder = (
+                    f'Traceback is not captured (policy: {Policy.Description})')
+        else:
+            Result = True
+        return Result
+    
+    def _captureLocals(self, Frames: TRawFramesList, *,
+                            CaptureLocals: TBoolNone = None,
+                            MaxLocalLength: TIntNone = None,
+                            MaxFrameLocalsLength: TIntNone = None) -> None:
+        """
+        Takes the bounded snapshots of the local variables of the passed frames
+        if the CaptureLocals mode is on (argument or class field). The snapshots
+        hold only what the representations need (see the class _LocalsRepr),
+        and no __repr__() method is called; the bounded representations are
+        created by the method _resolveLocals() upon the first access of the
+        Locals or Info property (regardless of the LazyContext mode), after
+        which the snapshots are released.
+
+        Signature:
+            list(tuple(types.FrameType, int >= 0))/, *, bool OR None,
+                int > 0 OR None, int > 0 OR None/ -> None
+        
+        Args:
+            Frames: list(tuple(types.FrameType, int >= 0)); list of pairs of a
+                frame object and the number of the currently executed line, in
+                the same order as the stored frame records
+            CaptureLocals: (keyword) bool OR None; if True, the snapshots are
+                taken (default is None -> the value of the class field
+                CaptureLocals)
+            MaxLocalLength: (keyword) int > 0 OR None; max length of the
+                representation of a single value (default is None -> the value
+                of the class field MaxLocalLength)
+            MaxFrameLocalsLength: (keyword) int > 0 OR None; max total length
+                of the representations per frame (default is None -> the value
+                of the class field MaxFrameLocalsLength)
+        
+        Version 1.1.0.0
+        """
+        self._Locals = None
+        self._PendingLocals = None
+        if CaptureLocals is None:
+            CaptureLocals = self.CaptureLocals
+        if CaptureLocals:
+            if not (isinstance(MaxLocalLength, int) and MaxLocalLength > 0):
+                MaxLocalLength = self.MaxLocalLength
+            if not (isinstance(MaxFrameLocalsLength, int) and
+                                                    MaxFrameLocalsLength > 0):
+                MaxFrameLocalsLength = self.MaxFrameLocalsLength
+            Formatter = _LocalsRepr(MaxLocalLength)
+            Snapshots = [Formatter.snapshotLocals(FrameObject.f_locals)
+                                            for FrameObject, _ in Frames]
+            self._PendingLocals = (Snapshots, MaxLocalLength,
+                                                        MaxFrameLocalsLength)
+    
+    def _resolveLocals(self) -> None:
+        """
+        Creates the bounded representations of the local variables from the
+        snapshots taken by the method _captureLocals() and releases the
+        snapshots. Does nothing if the locals are not captured or they are
+        already resolved.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        Pending = self._PendingLocals
+        if not (Pending is None):
+            Snapshots, MaxLength, MaxFrameLength = Pending
+            self._Locals = [_FormatLocals(Snapshot, MaxLength, MaxFrameLength)
+                                                    for Snapshot in Snapshots]
+            self._PendingLocals = None
+            Snapshots.clear()
+            del Snapshots
+            del Pending
+    
+    def _iterLines(self, ConsoleWidth: int) -> Iterator[str]:
+        """
+        Generator yielding the lines of the human-readable representation of
+        the frames truncated to the specified width, see the method iterInfo().
+
+        Signature:
+            int > 0 -> iterator(str)
+        
+        Version 1.0.0.0
+        """
+        self._resolveContext()
+        self._resolveLocals()
+        if not (self._Placeholder is None):
+            yield self._Placeholder
+        yield from _IterFramesLines(self._Traceback, ConsoleWidth,
+                                                                self._Locals)
+    
+    def _getRenderKey(self, ConsoleWidth: int) -> Optional[tuple[Any, ...]]:
+        """
+        Creates the key of the rendered text in the process-wide cache, see the
+        class RenderCache: the fingerprint, the width, the context length and
+        the placeholder message (or None). The context length is the pending
+        one in the lazy mode; otherwise the length of the longest sniplet is
+        used, which yields the same text for the same locations, since the
+        sniplets of all frames are clipped to the whole files in that case. The
+        tracebacks with the captured local variables are not shared.
+
+        Signature:
+            int > 0 -> tuple(str, int, int OR None, str OR None) OR None
+        
+        Version 1.0.0.0
+        """
+        if not (self._Locals is None and self._PendingLocals is None):
+            return None
+        ContextLength = self._PendingContext
+        if ContextLength is None:
+            ContextLength = max((len(Record.CodeLines)
+                                    for Record in self._Traceback
+                                        if not (Record.CodeLines is None)),
+                                                                default = None)
+        return (self.Fingerprint, ConsoleWidth, ContextLength,
+                                                            self._Placeholder)
+    
+    @classmethod
+    def _fromRawFrames(cls, Frames: TRawFramesList, *,
+                        SkipFrames: TIntNone = None,
+                        ContextLength: TIntNone = None,
+                        ConsoleWidth: TIntNone = None) -> 'StackTraceback':
+        """
+        Alternative constructor creating an instance in the lazy mode from the
+        already obtained list of (frame, line number) pairs ordered from the
+        outmost frame, instead of the current call stack.
+
+        Signature:
+            list(tuple(types.FrameType, int >= 0))/, *, int > 0 OR None,
+                int > 0 OR None, int > 0 OR None/ -> StackTraceback
+        
+        Args:
+            Frames: list(tuple(types.FrameType, int >= 0)); list of pairs of a
+                frame object and the number of the currently executed line
+            SkipFrames: (keyword) int > 0 OR None; number of the deepest
+                (inner) frames to 'hide' (default is None -> zero)
+            ContextLength: (keyword) int > 0 OR None; total number of lines of
+                the source code to retrieve per frame (default is None -> the
+                value of the class field ContextLenght)
+            ConsoleWidth: (keyword) int > 0 OR None; width to which the source
+                code lines must be truncated (default is None -> the value of
+                the class field ConsoleWidth)
+        
+        Returns:
+            StackTraceback: new instance of the class
+        
+        Version 1.1.0.0
+        """
+        return cls._fromRecords(ParseRawFrames(Frames,
+                                                SkipFrames = SkipFrames),
+                                ContextLength = ContextLength,
+                                ConsoleWidth = ConsoleWidth)
+    
+    @classmethod
+    def _fromRecords(cls, Records: TParsedFrame, *,
+                        ContextLength: TIntNone = None,
+                        ConsoleWidth: TIntNone = None) -> 'StackTraceback':
+        """
+        Alternative constructor creating an instance in the lazy mode from the
+        already parsed frame records ordered from the outmost frame. The list
+        is stored as it is, i.e. the records may be shared with other
+        instances.
+
+        Signature:
+            list(FrameRecord)/, *, int > 0 OR None, int > 0 OR None/
+                -> StackTraceback
+        
+        Args:
+            Records: list(FrameRecord); the parsed frames
+            ContextLength: (keyword) int > 0 OR None; total number of lines of
+                the source code to retrieve per frame (default is None -> the
+                value of the class field ContextLenght)
+            ConsoleWidth: (keyword) int > 0 OR None; width to which the source
+                code lines must be truncated (default is None -> the value of
+                the class field ConsoleWidth)
+        
+        Returns:
+            StackTraceback: new instance of the class
+        
+        Version 1.0.0.0
+        """
+        Instance = cls.__new__(cls)
+        if (isinstance(ContextLength, int) and ContextLength > 0):
+            Instance._PendingContext = ContextLength
+        else:
+            Instance._PendingContext = cls.ContextLenght
+        if (isinstance(ConsoleWidth, int) and ConsoleWidth > 0):
+            Instance._ConsoleWidth = ConsoleWidth
+        else:
+            Instance._ConsoleWidth = cls.ConsoleWidth
+        Instance._Traceback = Records
+        Instance._Fingerprint = None
+        Instance._Locals = None
+        Instance._PendingLocals = None
+        return Instance
+    
+    #public methods
+    
+    #+ properties
+    
+    @property
+    def CallChain(self) -> TStringList:
+        """
+        Extracts and returns the call chain from the stored parsed snapshot of
+        the traceback. All callers names are fully qualified. Does not require
+        the source code sniplets, thus does not trigger their retrieval in the
+        lazy mode.
+        
+        Signature:
+            None -> list(str)
+        
+        Version 1.0.1.0
+        """
+        Callers = [Item.FullName for Item in self._Traceback]
+        return Callers
+    
+    @property
+    def Fingerprint(self) -> str:
+        """
+        Returns a stable (independent on the process and the hash seed) hash
+        of the stored traceback as a hexadecimal string, which is based only on
+        the path to the module, the fully qualified name of the caller and the
+        line number of each frame. Thus, the tracebacks of the same failure
+        occured at different times or in different processes have the same
+        fingerprint, regardless of the rendering options and source code
+        sniplets. The value is computed upon the first access and memoized.
+        
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        if self._Fingerprint is None:
+            Hasher = hashlib.blake2b(digest_size = 16)
+            for Frame in self._Traceback:
+                Hasher.update('\x00'.join([Frame.FilePath, Frame.FullName,
+                                str(Frame.LineNumber), '']).encode('utf-8',
+                                                        'surrogateescape'))
+            self._Fingerprint = Hasher.hexdigest()
+        return self._Fingerprint
+    
+    @property
+    def Locals(self) -> list[dict[str, str]]:
+        """
+        Returns the bounded representations of the local variables of each
+        frame in the same order as the frames, i.e. the names of the variables
+        mapped to the representations of their values, if the traceback was
+        captured in the CaptureLocals mode; otherwise, an empty list. The
+        representations are created upon the first access of this property or
+        the Info property, regardless of the LazyContext mode.
+
+        Signature:
+            None -> list(dict(str -> str))
+        
+        Version 1.1.0.0
+        """
+        self._resolveLocals()
+        if self._Locals is None:
+            Result = []
+        else:
+            Result = [dict(Variables) for Variables, _ in self._Locals]
+        return Result
+    
+    @property
+    def IsPlaceholder(self) -> bool:
+        """
+        Checks if the capture of the traceback was declined by the capture
+        policy, i.e. only the raise site (innermost) frame is stored, and the
+        text representation starts with the line mentioning the policy.
+
+        Signature:
+            None -> bool
+        
+        Version 1.0.0.0
+        """
+        return not (self._Placeholder is None)
+    
+    @property
+    def Info(self) -> str:
+        """
+        Prepares and returns a human-readable representation of the frames
+        within the obtained traceback as a single string composed of multiple
+        lines separated by the new-line character ('\n'). For each frame record
+        the first line indicates the fully qualified name of the caller, and the
+        second line - the path to the corresponding module and the line number
+        in the source code, where the call has occurred. These lines are
+        followed by the extract from the source code containing a specified
+        number of lines centered around the one, where the call has occurred.
+        The lines are prefixed with the line number left padded when required
+        with zero in order to preserve the indentation. The line, where the
+        call has occurred is indicated by '>' character. The lines are truncated
+        when required such that the total length together with the line number
+        prefix (and two extra characters) does not exceed the specified width
+        of the output. The number of the source code lines per frame as well as
+        the output width can be specified during instantiation (ContextLength
+        and ContextWidth arguments) as non-negative integers; otherwise the
+        default values stored in the class attributes ContextLength and
+        ConsoleWidth are used. In the CaptureLocals mode the sniplet of each
+        frame is followed by the lines 'Local name = value' with the bounded
+        representations of its local variables. In the lazy mode the first
+        access retrieves the source code sniplets (and the representations of
+        the locals). The lines are produced by the method iterInfo(). The
+        rendered text is memoized, see the method getInfo().
+        
+        Signature:
+            None -> str
+        
+        Version 1.4.0.0
+        """
+        return self.getInfo()
+    
+    #+ methods
+    
+    def iterInfo(self) -> Iterator[str]:
+        """
+        Generator yielding the lines of the human-readable representation of
+        the frames within the obtained traceback one by one, without the
+        trailing new-line characters, see the property Info. The lines are
+        produced incrementally, thus the rendering time is linear with the
+        number of the frames, and no intermediate string is created. In the
+        lazy mode the first call retrieves the source code sniplets. The
+        placeholder traceback (see the property IsPlaceholder) starts with the
+        line mentioning the capture policy.
+        
+        Signature:
+            None -> iterator(str)
+        
+        Yields:
+            str: the next line of the frames representation
+        
+        Version 1.3.0.0
+        """
+        yield from self._iterLines(self._ConsoleWidth)
+    
+    def getInfo(self, ConsoleWidth: TIntNone = None) -> str:
+        """
+        Returns the human-readable representation of the frames within the
+        obtained traceback, see the property Info, with the lines truncated to
+        the specified width instead of the console width set for the instance.
+        The rendered text is memoized per width, thus the repeated rendering
+        (e.g. by several logging handlers) is not required. If the class
+        attribute InfoCache holds an instance of RenderCache, the text is also
+        looked up and stored there by the fingerprint, the width and the
+        context length, thus the repeated identical failures are formatted
+        only once in the process, and in the lazy mode even their source code
+        is not read. The tracebacks with the captured local variables are not
+        shared.
+
+        Signature:
+            /int > 0 OR None/ -> str
+        
+        Args:
+            ConsoleWidth: (optional) int > 0 OR None; width to which the lines
+                must be truncated (default is None -> the console width of the
+                instance)
+        
+        Returns:
+            str: the human-readable representation of the frames
+        
+        Version 1.0.0.0
+        """
+        if not (isinstance(ConsoleWidth, int) and
+                    not isinstance(ConsoleWidth, bool) and ConsoleWidth > 0):
+            ConsoleWidth = self._ConsoleWidth
+        Rendered = self._Rendered
+        if Rendered is None:
+            Rendered = dict()
+            self._Rendered = Rendered
+        Result = Rendered.get(ConsoleWidth, None)
+        if Result is None:
+            Cache = self.InfoCache
+            if isinstance(Cache, RenderCache):
+                Key = self._getRenderKey(ConsoleWidth)
+            else:
+                Key = None
+            if not (Key is None):
+                Result = Cache.get(Key)
+            if Result is None:
+                Result = '\n'.join(self._iterLines(ConsoleWidth))
+                if not (Key is None):
+                    Cache.put(Key, Result)
+            Rendered[ConsoleWidth] = Result
+        return Result
+    
+    def writeInfo(self, Stream: TextIO) -> None:
+        """
+        Writes the human-readable representation of the frames within the
+        obtained traceback into the passed text stream line by line, see the
+        property Info. The written text is the same as the value of the Info
+        property, i.e. the lines are separated by the new-line character, but
+        no new-line character is added after the last line. The whole text is
+        never created as a single string, unless it is already memoized, see
+        the method getInfo().
+        
+        Signature:
+            file-like -> None
+        
+        Args:
+            Stream: file-like; any object supporting the method write(str),
+                e.g. sys.stdout, a text file or io.StringIO instance
+        
+        Version 1.1.0.0
+        """
+        Rendered = self._Rendered
+        if Rendered is None:
+            Text = None
+        else:
+            Text = Rendered.get(self._ConsoleWidth, None)
+        if Text is None:
+            Separator = ''
+            for Line in self.iterInfo():
+                Stream.write(Separator)
+                Stream.write(Line)
+                Separator = '\n'
+        else:
+            Stream.write(Text)
+    
+    def asRecords(self, *, WithContext: bool = True) -> list[dict[str, Any]]:
+        """
+        Returns the frames within the obtained traceback as a list of the
+        dictionaries of the atomic fields (in the same order as the frames),
+        which is a structured alternative to the property Info, e.g. for the
+        log shipping, without creation of the text representation. Each
+        dictionary contains the keys 'FilePath', 'Caller', 'FullName',
+        'LineNumber', 'LineIndex' and 'CodeLines' (the sniplet lines without
+        the trailing new-line characters, as a list). In the CaptureLocals mode
+        the keys 'Locals' (dictionary of the bounded representations) and
+        'OmittedLocals' (number of the not represented variables) are added.
+        In the lazy mode the source code sniplets are retrieved only if
+        requested; if not requested both 'LineIndex' and 'CodeLines' are None.
+
+        Signature:
+            /bool/ -> list(dict(str -> type A))
+        
+        Args:
+            WithContext: (keyword) bool; flag if the source code sniplets are
+                to be included, defaults to True
+        
+        Returns:
+            list(dict(str -> type A)): the fields of the frames
+        
+        Version 1.0.0.0
+        """
+        if WithContext:
+            self._resolveContext()
+        self._resolveLocals()
+        Result = []
+        for Record in self._Traceback:
+            if WithContext and not (Record.CodeLines is None):
+                LineIndex = Record.LineIndex
+                CodeLines = [Line.rstrip('\n') for Line in Record.CodeLines]
+            else:
+                LineIndex = None
+                CodeLines = None
+            Result.append({'FilePath' : Record.FilePath,
+                            'Caller' : Record.Caller,
+                            'FullName' : Record.FullName,
+                            'LineNumber' : Record.LineNumber,
+                            'LineIndex' : LineIndex,
+                            'CodeLines' : CodeLines})
+        if not (self._Locals is None):
+            for Item, (Variables, Omitted) in zip(Result, self._Locals):
+                Item['Locals'] = dict(Variables)
+                Item['OmittedLocals'] = Omitted
+        return Result
+    
+    def toJSON(self, *, WithContext: bool = True,
+                                            Indent: TIntNone = None) -> str:
+        """
+        Serializes the traceback into a JSON object string without creation of
+        the text representation (see the property Info). The object contains
+        the keys 'Class' (name of the class), 'Fingerprint' and 'Frames' (see
+        the method asRecords()), as well as the additional string (or None)
+        instance attributes of the sub-classes and the placeholder message (if
+        the capture was declined) under their names without the leading
+        underscores, e.g. 'Placeholder'.
+
+        Signature:
+            /bool, int >= 0 OR None/ -> str
+        
+        Args:
+            WithContext: (keyword) bool; flag if the source code sniplets are
+                to be included, defaults to True
+            Indent: (keyword) int >= 0 OR None; indentation of the nested
+                elements, defaults to None - compact single line output
+        
+        Returns:
+            str: JSON representation of the traceback
+        
+        Version 1.0.0.0
+        """
+        Result = {'Class' : self.__class__.__name__,
+                    'Fingerprint' : self.Fingerprint}
+        for Name, Value in self.__dict__.items():
+            if (not (Name in self._CoreAttributes) and
+                                    (Value is None or isinstance(Value, str))):
+                Result[Name.lstrip('_')] = Value
+        Result['Frames'] = self.asRecords(WithContext = WithContext)
+        if not (isinstance(Indent, int) and not isinstance(Indent, bool)
+                                                            and Indent >= 0):
+            Indent = None
+        return json.dumps(Result, indent = Indent)
+    
+    def toBytes(self) -> bytes:
+        """
+        Serializes the traceback into a compact binary representation, which
+        does not contain any frame object and can be transferred to another
+        process (e.g. from a worker of a process pool) and restored there by the
+        class method fromBytes() with the same call chain and human-readable
+        representation. In the lazy mode the source code sniplets are retrieved
+        first. All strings (paths, names, source code lines) are stored only
+        once in a strings table and referenced by the index; all integers are
+        encoded as the variable length integers. The additional string (or
+        None) instance attributes listed in the class attribute
+        _ExtraAttributes (e.g. the task's name) are also stored.
+
+        Format: b'TB', version byte (2), console width, strings table size, the
+        strings (UTF-8 length and data each), number of frames, per frame -
+        indexes of the path, the caller and the qualified name, the line number
+        + 1, the sniplet line index + 1, the number of sniplet lines + 1 and
+        their indexes (0 means None for the shifted values), number of the
+        additional attributes, per attribute - the index of the name and the
+        index of the value + 1, the number of the frames with the captured
+        local variables + 1, per frame - the number of the variables, the
+        indexes of the name and the representation of each variable, and the
+        number of the omitted variables.
+
+        Signature:
+            None -> bytes
+        
+        Version 1.2.0.0
+        """
+        self._resolveContext()
+        self._resolveLocals()
+        Strings = dict()
+        Body = bytearray()
+        
+        def GetIndex(Value: str) -> int:
+            Index = Strings.get(Value, None)
+            if Index is None:
+                Index = len(Strings)
+                Strings[Value] = Index
+            return Index
+        
+        def AddOptional(Value: TIntNone) -> None:
+            _EncodeVarint(0 if Value is None else Value + 1, Body)
+        
+        _EncodeVarint(len(self._Traceback), Body)
+        for Record in self._Traceback:
+            _EncodeVarint(GetIndex(Record.FilePath), Body)
+            _EncodeVarint(GetIndex(Record.Caller), Body)
+            _EncodeVarint(GetIndex(Record.FullName), Body)
+            AddOptional(Record.LineNumber)
+            AddOptional(Record.LineIndex)
+            CodeLines = Record.CodeLines
+            AddOptional(None if CodeLines is None else len(CodeLines))
+            if not (CodeLines is None):
+                for Line in CodeLines:
+                    _EncodeVarint(GetIndex(Line), Body)
+        Extras = [(Name, Value) for Name, Value in self.__dict__.items()
+                    if Name in self._ExtraAttributes and
+                                    (Value is None or isinstance(Value, str))]
+        _EncodeVarint(len(Extras), Body)
+        for Name, Value in Extras:
+            _EncodeVarint(GetIndex(Name), Body)
+            AddOptional(None if Value is None else GetIndex(Value))
+        Locals = self._Locals
+        AddOptional(None if Locals is None else len(Locals))
+        if not (Locals is None):
+            for Variables, Omitted in Locals:
+                _EncodeVarint(len(Variables), Body)
+                for Name, Text in Variables.items():
+                    _EncodeVarint(GetIndex(Name), Body)
+                    _EncodeVarint(GetIndex(Text), Body)
+                _EncodeVarint(Omitted, Body)
+        Result = bytearray(b'TB\x02')
+        _EncodeVarint(self._ConsoleWidth, Result)
+        _EncodeVarint(len(Strings), Result)
+        for Value in Strings: #insertion order = index order
+            Data = Value.encode('utf-8', 'surrogatepass')
+            _EncodeVarint(len(Data), Result)
+            Result.extend(Data)
+        Result.extend(Body)
+        return bytes(Result)
+    
+    #+ class methods
+    
+    @classmethod
+    def fromBytes(cls, Data: TBytesLike) -> 'StackTraceback':
+        """
+        Restores a traceback from its compact binary representation created by
+        the method toBytes(). The frame objects are not required; the restored
+        instance has the same call chain, human-readable representation
+        (including the captured local variables) and fingerprint as the
+        original one.
+
+        Signature:
+            bytes OR bytearray OR memoryview -> StackTraceback
+        
+        Args:
+            Data: bytes OR bytearray OR memoryview; the binary representation
+        
+        Returns:
+            StackTraceback: the restored instance of the class, on which the
+                method is called
+        
+        Raises:
+            TypeError: the argument is not a bytes-like object
+            ValueError: the data is not a proper representation (wrong header
+                or version, truncated or corrupted data, additional attribute
+                not supported by the class)
+        
+        Version 1.2.0.0
+        """
+        if not isinstance(Data, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                        f'{type(Data).__name__} is not a bytes-like object')
+        Data = bytes(Data)
+        if Data[:3] != b'TB\x02':
+            raise ValueError(
+                        'Not a serialized traceback or unsupported version')
+        try:
+            ConsoleWidth, Position = _DecodeVarint(Data, 3)
+            Size, Position = _DecodeVarint(Data, Position)
+            Strings = []
+            for _ in range(Size):
+                Length, Position = _DecodeVarint(Data, Position)
+                End = Position + Length
+                if End > len(Data):
+                    raise IndexError('truncated string')
+                Strings.append(sys.intern(
+                        Data[Position : End].decode('utf-8', 'surrogatepass')))
+                Position = End
+            NumberFrames, Position = _DecodeVarint(Data, Position)
+            Records = []
+            for _ in range(NumberFrames):
+                Values = []
+                for _ in range(6):
+                    Value, Position = _DecodeVarint(Data, Position)
+                    Values.append(Value)
+                FilePath, Caller, FullName = (Strings[Index]
+                                                    for Index in Values[:3])
+                LineNumber, LineIndex, NumberLines = (
+                                    None if Value == 0 else Value - 1
+                                                    for Value in Values[3:])
+                if NumberLines is None:
+                    CodeLines = None
+                else:
+                    CodeLines = []
+                    for _ in range(NumberLines):
+                        Index, Position = _DecodeVarint(Data, Position)
+                        CodeLines.append(Strings[Index])
+                Records.append(FrameRecord(FilePath, Caller, FullName,
+                                            LineNumber, LineIndex, CodeLines))
+            NumberExtras, Position = _DecodeVarint(Data, Position)
+            Extras = dict()
+            for _ in range(NumberExtras):
+                Index, Position = _DecodeVarint(Data, Position)
+                Name = Strings[Index]
+                if not (Name in cls._ExtraAttributes):
+                    raise ValueError('Attribute {!r} is not supported by {}'
+                                                .format(Name, cls.__name__))
+                Index, Position = _DecodeVarint(Data, Position)
+                Extras[Name] = None if Index == 0 else Strings[Index - 1]
+            NumberFrames, Position = _DecodeVarint(Data, Position)
+            if NumberFrames == 0:
+                Locals = None
+            else:
+                Locals = []
+                for _ in range(NumberFrames - 1):
+                    NumberVariables, Position = _DecodeVarint(Data, Position)
+                    Variables = dict()
+                    for _ in range(NumberVariables):
+                        Index, Position = _DecodeVarint(Data, Position)
+                        Name = Strings[Index]
+                        Index, Position = _DecodeVarint(Data, Position)
+                        Variables[Name] = Strings[Index]
+                    Omitted, Position = _DecodeVarint(Data, Position)
+                    Locals.append((Variables, Omitted))
+        except IndexError as err:
+            raise ValueError('Truncated or corrupted serialized traceback'
+                                                                    ) from err
+        except UnicodeDecodeError as err:
+            raise ValueError('Corrupted serialized traceback') from err
+        if Position != len(Data):
+            raise ValueError('Unexpected data after the serialized traceback')
+        Instance = cls.__new__(cls)
+        Instance._Traceback = Records
+        Instance._ConsoleWidth = ConsoleWidth
+        Instance._PendingContext = None
+        Instance._Fingerprint = None
+        Instance._Locals = Locals
+        Instance._PendingLocals = None
+        for Name, Value in Extras.items():
+            setattr(Instance, Name, Value)
+        return Instance
+
+class ExceptionTraceback(StackTraceback):
+    """
+    Utility class to obtain and analyze the traceback of the last raised
+    exception currently being handled as a a list of frame records for the stack
+    between the current frame and the frame in which an exception currently
+    being handled was raised in. Alternatively, can be used for parsing of a
+    traceback of any other exception (including the last one) stored in the
+    exception instance itself.
+    
+    Walks the chain of the traceback objects directly (same frames as returned
+    by the functions inspect.trace() and inspect.getinnerframes()); preserves
+    the order of the frames.
+    
+    Extends the class StackTraceback and inherits the read-only properties and
+    the public methods.
+    
+    Properties:
+        CallChain: (read-only) list(str); list of the names of the callers
+        Info: (read-only) str; human-readable frames data
+        Fingerprint: (read-only) str; stable hash of the frames locations
+        Locals: (read-only) list(dict(str -> str)); bounded representations
+            of the local variables per frame (CaptureLocals mode only)
+        IsPlaceholder: (read-only) bool; the capture was declined by the
+            capture policy, only the raise site frame is stored
+    
+    Methods:
+        iterInfo():
+            None -> iterator(str)
+        writeInfo(Stream):
+            file-like -> None
+    
+    Version 1.6.0.0
+    """
+    
+    #special methods
+    
+    def __init__(self, *, SkipFrames: TIntNone = None,
+                            ContextLength: TIntNone = None,
+                            ConsoleWidth: TIntNone = None,
+                            FromTraceback: TTracebackNone = None,
+                            LazyContext: TBoolNone = None,
+                            MaxFrames: TIntNone = None,
+                            Include: TPatterns = None,
+                            Exclude: TPatterns = None,
+                            CaptureLocals: TBoolNone = None,
+                            MaxLocalLength: TIntNone = None,
+                            MaxFrameLocalsLength: TIntNone = None) -> None:
+        """
+        Initialization method. Attempts to retrieve and store the traceback of
+        the last raised exception as a a list of frame records for the stack
+        between the current frame and the frame in which an exception currently
+        being handled was raised in. Can accept up to 3 optional positional
+        arguments, which can be passed as the keyword arguments: SkipFrames,
+        ConsoleWidth and ConsoleWidth.
+
+        Alternatively, a traceback stored in an exception can be passed as the
+        keyword argument FromTraceback, in which case the SkipFrames argument
+        is ignored, and the traceback is reconstructed from the passed object.
+
+        The traceback objects are walked directly, and the skipped, filtered out
+        and exceeding the MaxFrames limit frames are never parsed, nor their
+        source code is looked up, see the StackTraceback class. In the lazy mode
+        the source code sniplets are retrieved upon the first access of the Info
+        property.
+
+        In the CaptureLocals mode the bounded snapshots of the local variables
+        of each frame are also recorded, which is useful for the post-mortem
+        analysis; the built-in containers and strings are represented as at the
+        moment of the capture, the other objects - as at the first access of
+        the Locals or Info property, when the representations are created.
+
+        If the class attribute Policy holds an instance of CapturePolicy, and
+        it declines the capture for the raise site (the innermost frame of the
+        traceback after the skipped ones), only a placeholder with that frame
+        is stored, see the method _checkPolicy().
+        
+        Signature:
+            /int > 0 OR None, int > 0 OR None, int > 0 OR None,
+                types.TracebackType OR None, bool OR None, int > 0 OR None,
+                    str OR seq(str) OR None, str OR seq(str) OR None,
+                        bool OR None, int > 0 OR None, int > 0 OR None/ -> None
+        
+        Args:
+            SkipFrames: (keyword) int > 0; number of the deepest (inner) frames
+                to 'hide' in the traceback excluding the initialization method
+                itself, which is always removed (default is None -> zero),
+                ignored if FromTraceback argument is a proper traceback object
+            ContextLength: (keyword) int > 0; total number of lines of the
+                source code to retrieve around and including the one, there a
+                call was made (default is None -> the value of the class field
+                ContextLenght)
+            ConsoleWidth: (keyword) int > 0; width to which the source code
+                lines must be truncated, including the line's number + 2 extra
+                characters (default is None -> the value of the class field
+                ConsoleWidth)
+            FromTraceback: (keyword) types.TracebackType OR None; an instance of
+                a traceback object from which the extract the information, if
+                provided and proper - the SkipFrames argument is ignored
+                (defaults to None -> actual traceback stack is analyzed)
+            LazyContext: (keyword) bool; if True, the retrieval of the source
+                code sniplets is deferred until the first access of the Info
+                property (default is None -> the value of the class field
+                LazyContext)
+            MaxFrames: (keyword) int > 0; max number of the innermost frames
+                (after the skipping and filtering) to keep (default is None ->
+                not limited)
+            Include: (keyword) str OR seq(str); glob-style pattern(s), only the
+                frames matching any of them are kept (default is None -> all
+                frames are kept)
+            Exclude: (keyword) str OR seq(str); glob-style pattern(s), the
+                frames matching any of them are removed (default is None ->
+                no frames are removed)
+            CaptureLocals: (keyword) bool; if True, the bounded representations
+                of the local variables of each frame are recorded (default is
+                None -> the value of the class field CaptureLocals)
+            MaxLocalLength: (keyword) int > 0; max length of the
+                representation of a single local variable (default is None ->
+                the value of the class field MaxLocalLength)
+            MaxFrameLocalsLength: (keyword) int > 0; max total length of the
+                names and representations of the local variables per frame
+                (default is None -> the value of the class field
+                MaxFrameLocalsLength)
+        
+        Version 1.5.0.0
+        """
+        if (isinstance(ContextLength, int) and ContextLength > 0):
+            _ContextLenght = ContextLength
+        else:
+            _ContextLenght = self.ContextLenght
+        if (isinstance(ConsoleWidth, int) and ConsoleWidth > 0):
+            self._ConsoleWidth = ConsoleWidth
+        else:
+            self._ConsoleWidth = self.ConsoleWidth
+        if LazyContext is None:
+            LazyContext = self.LazyContext
+        if isinstance(FromTraceback, TracebackType):
+            RawFrames = _WalkTraceback(FromTraceback)
+        else:
+            CurrentError = sys.exception()
+            if CurrentError is None:
+                RawFrames = []
+            else:
+                RawFrames = _WalkTraceback(CurrentError.__traceback__)
+            del CurrentError
+            NumberFrames = len(RawFrames)
+            if (isinstance(SkipFrames, int) and
+                                            (0 < SkipFrames < NumberFrames)):
+                del RawFrames[NumberFrames - SkipFrames : ]
+        if RawFrames:
+            IsAllowed = self._checkPolicy(RawFrames[-1], _ContextLenght)
+        else:
+            IsAllowed = True
+        if IsAllowed:
+            Selected = _SelectFrames(RawFrames, MaxFrames = MaxFrames,
+                                    Include = _CompilePatterns(Include),
+                                    Exclude = _CompilePatterns(Exclude))
+            RawFrames.clear()
+            self._Traceback = ParseRawFrames(Selected)
+            self._PendingContext = _ContextLenght
+            self._Fingerprint = None
+            self._captureLocals(Selected, CaptureLocals = CaptureLocals,
+                                MaxLocalLength = MaxLocalLength,
+                                MaxFrameLocalsLength = MaxFrameLocalsLength)
+            if not LazyContext:
+                self._resolveContext()
+            Selected.clear()
+            del Selected
+        RawFrames.clear()
+        del RawFrames
+
+class AsyncTaskTraceback(StackTraceback):
+    """
+    Utility class to obtain and analyze the logical call chain of an asyncio
+    task or a coroutine, i.e. the chain of the coroutines awaiting each other,
+    starting from the coroutine of the task (the first element) to the
+    innermost awaited coroutine (the last element). For a suspended task the
+    chain is reconstructed by following the cr_await / ag_await links; for the
+    currently running task the actual call stack is walked down to the frame
+    of the task's coroutine. Thus, the traceback does not stop at the event
+    loop's machinery.
+
+    Extends the class StackTraceback and inherits the read-only properties and
+    the public methods.
+    
+    Properties:
+        CallChain: (read-only) list(str); list of the names of the callers
+        Info: (read-only) str; human-readable frames data
+        Fingerprint: (read-only) str; stable hash of the frames locations
+        TaskName: (read-only) str OR None; name of the analyzed task
+    
+    Methods:
+        iterInfo():
+            None -> iterator(str)
+        writeInfo(Stream):
+            file-like -> None
+    
+    Class methods:
+        fromAllTasks(Loop = None, **kwargs):
+            /asyncio.AbstractEventLoop OR None, **kwargs/
+                -> list(AsyncTaskTraceback)
+    
+    Version 1.2.0.0
+    """
+
+    #class data attributes - default values
+
+    #optional string instance attributes serialized by toBytes()
+    _ExtraAttributes: ClassVar[frozenset[str]] = (
+                    StackTraceback._ExtraAttributes | frozenset(['_TaskName']))
+
+    #special methods
+
+    def __init__(self, *, Task: Any = None, SkipFrames: TIntNone = None,
+                            ContextLength: TIntNone = None,
+                            ConsoleWidth: TIntNone = None,
+                            LazyContext: TBoolNone = None,
+                            MaxFrames: TIntNone = None,
+                            Include: TPatterns = None,
+                            Exclude: TPatterns = None) -> None:
+        """
+        Initialization method. Attempts to retrieve and store the logical call
+        chain of the passed task (or coroutine, asynchronous generator) or of
+        the current task, if the argument is not passed. If there is no current
+        task (no running event loop) or the task is finished, the traceback is
+        empty.
+
+        The limit of the number of the (innermost) frames and the include /
+        exclude filters are applied in the same manner as by the StackTraceback
+        class.
+
+        Signature:
+            /asyncio.Task OR coroutine OR async_generator OR None,
+                int > 0 OR None, int > 0 OR None, int > 0 OR None,
+                    bool OR None, int > 0 OR None, str OR seq(str) OR None,
+                        str OR seq(str) OR None/ -> None
+        
+        Args:
+            Task: (keyword) asyncio.Task OR coroutine OR async_generator OR
+                None; the task or the coroutine to analyze (default is None ->
+                the current task)
+            SkipFrames: (keyword) int > 0; number of the innermost frames of
+                the caller of the initialization method to 'hide', relevant
+                only for the task being executed (default is None -> zero)
+            ContextLength: (keyword) int > 0; total number of lines of the
+                source code to retrieve around and including the one, there a
+                call was made (default is None -> the value of the class field
+                ContextLenght)
+            ConsoleWidth: (keyword) int > 0; width to which the source code
+                lines must be truncated, including the line's number + 2 extra
+                characters (default is None -> the value of the class field
+                ConsoleWidth)
+            LazyContext: (keyword) bool; if True, the retrieval of the source
+                code sniplets is deferred until the first access of the Info
+                property (default is None -> the value of the class field
+                LazyContext)
+            MaxFrames: (keyword) int > 0; max number of the innermost frames
+                (after the filtering) to keep (default is None -> not limited)
+            Include: (keyword) str OR seq(str); glob-style pattern(s), only the
+                frames matching any of them are kept (default is None -> all
+                frames are kept)
+            Exclude: (keyword) str OR seq(str); glob-style pattern(s), the
+                frames matching any of them are removed (default is None ->
+                no frames are removed)
+        
+        Version 1.1.0.0
+        """
+        if (isinstance(ContextLength, int) and ContextLength > 0):
+            _ContextLenght = ContextLength
+        else:
+            _ContextLenght = self.ContextLenght
+        if (isinstance(ConsoleWidth, int) and ConsoleWidth > 0):
+            self._ConsoleWidth = ConsoleWidth
+        else:
+            self._ConsoleWidth = self.ConsoleWidth
+        if LazyContext is None:
+            LazyContext = self.LazyContext
+        if Task is None:
+            import asyncio #the module is heavy, only imported when required
+            try:
+                Task = asyncio.current_task()
+            except RuntimeError: #no running event loop
+                Task = None
+        if hasattr(Task, 'get_coro'):
+            self._TaskName = Task.get_name()
+            Coroutine = Task.get_coro()
+        else:
+            self._TaskName = None
+            Coroutine = Task
+        RawFrames = self._walkRunning(Coroutine, SkipFrames = SkipFrames)
+        if not RawFrames:
+            RawFrames = _WalkAwaitChain(Coroutine)
+        del Coroutine
+        del Task
+        Selected = _SelectFrames(RawFrames, MaxFrames = MaxFrames,
+                                    Include = _CompilePatterns(Include),
+                                    Exclude = _CompilePatterns(Exclude))
+        RawFrames.clear()
+        self._Traceback = ParseRawFrames(Selected)
+        self._PendingContext = _ContextLenght
+        self._Fingerprint = None
+        self._Locals = None
+        self._PendingLocals = None
+        if not LazyContext:
+            self._resolveContext()
+        Selected.clear()
+        del Selected
+        del RawFrames
+    
+    #private methods
+
+    def _walkRunning(self, Coroutine: Any, *,
+                        SkipFrames: TIntNone = None) -> TRawFramesList:
+        """
+        Walks the actual call stack of the calling thread from the caller of
+        the initialization method outwards until the frame of the passed
+        coroutine (or asynchronous generator) is found. Returns the list of the
+        frames from the coroutine's frame to the innermost one, if the coroutine
+        is being executed in this thread; otherwise - an empty list.
+
+        The frames of the instance being initialized (this method and the
+        initialization methods along the MRO, including those of the
+        sub-classes) are recognized by the instance itself as their 'self'
+        local variable, thus the depth of the calls is not assumed. Then the
+        specified number of the outer frames is skipped, unless there are not
+        enough frames.
+
+        Signature:
+            type A/, *, int > 0 OR None/
+                -> list(tuple(types.FrameType, int >= 0))
+        
+        Version 1.1.0.0
+        """
+        Result = []
+        if isinstance(Coroutine, CoroutineType) and Coroutine.cr_running:
+            Target = Coroutine.cr_frame
+        elif (isinstance(Coroutine, AsyncGeneratorType) and
+                                                    Coroutine.ag_running):
+            Target = Coroutine.ag_frame
+        else:
+            Target = None
+        if not (Target is None):
+            FrameObject = sys._getframe()
+            while (not (FrameObject.f_back is None) and
+                                    FrameObject.f_locals.get('self') is self):
+                FrameObject = FrameObject.f_back
+            if isinstance(SkipFrames, int) and SkipFrames > 0:
+                StartFrame = FrameObject
+                for _ in range(SkipFrames):
+                    StartFrame = StartFrame.f_back
+                    if StartFrame is None or StartFrame is Target:
+                        break
+                if not (StartFrame is None):
+                    FrameObject = StartFrame
+                del StartFrame
+            while not (FrameObject is None):
+                Result.append((FrameObject, FrameObject.f_lineno))
+                if FrameObject is Target:
+                    break
+                FrameObject = FrameObject.f_back
+            if FrameObject is None: #not in this thread
+                Result.clear()
+            del FrameObject
+            Result.reverse()
+        del Target
+        return Result
+    
+    #public methods
+
+    #+ properties
+
+    @property
+    def TaskName(self) -> Optional[str]:
+        """
+        Read-only property returning the name of the analyzed task, or None if
+        a coroutine was analyzed, or there was no current task.
+
+        Signature:
+            None -> str OR None
+        
+        Version 1.0.0.0
+        """
+        return self._TaskName
+    
+    #+ class methods
+
+    @classmethod
+    def fromAllTasks(cls, Loop: Any = None, *,
+                        ContextLength: TIntNone = None,
+                        ConsoleWidth: TIntNone = None,
+                        LazyContext: TBoolNone = None,
+                        MaxFrames: TIntNone = None,
+                        Include: TPatterns = None,
+                        Exclude: TPatterns = None) -> TAsyncTracebacks:
+        """
+        Takes a snapshot of the logical call chains of all not finished tasks
+        of the event loop, sorted by the names of the tasks. The source code
+        sniplets are retrieved only once per unique location within the
+        snapshot (unless in the lazy mode). The keyword arguments have the same
+        meaning as for the initialization method. The call chain of the current
+        task ends at the caller of this method.
+
+        Signature:
+            /asyncio.AbstractEventLoop OR None, *, int > 0 OR None,
+                int > 0 OR None, bool OR None, int > 0 OR None,
+                    str OR seq(str) OR None, str OR seq(str) OR None/
+                        -> list(AsyncTaskTraceback)
+        
+        Args:
+            Loop: (optional) asyncio.AbstractEventLoop OR None; the event loop
+                (default is None -> the running event loop)
+        
+        Returns:
+            list(AsyncTaskTraceback): the call chains of the tasks
+        
+        Raises:
+            RuntimeError: the loop is not passed, and there is no running loop
+        
+        Version 1.1.0.0
+        """
+        import asyncio #the module is heavy, only imported when required
+        Tasks = sorted(asyncio.all_tasks(Loop),
+                                            key = lambda Item: Item.get_name())
+        Result = [cls(Task = Task, SkipFrames = 1,
+                        ContextLength = ContextLength,
+                        ConsoleWidth = ConsoleWidth, LazyContext = True,
+                        MaxFrames = MaxFrames, Include = Include,
+                        Exclude = Exclude) for Task in Tasks]
+        Tasks.clear()
+        if LazyContext is None:
+            LazyContext = cls.LazyContext
+        if not LazyContext:
+            Cache = dict()
+            for Traceback in Result:
+                Traceback._resolveContext(Cache)
+        return Result
+
+class ChainedExceptionTraceback():
+    """
+    Aggregated traceback of an exception together with all exceptions linked
+    to it: the explicit causes (__cause__), the implicit contexts (__context__,
+    unless suppressed) and the members of the exception groups, recursively.
+    The traceback of each exception in the chain is stored as an instance of
+    the ExceptionTraceback class, but the frames shared between the chained
+    tracebacks (e.g. the same outer frames re-raised with a wrapping exception,
+    or a substituted traceback) are parsed and stored only once, and the
+    records are shared by all tracebacks. The combined report lists the
+    exceptions in the same order as the Standard Library traceback module does,
+    i.e. starting with the root cause, and the outer frames shared with the
+    previous traceback in the report are replaced by a single line.
+
+    Properties:
+        Exceptions: (read-only) list(str); types and messages of the chained
+            exceptions in the order of the report
+        Tracebacks: (read-only) list(ExceptionTraceback); tracebacks of the
+            chained exceptions in the order of the report
+        Info: (read-only) str; human-readable combined report
+    
+    Methods:
+        iterInfo():
+            None -> iterator(str)
+        writeInfo(Stream):
+            file-like -> None
+    
+    Version 1.0.0.0
+    """
+
+    #class data attributes - headers of the linked exceptions
+
+    _CauseHeader: ClassVar[str] = ' '.join(['The above exception was the',
+                                    'direct cause of the following exception:'])
+
+    _ContextHeader: ClassVar[str] = ' '.join(['During handling of the above',
+                                    'exception, another exception occurred:'])
+
+    #special methods
+
+    def __init__(self, *, FromException: Optional[BaseException] = None,
+                            ContextLength: TIntNone = None,
+                            ConsoleWidth: TIntNone = None,
+                            LazyContext: TBoolNone = None,
+                            MaxFrames: TIntNone = None,
+                            Include: TPatterns = None,
+                            Exclude: TPatterns = None) -> None:
+        """
+        Initialization method. Walks the chain of the exceptions linked to the
+        passed or currently handled exception and stores their tracebacks. The
+        loops in the chain are broken, each exception is processed only once.
+
+        Signature:
+            /BaseException OR None, int > 0 OR None, int > 0 OR None,
+                bool OR None, int > 0 OR None, str OR seq(str) OR None,
+                    str OR seq(str) OR None/ -> None
+        
+        Args:
+            FromException: (keyword) BaseException OR None; the exception to
+                analyze (default is None -> the exception being currently
+                handled, if any)
+            ContextLength: (keyword) int > 0; total number of lines of the
+                source code to retrieve around and including the one, there a
+                call was made (default is None -> the value of the class field
+                StackTraceback.ContextLenght)
+            ConsoleWidth: (keyword) int > 0; width to which the source code
+                lines must be truncated, including the line's number + 2 extra
+                characters (default is None -> the value of the class field
+                StackTraceback.ConsoleWidth)
+            LazyContext: (keyword) bool; if True, the retrieval of the source
+                code sniplets is deferred until the first rendering (default is
+                None -> the value of the class field StackTraceback.LazyContext)
+            MaxFrames: (keyword) int > 0; max number of the innermost frames
+                (after the filtering) to keep per traceback (default is None ->
+                not limited)
+            Include: (keyword) str OR seq(str); glob-style pattern(s), only the
+                frames matching any of them are kept (default is None -> all
+                frames are kept)
+            Exclude: (keyword) str OR seq(str); glob-style pattern(s), the
+                frames matching any of them are removed (default is None ->
+                no frames are removed)
+        
+        Version 1.0.0.0
+        """
+        if LazyContext is None:
+            LazyContext = StackTraceback.LazyContext
+        self._ContextLength = ContextLength
+        self._ConsoleWidth = ConsoleWidth
+        self._MaxFrames = MaxFrames
+        self._Include = _CompilePatterns(Include)
+        self._Exclude = _CompilePatterns(Exclude)
+        self._Links = []
+        self._Records = dict()
+        self._Parsed = dict()
+        if FromException is None:
+            FromException = sys.exception()
+        if isinstance(FromException, BaseException):
+            self._addChain(FromException, None, set())
+        del FromException
+        self._Parsed.clear()
+        self._Parsed = None
+        self._SourceCache = dict()
+        if not LazyContext:
+            self._resolveContext()
+    
+    def __len__(self) -> int:
+        """
+        Returns the number of the exceptions in the chain.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return len(self._Links)
+    
+    #private methods
+
+    def _getRecords(self, Traceback: TTracebackNone) -> TParsedFrame:
+        """
+        Walks the traceback, applies the limit and the filters and returns the
+        frame records, parsing only the frames not yet seen in the chain. The
+        already parsed frames and the frames with the same location (path to
+        the module, the caller's name and the line number) are represented by
+        the same record objects.
+
+        Signature:
+            types.TracebackType OR None -> list(FrameRecord)
+        
+        Version 1.0.0.0
+        """
+        RawFrames = _SelectFrames(_WalkTraceback(Traceback),
+                                    MaxFrames = self._MaxFrames,
+                                    Include = self._Include,
+                                    Exclude = self._Exclude)
+        Result = []
+        for FrameObject, LineNumber in RawFrames:
+            Key = (id(FrameObject), LineNumber)
+            Record = self._Parsed.get(Key, None)
+            if Record is None:
+                Record = ParseRawFrames([(FrameObject, LineNumber)])[0]
+                Record = self._Records.setdefault((Record.FilePath,
+                                Record.FullName, Record.LineNumber), Record)
+                self._Parsed[Key] = Record
+            Result.append(Record)
+        RawFrames.clear()
+        return Result
+    
+    def _addLink(self, Error: BaseException, Header: Optional[str]) -> None:
+        """
+        Stores the traceback of a single exception together with the header
+        line (relation to the previous exception in the report) and the type
+        and message of the exception. Also counts the number of the outer
+        frames shared with the previous traceback in the report.
+
+        Signature:
+            BaseException, str OR None -> None
+        
+        Version 1.0.0.0
+        """
+        Records = self._getRecords(Error.__traceback__)
+        Shared = 0
+        if self._Links:
+            Previous = self._Links[-1][2]._Traceback
+            Limit = min(len(Previous), len(Records))
+            while Shared < Limit and Records[Shared] is Previous[Shared]:
+                Shared += 1
+        Traceback = ExceptionTraceback._fromRecords(Records,
+                                    ContextLength = self._ContextLength,
+                                    ConsoleWidth = self._ConsoleWidth)
+        self._Links.append((Header, _FormatException(Error), Traceback,
+                                                                    Shared))
+    
+    def _addChain(self, Error: BaseException, Header: Optional[str],
+                                                        Seen: set[int]) -> None:
+        """
+        Stores the tracebacks of the exception and all exceptions linked to it
+        in the order of the report: the root cause first, each exception being
+        followed by the members of the exception group (if it is a group).
+
+        Signature:
+            BaseException, str OR None, set(int) -> None
+        
+        Version 1.0.0.0
+        """
+        Chain = []
+        Relation = None
+        while (isinstance(Error, BaseException) and
+                                                not (id(Error) in Seen)):
+            Seen.add(id(Error))
+            Chain.append((Error, Relation))
+            if not (Error.__cause__ is None):
+                Error, Relation = Error.__cause__, self._CauseHeader
+            elif ((not (Error.__context__ is None)) and
+                                            (not Error.__suppress_context__)):
+                Error, Relation = Error.__context__, self._ContextHeader
+            else:
+                Error = None
+        for Index in range(len(Chain) - 1, -1, -1):
+            Error = Chain[Index][0]
+            if Index < len(Chain) - 1:
+                Header = Chain[Index + 1][1]
+            self._addLink(Error, Header)
+            if isinstance(Error, BaseExceptionGroup):
+                Total = len(Error.exceptions)
+                GroupName = _FormatException(Error).split(':', 1)[0]
+                for Number, Member in enumerate(Error.exceptions, start = 1):
+                    self._addChain(Member, ' '.join([f'Sub-exception {Number}',
+                                    f'of {Total} of the exception group',
+                                    f'{GroupName}:']), Seen)
+        Chain.clear()
+    
+    def _resolveContext(self) -> None:
+        """
+        Retrieves the source code sniplets for all stored tracebacks, sharing
+        the retrieved sniplets between them. Does nothing if they are already
+        retrieved.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        Cache = self._SourceCache
+        if not (Cache is None):
+            for _, _, Traceback, _ in self._Links:
+                Traceback._resolveContext(Cache)
+            self._SourceCache = None
+    
+    #public methods
+
+    #+ properties
+
+    @property
+    def Exceptions(self) -> TStringList:
+        """
+        Read-only property returning the types (qualified by the module's name
+        unless built-in) and messages of the chained exceptions in the order of
+        the report, e.g. 'ValueError: wrong value'.
+
+        Signature:
+            None -> list(str)
+        
+        Version 1.0.0.0
+        """
+        return [Link[1] for Link in self._Links]
+    
+    @property
+    def Tracebacks(self) -> list[ExceptionTraceback]:
+        """
+        Read-only property returning the tracebacks of the chained exceptions
+        in the order of the report. The frame records may be shared between
+        the tracebacks.
+
+        Signature:
+            None -> list(ExceptionTraceback)
+        
+        Version 1.0.0.0
+        """
+        return [Link[2] for Link in self._Links]
+    
+    @property
+    def Info(self) -> str:
+        """
+        Prepares and returns a human-readable combined report on the chained
+        exceptions as a single string composed of multiple lines separated by
+        the new-line character ('\n'). The exceptions are separated by an empty
+        line, and each one is represented by the header line describing its
+        relation to the previous exception (if applicable) followed by an empty
+        line, the same lines as the property Info of the ExceptionTraceback
+        class and the exception's type and message. The leading frames shared
+        with the previous traceback are replaced by a single line indicating
+        their number. The lines are produced by the method iterInfo().
+
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        return '\n'.join(self.iterInfo())
+    
+    #+ methods
+
+    def iterInfo(self) -> Iterator[str]:
+        """
+        Generator yielding the lines of the human-readable combined report one
+        by one, without the trailing new-line characters, see the property
+        Info. The shared frames are rendered only once. In the lazy mode the
+        first call retrieves the source code sniplets.
+
+        Signature:
+            None -> iterator(str)
+        
+        Yields:
+            str: the next line of the representation
+        
+        Version 1.0.0.0
+        """
+        self._resolveContext()
+        IsFirst = True
+        for Header, Message, Traceback, Shared in self._Links:
+            if IsFirst:
+                IsFirst = False
+            else:
+                yield ''
+            if not (Header is None):
+                yield Header
+                yield ''
+            Frames = Traceback._Traceback
+            if Shared:
+                Frames = Frames[Shared:]
+                if Shared == 1:
+                    yield '... 1 frame shared with the traceback above'
+                else:
+                    yield f'... {Shared} frames shared with the traceback above'
+            yield from _IterFramesLines(Frames, Traceback._ConsoleWidth)
+            yield Message
+    
+    def writeInfo(self, Stream: TextIO) -> None:
+        """
+        Writes the human-readable combined report into the passed text stream
+        line by line. The written text is the same as the value of the Info
+        property, i.e. no new-line character is added after the last line.
+
+        Signature:
+            file-like -> None
+        
+        Args:
+            Stream: file-like; any object supporting the method write(str),
+                e.g. sys.stderr, a text file or io.StringIO instance
+        
+        Version 1.0.0.0
+        """
+        Separator = ''
+        for Line in self.iterInfo():
+            Stream.write(Separator)
+            Stream.write(Line)
+            Separator = '\n'
+
+class ThreadStacksSnapshot():
+    """
+    Snapshot of the call stacks of all running threads taken in one pass using
+    the function sys._current_frames(). The stack of each thread is stored as
+    an instance of the StackTraceback class in the order of the threads
+    returned by threading.enumerate() (i.e. the main thread first), followed
+    by the threads not created by the module threading. For the thread, which
+    creates the snapshot, the initialization method's frame is excluded. The
+    module-level cache of the modules' names is shared by all threads, and the
+    source code sniplets are retrieved only once per unique frame location
+    within the snapshot. The default rendering options are the values of the
+    class fields of the StackTraceback class.
+
+    Properties:
+        ThreadIds: (read-only) list(int); identifiers of the captured threads
+        Info: (read-only) str; human-readable frames data of all threads
+    
+    Methods:
+        getTraceback(ThreadId):
+            int -> StackTraceback OR None
+        getThreadName(ThreadId):
+            int -> str OR None
+        iterInfo():
+            None -> iterator(str)
+        writeInfo(Stream):
+            file-like -> None
+    
+    Version 1.0.0.0
+    """
+
+    #special methods
+
+    def __init__(self, *, ContextLength: TIntNone = None,
+                            ConsoleWidth: TIntNone = None,
+                            LazyContext: TBoolNone = None) -> None:
+        """
+        Initialization method. Captures the call stacks of all threads.
+
+        Signature:
+            /int > 0 OR None, int > 0 OR None, bool OR None/ -> None
+        
+        Args:
+            ContextLength: (keyword) int > 0; total number of lines of the
+                source code to retrieve around and including the one, there a
+                call was made (default is None -> the value of the class field
+                StackTraceback.ContextLenght)
+            ConsoleWidth: (keyword) int > 0; width to which the source code
+                lines must be truncated, including the line's number + 2 extra
+                characters (default is None -> the value of the class field
+                StackTraceback.ConsoleWidth)
+            LazyContext: (keyword) bool; if True, the retrieval of the source
+                code sniplets is deferred until the first rendering (default is
+                None -> the value of the class field StackTraceback.LazyContext)
+        
+        Version 1.0.0.0
+        """
+        if LazyContext is None:
+            LazyContext = StackTraceback.LazyContext
+        CurrentThread = threading.get_ident()
+        Threads = {Thread.ident : Thread for Thread in threading.enumerate()}
+        Frames = sys._current_frames()
+        Order = [ThreadId for ThreadId in Threads if ThreadId in Frames]
+        Order.extend(ThreadId for ThreadId in Frames
+                                                if not (ThreadId in Threads))
+        self._Stacks = dict()
+        for ThreadId in Order:
+            RawFrames = _WalkStack(Frames[ThreadId])
+            Traceback = StackTraceback._fromRawFrames(RawFrames,
+                        SkipFrames = 1 if ThreadId == CurrentThread else None,
+                        ContextLength = ContextLength,
+                        ConsoleWidth = ConsoleWidth)
+            RawFrames.clear()
+            del RawFrames
+            Thread = Threads.get(ThreadId, None)
+            if Thread is None:
+                Header = f'Thread <unknown> (id {ThreadId})'
+                Name = None
+            else:
+                Name = Thread.name
+                if Thread.daemon:
+                    Header = f'Thread {Name} (id {ThreadId}, daemon)'
+                else:
+                    Header = f'Thread {Name} (id {ThreadId})'
+            self._Stacks[ThreadId] = (Name, Header, Traceback)
+        Frames.clear()
+        del Frames
+        del Threads
+        self._SourceCache = dict()
+        if not LazyContext:
+            self._resolveContext()
+    
+    def __len__(self) -> int:
+        """
+        Returns the number of the captured threads.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return len(self._Stacks)
+    
+    #private methods
+
+    def _resolveContext(self) -> None:
+        """
+        Retrieves the source code sniplets for all captured stacks, sharing the
+        retrieved sniplets between them. Does nothing if they are already
+        retrieved.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        Cache = self._SourceCache
+        if not (Cache is None):
+            for _, _, Traceback in self._Stacks.values():
+                Traceback._resolveContext(Cache)
+            self._SourceCache = None
+    
+    #public methods
+
+    #+ properties
+
+    @property
+    def ThreadIds(self) -> list[int]:
+        """
+        Read-only property returning the identifiers of the captured threads in
+        the order of their representation.
+
+        Signature:
+            None -> list(int)
+        
+        Version 1.0.0.0
+        """
+        return list(self._Stacks)
+    
+    @property
+    def Info(self) -> str:
+        """
+        Prepares and returns a human-readable representation of the stacks of
+        all captured threads as a single string composed of multiple lines
+        separated by the new-line character ('\n'). Each thread is represented
+        by the header line with its name and identifier followed by the same
+        lines as the property Info of the StackTraceback class; the threads are
+        separated by an empty line. The lines are produced by the method
+        iterInfo().
+
+        Signature:
+            None -> str
+        
+        Version 1.0.0.0
+        """
+        return '\n'.join(self.iterInfo())
+    
+    #+ methods
+
+    def getTraceback(self, ThreadId: int) -> Optional[StackTraceback]:
+        """
+        Returns the captured call stack of the thread.
+
+        Signature:
+            int -> StackTraceback OR None
+        
+        Args:
+            ThreadId: int; identifier of the thread
+        
+        Returns:
+            StackTraceback: the call stack of the thread
+            None: the thread is not captured
+        
+        Version 1.0.0.0
+        """
+        Entry = self._Stacks.get(ThreadId, None)
+        return None if Entry is None else Entry[2]
+    
+    def getThreadName(self, ThreadId: int) -> Optional[str]:
+        """
+        Returns the name of the captured thread, or None if the thread is not
+        captured or it is not created by the module threading.
+
+        Signature:
+            int -> str OR None
+        
+        Version 1.0.0.0
+        """
+        Entry = self._Stacks.get(ThreadId, None)
+        return None if Entry is None else Entry[0]
+    
+    def iterInfo(self) -> Iterator[str]:
+        """
+        Generator yielding the lines of the human-readable representation of
+        the stacks of all captured threads one by one, without the trailing
+        new-line characters, see the property Info. In the lazy mode the first
+        call retrieves the source code sniplets.
+
+        Signature:
+            None -> iterator(str)
+        
+        Yields:
+            str: the next line of the representation
+        
+        Version 1.0.0.0
+        """
+        self._resolveContext()
+        IsFirst = True
+        for _, Header, Traceback in self._Stacks.values():
+            if IsFirst:
+                IsFirst = False
+            else:
+                yield ''
+            yield Header
+            yield from Traceback.iterInfo()
+    
+    def writeInfo(self, Stream: TextIO) -> None:
+        """
+        Writes the human-readable representation of the stacks of all captured
+        threads into the passed text stream line by line. The written text is
+        the same as the value of the Info property, i.e. no new-line character
+        is added after the last line.
+
+        Signature:
+            file-like -> None
+        
+        Args:
+            Stream: file-like; any object supporting the method write(str),
+                e.g. sys.stderr, a text file or io.StringIO instance
+        
+        Version 1.0.0.0
+        """
+        Separator = ''
+        for Line in self.iterInfo():
+            Stream.write(Separator)
+            Stream.write(Line)
+            Separator = '\n'
+
+class TracebackStore():
+    """
+    Thread-safe storage of the traceback analysis objects (instances of the
+    StackTraceback class or its sub-classes), which interns identical tracebacks
+    by their fingerprints. Only the first traceback of each kind is stored,
+    whereas the number of its occurrences and the times of the first and the
+    last occurrences are tracked. The human-readable representation of each
+    stored traceback is rendered only once, upon the first request. The number
+    of the stored tracebacks is bounded - when the limit is reached the least
+    recently seen traceback is discarded.
+
+    All look-ups and updates of the entries are done under the lock, whereas
+    the rendering is done outside it; the concurrent requests of the same
+    not yet rendered traceback wait for the first one to render it.
+
+    Properties:
+        Size: (read-only) int >= 0; number of the stored unique tracebacks
+    
+    Methods:
+        add(Traceback):
+            StackTraceback -> str
+        addException(Error):
+            BaseException -> str
+        get(Fingerprint):
+            str -> StackTraceback OR None
+        getInfo(Fingerprint):
+            str -> str OR None
+        getCount(Fingerprint):
+            str -> int >= 0
+        getStatistics():
+            None -> list(tuple(str, int > 0, float, float))
+        clear():
+            None -> None
+    
+    Version 1.1.0.0
+    """
+
+    #class data attributes - default values
+
+    MaxSize: ClassVar[int] = 1024 #max number of the stored unique tracebacks
+
+    #special methods
+
+    def __init__(self, *, MaxSize: TIntNone = None) -> None:
+        """
+        Initialization method.
+
+        Signature:
+            /int > 0 OR None/ -> None
+        
+        Args:
+            MaxSize: (keyword) int > 0 OR None; max number of the stored unique
+                tracebacks (default is None -> the value of the class field
+                MaxSize)
+        
+        Version 1.0.0.0
+        """
+        if (isinstance(MaxSize, int) and MaxSize > 0):
+            self._MaxSize = MaxSize
+        else:
+            self._MaxSize = self.MaxSize
+        self._Lock = threading.Lock()
+        self._Entries = collections.OrderedDict()
+    
+    def __len__(self) -> int:
+        """
+        Returns the number of the stored unique tracebacks.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return len(self._Entries)
+    
+    def __contains__(self, Fingerprint: str) -> bool:
+        """
+        Checks if a traceback with the fingerprint is stored.
+
+        Signature:
+            str -> bool
+        
+        Version 1.0.1.0
+        """
+        with self._Lock:
+            return Fingerprint in self._Entries
+    
+    #public methods
+
+    #+ properties
+
+    @property
+    def Size(self) -> int:
+        """
+        Read-only property returning the number of the stored unique tracebacks.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return len(self._Entries)
+    
+    #+ methods
+
+    def add(self, Traceback: StackTraceback) -> str:
+        """
+        Registers an occurrence of the traceback. If a traceback with the same
+        fingerprint is already stored, only its counter and the last seen time
+        are updated, and the passed object is not retained; otherwise, it is
+        stored, and, if required, the least recently seen traceback is
+        discarded.
+
+        Signature:
+            StackTraceback -> str
+        
+        Args:
+            Traceback: StackTraceback; a traceback analysis object, including
+                an instance of any sub-class
+        
+        Returns:
+            str: the fingerprint of the traceback
+        
+        Raises:
+            TypeError: the argument is not an instance of StackTraceback class
+                or its sub-class
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Traceback, StackTraceback):
+            raise TypeError(f'{type(Traceback).__name__} is not a sub-class of '
+                                                            'StackTraceback')
+        Fingerprint = Traceback.Fingerprint
+        Now = time.time()
+        with self._Lock:
+            Entry = self._Entries.get(Fingerprint, None)
+            if Entry is None:
+                #traceback, counter, first seen, last seen, rendered info
+                self._Entries[Fingerprint] = [Traceback, 1, Now, Now, None]
+                while len(self._Entries) > self._MaxSize:
+                    self._Entries.popitem(last = False)
+            else:
+                Entry[1] += 1
+                Entry[3] = Now
+                self._Entries.move_to_end(Fingerprint)
+        return Fingerprint
+    
+    def addException(self, Error: BaseException) -> str:
+        """
+        Registers an occurrence of the traceback of the passed exception. The
+        traceback analysis object is taken from the property Traceback of the
+        exception, if it is defined (custom exceptions); otherwise it is created
+        in the lazy mode from the actual traceback of the exception.
+
+        Signature:
+            BaseException -> str
+        
+        Args:
+            Error: BaseException; an exception, which has been raised
+        
+        Returns:
+            str: the fingerprint of the traceback
+        
+        Version 1.0.0.0
+        """
+        Traceback = getattr(Error, 'Traceback', None)
+        if not isinstance(Traceback, StackTraceback):
+            Traceback = ExceptionTraceback(FromTraceback = Error.__traceback__,
+                                                            LazyContext = True)
+        return self.add(Traceback)
+    
+    def get(self, Fingerprint: str) -> Optional[StackTraceback]:
+        """
+        Returns the stored traceback analysis object with the fingerprint.
+
+        Signature:
+            str -> StackTraceback OR None
+        
+        Version 1.0.1.0
+        """
+        with self._Lock:
+            Entry = self._Entries.get(Fingerprint, None)
+        return None if Entry is None else Entry[0]
+    
+    def getInfo(self, Fingerprint: str) -> Optional[str]:
+        """
+        Returns the human-readable representation of the stored traceback with
+        the fingerprint, which is rendered only once, upon the first request.
+        The rendering is done outside the lock, and the concurrent requests
+        wait for it (the pending rendering is marked by an event object in
+        place of the text); if it fails, the next request renders again.
+
+        Signature:
+            str -> str OR None
+        
+        Version 1.1.0.0
+        """
+        with self._Lock:
+            Entry = self._Entries.get(Fingerprint, None)
+            if Entry is None:
+                return None
+            Result = Entry[4]
+            if Result is None:
+                Pending = threading.Event()
+                Entry[4] = Pending
+        if isinstance(Result, str):
+            return Result
+        if Result is None: #rendering by this thread
+            try:
+                Result = Entry[0].Info
+            except BaseException:
+                with self._Lock:
+                    Entry[4] = None
+                Pending.set()
+                raise
+            with self._Lock:
+                Entry[4] = Result
+            Pending.set()
+            return Result
+        Result.wait() #rendering by another thread
+        with self._Lock:
+            Result = Entry[4]
+        if not isinstance(Result, str): #failed, try again
+            Result = self.getInfo(Fingerprint)
+        return Result
+    
+    def getCount(self, Fingerprint: str) -> int:
+        """
+        Returns the number of the registered occurrences of the traceback with
+        the fingerprint, or 0 if it is not stored.
+
+        Signature:
+            str -> int >= 0
+        
+        Version 1.0.1.0
+        """
+        with self._Lock:
+            Entry = self._Entries.get(Fingerprint, None)
+            return 0 if Entry is None else Entry[1]
+    
+    def getStatistics(self) -> TStoreStatistics:
+        """
+        Returns the statistics on the stored tracebacks as a list of tuples of
+        the fingerprint, the number of occurrences, the first and the last
+        seen times (as returned by time.time()), sorted by the number of
+        occurrences in the descending order.
+
+        Signature:
+            None -> list(tuple(str, int > 0, float, float))
+        
+        Version 1.0.0.0
+        """
+        with self._Lock:
+            Result = [(Fingerprint, Entry[1], Entry[2], Entry[3])
+                            for Fingerprint, Entry in self._Entries.items()]
+        Result.sort(key = lambda Item: Item[1], reverse = True)
+        return Result
+    
+    def clear(self) -> None:
+        """
+        Removes all stored tracebacks and statistics.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        with self._Lock:
+            self._Entries.clear()
+
+class StackSampler():
+    """
+    Low overhead sampling profiler of the call stacks of the running threads.
+    The stacks of the selected threads (or of all threads) are snapshot
+    periodically by a background daemon thread using sys._current_frames(), and
+    the call paths - tuples of the fully qualified names of the callers, from
+    the outmost to the innermost one - are counted. The aggregated counts can be
+    exported as the collapsed stacks compatible with the flame graph tools. The
+    thread taking a sample (i.e. the sampling thread itself) is never included.
+    The resolved names of the callers are cached per code object, unless they
+    depend on the class of the 'self' or 'cls' local variable; the least
+    recently sampled code objects are dropped first when the cache is full.
+
+    Properties:
+        IsRunning: (read-only) bool; the background sampling is active
+        Samples: (read-only) int >= 0; number of the samples taken
+        Overhead: (read-only) float >= 0; fraction of the sampling time, during
+            which the samples were being taken
+    
+    Methods:
+        start():
+            None -> None
+        stop():
+            None -> None
+        sample():
+            None -> None
+        getCounts():
+            None -> dict(tuple(str) -> int > 0)
+        getCollapsed():
+            None -> list(str)
+        writeCollapsed(Stream):
+            file-like -> None
+        clear():
+            None -> None
+    
+    Version 1.1.0.0
+    """
+
+    #class data attributes - default values
+
+    Interval: ClassVar[float] = 0.01 #sampling interval in seconds
+
+    MaxDepth: ClassVar[int] = 128 #max number of the innermost frames per stack
+
+    #special methods
+
+    def __init__(self, *, Interval: TFloatNone = None,
+                    MaxDepth: TIntNone = None,
+                    Threads: TThreadsNone = None) -> None:
+        """
+        Initialization method.
+
+        Signature:
+            /int > 0 OR float > 0 OR None, int > 0 OR None,
+                seq(int OR threading.Thread) OR None/ -> None
+        
+        Args:
+            Interval: (keyword) int > 0 OR float > 0 OR None; interval between
+                the samples in seconds (default is None -> the value of the
+                class field Interval)
+            MaxDepth: (keyword) int > 0 OR None; max number of the innermost
+                frames to keep per stack (default is None -> the value of the
+                class field MaxDepth)
+            Threads: (keyword) seq(int OR threading.Thread) OR None; threads to
+                sample as the identifiers or the thread objects (default is
+                None -> all threads)
+        
+        Version 1.1.0.0
+        """
+        if (isinstance(Interval, (int, float)) and
+                            (not isinstance(Interval, bool)) and Interval > 0):
+            self._Interval = Interval
+        else:
+            self._Interval = self.Interval
+        if (isinstance(MaxDepth, int) and not isinstance(MaxDepth, bool)
+                                                            and MaxDepth > 0):
+            self._MaxDepth = MaxDepth
+        else:
+            self._MaxDepth = self.MaxDepth
+        if Threads is None:
+            self._Threads = None
+        else:
+            Identifiers = set()
+            for Item in Threads:
+                if isinstance(Item, threading.Thread):
+                    Item = Item.ident
+                if isinstance(Item, int):
+                    Identifiers.add(Item)
+            self._Threads = frozenset(Identifiers)
+        self._Lock = threading.Lock()
+        self._StopEvent = threading.Event()
+        self._Worker = None
+        self._Counts = collections.Counter()
+        self._Names = collections.OrderedDict()
+        self._Samples = 0
+        self._SamplingTime = 0.0
+        self._RunningTime = 0.0
+        self._StartTime = None
+    
+    def __enter__(self) -> 'StackSampler':
+        """
+        Starts the background sampling upon entering the context.
+
+        Signature:
+            None -> StackSampler
+        
+        Version 1.0.0.0
+        """
+        self.start()
+        return self
+    
+    def __exit__(self, *args) -> None:
+        """
+        Stops the background sampling upon exiting the context.
+
+        Signature:
+            type A, type B, type C -> None
+        
+        Version 1.0.0.0
+        """
+        self.stop()
+    
+    #private methods
+
+    def _getName(self, FrameObject: FrameType) -> str:
+        """
+        Resolves the fully qualified name of the caller of a frame and caches it
+        per code object, unless it depends on the class of 'self' or 'cls'
+        local variable - such code objects are marked as not cached. The cache
+        is bounded by the class attribute MaxSize of ModuleNameResolver; the
+        least recently used entries are dropped first.
+
+        Signature:
+            types.FrameType -> str
+        
+        Version 1.1.0.0
+        """
+        Code = FrameObject.f_code
+        Caller = Code.co_name
+        Variables = Code.co_varnames + Code.co_cellvars + Code.co_freevars
+        Name = _GetFullName(FrameObject, Caller)
+        while len(self._Names) >= ModuleNameResolver.MaxSize:
+            self._Names.popitem(last = False)
+        if Caller != '<module>' and ('self' in Variables or 'cls' in Variables):
+            self._Names[Code] = False
+        else:
+            self._Names[Code] = Name
+        return Name
+    
+    def _run(self) -> None:
+        """
+        Body of the background sampling thread - takes the samples with the
+        set interval until the stop is requested.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        while not self._StopEvent.wait(self._Interval):
+            self.sample()
+    
+    #public methods
+
+    #+ properties
+
+    @property
+    def IsRunning(self) -> bool:
+        """
+        Read-only property indicating if the background sampling is active.
+
+        Signature:
+            None -> bool
+        
+        Version 1.0.0.0
+        """
+        return not (self._Worker is None)
+    
+    @property
+    def Samples(self) -> int:
+        """
+        Read-only property returning the number of the samples taken.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Samples
+    
+    @property
+    def Overhead(self) -> float:
+        """
+        Read-only property returning the fraction of the total time of the
+        background sampling, which has been spent on taking the samples, i.e.
+        the estimated profiling overhead.
+
+        Signature:
+            None -> float >= 0
+        
+        Version 1.0.0.0
+        """
+        RunningTime = self._RunningTime
+        if not (self._StartTime is None):
+            RunningTime += time.perf_counter() - self._StartTime
+        if RunningTime > 0:
+            Result = self._SamplingTime / RunningTime
+        else:
+            Result = 0.0
+        return Result
+    
+    #+ methods
+
+    def start(self) -> None:
+        """
+        Starts the background sampling in a daemon thread. Does nothing if the
+        sampling is already active.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        if self._Worker is None:
+            self._StopEvent.clear()
+            self._Worker = threading.Thread(target = self._run,
+                                    name = 'StackSampler', daemon = True)
+            self._StartTime = time.perf_counter()
+            self._Worker.start()
+    
+    def stop(self) -> None:
+        """
+        Stops the background sampling and waits for the sampling thread to
+        finish. Does nothing if the sampling is not active. The collected data
+        is kept.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        if not (self._Worker is None):
+            self._StopEvent.set()
+            self._Worker.join()
+            self._Worker = None
+            self._RunningTime += time.perf_counter() - self._StartTime
+            self._StartTime = None
+    
+    def sample(self) -> None:
+        """
+        Takes a single sample of the call stacks of the selected threads, except
+        for the calling thread, and counts the call paths truncated to the max
+        depth (the innermost frames are kept). The cached names of the sampled
+        code objects are marked as the most recently used.
+
+        Signature:
+            None -> None
+        
+        Version 1.1.0.0
+        """
+        Start = time.perf_counter()
+        CurrentThread = threading.get_ident()
+        Selected = self._Threads
+        MaxDepth = self._MaxDepth
+        Cache = self._Names
+        Paths = []
+        Frames = sys._current_frames()
+        for ThreadId, FrameObject in Frames.items():
+            if ThreadId == CurrentThread or not (Selected is None or
+                                                        ThreadId in Selected):
+                continue
+            Names = []
+            Depth = MaxDepth
+            while Depth and not (FrameObject is None):
+                Depth -= 1
+                Code = FrameObject.f_code
+                Name = Cache.get(Code, None)
+                if Name is None:
+                    Name = self._getName(FrameObject)
+                else:
+                    Cache.move_to_end(Code)
+                    if Name is False: #name depends on self / cls - not cached
+                        Name = _GetFullName(FrameObject, Code.co_name)
+                Names.append(Name)
+                FrameObject = FrameObject.f_back
+            Names.reverse()
+            Paths.append(tuple(Names))
+        del FrameObject
+        del Frames
+        with self._Lock:
+            self._Counts.update(Paths)
+            self._Samples += 1
+            self._SamplingTime += time.perf_counter() - Start
+    
+    def getCounts(self) -> dict[TCallPath, int]:
+        """
+        Returns the aggregated counts of the sampled call paths.
+
+        Signature:
+            None -> dict(tuple(str) -> int > 0)
+        
+        Returns:
+            dict(tuple(str) -> int > 0): mapping of the call paths as tuples of
+                the fully qualified names of the callers, from the outmost to
+                the innermost, to the number of the samples they were found in
+        
+        Version 1.0.0.0
+        """
+        with self._Lock:
+            Result = dict(self._Counts)
+        return Result
+    
+    def getCollapsed(self) -> TStringList:
+        """
+        Returns the aggregated counts of the sampled call paths in the collapsed
+        stacks format (one line per path: the callers' names separated by the
+        semicolons, a space and the count), which is the input format of the
+        flame graph tools. The lines are sorted by the count in the descending
+        order.
+
+        Signature:
+            None -> list(str)
+        
+        Version 1.0.0.0
+        """
+        Items = sorted(self.getCounts().items(),
+                                    key = lambda Item: (-Item[1], Item[0]))
+        return ['{} {}'.format(';'.join(Name.replace(';', ':')
+                                        for Name in Path), Count)
+                                                    for Path, Count in Items]
+    
+    def writeCollapsed(self, Stream: TextIO) -> None:
+        """
+        Writes the aggregated counts of the sampled call paths in the collapsed
+        stacks format into the passed text stream, one line per path, each
+        line is terminated by the new-line character.
+
+        Signature:
+            file-like -> None
+        
+        Args:
+            Stream: file-like; any object supporting the method write(str)
+        
+        Version 1.0.0.0
+        """
+        for Line in self.getCollapsed():
+            Stream.write(Line)
+            Stream.write('\n')
+    
+    def clear(self) -> None:
+        """
+        Removes all collected data (counts and statistics). The background
+        sampling, if active, is not stopped.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        with self._Lock:
+            self._Counts.clear()
+            self._Samples = 0
+            self._SamplingTime = 0.0
+            self._RunningTime = 0.0
+            if not (self._StartTime is None):
+                self._StartTime = time.perf_counter()
+
+class CallPathTrie():
+    """
+    Thread-safe aggregator of the call paths (call chains of the tracebacks,
+    i.e. the sequences of the fully qualified names of the callers from the
+    outmost to the innermost one), which stores them in a prefix tree. Each
+    node is a small list of the number of the paths passing through it, the
+    number of the paths ending at it and the dictionary of its children (or
+    None), and each name is stored only once per node, so the common outer
+    parts of the paths are shared. Thus, millions of the registered paths cost
+    only as much memory as the distinct paths. The tries from several processes
+    can be merged, and the trie can be serialized into a compact binary form.
+
+    Properties:
+        Total: (read-only) int >= 0; number of the registered paths
+        Size: (read-only) int >= 0; number of the nodes (excluding the root)
+    
+    Methods:
+        add(Path, Count = 1):
+            StackTraceback OR seq(str)/, int > 0/ -> None
+        addException(Error):
+            BaseException -> None
+        getCount(Prefix):
+            StackTraceback OR seq(str) -> int >= 0
+        getTop(Number, *, Prefix = None):
+            int > 0/, seq(str) OR None/ -> list(tuple(tuple(str), int > 0))
+        merge(Other):
+            CallPathTrie -> None
+        toBytes():
+            None -> bytes
+        clear():
+            None -> None
+    
+    Class methods:
+        fromBytes(Data):
+            bytes OR bytearray OR memoryview -> CallPathTrie
+    
+    Version 1.0.0.0
+    """
+
+    #special methods
+
+    def __init__(self) -> None:
+        """
+        Initialization method. Creates an empty trie.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        self._Lock = threading.Lock()
+        self.clear()
+    
+    def __len__(self) -> int:
+        """
+        Returns the number of the distinct registered paths.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Paths
+    
+    def __reduce__(self) -> tuple[Any, tuple[bytes]]:
+        """
+        Support of the pickle protocol - an instance is pickled as its compact
+        binary representation, see the method toBytes(), and it is restored by
+        the class method fromBytes().
+
+        Signature:
+            None -> tuple(classmethod, tuple(bytes))
+        
+        Version 1.0.0.0
+        """
+        return (self.__class__.fromBytes, (self.toBytes(), ))
+    
+    #private methods
+
+    def _iterNodes(self, Node: TTrieNode,
+                            Path: TCallPath = ()) -> Iterator[TTrieItem]:
+        """
+        Generator walking the sub-tree of the node in the pre-order (each node
+        before its children, the children in the insertion order) without
+        recursion.
+
+        Signature:
+            list(int, int, dict OR None)/, tuple(str)/
+                -> iterator(tuple(tuple(str), list(int, int, dict OR None)))
+        
+        Args:
+            Node: list(int, int, dict OR None); the starting node
+            Path: (optional) tuple(str); the path to the starting node
+        
+        Yields:
+            tuple(tuple(str), list(int, int, dict OR None)): the path to the
+                node and the node itself
+        
+        Version 1.0.0.0
+        """
+        Stack = [(Path, Node)]
+        while Stack:
+            Path, Node = Stack.pop()
+            yield Path, Node
+            Children = Node[2]
+            if Children:
+                Stack.extend((Path + (Name, ), Child)
+                            for Name, Child in reversed(Children.items()))
+    
+    def _findNode(self, Path: Iterable[str]) -> Optional[TTrieNode]:
+        """
+        Finds the node of the path.
+
+        Signature:
+            seq(str) -> list(int, int, dict OR None) OR None
+        
+        Version 1.0.0.0
+        """
+        Node = self._Root
+        for Name in Path:
+            Children = Node[2]
+            Node = None if Children is None else Children.get(Name, None)
+            if Node is None:
+                break
+        return Node
+    
+    @staticmethod
+    def _getPath(Path: Any) -> TStringList:
+        """
+        Converts the argument into a list of the callers' names.
+
+        Signature:
+            StackTraceback OR seq(str) -> list(str)
+        
+        Raises:
+            TypeError: the argument is neither a traceback, nor a sequence of
+                strings
+        
+        Version 1.0.0.0
+        """
+        if isinstance(Path, StackTraceback):
+            Result = Path.CallChain
+        elif isinstance(Path, (list, tuple)) and all(isinstance(Name, str)
+                                                            for Name in Path):
+            Result = list(Path)
+        else:
+            raise TypeError(f'{type(Path).__name__} is not a sub-class of '
+                                            'StackTraceback or seq(str)')
+        return Result
+    
+    #public methods
+
+    #+ properties
+
+    @property
+    def Total(self) -> int:
+        """
+        Read-only property returning the total number of the registered paths.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Root[0]
+    
+    @property
+    def Size(self) -> int:
+        """
+        Read-only property returning the number of the nodes of the trie,
+        excluding the root node.
+
+        Signature:
+            None -> int >= 0
+        
+        Version 1.0.0.0
+        """
+        return self._Size
+    
+    #+ methods
+
+    def add(self, Path: Union[StackTraceback, Iterable[str]],
+                                                    Count: int = 1) -> None:
+        """
+        Registers the call path (the occurrence of a traceback) one or several
+        times.
+
+        Signature:
+            StackTraceback OR seq(str)/, int > 0/ -> None
+        
+        Args:
+            Path: StackTraceback OR seq(str); a traceback analysis object, or
+                its call chain - the names of the callers from the outmost one
+            Count: (optional) int > 0; the number of the occurrences (default
+                is 1)
+        
+        Raises:
+            TypeError: the path is neither a traceback, nor a sequence of
+                strings, or the count is not an integer
+            ValueError: the count is not positive
+        
+        Version 1.0.0.0
+        """
+        Names = self._getPath(Path)
+        if not isinstance(Count, int) or isinstance(Count, bool):
+            raise TypeError(f'{type(Count).__name__} is not a sub-class of int')
+        if Count < 1:
+            raise ValueError(f'Count must be positive, got {Count}')
+        with self._Lock:
+            Node = self._Root
+            Node[0] += Count
+            for Name in Names:
+                Children = Node[2]
+                if Children is None:
+                    Children = dict()
+                    Node[2] = Children
+                Child = Children.get(Name, None)
+                if Child is None:
+                    Child = [0, 0, None]
+                    Children[sys.intern(Name)] = Child
+                    self._Size += 1
+                Node = Child
+                Node[0] += Count
+            if not Node[1]:
+                self._Paths += 1
+            Node[1] += Count
+    
+    def addException(self, Error: BaseException) -> None:
+        """
+        Registers the call path of the traceback of the passed exception. The
+        traceback analysis object is taken from the property Traceback of the
+        exception, if it is defined (custom exceptions); otherwise it is created
+        in the lazy mode from the actual traceback of the exception, thus the
+        source code is never retrieved.
+
+        Signature:
+            BaseException -> None
+        
+        Args:
+            Error: BaseException; an exception, which has been raised
+        
+        Version 1.0.0.0
+        """
+        Traceback = getattr(Error, 'Traceback', None)
+        if not isinstance(Traceback, StackTraceback):
+            Traceback = ExceptionTraceback(FromTraceback = Error.__traceback__,
+                                                            LazyContext = True)
+        self.add(Traceback)
+    
+    def getCount(self, Prefix: Union[StackTraceback, Iterable[str]]) -> int:
+        """
+        Returns the number of the registered paths starting with the prefix,
+        e.g. the number of the errors raised from within a specific function
+        called along the specific path.
+
+        Signature:
+            StackTraceback OR seq(str) -> int >= 0
+        
+        Args:
+            Prefix: StackTraceback OR seq(str); a traceback analysis object, or
+                the names of the callers from the outmost one
+        
+        Returns:
+            int >= 0: the number of the paths, zero if the prefix is unknown
+        
+        Raises:
+            TypeError: the prefix is neither a traceback, nor a sequence of
+                strings
+        
+        Version 1.0.0.0
+        """
+        Names = self._getPath(Prefix)
+        with self._Lock:
+            Node = self._findNode(Names)
+            Result = 0 if Node is None else Node[0]
+        return Result
+    
+    def getTop(self, Number: int, *,
+                    Prefix: Optional[Iterable[str]] = None) -> TCallPathCounts:
+        """
+        Returns the specified number of the most often registered complete
+        paths (optionally, only those starting with the prefix) with their
+        counts in the descending order of the counts.
+
+        Signature:
+            int > 0/, *, seq(str) OR None/ -> list(tuple(tuple(str), int > 0))
+        
+        Args:
+            Number: int > 0; the max number of the paths to return
+            Prefix: (keyword) seq(str) OR None; the names of the callers from
+                the outmost one, the paths must start with (default is None ->
+                all paths)
+        
+        Returns:
+            list(tuple(tuple(str), int > 0)): the paths as the tuples of the
+                callers' names paired with their counts
+        
+        Raises:
+            TypeError: the number is not an integer, or the prefix is not a
+                sequence of strings
+            ValueError: the number is not positive
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Number, int) or isinstance(Number, bool):
+            raise TypeError(
+                        f'{type(Number).__name__} is not a sub-class of int')
+        if Number < 1:
+            raise ValueError(f'Number must be positive, got {Number}')
+        Names = [] if Prefix is None else self._getPath(Prefix)
+        with self._Lock:
+            Node = self._findNode(Names)
+            if Node is None:
+                Result = []
+            else:
+                Result = heapq.nlargest(Number,
+                            ((Path, Item[1]) for Path, Item
+                                    in self._iterNodes(Node, tuple(Names))
+                                                                if Item[1]),
+                                            key = lambda Pair: Pair[1])
+        return Result
+    
+    def merge(self, Other: 'CallPathTrie') -> None:
+        """
+        Adds all paths registered in another trie (e.g. restored from the
+        binary representation sent by another process) with their counts.
+
+        Signature:
+            CallPathTrie -> None
+        
+        Args:
+            Other: CallPathTrie; the trie to merge into the current one
+        
+        Raises:
+            TypeError: the argument is not an instance of CallPathTrie class
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Other, CallPathTrie):
+            raise TypeError(
+                f'{type(Other).__name__} is not a sub-class of CallPathTrie')
+        with Other._Lock:
+            Items = [(Path, Node[1]) for Path, Node
+                                    in Other._iterNodes(Other._Root) if Node[1]]
+        for Path, Count in Items:
+            self.add(Path, Count)
+    
+    def toBytes(self) -> bytes:
+        """
+        Serializes the trie into a compact binary representation, which can be
+        transferred to another process and restored by the class method
+        fromBytes(). Each name is stored only once in a strings table and
+        referenced by the index; all integers are encoded as the variable
+        length integers.
+
+        Format: b'CT', version byte (1), strings table size, the strings (UTF-8
+        length and data each), then the nodes in the pre-order, each as the
+        index of the name (except for the root), the number of the paths ending
+        at the node and the number of its children.
+
+        Signature:
+            None -> bytes
+        
+        Version 1.0.0.0
+        """
+        Strings = dict()
+        Body = bytearray()
+        with self._Lock:
+            for Path, Node in self._iterNodes(self._Root):
+                if Path:
+                    Name = Path[-1]
+                    Index = Strings.get(Name, None)
+                    if Index is None:
+                        Index = len(Strings)
+                        Strings[Name] = Index
+                    _EncodeVarint(Index, Body)
+                _EncodeVarint(Node[1], Body)
+                _EncodeVarint(len(Node[2]) if Node[2] else 0, Body)
+        Result = bytearray(b'CT\x01')
+        _EncodeVarint(len(Strings), Result)
+        for Value in Strings: #insertion order = index order
+            Data = Value.encode('utf-8', 'surrogatepass')
+            _EncodeVarint(len(Data), Result)
+            Result.extend(Data)
+        Result.extend(Body)
+        return bytes(Result)
+    
+    def clear(self) -> None:
+        """
+        Removes all registered paths.
+
+        Signature:
+            None -> None
+        
+        Version 1.0.0.0
+        """
+        with self._Lock:
+            self._Root = [0, 0, None]
+            self._Size = 0
+            self._Paths = 0
+    
+    #+ class methods
+    
+    @classmethod
+    def fromBytes(cls, Data: TBytesLike) -> 'CallPathTrie':
+        """
+        Restores a trie from its compact binary representation created by the
+        method toBytes().
+
+        Signature:
+            bytes OR bytearray OR memoryview -> CallPathTrie
+        
+        Args:
+            Data: bytes OR bytearray OR memoryview; the binary representation
+        
+        Returns:
+            CallPathTrie: the restored instance of the class, on which the
+                method is called
+        
+        Raises:
+            TypeError: the argument is not a bytes-like object
+            ValueError: the data is not a proper representation (wrong header
+                or version, truncated or corrupted data)
+        
+        Version 1.0.0.0
+        """
+        if not isinstance(Data, (bytes, bytearray, memoryview)):
+            raise TypeError(
+                        f'{type(Data).__name__} is not a bytes-like object')
+        Data = bytes(Data)
+        if Data[:3] != b'CT\x01':
+            raise ValueError('Not a serialized call path trie or '
+                                                        'unsupported version')
+        Instance = cls()
+        Root = Instance._Root
+        Nodes = [Root]
+        try:
+            Size, Position = _DecodeVarint(Data, 3)
+            Strings = []
+            for _ in range(Size):
+                Length, Position = _DecodeVarint(Data, Position)
+                End = Position + Length
+                if End > len(Data):
+                    raise IndexError('truncated string')
+                Strings.append(sys.intern(
+                        Data[Position : End].decode('utf-8', 'surrogatepass')))
+                Position = End
+            Root[1], Position = _DecodeVarint(Data, Position)
+            NumberChildren, Position = _DecodeVarint(Data, Position)
+            Stack = [[Root, NumberChildren]]
+            while Stack:
+                Pending = Stack[-1]
+                if not Pending[1]:
+                    Stack.pop()
+                    continue
+                Pending[1] -= 1
+                Parent = Pending[0]
+                Index, Position = _DecodeVarint(Data, Position)
+                Name = Strings[Index]
+                Node = [0, 0, None]
+                Node[1], Position = _DecodeVarint(Data, Position)
+                NumberChildren, Position = _DecodeVarint(Data, Position)
+                if Parent[2] is None:
+                    Parent[2] = dict()
+                if Name in Parent[2]:
+                    raise ValueError('Duplicate node in serialized trie')
+                Parent[2][Name] = Node
+                Nodes.append(Node)
+                Stack.append([Node, NumberChildren])
+        except IndexError as err:
+            raise ValueError('Truncated or corrupted serialized trie'
+                                                                    ) from err
+        except UnicodeDecodeError as err:
+            raise ValueError('Corrupted serialized trie') from err
+        if Position != len(Data):
+            raise ValueError('Unexpected data after the serialized trie')
+        for Node in reversed(Nodes): #children are after their parent
+            Node[0] += Node[1]
+            if Node[2]:
+                Node[0] += sum(Child[0] for Child in Node[2].values())
+            if Node[1]:
+                Instance._Paths += 1
+        Instance._Size = len(Nodes) - 1
+        return Instance
+
+#module level objects
+
+_ModuleResolver = ModuleNameResolver()
+
+_SourceFilesCache = SourceCache()
@@ -22,8 +22,8 @@ Functions:
         type A, str OR int OR seq(type B), type C/, *, bool/ -> None
 """
 
-__version__ = "1.1.0.0"
-__date__ = "01-07-2026"
+__version__ = "1.3.0.0"
+__date__ = "18-10-2026"
 __status__ = "Production"
 
 #imports
@@ -38,6 +38,8 @@ from typing import Any, Union
 
 from .base_exceptions import UT_TypeError, UT_ValueError, UT_AttributeError
 from .base_exceptions import UT_KeyError, UT_IndexError, GetObjectClass
+from .base_exceptions import LazyFormat
+from .base_exceptions import LW_KeyError, LW_IndexError, LW_AttributeError
 
 #types
 
@@ -47,6 +49,65 @@ type TGenericPath = Union[int, str, collections.abc.Sequence[Any]]
 
 #functions
 
+#+ private functions
+
+def _GetData(Object: Any, Path: TPathElement) -> Any:
+    """
+    Implementation of the universal 'read' access, see GetData(). The type
+    mismatch is reported by the exception UT_TypeError as intended for the
+    caller of GetData(); whereas the not found element is signalled by the
+    lightweight exceptions without the traceback analysis, since this helper
+    is also used for the walking along a path, where the not found element is
+    handled internally.
+
+    Signature:
+        type A, str OR int -> type B
+    
+    Raises:
+        UT_TypeError: type mismatch between object and path
+        LW_IndexError: index is outside the range of a sequence
+        LW_KeyError: key is not found in a mapping
+        LW_AttributeError: attribute is not found
+    
+    Version 1.0.0.0
+    """
+    if not isinstance(Path, (int, str)):
+        Error = UT_TypeError(Path, [int, str], SkipFrames = 2)
+        Error.appendMessage('in "{}" path', Path)
+        raise Error
+    if isinstance(Object, collections.abc.Sequence):
+        #dirty hack to allow string (attrubute) access to named tuples
+        if isinstance(Path, str) and (not hasattr(Object, '_fields')):
+            Error = UT_TypeError(Path, int, SkipFrames = 2)
+            Error.appendMessage('in "{}" path for sequence {}', Path,
+                                                                        Object)
+            raise Error
+        if isinstance(Path, int): #index access
+            Length = len(Object)
+            if (Path < (- Length)) or (Path >= Length):
+                raise LW_IndexError
+            Result = Object[Path]
+        else: #attribute access - for named tuples only
+            if not hasattr(Object, Path):
+                raise LW_AttributeError
+            Result = getattr(Object, Path)
+    else:
+        if not isinstance(Path, str):
+            Error = UT_TypeError(Path, str, SkipFrames = 2)
+            Error.appendMessage('in "{}" path for {}', Path, Object)
+            raise Error
+        if isinstance(Object, collections.abc.Mapping):
+            if not Path in Object:
+                raise LW_KeyError
+            Result = Object[Path]
+        else:
+            if not hasattr(Object, Path):
+                raise LW_AttributeError
+            Result = getattr(Object, Path)
+    return Result
+
+#+ public functions
+
 def GetData(Object: Any, Path: TPathElement) -> Any:
     """
     Universal 'read' access to an element of a list, key : value pair entry of
@@ -78,46 +139,20 @@ def GetData(Object: Any, Path: TPathElement) -> Any:
         UT_AttributeError: object is a genric class or instance, and path is a
             string, but it is not found among the attributes
     
-    Version 1.1.0.0
+    Version 1.3.0.0
     """
-    if not isinstance(Path, (int, str)):
-        Error = UT_TypeError(Path, [int, str], SkipFrames = 1)
-        Error.appendMessage(f'in "{Path}" path')
-        raise Error
-    if isinstance(Object, collections.abc.Sequence):
-        #dirty hack to allow string (attrubute) access to named tuples
-        if isinstance(Path, str) and (not hasattr(Object, '_fields')):
-            Error = UT_TypeError(Path, int, SkipFrames = 1)
-            Error.appendMessage(f'in "{Path}" path for sequence {Object}')
-            raise Error
-        if isinstance(Path, int): #index access
-            Length = len(Object)
-            if (Path < (- Length)) or (Path >= Length):
-                Name = f'passed sequence {Object}'
-                raise UT_IndexError(Name, Path, SkipFrames = 1)
-            Result = Object[Path]
-        else: #attribute access - for named tuples only
-            if not hasattr(Object, Path):
-                Error = UT_AttributeError(Object, Path, SkipFrames = 1)
-                Error.appendMessage('not found attribute')
-                raise Error
-            Result = getattr(Object, Path)
-    else:
-        if not isinstance(Path, str):
-            Error = UT_TypeError(Path, str, SkipFrames = 1)
-            Error.appendMessage(f'in "{Path}" path for {Object}')
-            raise Error
-        if isinstance(Object, collections.abc.Mapping):
-            if not Path in Object:
-                Name = f'passed mapping {Object}'
-                raise UT_KeyError(Name, Path, SkipFrames = 1)
-            Result = Object[Path]
-        else:
-            if not hasattr(Object, Path):
-                Error = UT_AttributeError(Object, Path, SkipFrames = 1)
-                Error.appendMessage('not found attribute')
-                raise Error
-            Result = getattr(Object, Path)
+    try:
+        Result = _GetData(Object, Path)
+    except LW_IndexError:
+        Name = LazyFormat('passed sequence {}', Object)
+        raise UT_IndexError(Name, Path, SkipFrames = 1) from None
+    except LW_KeyError:
+        Name = LazyFormat('passed mapping {}', Object)
+        raise UT_KeyError(Name, Path, SkipFrames = 1) from None
+    except LW_AttributeError:
+        Error = UT_AttributeError(Object, Path, SkipFrames = 1)
+        Error.appendMessage('not found attribute')
+        raise Error from None
     return Result
 
 def GetDataDefault(Object: Any, Path: TPathElement, Default: Any) -> Any:
@@ -146,17 +181,18 @@ def GetDataDefault(Object: Any, Path: TPathElement, Default: Any) -> Any:
             and non-integer path, non-sequence object and non-string path, OR
             the path is neither an integer or a string
     
-    Version 1.1.0.0
+    Version 1.2.0.0
     """
     if not isinstance(Path, (int, str)):
         Error = UT_TypeError(Path, [int, str], SkipFrames = 1)
-        Error.appendMessage(f'in "{Path}" path')
+        Error.appendMessage('in "{}" path', Path)
         raise Error
     if isinstance(Object, collections.abc.Sequence):
         #dirty hack to allow string (attrubute) access to named tuples
         if isinstance(Path, str) and (not hasattr(Object, '_fields')):
             Error = UT_TypeError(Path, int, SkipFrames = 1)
-            Error.appendMessage(f'in "{Path}" path for sequence {Object}')
+            Error.appendMessage('in "{}" path for sequence {}', Path,
+                                                                        Object)
             raise Error
         if isinstance(Path, int): #index access
             Length = len(Object)
@@ -169,7 +205,7 @@ def GetDataDefault(Object: Any, Path: TPathElement, Default: Any) -> Any:
     else:
         if not isinstance(Path, str):
             Error = UT_TypeError(Path, str, SkipFrames = 1)
-            Error.appendMessage(f'in "{Path}" path for {Object}')
+            Error.appendMessage('in "{}" path for {}', Path, Object)
             raise Error
         if isinstance(Object, collections.abc.Mapping):
             Result = Object.get(Path, Default)
@@ -208,11 +244,11 @@ def SetDataStrict(Object: Any, Path: TPathElement, Value: Any) -> None:
         UT_AttributeError: object is a genric class or instance, and path is a
             string, but it is not found among the attributes
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     if not isinstance(Path, (int, str)):
         Error = UT_TypeError(Path, [int, str], SkipFrames = 1)
-        Error.appendMessage(f'in "{Path}" path')
+        Error.appendMessage('in "{}" path', Path)
         raise Error
     if isinstance(Object, collections.abc.Sequence):
         if not isinstance(Object, collections.abc.MutableSequence):
@@ -220,29 +256,31 @@ def SetDataStrict(Object: Any, Path: TPathElement, Value: Any) -> None:
                                                                 SkipFrames = 1)
         if not isinstance(Path, int):
             Error = UT_TypeError(Path, int, SkipFrames = 1)
-            Error.appendMessage(f'in "{Path}" path for sequence {Object}')
+            Error.appendMessage('in "{}" path for sequence {}', Path,
+                                                                        Object)
             raise Error
         Length = len(Object)
         if (Path < (- Length)) or (Path >= Length):
-            raise UT_IndexError(f'passed sequence {Object}', Path, SkipFrames=1)
+            raise UT_IndexError(LazyFormat('passed sequence {}', Object), Path,
+                                                                SkipFrames = 1)
         Object[Path] = Value
     else:
         if not isinstance(Path, str):
             Error = UT_TypeError(Path, str, SkipFrames = 1)
-            Error.appendMessage(f'in "{Path}" path for {Object}')
+            Error.appendMessage('in "{}" path for {}', Path, Object)
             raise Error
         if isinstance(Object, collections.abc.Mapping):
             if not isinstance(Object, collections.abc.MutableMapping):
                 raise UT_TypeError(Object, collections.abc.MutableMapping,
                                                                 SkipFrames = 1)
             if not Path in Object:
-                raise UT_KeyError(f'passed mapping {Object}', Path,
-                                                                SkipFrames = 1)
+                raise UT_KeyError(LazyFormat('passed mapping {}', Object),
+                                                        Path, SkipFrames = 1)
             Object[Path] = Value
         else:
             if not hasattr(Object, Path):
                 Error = UT_AttributeError(Object, Path, SkipFrames = 1)
-                Error.appendMessage(f'not found attribute')
+                Error.appendMessage('not found attribute')
                 raise Error
             setattr(Object, Path, Value)
 
@@ -273,11 +311,11 @@ def SetData(Object: Any, Path: TPathElement, Value: Any) -> None:
             non-sequence object and non-string path, OR the path is neither an
             integer or a string
     
-    Version 1.0.0.0
+    Version 1.1.0.0
     """
     if not isinstance(Path, (int, str)):
         Error = UT_TypeError(Path, [int, str], SkipFrames = 1)
-        Error.appendMessage(f'in "{Path}" path')
+        Error.appendMessage('in "{}" path', Path)
         raise Error
     if isinstance(Object, collections.abc.Sequence):
         if not isinstance(Object, collections.abc.MutableSequence):
@@ -285,7 +323,8 @@ def SetData(Object: Any, Path: TPathElement, Value: Any) -> None:
                                                                 SkipFrames = 1)
         if not isinstance(Path, int):
             Error = UT_TypeError(Path, int, SkipFrames = 1)
-            Error.appendMessage(f'in "{Path}" path for sequence {Object}')
+            Error.appendMessage('in "{}" path for sequence {}', Path,
+                                                                        Object)
             raise Error
         Length = len(Object)
         if Path < (- Length):
@@ -297,7 +336,7 @@ def SetData(Object: Any, Path: TPathElement, Value: Any) -> None:
     else:
         if not isinstance(Path, str):
             Error = UT_TypeError(Path, str, SkipFrames = 1)
-            Error.appendMessage(f'in "{Path}" for {Object}')
+            Error.appendMessage('in "{}" for {}', Path, Object)
             raise Error
         if isinstance(Object, collections.abc.Mapping):
             if not isinstance(Object, collections.abc.MutableMapping):
@@ -330,7 +369,7 @@ def FlattenPath(Path: TGenericPath) -> TCannonicalPath:
         UT_TypeError: the passed generic path is not an integer, a string or
             a (nested) sequence of only strings and integers
     
-    Version 1.0.0.0
+    Version 1.2.0.0
     """
     if isinstance(Path, str):
         Result = Path.split(".")
@@ -343,8 +382,8 @@ def FlattenPath(Path: TGenericPath) -> TCannonicalPath:
                 Temp = FlattenPath(Item)
             except UT_TypeError as err:
                 Error = UT_TypeError(1, int, SkipFrames = 1)
-                Message = err.getMessage()
-                Error.setMessage(f'{Message} in {Path}')
+                Error.setMessage('{} in {}', LazyFormat(err.getMessage),
+                                                                        Path)
                 raise Error from None
             Result.extend(Temp)
     else:
@@ -398,15 +437,15 @@ def GetElement(Object: Any, Path: TGenericPath, *,
             instance, and the respective attribute is not found - 'strict' mode
             only
     
-    Version 1.0.0.0
+    Version 1.2.0.0
     """
     #convert the path into the canonical form - and check that it is not empty
     try:
         Path = FlattenPath(Path)
     except UT_TypeError as err:
-        Message = err.getMessage()
         Error = UT_TypeError(1, int, SkipFrames = 1)
-        Error.setMessage(f'{Message} - invalid path definition')
+        Error.setMessage('{} - invalid path definition',
+                                                LazyFormat(err.getMessage))
         raise Error from None
     if not Path:
         raise UT_ValueError(Path, 'not empty path', SkipFrames = 1)
@@ -426,13 +465,13 @@ def GetElement(Object: Any, Path: TGenericPath, *,
             ErrorClass = UT_AttributeError
             FullName = f'{Name}.{Item}'
         try:
-            Result = GetData(CurrentObject, Item)
+            Result = _GetData(CurrentObject, Item)
         except UT_TypeError as err1: #object - path mismatch
-            Message = err1.getMessage()
             Error = UT_TypeError(1, int, SkipFrames = 1)
-            Error.setMessage(f'{FullName} - {Message}')
+            Error.setMessage('{} - {}', FullName,
+                                                LazyFormat(err1.getMessage))
             raise Error from None
-        except (UT_AttributeError, UT_IndexError, UT_KeyError):
+        except (LW_AttributeError, LW_IndexError, LW_KeyError):
             #not found level
             if IsStrict:
                 raise ErrorClass(FullName, Item, SkipFrames = 1) from None
@@ -482,15 +521,15 @@ def SetElement(Object: Any, Path: TGenericPath, Value: Any, *,
             instance, and the respective attribute is not found - 'strict' mode
             only
     
-    Version 1.0.0.0
+    Version 1.2.0.0
     """
     #convert the path into the canonical form - and check that it is not empty
     try:
         Path = FlattenPath(Path)
     except UT_TypeError as err:
         Error = UT_TypeError(1, int, SkipFrames = 1)
-        Message = err.getMessage()
-        Error.setMessage(f'{Message} - invalid path definition')
+        Error.setMessage('{} - invalid path definition',
+                                                LazyFormat(err.getMessage))
         raise Error from None
     Length = len(Path)
     if not Length:
@@ -512,13 +551,13 @@ def SetElement(Object: Any, Path: TGenericPath, Value: Any, *,
             FullName = f'{Name}.{Item}'
         if Index < (Length - 1): #not last element in the path
             try:
-                Result = GetData(CurrentObject, Item)
+                Result = _GetData(CurrentObject, Item)
             except UT_TypeError as err1: #object - path mismatch
                 Error = UT_TypeError(1, int, SkipFrames = 1)
-                Message = err1.getMessage()
-                Error.setMessage(f'{FullName} - {Message}')
+                Error.setMessage('{} - {}', FullName,
+                                                LazyFormat(err1.getMessage))
                 raise Error from None
-            except (UT_AttributeError, UT_IndexError, UT_KeyError):
+            except (LW_AttributeError, LW_IndexError, LW_KeyError):
                 #not found level
                 if IsStrict:
                     raise ErrorClass(Name, Item, SkipFrames = 1) from None
@@ -532,8 +571,8 @@ def SetElement(Object: Any, Path: TGenericPath, Value: Any, *,
                         SetData(CurrentObject, Item, NewItem)
                     except UT_TypeError as err2: #immutable at this level
                         Error = UT_TypeError(1, int, SkipFrames = 1)
-                        Message = err2.getMessage()
-                        Error.setMessage(f'{FullName} - {Message}')
+                        Error.setMessage('{} - {}', FullName,
+                                                LazyFormat(err2.getMessage))
                         raise Error from None
                     Result = NewItem
             CurrentObject = Result #reference to the next level
@@ -546,6 +585,6 @@ def SetElement(Object: Any, Path: TGenericPath, Value: Any, *,
                     SetData(CurrentObject, Item, Value)
             except UT_TypeError as err3: #object - path mismatch or immutable
                 Error = UT_TypeError(1, int, SkipFrames = 1)
-                Message = err3.getMessage()
-                Error.setMessage(f'{FullName} - {Message}')
+                Error.setMessage('{} - {}', FullName,
+                                                LazyFormat(err3.getMessage))
                 raise Error from None